@@ -0,0 +1,13 @@
+"""Hot-path benchmarks for pymammotion.
+
+Each ``bench_*.py`` module exposes ``bench_*`` functions that take a
+:class:`benchmarks._harness.Bench` and time one or more cases on it.  Run the
+whole suite (or a subset) with::
+
+    uv run python -m benchmarks                 # everything, table on stdout
+    uv run python -m benchmarks -k reducer      # only cases whose name matches
+    uv run python -m benchmarks --json out.json # machine-readable results
+
+Fixtures are deterministic (see :mod:`benchmarks.fixtures`) so numbers are
+comparable across runs and releases on the same machine.
+"""
@@ -0,0 +1,56 @@
+"""Run every ``bench_*`` function in the ``benchmarks`` package."""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+from pathlib import Path
+import pkgutil
+import platform
+import sys
+
+import benchmarks
+from benchmarks._harness import Bench
+
+
+def _format_seconds(value: float) -> str:
+    for unit, scale in (("s", 1.0), ("ms", 1e-3), ("µs", 1e-6)):
+        if value >= scale:
+            return f"{value / scale:8.2f} {unit}"
+    return f"{value / 1e-9:8.2f} ns"
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Discover and run the benchmark modules; print a table and optionally dump JSON."""
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", default="", help="only run cases whose group.name contains this")
+    parser.add_argument("--json", dest="json_path", type=Path, help="write machine-readable results here")
+    args = parser.parse_args(argv)
+
+    bench = Bench(args.pattern)
+    for module_info in sorted(pkgutil.iter_modules(benchmarks.__path__), key=lambda m: m.name):
+        if not module_info.name.startswith("bench_"):
+            continue
+        module = importlib.import_module(f"benchmarks.{module_info.name}")
+        for attr in sorted(dir(module)):
+            if attr.startswith("bench_") and callable(fn := getattr(module, attr)):
+                fn(bench)
+
+    for result in bench.results:
+        unit = result.extra.get("unit")
+        value = f"{result.median:12,.0f} {unit}" if unit else _format_seconds(result.median)
+        print(f"{result.group + '.' + result.name:<60} {value}")  # noqa: T201
+
+    if args.json_path is not None:
+        payload = {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "results": [r.to_dict() for r in bench.results],
+        }
+        args.json_path.write_text(json.dumps(payload, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
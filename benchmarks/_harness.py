@@ -0,0 +1,116 @@
+"""Minimal timing harness shared by the ``bench_*`` modules.
+
+Deliberately dependency-free: ``time.perf_counter`` in a repeat/number loop,
+the same shape as :mod:`timeit`, with results collected into plain dataclasses
+so ``python -m benchmarks --json`` can dump them for cross-release comparison.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass, field
+import gc
+import statistics
+import time
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+@dataclass
+class BenchResult:
+    """Per-call timings (seconds) for one benchmark case."""
+
+    name: str
+    group: str
+    number: int
+    repeat: int
+    min: float
+    median: float
+    mean: float
+    max: float
+    extra: dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-serialisable dict of this result."""
+        return asdict(self)
+
+
+class Bench:
+    """Collects :class:`BenchResult` entries for one run of the suite."""
+
+    def __init__(self, pattern: str = "") -> None:
+        """Initialise with an optional substring filter on ``group.name``."""
+        self._pattern = pattern
+        self.results: list[BenchResult] = []
+
+    def wanted(self, group: str, name: str) -> bool:
+        """Return True when ``group.name`` matches the ``-k`` filter."""
+        return not self._pattern or self._pattern in f"{group}.{name}"
+
+    def run(
+        self,
+        group: str,
+        name: str,
+        fn: Callable[[], Any],
+        *,
+        number: int = 100,
+        repeat: int = 5,
+        setup: Callable[[], Any] | None = None,
+        extra: dict[str, Any] | None = None,
+    ) -> BenchResult | None:
+        """Time *fn* ``repeat`` times over ``number`` calls and record per-call stats.
+
+        *setup* runs before every repeat (outside the timed region), for cases
+        that consume their input.  GC is disabled inside the timed loop, as
+        :mod:`timeit` does, so collector pauses don't land on random samples.
+        """
+        if not self.wanted(group, name):
+            return None
+        fn()  # warm-up: first-call imports and caches stay out of the samples
+        samples: list[float] = []
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            gc_was_enabled = gc.isenabled()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                for _ in range(number):
+                    fn()
+                elapsed = time.perf_counter() - start
+            finally:
+                if gc_was_enabled:
+                    gc.enable()
+            samples.append(elapsed / number)
+        result = BenchResult(
+            name=name,
+            group=group,
+            number=number,
+            repeat=repeat,
+            min=min(samples),
+            median=statistics.median(samples),
+            mean=statistics.fmean(samples),
+            max=max(samples),
+            extra=dict(extra or {}),
+        )
+        self.results.append(result)
+        return result
+
+    def record(self, group: str, name: str, value: float, *, unit: str, extra: dict[str, Any] | None = None) -> None:
+        """Record a non-timing measurement (bytes, counts) alongside the timings."""
+        if not self.wanted(group, name):
+            return
+        self.results.append(
+            BenchResult(
+                name=name,
+                group=group,
+                number=1,
+                repeat=1,
+                min=value,
+                median=value,
+                mean=value,
+                max=value,
+                extra={"unit": unit, **(extra or {})},
+            )
+        )
@@ -0,0 +1,68 @@
+"""BluFi receive path: replay a checksummed fragment stream of a 40-frame map download.
+
+The stream is the ``toapp_get_commondata_ack`` frames of one area download,
+encoded and fragmented exactly as ``BleMessage.post_contains_data`` would
+send them.  ``crc_table_loop`` times the per-byte ``CRC_TB`` loop that
+``calc_crc`` used to run, over the same fragments.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import MagicMock
+
+from benchmarks.fixtures import AREA_HASH_BASE, commondata_message
+from pymammotion.bluetooth.ble_message import CRC_TB, FRAG_CONTENT_LEN, FRAG_LENGTH_PREFIX_LEN, MAX_DATA_LEN, BleMessage
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "blufi"
+MAP_FRAMES = 40
+
+
+def _fragment_stream(payloads: list[bytes]) -> list[bytes]:
+    """Split each payload into checksummed BluFi notifications, one sequence number per fragment."""
+    sender = BleMessage(MagicMock())
+    type_val = sender.getTypeValue(1, 19)
+    stream: list[bytes] = []
+    for data in payloads:
+        offset = 0
+        while offset < len(data):
+            remaining = len(data) - offset
+            if frag := remaining > MAX_DATA_LEN:
+                chunk = remaining.to_bytes(FRAG_LENGTH_PREFIX_LEN, "little") + data[offset : offset + FRAG_CONTENT_LEN]
+                offset += FRAG_CONTENT_LEN
+            else:
+                chunk = data[offset:]
+                offset = len(data)
+            sequence = sender.generate_send_sequence()
+            stream.append(sender.getPostBytes(type_val, False, True, False, frag, sequence, chunk))
+    return stream
+
+
+def _table_crc(initial: int, data: bytes) -> int:
+    crc = (~initial) & 0xFFFF
+    for byte in data:
+        crc = ((crc << 8) ^ CRC_TB[byte ^ (crc >> 8)]) & 0xFFFF
+    return (~crc) & 0xFFFF
+
+
+def bench_blufi(bench: Bench) -> None:
+    """Time parsing/reassembling the fragment stream and the CRC over it."""
+    payloads = [bytes(commondata_message(AREA_HASH_BASE, i + 1, MAP_FRAMES)) for i in range(MAP_FRAMES)]
+    stream = _fragment_stream(payloads)
+    extra = {"fragments": len(stream), "bytes": sum(len(p) for p in payloads)}
+
+    def _replay() -> None:
+        receiver = BleMessage(MagicMock())
+        for notification in stream:
+            if receiver.parseNotification(notification) == 0:
+                receiver.notification.getDataArray()
+                receiver.clear_notification()
+
+    bench.run(GROUP, "replay_map_download", _replay, number=5, extra=extra)
+
+    sections = [frame[4 : 4 + frame[3]] for frame in stream]
+    bench.run(GROUP, "crc_hqx", lambda: [BleMessage.calc_crc(0, s) for s in sections], number=20, extra=extra)
+    bench.run(GROUP, "crc_table_loop", lambda: [_table_crc(0, s) for s in sections], number=5, extra=extra)
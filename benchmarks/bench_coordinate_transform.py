@@ -0,0 +1,59 @@
+"""Local→lon/lat conversion and length/area stats: NumPy batch path vs per-point loop.
+
+Inputs come from ``tests/fixtures/hash_list_fixture.json``: the captured area
+ring as-is, and its mow path tiled out to the size of a full task's path.
+``loop`` cases force the pure-Python path by raising
+``GeojsonGenerator.VECTORISE_MIN_POINTS`` above the input size.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+from shapely.geometry import Point
+
+from benchmarks.fixtures import fixture_points, tiled
+from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from benchmarks._harness import Bench
+
+GROUP = "coordinate_transform"
+MOW_PATH_POINTS = 20_000
+
+
+def _both(bench: Bench, name: str, fn: Callable[[], object], number: int, extra: dict[str, int]) -> None:
+    bench.run(GROUP, f"{name}_numpy", fn, number=number, extra=extra)
+    threshold = GeojsonGenerator.VECTORISE_MIN_POINTS
+    GeojsonGenerator.VECTORISE_MIN_POINTS = sys.maxsize
+    try:
+        bench.run(GROUP, f"{name}_loop", fn, number=number, extra=extra)
+    finally:
+        GeojsonGenerator.VECTORISE_MIN_POINTS = threshold
+
+
+def bench_coordinate_transform(bench: Bench) -> None:
+    """Time coordinate conversion and stats on the fixture area and a tiled mow path."""
+    rtk = Point(-36.7395, 174.6252)
+    area = fixture_points("area")
+    mow_path = tiled(fixture_points("mow_path"), MOW_PATH_POINTS)
+
+    for label, points, number in (("area", area, 500), ("mow_path", mow_path, 5)):
+        extra = {"points": len(points)}
+        _both(
+            bench,
+            f"convert_{label}",
+            lambda points=points: GeojsonGenerator._convert_to_lonlat_coords(points, rtk, yaw=0.7),  # noqa: SLF001
+            number,
+            extra,
+        )
+        _both(
+            bench,
+            f"stats_{label}",
+            lambda points=points: GeojsonGenerator.map_object_stats(points, closed=True),
+            number,
+            extra,
+        )
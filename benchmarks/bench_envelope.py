@@ -0,0 +1,49 @@
+"""unwrap_envelope cost per inbound MQTT message, for both envelope shapes.
+
+``report`` wraps a small ``toapp_report_data`` push — the most frequent
+message — and ``map_frame`` a 200-point boundary frame, the largest one a map
+sync receives.  The Aliyun shape nests ``content`` under ``value``; the
+Mammotion shape carries it directly under ``params``.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from typing import TYPE_CHECKING
+
+from benchmarks.fixtures import AREA_HASH_BASE, commondata_message, report_data_message
+from pymammotion.transport.envelope import unwrap_envelope
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "envelope"
+_TOPIC = "/sys/bench/Luba-Bench/app/down/thing/events"
+
+
+def _envelopes(payload: bytes) -> dict[str, bytes]:
+    content = base64.b64encode(payload).decode()
+    return {
+        "aliyun": json.dumps(
+            {"method": "thing.events", "params": {"iotId": "bench-iot", "value": {"content": content}}}
+        ).encode(),
+        "mammotion": json.dumps({"params": {"iotId": "bench-iot", "content": content}}).encode(),
+    }
+
+
+def bench_envelope(bench: Bench) -> None:
+    """Time unwrap_envelope on report and map-frame payloads in both envelope shapes."""
+    for name, message in (
+        ("report", report_data_message()),
+        ("map_frame", commondata_message(AREA_HASH_BASE, 1, 4)),
+    ):
+        payload = bytes(message)
+        for shape, raw in _envelopes(payload).items():
+            bench.run(
+                GROUP,
+                f"unwrap_{name}_{shape}",
+                lambda raw=raw: unwrap_envelope(_TOPIC, raw),
+                number=2000,
+                extra={"payload_bytes": len(payload), "envelope_bytes": len(raw)},
+            )
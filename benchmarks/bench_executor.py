@@ -0,0 +1,77 @@
+"""Event-loop lag while a 60-area map's GeoJSON is rebuilt: on the loop vs on a ``MapExecutor``.
+
+Each case rebuilds the map view from scratch (no feature cache) five times
+while a :class:`LoopLagMonitor` samples the loop every 5 ms, and records the
+worst wake-up delay in microseconds — the stall every other device sees.
+
+The thread-pool figure is dominated by garbage collections that the build's
+allocations trigger: a full collection walks the whole map on whichever
+thread triggers it and holds the GIL while it does.  The process pool keeps
+those allocations out of the host process.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import TYPE_CHECKING
+
+from benchmarks.fixtures import large_map_device
+from pymammotion.utility.executor import ExecutorKind, LoopLagMonitor, MapExecutor
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from benchmarks._harness import Bench
+    from pymammotion.data.model.hash_list import HashList
+
+GROUP = "executor"
+_REBUILDS = 5
+
+
+async def _max_lag(build: Callable[[HashList], Awaitable[None]], hash_list: HashList) -> float:
+    monitor = LoopLagMonitor(interval=0.005, stall_threshold=1.0)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    for _ in range(_REBUILDS):
+        fresh = copy.copy(hash_list)
+        fresh._geojson_feature_cache = None  # noqa: SLF001
+        fresh.generated_geojson = {}
+        fresh._geojson_keys = {}  # noqa: SLF001
+        await build(fresh)
+        await asyncio.sleep(0.01)
+    await monitor.stop()
+    return monitor.stats().max_lag
+
+
+def bench_executor(bench: Bench) -> None:
+    """Record the worst loop lag of on-loop vs pooled GeoJSON rebuilds."""
+    device = large_map_device(areas=60)
+    hash_list = device.map
+    hash_list.set_geojson_origin(device.location.RTK, device.location.dock)
+    extra = {"areas": len(hash_list.area), "rebuilds": _REBUILDS}
+
+    async def _on_loop(fresh: HashList) -> None:
+        fresh._refresh_view("generated_geojson")  # noqa: SLF001
+
+    cases: list[tuple[str, Callable[[HashList], Awaitable[None]], MapExecutor | None]] = [
+        ("max_loop_lag_on_loop", _on_loop, None)
+    ]
+    for kind in ExecutorKind:
+        executor = MapExecutor(kind)
+
+        async def _pooled(fresh: HashList, executor: MapExecutor = executor) -> None:
+            await fresh.async_geojson("generated_geojson", executor)
+
+        cases.append((f"max_loop_lag_{kind.value}_pool", _pooled, executor))
+
+    for name, build, executor in cases:
+        if not bench.wanted(GROUP, name):
+            continue
+        if executor is not None:
+            # Start the pool outside the measured window.
+            asyncio.run(executor.run(len, ()))
+        lag = asyncio.run(_max_lag(build, hash_list))
+        if executor is not None:
+            executor.shutdown()
+        bench.record(GROUP, name, lag * 1e6, unit="µs", extra=extra)
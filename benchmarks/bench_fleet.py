@@ -0,0 +1,116 @@
+"""Client cost per device, measured against a fleet of virtual mowers.
+
+A real :class:`MammotionClient` is driven by
+:class:`~pymammotion.simulator.SimulatedFleet` over the in-process broker, so
+each figure covers the whole receive path — transport callback, handle,
+broker, reducer — with no network in the way:
+
+* heap held per registered device (``tracemalloc`` across the spawn);
+* telemetry frames the client absorbs per second, replayed from every mower;
+* wall time of one full map sync (hash list, names, every boundary frame).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import TYPE_CHECKING
+
+from pymammotion.client import MammotionClient
+from pymammotion.simulator import SimulatedFleet, synthetic_map
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+    from pymammotion.device.handle import DeviceHandle
+    from pymammotion.simulator import SimulatedMap
+
+GROUP = "fleet"
+_DEVICES = 200
+_TELEMETRY_ROUNDS = 5
+_MAP_SYNCS = 10
+
+
+async def _memory_per_device(sim_map: SimulatedMap) -> float:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        await fleet.spawn(_DEVICES, sim_map)
+        # Let each handle's connect-time traffic settle before sampling.
+        await asyncio.sleep(0.1)
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+        await fleet.stop()
+        await client.stop()
+    return (after - before) / _DEVICES
+
+
+async def _telemetry_rate(sim_map: SimulatedMap) -> float:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    try:
+        mowers = await fleet.spawn(_DEVICES, sim_map)
+        await asyncio.sleep(0.1)
+        # Record the frames first so the mowers' own serialisation stays out of the timing.
+        frames: list[tuple[str, bytes]] = []
+        for mower in mowers:
+            publish = mower.publish
+
+            async def _capture(payload: bytes, iot_id: str = mower.iot_id) -> None:
+                frames.append((iot_id, payload))
+
+            mower.publish = _capture
+            for _ in range(_TELEMETRY_ROUNDS):
+                await mower.emit_telemetry()
+            mower.publish = publish
+        start = time.perf_counter()
+        for iot_id, payload in frames:
+            await fleet.transport.deliver(iot_id, payload)
+        elapsed = time.perf_counter() - start
+    finally:
+        await fleet.stop()
+        await client.stop()
+    return len(frames) / elapsed
+
+
+def _synced(handle: DeviceHandle, expected: set[int]) -> bool:
+    raw_map = handle.snapshot.raw.map
+    return not handle.queue.is_saga_active and set(raw_map.area) | set(raw_map.obstacle) == expected
+
+
+async def _map_sync_latency(sim_map: SimulatedMap) -> float:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    samples = []
+    try:
+        mowers = await fleet.spawn(_MAP_SYNCS, sim_map)
+        expected = set(sim_map.root_hashes)
+        for mower in mowers:
+            handle = client.mower(mower.device_name)
+            start = time.perf_counter()
+            await client.start_map_sync(mower.device_name)
+            while not _synced(handle, expected):  # noqa: ASYNC110 — map_updated fires before the last boundary frame
+                await asyncio.sleep(0.001)
+            samples.append(time.perf_counter() - start)
+    finally:
+        await fleet.stop()
+        await client.stop()
+    return statistics.median(samples)
+
+
+def bench_fleet(bench: Bench) -> None:
+    """Record heap per device, telemetry throughput and map-sync latency."""
+    sim_map = synthetic_map(areas=10, frames_per_area=2, obstacles=2)
+    extra = {"devices": _DEVICES, "areas": len(sim_map.names), "hashes": len(sim_map.root_hashes)}
+    if bench.wanted(GROUP, "memory_per_device"):
+        bench.record(GROUP, "memory_per_device", asyncio.run(_memory_per_device(sim_map)), unit="B", extra=extra)
+    if bench.wanted(GROUP, "telemetry_frames_per_s"):
+        rate = asyncio.run(_telemetry_rate(sim_map))
+        bench.record(GROUP, "telemetry_frames_per_s", rate, unit="frames/s", extra=extra)
+    if bench.wanted(GROUP, "map_sync_latency"):
+        latency = asyncio.run(_map_sync_latency(sim_map))
+        bench.record(GROUP, "map_sync_latency", latency * 1e3, unit="ms", extra={**extra, "devices": _MAP_SYNCS})
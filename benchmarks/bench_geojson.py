@@ -0,0 +1,73 @@
+"""Map GeoJSON regeneration on a 60-area map: full rebuild vs one edited obstacle.
+
+``full_rebuild`` discards the per-hash feature cache before every call, which is
+what every regeneration cost before the cache existed.  ``record_inputs`` is
+what a report pays for the views, and ``memoised_read`` a read of a built
+view.  ``mow_progress`` builds the remaining-path collection for
+a 60-line cover path with the mower half way along the first line.
+"""
+
+from __future__ import annotations
+
+from itertools import cycle
+from typing import TYPE_CHECKING
+
+from shapely.geometry import Point
+
+from benchmarks.fixtures import LINE_HASH_BASE, OBSTACLE_HASH_BASE, add_mow_path, comm_frames, large_map_device
+from pymammotion.data.model.generate_geojson import GeojsonGenerator
+from pymammotion.data.model.hash_list import FrameList, PathType
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "geojson"
+
+
+def bench_geojson(bench: Bench) -> None:
+    """Time HashList.generate_geojson with and without the per-hash cache, and mow-progress generation."""
+    device = large_map_device(areas=60)
+    hash_list = device.map
+    rtk, dock = device.location.RTK, device.location.dock
+    extra = {"areas": len(hash_list.area), "obstacles": len(hash_list.obstacle)}
+
+    def _full() -> None:
+        hash_list._geojson_feature_cache = None  # noqa: SLF001
+        hash_list.generate_geojson(rtk, dock)
+
+    bench.run(GROUP, "full_rebuild_60_areas", _full, number=5, extra=extra)
+
+    # Alternate one obstacle between two shapes, copy-on-write as HashList.update does.
+    edited = OBSTACLE_HASH_BASE
+    shapes = cycle(
+        [
+            FrameList(total_frame=1, data=comm_frames(edited, PathType.OBSTACLE, points, 1))
+            for points in ([(0.0, 0.0), (3.0, 0.0), (3.0, 3.0)], [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0)])
+        ]
+    )
+
+    def _one_obstacle_edit() -> None:
+        hash_list.obstacle = {**hash_list.obstacle, edited: next(shapes)}
+        hash_list.generate_geojson(rtk, dock)
+
+    hash_list.generate_geojson(rtk, dock)
+    bench.run(GROUP, "one_obstacle_edit_60_areas", _one_obstacle_edit, number=20, extra=extra)
+
+    bench.run(
+        GROUP,
+        "record_inputs_per_report",
+        lambda: (hash_list.set_geojson_origin(rtk, dock), hash_list.set_mow_progress(10, 0, 0, 0)),
+        number=10000,
+        extra=extra,
+    )
+    bench.run(GROUP, "memoised_read_60_areas", lambda: hash_list.generated_geojson, number=10000, extra=extra)
+
+    add_mow_path(device, lines=60, points_per_line=400)
+    rtk_point = Point(rtk.latitude, rtk.longitude)
+    bench.run(
+        GROUP,
+        "mow_progress_60_lines",
+        lambda: GeojsonGenerator.generate_mow_progress_geojson(hash_list, 200, rtk_point, ub_path_hash=LINE_HASH_BASE),
+        number=20,
+        extra={"lines": 60, "points": 60 * 400},
+    )
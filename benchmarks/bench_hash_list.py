@@ -0,0 +1,59 @@
+"""HashList bookkeeping on a 60-area map: storing frames and asking what is still missing.
+
+``update_full_map`` replays a whole map download into an empty HashList —
+every boundary frame of every hash, in sync order, and
+``update_and_find_incomplete`` asks what is still missing after every frame,
+as the map saga does.  ``find_incomplete`` asks that question of a map that is
+complete and of one whose last area stopped half way.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+from benchmarks.fixtures import AREA_HASH_BASE, area_points, comm_frames, large_map_device
+from pymammotion.data.model.hash_list import HashList, PathType
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+    from pymammotion.data.model.hash_list import NavGetCommData
+
+GROUP = "hash_list"
+
+
+def bench_hash_list(bench: Bench) -> None:
+    """Time HashList.update over a full download and find_incomplete_hashes on complete/partial maps."""
+    device = large_map_device(areas=60)
+    complete = device.map
+    frames: list[NavGetCommData] = [
+        frame
+        for target in (complete.area, complete.obstacle)
+        for frame_list in target.values()
+        for frame in frame_list.data
+    ]
+    extra = {"areas": len(complete.area), "obstacles": len(complete.obstacle), "frames": len(frames)}
+
+    def _download() -> None:
+        hash_list = HashList(root_hash_lists=complete.root_hash_lists)
+        for frame in frames:
+            hash_list.update(frame)
+
+    bench.run(GROUP, "update_full_map_60_areas", _download, number=5, extra=extra)
+
+    def _download_asking() -> None:
+        # The map saga's loop: store a frame, then ask what is still missing.
+        hash_list = HashList(root_hash_lists=complete.root_hash_lists)
+        for frame in frames:
+            hash_list.update(frame)
+            hash_list.find_incomplete_hashes(0)
+
+    bench.run(GROUP, "update_and_find_incomplete_60_areas", _download_asking, number=5, extra=extra)
+
+    bench.run(GROUP, "find_incomplete_complete_60_areas", complete.find_incomplete_hashes, number=200, extra=extra)
+
+    partial = copy.copy(complete)
+    last_area = AREA_HASH_BASE + len(complete.area) - 1
+    partial.area = {k: v for k, v in complete.area.items() if k != last_area}
+    partial.update(comm_frames(last_area, PathType.AREA, area_points(len(complete.area) - 1, 800), 4)[0])
+    bench.run(GROUP, "find_incomplete_partial_60_areas", partial.find_incomplete_hashes, number=200, extra=extra)
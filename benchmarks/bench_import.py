@@ -0,0 +1,53 @@
+"""Cold-start cost: ``python -X importtime`` totals for the package and the client.
+
+Each case imports one module in a fresh interpreter and records the
+cumulative import time ``-X importtime`` reports for it, in microseconds —
+the median of a few runs, since a single cold import is noisy.  The module
+count the import leaves in ``sys.modules`` goes into the extras, so a lazy
+subpackage turning eager shows up even when the time hides in the noise.
+"""
+
+from __future__ import annotations
+
+import json
+import statistics
+import subprocess
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "import"
+_RUNS = 3
+_MODULES = ("pymammotion", "pymammotion.http.http", "pymammotion.client")
+
+
+def _cold_import(module: str) -> tuple[int, int]:
+    """Return the cumulative import time (µs) of *module* and the number of modules loaded."""
+    code = f"import sys; import {module}; print(len(sys.modules))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    for line in reversed(result.stderr.splitlines()):
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        if name.strip() == module:
+            return int(cumulative_us), json.loads(result.stdout)
+    msg = f"{module} missing from -X importtime output"
+    raise RuntimeError(msg)
+
+
+def bench_import(bench: Bench) -> None:
+    """Record the cold import time of the package entry points."""
+    for module in _MODULES:
+        name = f"cold_import_{module.removeprefix('pymammotion').lstrip('.').replace('.', '_') or 'package'}"
+        if not bench.wanted(GROUP, name):
+            continue
+        runs = [_cold_import(module) for _ in range(_RUNS)]
+        bench.record(
+            GROUP,
+            name,
+            statistics.median(us for us, _ in runs),
+            unit="µs",
+            extra={"module": module, "modules_loaded": runs[0][1], "runs": _RUNS},
+        )
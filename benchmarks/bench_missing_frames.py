@@ -0,0 +1,48 @@
+"""Missing-frame bookkeeping over one large cover-path download.
+
+Replays what ``MowPathSaga`` does per ``cover_path_upload`` frame — store it,
+then ask how many frames are still missing.  ``set_rebuild`` is the previous
+per-frame query, which rebuilt ``set(range(1, total + 1))`` per transaction.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pymammotion.data.model.hash_list import HashList, MowPath
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from benchmarks._harness import Bench
+
+GROUP = "missing_frames"
+TRANSACTIONS = 4
+FRAMES = 500
+
+
+def _set_rebuild_count(hash_list: HashList) -> int:
+    count = 0
+    for frames_by_index in hash_list.current_mow_path.values():
+        total = next(iter(frames_by_index.values())).total_frame
+        count += len(set(range(1, total + 1)) - set(frames_by_index))
+    return count
+
+
+def bench_missing_frames(bench: Bench) -> None:
+    """Time a full path download with the bitmap count and with the set rebuild."""
+    paths = [
+        MowPath(transaction_id=tx, current_frame=frame, total_frame=FRAMES)
+        for tx in range(TRANSACTIONS)
+        for frame in range(1, FRAMES + 1)
+    ]
+    extra = {"transactions": TRANSACTIONS, "frames": len(paths)}
+
+    def _download(count: Callable[[HashList], int]) -> None:
+        hash_list = HashList()
+        for path in paths:
+            hash_list.update_mow_path(path)
+            count(hash_list)
+
+    bench.run(GROUP, "bitmap_count", lambda: _download(HashList.missing_mow_path_frame_count), number=3, extra=extra)
+    bench.run(GROUP, "set_rebuild", lambda: _download(_set_rebuild_count), number=1, extra=extra)
@@ -0,0 +1,33 @@
+"""LubaMsg tag peek vs full parse over a corpus of encoded inbound frames.
+
+The corpus mirrors one map download (40 ``toapp_get_commondata_ack`` frames)
+and the report pushes that arrive alongside it.  ``full_parse`` is what
+``DeviceHandle.on_raw_message`` always paid before knowing the frame type.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.fixtures import AREA_HASH_BASE, commondata_message, report_data_message
+from pymammotion.messaging.peek import peek_luba_msg
+from pymammotion.proto import LubaMsg
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "peek"
+MAP_FRAMES = 40
+REPORTS = 40
+
+
+def bench_peek(bench: Bench) -> None:
+    """Time peek_luba_msg and LubaMsg().parse over map frames and report pushes."""
+    corpora = {
+        "map_frames": [bytes(commondata_message(AREA_HASH_BASE, i + 1, MAP_FRAMES)) for i in range(MAP_FRAMES)],
+        "report_data": [bytes(report_data_message(battery=i)) for i in range(REPORTS)],
+    }
+    for name, corpus in corpora.items():
+        extra = {"frames": len(corpus), "bytes": sum(len(p) for p in corpus)}
+        bench.run(GROUP, f"peek_{name}", lambda c=corpus: [peek_luba_msg(p) for p in c], number=20, extra=extra)
+        bench.run(GROUP, f"full_parse_{name}", lambda c=corpus: [LubaMsg().parse(p) for p in c], number=3, extra=extra)
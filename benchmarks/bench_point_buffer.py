@@ -0,0 +1,64 @@
+"""Memory held by one large map's points: PointBuffer vs the old ``list[CommDataCouple]``.
+
+``list`` cases rebuild every stored point sequence as the plain list of
+``CommDataCouple`` objects the models used to hold, so both figures cover the
+same points.  Sizes come from ``tracemalloc`` and are recorded in bytes.
+"""
+
+from __future__ import annotations
+
+import copy
+import tracemalloc
+from typing import TYPE_CHECKING, Any
+
+from benchmarks.fixtures import fixture_points, large_map_device, tiled
+from pymammotion.data.model.hash_list import NavGetCommData
+from pymammotion.data.model.point_buffer import PointBuffer
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from benchmarks._harness import Bench
+
+GROUP = "point_buffer"
+DYNAMICS_LINE_POINTS = 20_000
+
+
+def _traced_bytes(build: Callable[[], Any]) -> int:
+    """Return the bytes still allocated by *build*'s result once it returns."""
+    tracemalloc.start()
+    try:
+        before, _ = tracemalloc.get_traced_memory()
+        kept = build()
+        after, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del kept
+    return after - before
+
+
+def bench_point_buffer(bench: Bench) -> None:
+    """Record per-device point memory for both layouts and time a map deepcopy."""
+    device = large_map_device(areas=60)
+    hash_list = device.map
+    hash_list.update_dynamics_line(tiled(fixture_points("mow_path"), DYNAMICS_LINE_POINTS))
+    sequences = [
+        frame.data_couple
+        for frame_list in (*hash_list.area.values(), *hash_list.obstacle.values())
+        for frame in frame_list.data
+        if isinstance(frame, NavGetCommData)
+    ]
+    sequences.append(hash_list.dynamics_line)
+    extra = {"points": sum(len(seq) for seq in sequences), "sequences": len(sequences)}
+
+    bench.record(
+        GROUP,
+        "device_points_buffer",
+        _traced_bytes(lambda: [PointBuffer.from_coords(seq.coords) for seq in sequences]),
+        unit="bytes",
+        extra=extra,
+    )
+    bench.record(
+        GROUP, "device_points_list", _traced_bytes(lambda: [list(seq) for seq in sequences]), unit="bytes", extra=extra
+    )
+    bench.run(GROUP, "deepcopy_map_60_areas", lambda: copy.deepcopy(hash_list), number=5, extra=extra)
@@ -0,0 +1,60 @@
+"""Protobuf → model conversion: direct ``from_proto`` vs the ``from_dict(to_dict())`` round trip.
+
+Frames are decoded once up front; only the model conversion the reducer
+does per frame is timed.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import betterproto2
+
+from benchmarks.fixtures import AREA_HASH_BASE, commondata_message, report_data_message
+from pymammotion.data.model.hash_list import NavGetCommData
+from pymammotion.data.model.proto_convert import from_proto
+from pymammotion.data.model.report_info import ReportData
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "proto_convert"
+MAP_FRAMES = 40
+REPORTS = 40
+
+
+def _dict_report(acks: list) -> None:
+    # The pre-from_proto body of ReportData.update for the fields these pushes carry.
+    for ack in acks:
+        data = ReportData()
+        data.dev = type(data.dev).from_dict(ack.dev.to_dict(casing=betterproto2.Casing.SNAKE))
+        data.rtk = type(data.rtk).from_dict(ack.rtk.to_dict(casing=betterproto2.Casing.SNAKE))
+
+
+def bench_proto_convert(bench: Bench) -> None:
+    """Time from_proto against the dict round trip for map frames and report pushes."""
+    frames = [
+        commondata_message(AREA_HASH_BASE, i + 1, MAP_FRAMES).nav.toapp_get_commondata_ack for i in range(MAP_FRAMES)
+    ]
+    extra = {"frames": MAP_FRAMES, "points": sum(len(f.data_couple) for f in frames)}
+    bench.run(
+        GROUP,
+        "from_proto_map_frames",
+        lambda: [from_proto(NavGetCommData, f) for f in frames],
+        number=10,
+        extra=extra,
+    )
+    bench.run(
+        GROUP,
+        "dict_round_trip_map_frames",
+        lambda: [NavGetCommData.from_dict(f.to_dict(casing=betterproto2.Casing.SNAKE)) for f in frames],
+        number=3,
+        extra=extra,
+    )
+
+    reports = [report_data_message(battery=i).sys.toapp_report_data for i in range(REPORTS)]
+    extra = {"frames": REPORTS}
+    bench.run(
+        GROUP, "from_proto_report_data", lambda: [ReportData().update(r) for r in reports], number=20, extra=extra
+    )
+    bench.run(GROUP, "dict_round_trip_report_data", lambda: _dict_report(reports), number=20, extra=extra)
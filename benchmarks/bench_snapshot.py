@@ -0,0 +1,36 @@
+"""Persisting a 60-area mower: binary snapshot vs the JSON ``to_jsonb`` path.
+
+The device carries its generated map GeoJSON, as a live one does — the JSON
+path writes it out, the snapshot leaves it to be rebuilt.  Sizes are recorded
+in bytes; ``load`` cases include rebuilding the ``MowerDevice``.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import orjson
+
+from benchmarks.fixtures import large_map_device
+from pymammotion.data.model.device import MowerDevice
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "snapshot"
+
+
+def bench_snapshot(bench: Bench) -> None:
+    """Record encoded size and time save/load for both formats."""
+    device = large_map_device(areas=60)
+    device.map.generate_geojson(device.location.RTK, device.location.dock)
+    snapshot = device.to_snapshot_bytes()
+    json_bytes = device.to_jsonb()
+    extra = {"areas": len(device.map.area), "obstacles": len(device.map.obstacle)}
+
+    bench.record(GROUP, "size_snapshot", len(snapshot), unit="bytes", extra=extra)
+    bench.record(GROUP, "size_json", len(json_bytes), unit="bytes", extra=extra)
+    bench.run(GROUP, "save_snapshot", device.to_snapshot_bytes, number=5, extra=extra)
+    bench.run(GROUP, "save_json", device.to_jsonb, number=5, extra=extra)
+    bench.run(GROUP, "load_snapshot", lambda: MowerDevice.from_snapshot_bytes(snapshot), number=5, extra=extra)
+    bench.run(GROUP, "load_json", lambda: MowerDevice.from_dict(orjson.loads(json_bytes)), number=5, extra=extra)
@@ -0,0 +1,53 @@
+"""DeviceStateMachine._diff cost per reduced frame on a 60-area device.
+
+Each case diffs the snapshot before a frame against the one after it, as
+``DeviceStateMachine.apply`` does on every message.  ``written`` narrows the
+walk to the reducer's :attr:`~pymammotion.device.state_reducer.StateReducer.last_writes`;
+``all_fields`` starts from every top-level device field, which is what a
+caller without write tracking (properties, events) pays.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from benchmarks.fixtures import cover_path_message, large_map_device, rapid_state_message, report_data_message
+from pymammotion.device.state_reducer import MowerStateReducer
+from pymammotion.state.device_state import DeviceAvailability, DeviceStateMachine
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "state_machine"
+
+
+def bench_state_machine(bench: Bench) -> None:
+    """Time _diff after report, rapid-state and cover-path frames, with and without write tracking."""
+    device = large_map_device(areas=60)
+    reducer = MowerStateReducer(is_saga_active=lambda: False)
+    machine = DeviceStateMachine("Luba-Bench", device)
+    old = machine.current
+    extra = {"areas": len(device.map.area)}
+
+    for name, message in (
+        ("report_data", report_data_message(battery=42)),
+        ("rapid_state", rapid_state_message(tick=17)),
+        ("cover_path", cover_path_message(0, 1, 60)),
+    ):
+        updated = reducer.apply(device, message)
+        written = reducer.last_writes
+        new = machine._make_snapshot(updated, DeviceAvailability())  # noqa: SLF001
+        bench.run(
+            GROUP,
+            f"diff_{name}_written",
+            lambda new=new, written=written: machine._diff(old, new, written),  # noqa: SLF001
+            number=500,
+            extra={**extra, "written": sorted(written or ())},
+        )
+        bench.run(
+            GROUP,
+            f"diff_{name}_all_fields",
+            lambda new=new: machine._diff(old, new),  # noqa: SLF001
+            number=100,
+            extra=extra,
+        )
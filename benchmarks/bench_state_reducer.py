@@ -0,0 +1,60 @@
+"""Per-frame MowerStateReducer cost on a 60-area map, per sub-message type.
+
+``legacy_deepcopy_map`` times the ``copy.deepcopy(current.map)`` the reducer
+used to pay on every nav message, for comparison with the copy-on-write path.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import TYPE_CHECKING
+
+from benchmarks.fixtures import (
+    AREA_HASH_BASE,
+    area_points,
+    comm_frames,
+    commondata_message,
+    cover_path_message,
+    hash_list_message,
+    large_map_device,
+    rapid_state_message,
+    report_data_message,
+)
+from pymammotion.data.model.hash_list import PathType
+from pymammotion.device.state_reducer import MowerStateReducer
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "state_reducer"
+
+
+def bench_state_reducer(bench: Bench) -> None:
+    """Time reducer.apply for map, hash-list, cover-path, rapid-state and report frames on a 60-area device."""
+    device = large_map_device(areas=60)
+    # Saga active, as during a real map fetch.
+    reducer = MowerStateReducer(is_saga_active=lambda: True)
+    extra = {"areas": 60, "points": sum(len(f.data_couple) for fl in device.map.area.values() for f in fl.data)}
+
+    # Re-delivers frame 2 of a 3-frame hash that already holds frame 1 — the
+    # common mid-sync case.  Input is never mutated, so every call does equal work.
+    partial = copy.copy(device)
+    partial.map = copy.copy(device.map)
+    partial.map.update(comm_frames(AREA_HASH_BASE + 999, PathType.AREA, area_points(999, 600), 3)[0])
+    frame_msg = commondata_message(AREA_HASH_BASE + 999, 2, 3)
+    bench.run(GROUP, "commondata_frame_60_areas", lambda: reducer.apply(partial, frame_msg), number=200, extra=extra)
+
+    report_msg = report_data_message()
+    bench.run(GROUP, "report_data_60_areas", lambda: reducer.apply(device, report_msg), number=500, extra=extra)
+
+    rapid_msg = rapid_state_message()
+    bench.run(GROUP, "rapid_state_60_areas", lambda: reducer.apply(device, rapid_msg), number=500, extra=extra)
+
+    root_hashes = [h for rl in device.map.root_hash_lists for obj in rl.data for h in obj.data_couple]
+    hash_msg = hash_list_message(root_hashes)
+    bench.run(GROUP, "gethash_ack_60_areas", lambda: reducer.apply(device, hash_msg), number=200, extra=extra)
+
+    cover_msg = cover_path_message(0, 1, 60)
+    bench.run(GROUP, "cover_path_frame_60_areas", lambda: reducer.apply(device, cover_msg), number=200, extra=extra)
+
+    bench.run(GROUP, "legacy_deepcopy_map_60_areas", lambda: copy.deepcopy(device.map), number=5, extra=extra)
@@ -0,0 +1,89 @@
+"""Aliyun Tea request latency with and without the keep-alive session pool.
+
+A local aiohttp HTTPS server with a self-signed certificate stands in for
+the API gateway.  The unpooled case is ``TeaCore.async_do_action`` as it ran
+before the pool — fresh SSL context, certifi bundle parse, connector, session
+and TLS handshake per request — with certifi pointed at a copy of the real
+bundle plus the stand-in's certificate so the parse cost stays realistic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+import ssl
+import tempfile
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+from aiohttp import web
+import certifi
+from Tea.request import TeaRequest
+
+from benchmarks.fixtures import self_signed_cert
+from pymammotion.aliyun.tea.core import TeaCore
+from pymammotion.aliyun.tea.session_pool import TeaSessionPool
+
+if TYPE_CHECKING:
+    from benchmarks._harness import Bench
+
+GROUP = "tea_session_pool"
+
+
+async def _invoke(_request: web.Request) -> web.Response:
+    return web.json_response({"code": 200, "data": {"messageId": "bench"}})
+
+
+def _tea_request(port: int) -> TeaRequest:
+    request = TeaRequest()
+    request.protocol = "https"
+    request.method = "POST"
+    request.port = port
+    request.pathname = "/thing/service/invoke"
+    request.headers = {"host": "127.0.0.1", "content-type": "application/octet-stream"}
+    request.body = '{"id": "bench", "params": {}}'
+    return request
+
+
+def bench_tea_session_pool(bench: Bench) -> None:
+    """Time one invoke round trip against a local HTTPS stand-in, pooled vs. per-request session."""
+    if not (bench.wanted(GROUP, "per_request_session") or bench.wanted(GROUP, "pooled_session")):
+        return
+    loop = asyncio.new_event_loop()
+    with tempfile.TemporaryDirectory() as tmp:
+        cert, key = self_signed_cert(Path(tmp))
+        bundle = Path(tmp) / "bundle.pem"
+        bundle.write_bytes(Path(certifi.where()).read_bytes() + cert.read_bytes())
+
+        server_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        server_ctx.load_cert_chain(cert, key)
+        app = web.Application()
+        app.router.add_post("/thing/service/invoke", _invoke)
+        runner = web.AppRunner(app, access_log=None)
+        loop.run_until_complete(runner.setup())
+        site = web.TCPSite(runner, "127.0.0.1", 0, ssl_context=server_ctx)
+        loop.run_until_complete(site.start())
+        port = runner.addresses[0][1]
+
+        client_ctx = ssl.create_default_context(cafile=str(bundle))
+        pool = TeaSessionPool(ssl_context=client_ctx)
+        try:
+            with patch("pymammotion.aliyun.tea.core.certifi.where", return_value=str(bundle)):
+                bench.run(
+                    GROUP,
+                    "per_request_session",
+                    lambda: loop.run_until_complete(TeaCore.async_do_action(_tea_request(port))),
+                    number=20,
+                )
+            result = bench.run(
+                GROUP,
+                "pooled_session",
+                lambda: loop.run_until_complete(TeaCore.async_do_action(_tea_request(port), pool=pool)),
+                number=200,
+            )
+            if result is not None:
+                result.extra["sessions_opened"] = pool.stats.sessions_opened
+        finally:
+            loop.run_until_complete(pool.close())
+            loop.run_until_complete(runner.cleanup())
+            loop.close()
@@ -0,0 +1,281 @@
+"""Deterministic synthetic devices and frames for the benchmark modules.
+
+Everything here is a pure function of its arguments — no RNG, no clock — so
+two runs on the same machine measure the same work.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from pathlib import Path
+
+from pymammotion.data.model.device import MowerDevice
+from pymammotion.data.model.hash_list import (
+    CommDataCouple,
+    MowPath,
+    MowPathPacket,
+    NavGetCommData,
+    NavGetHashListData,
+    PathType,
+)
+from pymammotion.proto import (
+    CommDataCouple as CommDataCoupleProto,
+    CoverPathPacketT,
+    CoverPathUploadT,
+    LubaMsg,
+    MctlNav,
+    MctlSys,
+    NavGetCommDataAck,
+    NavGetHashListAck,
+    ReportInfoData,
+    RptDevStatus,
+    RptRtk,
+    SystemTardStateTunnelMsg,
+)
+
+#: Real device capture shared with the unit tests (two area frames, two mow-path frames).
+HASH_LIST_FIXTURE = Path(__file__).parents[1] / "tests" / "fixtures" / "hash_list_fixture.json"
+
+AREA_HASH_BASE = 1_000_000
+OBSTACLE_HASH_BASE = 2_000_000
+LINE_HASH_BASE = 3_000_000
+
+
+def _ring(cx: float, cy: float, radius: float, count: int, phase: int) -> list[tuple[float, float]]:
+    """Return *count* points on a slightly wobbly ring — enough shape to defeat dedup shortcuts."""
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = radius * (1.0 + 0.05 * math.sin(7 * angle + phase))
+        points.append((cx + r * math.cos(angle), cy + r * math.sin(angle)))
+    return points
+
+
+def area_points(index: int, count: int) -> list[tuple[float, float]]:
+    """Boundary points (metres, device frame) for synthetic area *index*."""
+    return _ring(cx=(index % 10) * 40.0, cy=(index // 10) * 40.0, radius=15.0, count=count, phase=index)
+
+
+def comm_frames(hash_id: int, type_code: int, points: list[tuple[float, float]], frames: int) -> list[NavGetCommData]:
+    """Split *points* across *frames* NavGetCommData frames for one hash."""
+    per_frame = math.ceil(len(points) / frames)
+    return [
+        NavGetCommData(
+            pver=1,
+            action=8,
+            type=type_code,
+            hash=hash_id,
+            total_frame=frames,
+            current_frame=frame + 1,
+            data_len=len(chunk),
+            data_couple=[CommDataCouple(x=x, y=y) for x, y in chunk],
+        )
+        for frame in range(frames)
+        if (chunk := points[frame * per_frame : (frame + 1) * per_frame])
+    ]
+
+
+def fixture_points(kind: str = "area") -> list[CommDataCouple]:
+    """Return the *kind* (``"area"`` or ``"mow_path"``) points from :data:`HASH_LIST_FIXTURE`, in order."""
+    raw = json.loads(HASH_LIST_FIXTURE.read_text())
+    if kind == "area":
+        couples = [c for frame in raw["area_frames"] for c in frame["data_couple"]]
+    else:
+        couples = [c for frame in raw["mow_path_frames"] for p in frame["path_packets"] for c in p["data_couple"]]
+    return [CommDataCouple(x=c["x"], y=c["y"]) for c in couples]
+
+
+def tiled(points: list[CommDataCouple], count: int, step: float = 0.5) -> list[CommDataCouple]:
+    """Repeat *points*, shifting each copy by *step* metres, until there are *count* of them."""
+    out: list[CommDataCouple] = []
+    shift = 0.0
+    while len(out) < count:
+        out.extend(CommDataCouple(x=p.x + shift, y=p.y) for p in points)
+        shift += step
+    return out[:count]
+
+
+def large_map_device(
+    areas: int = 60, frames_per_area: int = 4, points_per_frame: int = 200, obstacles: int = 20
+) -> MowerDevice:
+    """Return a MowerDevice whose map holds *areas* complete areas plus *obstacles* obstacles.
+
+    The default (60 areas x 4 frames x 200 points) is in the range of the
+    largest real maps seen in issue reports.
+    """
+    device = MowerDevice(name="Luba-Bench")
+    device.location.RTK.latitude = math.radians(52.0)
+    device.location.RTK.longitude = math.radians(4.0)
+    area_hashes = [AREA_HASH_BASE + i for i in range(areas)]
+    obstacle_hashes = [OBSTACLE_HASH_BASE + i for i in range(obstacles)]
+    device.map.update_root_hash_list(
+        NavGetHashListData(
+            pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=[*area_hashes, *obstacle_hashes]
+        )
+    )
+    for i, hash_id in enumerate(area_hashes):
+        for frame in comm_frames(
+            hash_id, PathType.AREA, area_points(i, frames_per_area * points_per_frame), frames_per_area
+        ):
+            device.map.update(frame)
+    for i, hash_id in enumerate(obstacle_hashes):
+        points = _ring(cx=(i % 10) * 40.0 + 5.0, cy=(i // 10) * 40.0, radius=2.0, count=32, phase=i)
+        for frame in comm_frames(hash_id, PathType.OBSTACLE, points, 1):
+            device.map.update(frame)
+    return device
+
+
+def zigzag_points(index: int, count: int) -> list[tuple[float, float]]:
+    """Cover-path points (metres) sweeping back and forth across synthetic area *index*."""
+    cx, cy = (index % 10) * 40.0, (index // 10) * 40.0
+    return [(cx - 10.0 + 20.0 * i / count, cy + (5.0 if i % 2 else -5.0)) for i in range(count)]
+
+
+def add_mow_path(device: MowerDevice, lines: int, points_per_line: int = 400, transaction_id: int = 1) -> None:
+    """Give *device* a downloaded cover path of *lines* lines, one ``MowPath`` frame each.
+
+    Line *i* sweeps area *i*, and the sub_cmd 3 hash list is set to mowing order.
+    """
+    line_hashes = [LINE_HASH_BASE + i for i in range(lines)]
+    device.map.update_root_hash_list(
+        NavGetHashListData(pver=1, sub_cmd=3, total_frame=1, current_frame=1, data_couple=line_hashes)
+    )
+    for i, line_hash in enumerate(line_hashes):
+        device.map.update_mow_path(
+            MowPath(
+                pver=1,
+                sub_cmd=3,
+                total_frame=lines,
+                current_frame=i + 1,
+                total_path_num=1,
+                valid_path_num=1,
+                transaction_id=transaction_id,
+                path_packets=[
+                    MowPathPacket(
+                        path_hash=line_hash,
+                        path_total=1,
+                        path_cur=1,
+                        zone_hash=AREA_HASH_BASE + i,
+                        data_couple=[CommDataCouple(x=x, y=y) for x, y in zigzag_points(i, points_per_line)],
+                    )
+                ],
+            )
+        )
+
+
+def commondata_message(hash_id: int, current_frame: int, total_frame: int, points: int = 200) -> LubaMsg:
+    """Return a ``toapp_get_commondata_ack`` LubaMsg carrying one area frame."""
+    coords = _ring(cx=0.0, cy=0.0, radius=10.0, count=points, phase=current_frame)
+    return LubaMsg(
+        nav=MctlNav(
+            toapp_get_commondata_ack=NavGetCommDataAck(
+                pver=1,
+                action=8,
+                type=PathType.AREA,
+                hash=hash_id,
+                total_frame=total_frame,
+                current_frame=current_frame,
+                data_len=points,
+                data_couple=[CommDataCoupleProto(x=x, y=y) for x, y in coords],
+            )
+        )
+    )
+
+
+def report_data_message(battery: int = 80) -> LubaMsg:
+    """Return a minimal ``toapp_report_data`` LubaMsg (battery + RTK), the most frequent push."""
+    return LubaMsg(
+        sys=MctlSys(
+            toapp_report_data=ReportInfoData(
+                dev=RptDevStatus(sys_status=13, battery_val=battery),
+                rtk=RptRtk(status=4, gps_stars=25),
+            )
+        )
+    )
+
+
+def rapid_state_message(tick: int = 0) -> LubaMsg:
+    """Return a ``system_tard_state_tunnel`` LubaMsg — the 4 Hz rapid-state push while mowing."""
+    angle = 2 * math.pi * tick / 240
+    x, y = round(10.0 * math.cos(angle) * 1e4), round(10.0 * math.sin(angle) * 1e4)
+    return LubaMsg(
+        sys=MctlSys(
+            system_tard_state_tunnel=SystemTardStateTunnelMsg(
+                tard_state_data=[4, 1, 30, 10, 50, 50, 20, x, y, round(angle * 1e4), 1, AREA_HASH_BASE]
+            )
+        )
+    )
+
+
+def hash_list_message(hashes: list[int], sub_cmd: int = 0) -> LubaMsg:
+    """Return a single-frame ``toapp_gethash_ack`` LubaMsg carrying *hashes*."""
+    return LubaMsg(
+        nav=MctlNav(
+            toapp_gethash_ack=NavGetHashListAck(
+                pver=1, sub_cmd=sub_cmd, total_frame=1, current_frame=1, hash_len=len(hashes), data_couple=hashes
+            )
+        )
+    )
+
+
+def cover_path_message(line: int, current_frame: int, total_frame: int, points: int = 400) -> LubaMsg:
+    """Return a ``cover_path_upload`` LubaMsg carrying the cover path of synthetic line *line*."""
+    coords = zigzag_points(line, points)
+    return LubaMsg(
+        nav=MctlNav(
+            cover_path_upload=CoverPathUploadT(
+                pver=1,
+                sub_cmd=3,
+                total_frame=total_frame,
+                current_frame=current_frame,
+                total_path_num=1,
+                valid_path_num=1,
+                transaction_id=1,
+                data_len=points,
+                path_packets=[
+                    CoverPathPacketT(
+                        path_hash=LINE_HASH_BASE + line,
+                        path_total=1,
+                        path_cur=1,
+                        zone_hash=AREA_HASH_BASE + line,
+                        data_couple=[CommDataCoupleProto(x=x, y=y) for x, y in coords],
+                    )
+                ],
+            )
+        )
+    )
+
+
+def self_signed_cert(directory: Path, host: str = "127.0.0.1") -> tuple[Path, Path]:
+    """Write a self-signed cert + key for *host* into *directory*; return ``(cert, key)`` paths."""
+    from datetime import UTC, datetime, timedelta
+    import ipaddress
+
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, host)])
+    now = datetime.now(tz=UTC)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - timedelta(days=1))
+        .not_valid_after(now + timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address(host))]), critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path = directory / "standin.pem"
+    key_path = directory / "standin.key"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption())
+    )
+    return cert_path, key_path
@@ -5,24 +5,34 @@ The public API entry point is ``MammotionClient``; import it directly:
     from pymammotion.client import MammotionClient
 
 Lower-level transports live under ``pymammotion.transport``.
+
+``import pymammotion`` itself stays cheap: the top-level names and the
+subpackages' re-exports are resolved on first access (PEP 562), so the
+protobuf tables, BLE stack, HTTP client and Home Assistant glue are only
+imported by the code that uses them.
 """
 
-import contextlib
+from __future__ import annotations
+
 import logging
+from typing import TYPE_CHECKING
 
-# betterproto2's first SerializeToString() probes pydantic via
-# pydantic.dataclasses.is_pydantic_dataclass; pydantic resolves .dataclasses through a
-# lazy module __getattr__ -> import_module, which Home Assistant flags as a blocking
-# call inside the event loop (Mammotion-HA #779).  Import it eagerly at package import
-# time (already off the loop) so the first serialization is import-free.
-with contextlib.suppress(ImportError):
-    import pydantic.dataclasses  # noqa: F401
+from pymammotion.utility.lazy import lazy_exports
 
-from pymammotion.bluetooth.ble import MammotionBLE
-from pymammotion.http.http import MammotionHTTP
+if TYPE_CHECKING:
+    from pymammotion.bluetooth.ble import MammotionBLE
+    from pymammotion.http.http import MammotionHTTP
 
 __version__ = "0.0.5"
 
 logger = logging.getLogger(__name__)
 
 __all__ = ["MammotionBLE", "MammotionHTTP", "logger"]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "MammotionBLE": "pymammotion.bluetooth.ble",
+        "MammotionHTTP": "pymammotion.http.http",
+    },
+)
@@ -0,0 +1,243 @@
+"""Proactive per-account request budgets: one token bucket per kind of cloud call.
+
+The cloud side only pushes back after the fact — a 429 from the Aliyun
+gateway arms ``CloudIOTGateway``'s doubling circuit breaker, and a transport
+that has been told off parks its sends for hours.  An :class:`AccountRateLimiter`
+spends a steady budget *before* the call instead, so a large account stays
+under the limit rather than bouncing off it.
+
+Rate limiting is opt-in: once ``MammotionClient.rate_limit_config`` is set,
+each :class:`AccountSession` created afterwards owns one limiter with four buckets
+(:class:`RateLimitBucket`): device command invokes, saga frames, property/status
+fetches and Mammotion REST calls.  Saga frames (map, plan and mow-path syncs)
+get a bucket of their own with a large burst: a sync sends hundreds of frames,
+which would starve ordinary commands of invoke tokens, but left unmetered they
+are the main source of 429s.  A bucket refills at ``rate_per_minute`` up to
+``burst`` tokens, and callers are served by :class:`Priority`:
+
+* ``EMERGENCY`` (e-stop, return-to-dock) is granted at once, even when that
+  overdraws the bucket — later callers repay the debt;
+* ``EXCLUSIVE`` / ``NORMAL`` wait for a token, higher priority first, then
+  FIFO;
+* ``BACKGROUND`` (polls) is shed when no token is free right now — a poll
+  that would have to queue is not worth its slot.
+
+:meth:`AccountRateLimiter.stats` reports tokens consumed, requests shed and
+time spent waiting per bucket.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+from enum import StrEnum
+import heapq
+import time
+
+from pymammotion.messaging.command_queue import Priority
+
+
+class RateLimitBucket(StrEnum):
+    """Kind of cloud call a token is spent on."""
+
+    #: Device command invokes (Aliyun ``/thing/service/invoke``, Mammotion ``mqtt_invoke``).
+    INVOKE = "invoke"
+    #: Cloud frames sent by an exclusive saga (map, plan and mow-path syncs).
+    SAGA = "saga"
+    #: Aliyun ``/thing/properties/get`` and ``/thing/status/get``.
+    PROPERTIES = "properties"
+    #: Mammotion REST API calls (device lists, OTA, credentials, …).
+    HTTP = "http"
+
+
+@dataclass(frozen=True)
+class BucketConfig:
+    """Refill rate and size of one bucket."""
+
+    rate_per_minute: float
+    burst: float
+
+
+#: Default invoke budget: 30 commands a minute per account, bursts of 10.
+DEFAULT_INVOKE_BUCKET = BucketConfig(rate_per_minute=30.0, burst=10.0)
+#: Default saga frame budget: a sync starts at full speed, then is paced at 2 frames a second.
+DEFAULT_SAGA_BUCKET = BucketConfig(rate_per_minute=120.0, burst=60.0)
+#: Default property/status fetch budget.
+DEFAULT_PROPERTIES_BUCKET = BucketConfig(rate_per_minute=20.0, burst=5.0)
+#: Default Mammotion REST budget.
+DEFAULT_HTTP_BUCKET = BucketConfig(rate_per_minute=20.0, burst=10.0)
+
+
+@dataclass(frozen=True)
+class RateLimitConfig:
+    """Bucket settings for an :class:`AccountRateLimiter`."""
+
+    invoke: BucketConfig = DEFAULT_INVOKE_BUCKET
+    saga: BucketConfig = DEFAULT_SAGA_BUCKET
+    properties: BucketConfig = DEFAULT_PROPERTIES_BUCKET
+    http: BucketConfig = DEFAULT_HTTP_BUCKET
+
+    def for_bucket(self, bucket: RateLimitBucket) -> BucketConfig:
+        """Return the settings of *bucket*."""
+        return getattr(self, bucket.value)
+
+
+@dataclass(frozen=True)
+class BucketStats:
+    """Counters of one bucket.
+
+    Attributes:
+        tokens: Tokens available now (negative while an emergency overdraft is repaid).
+        consumed: Tokens spent.
+        shed: Background requests refused for lack of a token.
+        waited: Requests that had to queue for a token.
+        total_wait: Seconds spent queueing, summed over requests.
+        max_wait: Longest single queueing time (s).
+        waiting: Requests queued right now.
+
+    """
+
+    tokens: float
+    consumed: float
+    shed: int
+    waited: int
+    total_wait: float
+    max_wait: float
+    waiting: int
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    tokens: float = field(compare=False)
+    future: asyncio.Future[None] = field(compare=False)
+
+
+class TokenBucket:
+    """Priority-aware token bucket; see the module docstring for the service rules."""
+
+    def __init__(self, rate_per_minute: float, burst: float) -> None:
+        """Create a full bucket refilling at *rate_per_minute* up to *burst* tokens."""
+        if rate_per_minute <= 0 or burst <= 0:
+            msg = "rate_per_minute and burst must be positive"
+            raise ValueError(msg)
+        self._rate = rate_per_minute / 60.0
+        self._burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._waiters: list[_Waiter] = []
+        self._sequence = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._consumed = 0.0
+        self._shed = 0
+        self._waited = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self) -> float:
+        now = time.monotonic()
+        self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        return self._tokens
+
+    def _take(self, tokens: float) -> None:
+        self._tokens -= tokens
+        self._consumed += tokens
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take *tokens* if they are free now and nobody is queued ahead; never waits."""
+        if self._waiters or self._refill() < tokens:
+            return False
+        self._take(tokens)
+        return True
+
+    async def acquire(self, priority: Priority = Priority.NORMAL, tokens: float = 1.0) -> bool:
+        """Take *tokens* under the rules for *priority*.
+
+        Returns False only when a ``BACKGROUND`` request is shed; every other
+        priority returns True, after waiting if it had to.
+        """
+        if priority == Priority.EMERGENCY:
+            self._refill()
+            self._take(tokens)
+            return True
+        if self.try_acquire(tokens):
+            return True
+        if priority >= Priority.BACKGROUND:
+            self._shed += 1
+            return False
+        self._sequence += 1
+        waiter = _Waiter(int(priority), self._sequence, tokens, asyncio.get_running_loop().create_future())
+        heapq.heappush(self._waiters, waiter)
+        started = time.monotonic()
+        self._serve()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if waiter.future.done() and not waiter.future.cancelled():
+                # Granted just as we were cancelled: hand the tokens back, never past burst.
+                self._tokens = min(self._tokens + tokens, self._burst)
+                self._consumed -= tokens
+            self._serve()
+            raise
+        waited = time.monotonic() - started
+        self._waited += 1
+        self._total_wait += waited
+        self._max_wait = max(self._max_wait, waited)
+        return True
+
+    def _serve(self) -> None:
+        """Grant queued waiters in order while tokens last; re-arm the timer for the rest."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            head = self._waiters[0]
+            if head.future.done():
+                heapq.heappop(self._waiters)
+                continue
+            if self._refill() < head.tokens:
+                delay = (head.tokens - self._tokens) / self._rate
+                self._timer = asyncio.get_running_loop().call_later(delay, self._serve)
+                return
+            heapq.heappop(self._waiters)
+            self._take(head.tokens)
+            head.future.set_result(None)
+
+    def stats(self) -> BucketStats:
+        """Return the bucket's counters."""
+        return BucketStats(
+            tokens=self._refill(),
+            consumed=self._consumed,
+            shed=self._shed,
+            waited=self._waited,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+            waiting=sum(1 for w in self._waiters if not w.future.done()),
+        )
+
+
+class AccountRateLimiter:
+    """The token buckets of one account."""
+
+    def __init__(self, config: RateLimitConfig | None = None) -> None:
+        """Create full buckets from *config* (defaults when None)."""
+        self.config = config or RateLimitConfig()
+        self._buckets: dict[RateLimitBucket, TokenBucket] = {
+            bucket: TokenBucket(cfg.rate_per_minute, cfg.burst)
+            for bucket in RateLimitBucket
+            for cfg in (self.config.for_bucket(bucket),)
+        }
+
+    def bucket(self, bucket: RateLimitBucket) -> TokenBucket:
+        """Return the :class:`TokenBucket` for *bucket*."""
+        return self._buckets[bucket]
+
+    async def acquire(self, bucket: RateLimitBucket, priority: Priority = Priority.NORMAL) -> bool:
+        """Spend one token from *bucket*; False means a background request was shed."""
+        return await self._buckets[bucket].acquire(priority)
+
+    def stats(self) -> dict[RateLimitBucket, BucketStats]:
+        """Return every bucket's counters."""
+        return {bucket: tb.stats() for bucket, tb in self._buckets.items()}
@@ -7,6 +7,7 @@ from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
+    from pymammotion.account.rate_limit import AccountRateLimiter
     from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
     from pymammotion.auth.token_manager import TokenManager
     from pymammotion.http.http import MammotionHTTP
@@ -36,6 +37,9 @@ class AccountSession:
     aliyun_transport: AliyunMQTTTransport | None = None
     mammotion_transport: MQTTTransport | None = None
     device_ids: set[str] = field(default_factory=set)
+    #: Token buckets shared by every transport and device of the account; None when
+    #: rate limiting is off (the client default).
+    rate_limiter: AccountRateLimiter | None = None
 
 
 class AccountRegistry:
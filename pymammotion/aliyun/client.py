@@ -8,6 +8,7 @@ from Tea.exceptions import UnretryableException
 from Tea.request import TeaRequest
 
 from pymammotion.aliyun.tea.core import TeaCore
+from pymammotion.aliyun.tea.session_pool import TeaSessionPool
 
 
 class Client:
@@ -25,7 +26,8 @@ class Client:
     _max_idle_conns: int | None = None
     _domain: str | None = None
 
-    def __init__(self, config) -> None:
+    def __init__(self, config, pool: TeaSessionPool | None = None) -> None:
+        self._pool = pool
         self._domain = config.domain
         self._app_key = config.app_key
         self._app_secret = config.app_secret
@@ -122,7 +124,7 @@ class Client:
                 _request.headers["x-ca-signature"] = APIGatewayUtilClient.get_signature(_request, self._app_secret)
                 _request.headers["ca_version"] = "1"
                 _last_request = _request
-                return await TeaCore.async_do_action(_request, _runtime)
+                return await TeaCore.async_do_action(_request, _runtime, self._pool)
             except asyncio.CancelledError:
                 # Never swallow cancellation: eating it here re-sends the request
                 # (autoretry) or masks the cancel as UnretryableException.
@@ -21,6 +21,7 @@ from alibabacloud_iot_api_gateway.models import CommonParams, Config, IoTApiRequ
 from alibabacloud_tea_util.client import Client as UtilClient
 from alibabacloud_tea_util.models import RuntimeOptions
 
+from pymammotion.account.rate_limit import RateLimitBucket
 from pymammotion.aliyun.client import Client
 from pymammotion.aliyun.exceptions import (
     DEVICE_OFFLINE_CODES,
@@ -43,6 +44,7 @@ from pymammotion.aliyun.model.regions_response import RegionResponse
 from pymammotion.aliyun.model.session_by_authcode_response import SessionByAuthCodeResponse
 from pymammotion.aliyun.model.thing_response import ThingPropertiesResponse
 from pymammotion.aliyun.regions import region_mappings
+from pymammotion.aliyun.tea.session_pool import TeaSessionPool
 from pymammotion.const import ALIYUN_DOMAIN, APP_KEY, APP_SECRET, APP_VERSION
 from pymammotion.transport.base import SessionExpiredError, TransportType
 from pymammotion.utility.datatype_converter import DatatypeConverter
@@ -50,6 +52,7 @@ from pymammotion.utility.datatype_converter import DatatypeConverter
 if TYPE_CHECKING:
     # The gateway no longer builds a login session — it is handed one — so this is
     # a type-only dependency now.
+    from pymammotion.account.rate_limit import AccountRateLimiter
     from pymammotion.http.http import MammotionHTTP
 
 logger = getLogger(__name__)
@@ -85,6 +88,10 @@ class CloudIOTGateway:
     _client_id = ""
     _device_sn = ""
     _utdid = ""
+    # Keep-alive HTTPS sessions shared by every Client this gateway builds, so a
+    # command reuses a warm TLS connection instead of handshaking anew.  Created
+    # on first use by http_pool.
+    _http_pool: TeaSessionPool | None = None
 
     converter = DatatypeConverter()
 
@@ -111,6 +118,9 @@ class CloudIOTGateway:
         # _rate_limit_backoff doubles on each successive 429 (60 s → 120 s → …).
         self._rate_limited_until: float = 0.0
         self._rate_limit_backoff: float = 60.0
+        # Proactive per-account budget for property/status fetches, set by the
+        # client from the AccountSession.  The breaker above stays as a backstop.
+        self.rate_limiter: AccountRateLimiter | None = None
         # Serialises concurrent check_or_refresh_session calls so only one
         # HTTP round-trip fires even when multiple coroutines race on an
         # expired token.  The second waiter re-checks freshness under the
@@ -196,7 +206,7 @@ class CloudIOTGateway:
         auth_code = self.mammotion_http.login_info.authorization_code  # type: ignore
 
         config = Config(app_key=self._app_key, app_secret=self._app_secret, domain=self.domain, protocol="https")
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(api_ver="1.0.2", language="en-US")
@@ -258,7 +268,7 @@ class CloudIOTGateway:
             aep_domain = self._region_response.data.apiGatewayEndpoint  # type: ignore
 
         config = Config(app_key=self._app_key, app_secret=self._app_secret, domain=aep_domain, protocol="https")
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         request = CommonParams(api_ver="1.0.0", language="en-US")
         logger.debug("client id %s", self._client_id)
@@ -460,7 +470,7 @@ class CloudIOTGateway:
             domain=self._region_response.data.apiGatewayEndpoint,  # type: ignore
             protocol="https",
         )
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(api_ver="1.0.4", language="en-US")
@@ -518,7 +528,7 @@ class CloudIOTGateway:
             domain=self._region_response.data.apiGatewayEndpoint,  # type: ignore
             protocol="https",
         )
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(api_ver="1.0.4", language="en-US")
@@ -555,6 +565,18 @@ class CloudIOTGateway:
         # Load the JSON string into a dictionary
         return self.parse_json_response(response_body_str)
 
+    @property
+    def http_pool(self) -> TeaSessionPool:
+        """The keep-alive HTTPS session pool shared by this gateway's API calls."""
+        if self._http_pool is None:
+            self._http_pool = TeaSessionPool()
+        return self._http_pool
+
+    async def close(self) -> None:
+        """Close the pooled HTTPS sessions.  Call once the gateway is discarded."""
+        if self._http_pool is not None:
+            await self._http_pool.close()
+
     async def check_or_refresh_session(self, *, force: bool = False) -> None:
         """Check or refresh the Aliyun IoT session token.
 
@@ -600,7 +622,7 @@ class CloudIOTGateway:
                 domain=self._region_response.data.apiGatewayEndpoint,  # type: ignore
                 protocol="https",
             )
-            client = Client(config)
+            client = Client(config, self.http_pool)
 
             # build request
             request = CommonParams(api_ver="1.0.4", language="en-US")
@@ -673,7 +695,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(
@@ -732,7 +754,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(
@@ -777,7 +799,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(
@@ -820,7 +842,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(
@@ -909,7 +931,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
         # build request
         request = CommonParams(
             api_ver="1.0.5",
@@ -998,6 +1020,8 @@ class CloudIOTGateway:
 
     async def get_device_properties(self, iot_id: str) -> ThingPropertiesResponse:
         """List bindings by account."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(RateLimitBucket.PROPERTIES)
         config = Config(
             app_key=self._app_key,
             app_secret=self._app_secret,
@@ -1005,7 +1029,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(
@@ -1044,6 +1068,8 @@ class CloudIOTGateway:
 
     async def get_device_status(self, iot_id: str) -> ThingPropertiesResponse:
         """List bindings by account."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire(RateLimitBucket.PROPERTIES)
         config = Config(
             app_key=self._app_key,
             app_secret=self._app_secret,
@@ -1051,7 +1077,7 @@ class CloudIOTGateway:
             protocol="https",
         )
 
-        client = Client(config)
+        client = Client(config, self.http_pool)
 
         # build request
         request = CommonParams(
@@ -16,6 +16,8 @@ from Tea.request import TeaRequest
 from Tea.response import TeaResponse
 from Tea.stream import BaseStream
 
+from pymammotion.aliyun.tea.session_pool import TeaSessionPool
+
 DEFAULT_CONNECT_TIMEOUT = 5000
 DEFAULT_READ_TIMEOUT = 10000
 DEFAULT_POOL_SIZE = 10
@@ -92,8 +94,15 @@ class TeaCore:
         return url.rstrip("?&")
 
     @staticmethod
-    async def async_do_action(request: TeaRequest, runtime_option=None) -> TeaResponse:
-        """Send an async HTTP/HTTPS request and return the response as a TeaResponse."""
+    async def async_do_action(
+        request: TeaRequest, runtime_option=None, pool: TeaSessionPool | None = None
+    ) -> TeaResponse:
+        """Send an async HTTP/HTTPS request and return the response as a TeaResponse.
+
+        With a *pool* the request goes over the pool's keep-alive session for
+        the endpoint; without one a throwaway session (and TLS handshake) is
+        used, as before.
+        """
         runtime_option = runtime_option or {}
 
         url = TeaCore.compose_url(request)
@@ -115,6 +124,22 @@ class TeaCore:
             if not proxy:
                 proxy = os.environ.get("HTTPS_PROXY") or os.environ.get("https_proxy")
 
+        timeout = aiohttp.ClientTimeout(sock_read=read_timeout, sock_connect=connect_timeout)
+        body = b""
+        if isinstance(request.body, BaseStream):
+            for content in request.body:
+                body += content
+        elif isinstance(request.body, str):
+            body = request.body.encode("utf-8")
+        else:
+            body = request.body
+
+        if pool is not None:
+            if request.protocol.upper() != "HTTPS":
+                verify = False
+            session = await pool.session_for(url)
+            return await TeaCore._send(session, request, url, body, verify, proxy, timeout)
+
         connector = None
         ca_cert = certifi.where()
         if ca_cert and request.protocol.upper() == "HTTPS":
@@ -129,28 +154,32 @@ class TeaCore:
         else:
             verify = False
 
-        timeout = aiohttp.ClientTimeout(sock_read=read_timeout, sock_connect=connect_timeout)
         async with aiohttp.ClientSession(connector=connector) as s:
-            body = b""
-            if isinstance(request.body, BaseStream):
-                for content in request.body:
-                    body += content
-            elif isinstance(request.body, str):
-                body = request.body.encode("utf-8")
-            else:
-                body = request.body
-            try:
-                async with s.request(
-                    request.method, url, data=body, headers=request.headers, ssl=verify, proxy=proxy, timeout=timeout
-                ) as response:
-                    tea_resp = TeaResponse()
-                    tea_resp.body = await response.read()
-                    tea_resp.headers = {k.lower(): v for k, v in response.headers.items()}
-                    tea_resp.status_code = response.status
-                    tea_resp.status_message = response.reason
-                    tea_resp.response = response
-            except OSError as e:
-                raise RetryError(str(e)) from e
+            return await TeaCore._send(s, request, url, body, verify, proxy, timeout)
+
+    @staticmethod
+    async def _send(
+        session: aiohttp.ClientSession,
+        request: TeaRequest,
+        url: str,
+        body,
+        verify: bool,
+        proxy: str | None,
+        timeout: aiohttp.ClientTimeout,
+    ) -> TeaResponse:
+        """Issue *request* on *session* and read the full response into a TeaResponse."""
+        try:
+            async with session.request(
+                request.method, url, data=body, headers=request.headers, ssl=verify, proxy=proxy, timeout=timeout
+            ) as response:
+                tea_resp = TeaResponse()
+                tea_resp.body = await response.read()
+                tea_resp.headers = {k.lower(): v for k, v in response.headers.items()}
+                tea_resp.status_code = response.status
+                tea_resp.status_message = response.reason
+                tea_resp.response = response
+        except OSError as e:
+            raise RetryError(str(e)) from e
         return tea_resp
 
     @staticmethod
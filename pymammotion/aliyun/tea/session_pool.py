@@ -0,0 +1,113 @@
+"""Keep-alive aiohttp sessions for the Aliyun Tea client, one per endpoint."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import socket
+import ssl
+import time
+from urllib.parse import urlsplit
+
+import aiohttp
+import certifi
+
+DEFAULT_LIMIT_PER_ENDPOINT = 10
+DEFAULT_KEEPALIVE_TIMEOUT = 30.0
+DEFAULT_IDLE_TIMEOUT = 300.0
+
+
+@dataclass
+class SessionPoolStats:
+    """Counters for :class:`TeaSessionPool` — how often a warm session was reused."""
+
+    sessions_opened: int = 0
+    sessions_evicted: int = 0
+    requests: int = 0
+
+
+class TeaSessionPool:
+    """Shared ``aiohttp.ClientSession`` per ``scheme://host:port``.
+
+    :meth:`TeaCore.async_do_action` used to build an SSL context, parse the
+    certifi bundle, and open a fresh connector + session for every request,
+    so each cloud command paid a full TLS handshake.  The pool keeps one
+    session per endpoint with a keep-alive connector of at most
+    ``limit_per_endpoint`` connections, and builds the SSL context once.
+
+    Sessions unused for ``idle_timeout`` seconds are closed lazily on the
+    next :meth:`session_for` call — there is no background task to manage.
+    The owner (``CloudIOTGateway``) must call :meth:`close` when done.
+    """
+
+    def __init__(
+        self,
+        limit_per_endpoint: int = DEFAULT_LIMIT_PER_ENDPOINT,
+        keepalive_timeout: float = DEFAULT_KEEPALIVE_TIMEOUT,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+        ssl_context: ssl.SSLContext | None = None,
+    ) -> None:
+        """Initialise an empty pool; *ssl_context* overrides the certifi-backed default."""
+        self._limit_per_endpoint = limit_per_endpoint
+        self._keepalive_timeout = keepalive_timeout
+        self._idle_timeout = idle_timeout
+        self._ssl_context = ssl_context
+        self._ssl_lock = asyncio.Lock()
+        # endpoint → (session, monotonic time of last checkout)
+        self._sessions: dict[str, tuple[aiohttp.ClientSession, float]] = {}
+        self.stats = SessionPoolStats()
+
+    async def ssl_context(self) -> ssl.SSLContext:
+        """Return the pool's SSL context, building it off-loop on first use."""
+        if self._ssl_context is None:
+            async with self._ssl_lock:
+                if self._ssl_context is None:
+                    loop = asyncio.get_running_loop()
+                    context = await loop.run_in_executor(None, ssl.create_default_context, ssl.Purpose.SERVER_AUTH)
+                    await loop.run_in_executor(None, context.load_verify_locations, certifi.where())
+                    self._ssl_context = context
+        return self._ssl_context
+
+    async def session_for(self, url: str) -> aiohttp.ClientSession:
+        """Return the live session for *url*'s endpoint, opening one if needed.
+
+        The returned session belongs to the pool — do not close it.
+        """
+        now = time.monotonic()
+        await self._evict_idle(now)
+        parts = urlsplit(url)
+        ssl_context = await self.ssl_context() if parts.scheme == "https" else False
+        # No awaits below this point, so concurrent callers can't open duplicate sessions.
+        endpoint = f"{parts.scheme}://{parts.netloc}"
+        self.stats.requests += 1
+        entry = self._sessions.get(endpoint)
+        if entry is not None and not entry[0].closed:
+            self._sessions[endpoint] = (entry[0], now)
+            return entry[0]
+
+        connector = aiohttp.TCPConnector(
+            ssl=ssl_context,
+            family=socket.AF_INET,
+            limit=self._limit_per_endpoint,
+            limit_per_host=self._limit_per_endpoint,
+            keepalive_timeout=self._keepalive_timeout,
+        )
+        session = aiohttp.ClientSession(connector=connector)
+        self._sessions[endpoint] = (session, now)
+        self.stats.sessions_opened += 1
+        return session
+
+    async def _evict_idle(self, now: float) -> None:
+        """Close every session idle for longer than ``idle_timeout``."""
+        stale = [ep for ep, (_, last_used) in self._sessions.items() if now - last_used > self._idle_timeout]
+        for endpoint in stale:
+            session, _ = self._sessions.pop(endpoint)
+            self.stats.sessions_evicted += 1
+            await session.close()
+
+    async def close(self) -> None:
+        """Close every pooled session.  The pool can be reused afterwards."""
+        sessions = [session for session, _ in self._sessions.values()]
+        self._sessions.clear()
+        for session in sessions:
+            await session.close()
@@ -1,5 +1,14 @@
 """Bluetooth (BluFi) support for Mammotion devices."""
 
-from .ble_message import BleMessage
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pymammotion.utility.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .ble_message import BleMessage
 
 __all__ = ["BleMessage"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"BleMessage": ".ble_message"})
@@ -1,9 +1,8 @@
 from asyncio import sleep
-from io import BytesIO
+from binascii import crc_hqx
 import json
 import logging
 import queue
-import sys
 import time
 from typing import Any
 
@@ -27,6 +26,15 @@ MAX_DATA_LEN = 255
 FRAG_LENGTH_PREFIX_LEN = 2
 FRAG_CONTENT_LEN = MAX_DATA_LEN - FRAG_LENGTH_PREFIX_LEN
 
+# Frame-control bits, tested inline on the hot receive path instead of
+# allocating a ``FrameCtrlData`` per notification.
+_FRAME_CTRL_ENCRYPTED = 1 << FrameCtrlData.FRAME_CTRL_POSITION_ENCRYPTED
+_FRAME_CTRL_CHECKSUM = 1 << FrameCtrlData.FRAME_CTRL_POSITION_CHECKSUM
+_FRAME_CTRL_FRAG = 1 << FrameCtrlData.FRAME_CTRL_POSITION_FRAG
+
+# Reference table for the BluFi CRC-16 (CCITT polynomial 0x1021, MSB first).
+# ``BleMessage.calc_crc`` computes the same function through ``binascii.crc_hqx``.
+
 CRC_TB = [
     0x0000,
     0x1021,
@@ -347,8 +355,12 @@ class BleMessage:
         """Write raw bytes to the GATT write characteristic with response."""
         await self.client.write_gatt_char(UUID_WRITE_CHARACTERISTIC, data, True)
 
-    def parseNotification(self, response: bytes | None) -> int:
-        """Parse notification data from BLE device."""
+    def parseNotification(self, response: bytes | bytearray | memoryview | None) -> int:
+        """Parse notification data from BLE device.
+
+        The fragment's data section is sliced as a ``memoryview`` and copied
+        once, into the notification's reassembly buffer.
+        """
         if response is None:
             # Log.w(TAG, "parseNotification null data");
             return -1
@@ -360,10 +372,9 @@ class BleMessage:
             _LOGGER.debug("parseNotification data length less than 4")
             return -2
 
-        sequence = int(response[2])  # toInt
+        sequence = response[2]
         current_sequence = self.mReadSequence.get() & 255
         if sequence == current_sequence:
-            # _LOGGER.debug(f"Received bluetooth data 1: {response.hex()}, object: {self}")
             return 2
 
         # Compare with the second counter, mod 255
@@ -378,47 +389,48 @@ class BleMessage:
             self.clear_notification()
 
         # LogUtil.m7773e(self.mGatt.getDevice().getName() + "打印丢包率", self.mReadSequence_2 + "/" + self.mReadSequence_1);
-        pkt_type = int(response[0])  # toInt
-        pkgType = self._getPackageType(pkt_type)
-        subType = self._getSubType(pkt_type)
-        self.notification.setType(pkt_type)
-        self.notification.setPkgType(pkgType)
-        self.notification.setSubType(subType)
-        frameCtrl = int(response[1])  # toInt
-        # _LOGGER.debug("frame ctrl")
-        # _LOGGER.debug(frameCtrl)
-        # _LOGGER.debug(response)
-        # _LOGGER.debug(f"pktType {pkt_type} pkgType {pkgType} subType {subType}")
-        self.notification.setFrameCtrl(frameCtrl)
-        frameCtrlData = FrameCtrlData(frameCtrl)
-        dataLen = int(response[3])  # toInt specifies length of data
+        pkt_type = response[0]
+        frameCtrl = response[1]
+        notification = self.notification
+        notification.setType(pkt_type)
+        notification.setPkgType(self._getPackageType(pkt_type))
+        notification.setSubType(self._getSubType(pkt_type))
+        notification.setFrameCtrl(frameCtrl)
+        dataLen = response[3]  # specifies length of data
 
         try:
-            dataBytes = response[4 : 4 + dataLen]
-            if frameCtrlData.isEncrypted():
+            dataBytes = memoryview(response)[4 : 4 + dataLen]
+            if frameCtrl & _FRAME_CTRL_ENCRYPTED:
                 _LOGGER.debug("is encrypted")
             #     BlufiAES aes = new BlufiAES(self.mAESKey, AES_TRANSFORMATION, generateAESIV(sequence));
             #     dataBytes = aes.decrypt(dataBytes);
             # }
-            if frameCtrlData.isChecksum():
-                respChecksum1 = int(response[-1])
-                respChecksum2 = int(response[-2])
-                crc = self.calc_crc(self.calc_crc(0, bytes([sequence, dataLen])), dataBytes)
+            if frameCtrl & _FRAME_CTRL_CHECKSUM:
+                respChecksum1 = response[-1]
+                respChecksum2 = response[-2]
+                crc = self.calc_crc(self.calc_crc(0, bytes((sequence, dataLen))), dataBytes)
                 calcChecksum1 = (crc >> 8) & 255
                 calcChecksum2 = crc & 255
 
                 if respChecksum1 != calcChecksum1 or respChecksum2 != calcChecksum2:
                     _LOGGER.debug(
-                        f"expect checksum: {respChecksum1}, {respChecksum2}\n"
-                        f"received checksum: {calcChecksum1}, {calcChecksum2}"
+                        "expect checksum: %s, %s\nreceived checksum: %s, %s",
+                        respChecksum1,
+                        respChecksum2,
+                        calcChecksum1,
+                        calcChecksum2,
                     )
                     self.clear_notification()
                     return -4
 
-            data_offset = 2 if frameCtrlData.hasFrag() else 0
-
-            self.notification.addData(dataBytes, data_offset)
-            return 1 if frameCtrlData.hasFrag() else 0
+            if frameCtrl & _FRAME_CTRL_FRAG:
+                if notification.mDataLen == 0:
+                    # First fragment: its prefix is the whole frame's content length.
+                    notification.reserve(int.from_bytes(dataBytes[:FRAG_LENGTH_PREFIX_LEN], "little"))
+                notification.addData(dataBytes, FRAG_LENGTH_PREFIX_LEN)
+                return 1
+            notification.addData(dataBytes, 0)
+            return 0
         except Exception as e:  # noqa: BLE001 — a malformed notification resets the buffer
             _LOGGER.debug(e)
             self.clear_notification()
@@ -613,51 +625,45 @@ class BleMessage:
         sequence: int,
         data: bytes | None,
     ) -> bytes:
-        """Assemble a BluFi packet header with optional payload into a byte buffer ready for GATT write."""
-        byteOS = BytesIO()
+        """Assemble a BluFi packet header with optional payload into a byte buffer ready for GATT write.
+
+        When *checksum* is set the CRC of ``sequence``, ``dataLen`` and the
+        data is appended low byte first.  Checking it is the receiver's job:
+        ``parseNotification`` recomputes it for every checksummed notification
+        and drops the frame (``-4``) on a mismatch.
+        """
         dataLength = 0 if data is None else len(data)
         frameCtrl = FrameCtrlData.getFrameCTRLValue(encrypt, checksum, 0, require_ack, hasFrag)
-        byteOS.write(type.to_bytes(1, sys.byteorder))
-        byteOS.write(frameCtrl.to_bytes(1, sys.byteorder))
-        byteOS.write(sequence.to_bytes(1, sys.byteorder))
-        byteOS.write(dataLength.to_bytes(1, sys.byteorder))
-
+        packet = bytearray((type, frameCtrl, sequence, dataLength))
         if data is not None:
-            byteOS.write(data)
-
-        _LOGGER.debug(byteOS.getvalue())
-        return byteOS.getvalue()
+            packet += data
+        if checksum:
+            crc = self.calc_crc(self.calc_crc(0, bytes((sequence, dataLength))), data or b"")
+            packet += crc.to_bytes(2, "little")
+        _LOGGER.debug("BluFi post: type=%d seq=%d len=%d frag=%s", type, sequence, dataLength, hasFrag)
+        return bytes(packet)
 
     @staticmethod
-    def calc_crc(initial: int, data: bytes | bytearray) -> int:
+    def calc_crc(initial: int, data: bytes | bytearray | memoryview) -> int:
         """Calculate CRC value for given initial value and byte array.
 
+        Equivalent to walking ``CRC_TB`` byte by byte, but runs in C via
+        ``binascii.crc_hqx`` (the same CCITT polynomial with the complement
+        applied on the way in and out).
+
         Args:
-            initial: Initial CRC value
+            initial: Initial CRC value (16-bit)
             data: Bytes to calculate CRC for
 
         Returns:
             Calculated CRC value (16-bit)
 
         Raises:
-            TypeError: If data is not bytes or bytearray
+            TypeError: If data does not support the buffer protocol
             ValueError: If initial value is out of valid range
 
         """
-        if not isinstance(data, (bytes, bytearray)):
-            raise TypeError("Data must be bytes or bytearray")
-
         if not 0 <= initial <= 0xFFFF:
-            raise ValueError("Initial value must be between 0 and 65535")
-
-        try:
-            crc = (~initial) & 0xFFFF
-
-            for byte in data:
-                crc = ((crc << 8) ^ CRC_TB[byte ^ (crc >> 8)]) & 0xFFFF
-
-            return (~crc) & 0xFFFF
-
-        except Exception as e:
-            _LOGGER.error("Error calculating CRC: %s", str(e))
-            raise
+            msg = "Initial value must be between 0 and 65535"
+            raise ValueError(msg)
+        return ~crc_hqx(data, ~initial & 0xFFFF) & 0xFFFF
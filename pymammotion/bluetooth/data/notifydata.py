@@ -1,13 +1,17 @@
-from io import BytesIO
-
-"""Notify data object"""
+"""Notify data object."""
 
 
 class BlufiNotifyData:
-    """Accumulator for a fragmented BluFi notification frame."""
+    """Accumulator for a fragmented BluFi notification frame.
+
+    Fragment payloads are copied straight from the notification buffer into
+    one ``bytearray``; :meth:`reserve` sizes it up front from the first
+    fragment's remaining-length prefix so a long frame is never regrown.
+    """
 
     def __init__(self) -> None:
-        self.mDataOS = BytesIO()
+        self.mData = bytearray()
+        self.mDataLen = 0
         self.mFrameCtrlValue = 0
         self.mPkgType = 0
         self.mSubType = 0
@@ -52,11 +56,23 @@ class BlufiNotifyData:
         self.mFrameCtrlValue = i
 
     #  JADX INFO: Access modifiers changed from: package-private
-    def addData(self, bArr, i) -> None:
+    def reserve(self, remaining: int) -> None:
+        """Make room for *remaining* more payload bytes without regrowing on each fragment."""
+        shortfall = self.mDataLen + remaining - len(self.mData)
+        if shortfall > 0:
+            self.mData.extend(bytes(shortfall))
+
+    #  JADX INFO: Access modifiers changed from: package-private
+    def addData(self, bArr: bytes | bytearray | memoryview, i: int) -> None:
         """Append the payload of a fragment, skipping the first ``i`` header bytes."""
-        self.mDataOS.write(bArr[i:])
+        view = memoryview(bArr)[i:]
+        end = self.mDataLen + len(view)
+        if end > len(self.mData):
+            self.reserve(len(view))
+        self.mData[self.mDataLen : end] = view
+        self.mDataLen = end
 
     #  JADX INFO: Access modifiers changed from: package-private
     def getDataArray(self) -> bytes:
         """Return the reassembled payload accumulated from all fragments."""
-        return self.mDataOS.getvalue()
+        return bytes(memoryview(self.mData)[: self.mDataLen])
@@ -43,12 +43,14 @@ from __future__ import annotations
 import asyncio
 import contextlib
 import dataclasses
+from enum import StrEnum
 import json
 import logging
 import time
 from typing import TYPE_CHECKING, Any, cast
 from urllib.parse import urlparse
 
+from pymammotion.account.rate_limit import AccountRateLimiter, RateLimitConfig
 from pymammotion.account.registry import BLE_ONLY_ACCOUNT, AccountRegistry, AccountSession
 from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
 from pymammotion.aliyun.model.dev_by_account_response import Device
@@ -59,9 +61,12 @@ from pymammotion.data.model.device import MowerDevice, MowingDevice, RTKBaseStat
 from pymammotion.data.model.hash_list import PathType
 from pymammotion.data.mqtt.status import StatusType
 from pymammotion.device.handle import DeviceHandle, DeviceRegistry
+from pymammotion.device.poll_scheduler import PollScheduler
 from pymammotion.device.readiness import get_readiness_checker
 from pymammotion.http.http import MammotionHTTP
 from pymammotion.http.model.http import CheckDeviceVersion, DeviceRecord, MQTTConnection, UnauthorizedExceptionError
+from pymammotion.http.response_cache import ResponseCache
+from pymammotion.mammotion.commands.mammotion_command import MammotionCommand
 from pymammotion.messaging.command_queue import Priority
 from pymammotion.messaging.common_data_saga import CommonDataSaga
 from pymammotion.messaging.edge_saga import EdgeMappingSaga
@@ -79,6 +84,7 @@ from pymammotion.transport.base import (
     ReLoginRequiredError,
     SessionExpiredError,
     Subscription,
+    Transport,
     TransportError,
     TransportType,
 )
@@ -86,6 +92,7 @@ from pymammotion.transport.ble import BLETransport, BLETransportConfig
 from pymammotion.transport.mqtt import MQTTTransport, MQTTTransportConfig
 from pymammotion.utility.constant import MOWING_ACTIVE_MODES, WorkMode
 from pymammotion.utility.device_type import DeviceType
+from pymammotion.utility.executor import LoopLagMonitor, MapExecutor
 from pymammotion.utility.svg import chunk_svg_messages
 
 #: Channels for the continuous subscription (matches HA-Luba async_request_iot_sync_continuous).
@@ -118,11 +125,12 @@ _ONE_SHOT_CHANNELS: list[RptInfoType] = [
     RptInfoType.RIT_RTK,
 ]
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
 
     from aiohttp import ClientSession
     from bleak import BLEDevice
 
+    from pymammotion.data.map_store import MapStore
     from pymammotion.data.mqtt.event import ThingEventMessage
     from pymammotion.data.mqtt.properties import MammotionPropertiesMessage, ThingPropertiesMessage
     from pymammotion.data.mqtt.status import ThingStatusMessage
@@ -132,6 +140,48 @@ _logger = logging.getLogger(__name__)
 _AUTH_REJECTED = (UnauthorizedExceptionError, ReLoginRequiredError, AuthError)
 
 
+#: Default number of devices :meth:`MammotionClient.send_command_to_many` sends to at once.
+FLEET_SEND_CONCURRENCY = 8
+#: Default seconds :meth:`MammotionClient.send_command_to_many` waits per device (queue wait included).
+FLEET_SEND_TIMEOUT = 30.0
+
+
+class FleetCommandStatus(StrEnum):
+    """Outcome of one device's send in :meth:`MammotionClient.send_command_to_many`."""
+
+    SENT = "sent"
+    #: Not registered, or no usable transport — nothing was enqueued.
+    SKIPPED = "skipped"
+    #: The device's cloud transport is inside its 429 / send-quota window.
+    RATE_LIMITED = "rate_limited"
+    #: The send did not run within the timeout; it was dropped from the queue.
+    TIMEOUT = "timeout"
+    FAILED = "failed"
+
+
+@dataclasses.dataclass(frozen=True)
+class FleetCommandResult:
+    """Per-device result yielded by :meth:`MammotionClient.send_command_to_many`."""
+
+    device_name: str
+    status: FleetCommandStatus
+    elapsed: float = 0.0
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        """True when the command was handed to a transport."""
+        return self.status is FleetCommandStatus.SENT
+
+
+def _send_blocked(handle: DeviceHandle, transport: Transport) -> bool:
+    """Return True when a send on *transport* would be refused by the rate-limit gate.
+
+    Same predicate as ``DeviceHandle._send_marked`` — BLE is never throttled.
+    """
+    return transport.transport_type is not TransportType.BLE and transport.is_send_blocked(handle.firmware_version)
+
+
 def _should_fetch_mow_path(device: MowerDevice, handle: DeviceHandle, path_hash: int) -> bool:
     """Return True if a MowPathSaga should be triggered.
 
@@ -165,6 +215,8 @@ class MammotionClient:
 
         """
         self._device_registry: DeviceRegistry = DeviceRegistry()
+        #: Drives every registered mower's MQTT poll cadence from one task.
+        self._poll_scheduler: PollScheduler = PollScheduler()
         self._account_registry: AccountRegistry = AccountRegistry()
         self._ble_manager: BLETransportManager = BLETransportManager()
         self._stopped: bool = False
@@ -187,6 +239,36 @@ class MammotionClient:
         #: Fired (async) whenever any credential type is successfully refreshed.
         #: Integrations can wire this to persist the updated token cache.
         self._on_credentials_updated: Callable[[], Awaitable[None]] | None = None
+        #: Hashes a cloud map sync streams at once (``MapFetchSaga`` pipeline_window).
+        #: 1 — the default — is the strict one-hash-at-a-time protocol; larger values
+        #: overlap the per-ack invoke round trips.  BLE syncs are always strict.
+        self.map_fetch_window: int = 1
+        #: device_name → firmware version on which a pipelined map sync stalled and
+        #: fell back to strict.  Later syncs on that firmware start strict; a
+        #: firmware update gets another pipelined attempt.
+        self._strict_map_fetch_firmware: dict[str, str] = {}
+        #: On-disk map cache.  When set, each mower's map is restored from it as
+        #: its handle is created and saved after every map / plan / mow-path
+        #: sync, so a restart with an unchanged ``bol_hash`` skips the map fetch.
+        self.map_store: MapStore | None = None
+        #: Per-account request budgets (invoke / property fetch / REST).  Opt-in: None
+        #: (the default) meters nothing; set a ``RateLimitConfig()`` before login and each
+        #: account session created afterwards gets its own buckets.
+        self.rate_limit_config: RateLimitConfig | None = None
+        #: Pool for CPU-heavy map work (GeoJSON builds after a sync, SVG chunking).
+        #: Replace before the first sync to use a process pool or more workers.
+        self.map_executor: MapExecutor = MapExecutor()
+        #: Event-loop lag probe; idle until ``loop_lag_monitor.start()``.
+        self.loop_lag_monitor: LoopLagMonitor = LoopLagMonitor()
+        #: Cache for the slow-changing REST endpoints, shared by every account's
+        #: ``MammotionHTTP`` (entries are keyed by account).  Replace before login to
+        #: change TTLs or add a ``DiskResponseStore``; None disables caching.
+        self.response_cache: ResponseCache | None = ResponseCache()
+
+    @property
+    def poll_scheduler(self) -> PollScheduler:
+        """The scheduler driving device polls; read ``poll_scheduler.stats()`` for its metrics."""
+        return self._poll_scheduler
 
     @property
     def on_credentials_updated(self) -> Callable[[], Awaitable[None]] | None:
@@ -223,6 +305,14 @@ class MammotionClient:
                 await session.token_manager.stop_refresh_scheduler()
         for handle in self._device_registry.all_devices:
             await handle.stop()
+        await self._poll_scheduler.stop()
+        await self.loop_lag_monitor.stop()
+        self.map_executor.shutdown()
+        for session in self._account_registry.all_sessions:
+            if session.cloud_client is not None:
+                await session.cloud_client.close()
+            if session.mammotion_http is not None:
+                await session.mammotion_http.close()
 
     async def remove_device(self, name: str) -> None:
         """Stop and remove the named device from the registry.
@@ -258,8 +348,9 @@ class MammotionClient:
           when the hash transitions to a non-zero value, our map is current
           (computed_bol_hash == device bol_hash), and no matching cover path
           is cached.
-        * ``(path_pos_x, path_pos_y)`` — rebuilds ``generated_mow_progress_geojson``
-          as the mower progresses along the path.
+        * ``(path_pos_x, path_pos_y)`` — records the mower's progress along the
+          path; ``generated_mow_progress_geojson`` is rebuilt from it on the
+          map executor.
         * ``bol_hash`` (from ``report_data.locations[0].bol_hash``) — fires
           ``MapFetchSaga`` when the device reports a different map hash,
           replacing the old ``MapStalenessWatcher`` for the maps case.
@@ -303,13 +394,9 @@ class MammotionClient:
             device = cast(MowerDevice, handle.snapshot.raw)
             if device.map.current_mow_path and device.report_data.dev.sys_status == WorkMode.MODE_WORKING:
                 work = device.report_data.work
-                device.map.apply_mow_progress_geojson(
-                    device.location.RTK,
-                    work.now_index,
-                    work.ub_path_hash,
-                    work.path_pos_x,
-                    work.path_pos_y,
-                )
+                device.map.set_geojson_origin(device.location.RTK)
+                device.map.set_mow_progress(work.now_index, work.ub_path_hash, work.path_pos_x, work.path_pos_y)
+                handle.refresh_geojson()
 
         async def _on_bol_hash_changed(bol_hash: int) -> None:
             # bol_hash changes when the device's map element DB has been edited —
@@ -334,6 +421,13 @@ class MammotionClient:
                     "Device %s bol_hash changed to %d but saga active — skipping map sync", device_name, bol_hash
                 )
                 return
+            if device_snapshot.map.is_map_synced(bol_hash):
+                # Typically a map restored from map_store at start-up: the frames
+                # already add up to the device's hash, so there is nothing to fetch.
+                _logger.debug("Device %s bol_hash %d matches the cached map — skipping map sync", device_name, bol_hash)
+                device_snapshot.map.set_geojson_origin(device_snapshot.location.RTK, device_snapshot.location.dock)
+                handle.refresh_geojson()
+                return
             _logger.debug(
                 "Device %s bol_hash changed to %d — syncing map if not mowing for lidar versions (incremental=%s)",
                 device_name,
@@ -371,18 +465,22 @@ class MammotionClient:
         sub = handle.watch_field(
             lambda s: s.raw.report_data.work.path_hash,  # type: ignore
             _on_path_hashes_changed,
+            fields=("report_data.work.path_hash",),
         )
         progress_sub = handle.watch_field(
             lambda s: (s.raw.report_data.work.path_pos_x, s.raw.report_data.work.path_pos_y),  # type: ignore
             _on_mow_progress_changed,
+            fields=("report_data.work.path_pos_x", "report_data.work.path_pos_y"),
         )
         bol_hash_sub = handle.watch_field(
             lambda s: s.raw.report_data.locations[0].bol_hash if s.raw.report_data.locations else 0,  # type: ignore
             _on_bol_hash_changed,
+            fields=("report_data.locations",),
         )
         init_cfg_hash_sub = handle.watch_field(
             lambda s: s.raw.report_data.work.init_cfg_hash,  # type: ignore
             _on_init_cfg_hash_changed,
+            fields=("report_data.work.init_cfg_hash",),
         )
 
         # Cancel any previous watchers first: a plain overwrite leaves the old
@@ -534,6 +632,12 @@ class MammotionClient:
     # Account session helpers
     # ------------------------------------------------------------------
 
+    def _new_rate_limiter(self) -> AccountRateLimiter | None:
+        """Return fresh account buckets from :attr:`rate_limit_config`, or None when rate limiting is off."""
+        if self.rate_limit_config is None:
+            return None
+        return AccountRateLimiter(self.rate_limit_config)
+
     def _get_session_for_device(self, device_name: str) -> AccountSession | None:
         """Return the AccountSession that owns *device_name*, or None."""
         return self._account_registry.find_by_device(device_name)
@@ -644,11 +748,12 @@ class MammotionClient:
         return handle.snapshot.raw  # type: ignore
 
     def regenerate_stale_geojson(self, device_name: str | None = None) -> None:
-        """Regenerate GeoJSON for any device whose stored map was built with a different RTK yaw.
+        """Rebuild the GeoJSON views of any device whose stored map was built with a different RTK yaw.
 
-        Call this after restoring device state (e.g. after ``handle.restore_device()``
-        in the HA coordinator) so that maps generated without the RTK heading correction
-        are immediately fixed without waiting for the next full map sync.
+        Call this from the event loop after restoring device state (e.g. after
+        ``handle.restore_device()`` in the HA coordinator) so that maps generated
+        without the RTK heading correction are rebuilt in the background without
+        waiting for the next full map sync.
 
         Args:
             device_name: Regenerate only this device.  When ``None`` (default),
@@ -669,12 +774,13 @@ class MammotionClient:
             rtk = device.location.RTK
             if device.map.geojson_needs_regeneration(rtk):
                 _logger.info(
-                    "regenerate_stale_geojson [%s]: regenerating (stored_yaw=%.3f current_yaw=%.3f)",
+                    "regenerate_stale_geojson [%s]: stale, rebuilding (stored_yaw=%.3f current_yaw=%.3f)",
                     handle.device_name,
                     device.map.geojson_yaw,
                     rtk.yaw,
                 )
-                device.map.generate_geojson(rtk, device.location.dock)
+            device.map.set_geojson_origin(rtk, device.location.dock)
+            handle.refresh_geojson()
 
     def mower(self, name: str) -> DeviceHandle | None:
         """Return the DeviceHandle for the named device, or None."""
@@ -947,10 +1053,14 @@ class MammotionClient:
             ble_transport=transport,
             prefer_ble=True,
         )
+        handle.poll_scheduler = self._poll_scheduler
+        handle.map_executor = self.map_executor
+        await self._restore_stored_map(handle)
         await self._device_registry.register(handle)
         # Add to BLE-only account session
         ble_session = self._account_registry.get(BLE_ONLY_ACCOUNT)
         if ble_session is None:
+            # No limiter: BLE sends never spend cloud tokens.
             ble_session = AccountSession(account_id=BLE_ONLY_ACCOUNT)
             await self._account_registry.register(ble_session)
         ble_session.device_ids.add(device_name)
@@ -988,6 +1098,7 @@ class MammotionClient:
                     await session.mammotion_http.logout()
                 except Exception:  # noqa: BLE001
                     _logger.warning("HTTP logout failed — proceeding anyway", exc_info=True)
+            await session.mammotion_http.close()
             session.mammotion_http = None
         if session.cloud_client is not None:
             if revoke:
@@ -995,6 +1106,7 @@ class MammotionClient:
                     await session.cloud_client.sign_out()
                 except Exception:  # noqa: BLE001
                     _logger.warning("cloud sign_out failed — proceeding anyway", exc_info=True)
+            await session.cloud_client.close()
             session.cloud_client = None
         if session.token_manager is not None:
             await session.token_manager.stop_refresh_scheduler()
@@ -1045,6 +1157,25 @@ class MammotionClient:
         # credentials the host still has cached before their replacement exists.
         await self._sign_out_existing_session(account, revoke=False)
         mammotion_http = MammotionHTTP(session=session, ha_version=self._ha_version)
+        mammotion_http.response_cache = self.response_cache
+        # Nothing owns the HTTP client (or the Aliyun gateway) until the session is
+        # registered, so a failure anywhere before that closes them here.
+        async with contextlib.AsyncExitStack() as on_failure:
+            on_failure.push_async_callback(mammotion_http.close)
+            await self._initiate_cloud(account, password, mammotion_http, on_failure)
+            on_failure.pop_all()
+
+    async def _initiate_cloud(
+        self,
+        account: str,
+        password: str,
+        mammotion_http: MammotionHTTP,
+        on_failure: contextlib.AsyncExitStack,
+    ) -> None:
+        """Run the login and device discovery of :meth:`login_and_initiate_cloud`.
+
+        Every client opened here is registered on *on_failure* for closing.
+        """
         login_resp = await mammotion_http.login_v2(account, password)
         if login_resp.code != 0:
             raise LoginFailedError(account, login_resp.msg)
@@ -1076,11 +1207,13 @@ class MammotionClient:
             email=account,
             password=password,
             mammotion_http=mammotion_http,
+            rate_limiter=self._new_rate_limiter(),
         )
         acct_session.user_account = self._extract_user_account(mammotion_http)
 
         if aliyun_devices:
             cloud_client = CloudIOTGateway(mammotion_http)
+            on_failure.push_async_callback(cloud_client.close)
             await self._connect_iot(cloud_client)
             shared_notice = await cloud_client.get_shared_notice_list()
             if shared_notice.data and shared_notice.data.data:
@@ -1096,6 +1229,7 @@ class MammotionClient:
                 raise RuntimeError(msg)
 
             acct_session.cloud_client = cloud_client
+            cloud_client.rate_limiter = acct_session.rate_limiter
             token_manager = await self._ensure_token_manager(acct_session, mammotion_http)
             token_manager.attach_cloud_gateway(cloud_client)
             al_transport = self._setup_aliyun_transport(cloud_client, acct_session)
@@ -1111,6 +1245,7 @@ class MammotionClient:
                         ua,
                         device.product_key,
                         token_manager=acct_session.token_manager,
+                        rate_limiter=acct_session.rate_limiter,
                     )
                     acct_session.device_ids.add(device.device_name)
             await al_transport.connect()
@@ -1198,7 +1333,12 @@ class MammotionClient:
         # Get or create the session for this account
         acct_session = self._account_registry.get(account)
         if acct_session is None:
-            acct_session = AccountSession(account_id=account, email=account, password=password)
+            acct_session = AccountSession(
+                account_id=account,
+                email=account,
+                password=password,
+                rate_limiter=self._new_rate_limiter(),
+            )
             await self._account_registry.register(acct_session)
         else:
             acct_session.password = password
@@ -1230,6 +1370,7 @@ class MammotionClient:
         # has expired" on credentials that look perfectly fresh.  Only TokenManager wires
         # MammotionHTTP.on_login_refreshed to the host's persistence callback, so it has
         # to exist before the first refresh can happen.
+        mammotion_http.response_cache = self.response_cache
         acct_session.mammotion_http = mammotion_http
         acct_session.user_account = self._extract_user_account(mammotion_http)
         await self._ensure_token_manager(acct_session, mammotion_http)
@@ -1319,6 +1460,7 @@ class MammotionClient:
         Reuses the existing manager whenever it refreshes this exact login session,
         wiring the persistence callback and seeding its credential snapshots either way.
         """
+        mammotion_http.rate_limiter = acct_session.rate_limiter
         existing = acct_session.token_manager
         if existing is not None:
             if existing.http is mammotion_http:
@@ -1426,6 +1568,7 @@ class MammotionClient:
         transport: Any,
         user_account: int,
         token_manager: TokenManager | None,
+        rate_limiter: AccountRateLimiter | None = None,
     ) -> None:
         """Create, register and start a DeviceHandle for a cloud transport.
 
@@ -1445,12 +1588,49 @@ class MammotionClient:
             readiness_checker=get_readiness_checker(device_name, product_key),
         )
         handle.on_device_unbound = self._on_device_unbound
+        handle.poll_scheduler = self._poll_scheduler
+        handle.map_executor = self.map_executor
+        handle.rate_limiter = rate_limiter
+        await self._restore_stored_map(handle)
         await self._device_registry.register(handle)
         await handle.start()
         if token_manager is not None:
             token_manager.subscribe_handle(handle)
         self._iot_id_to_device_id[iot_id] = device_name
 
+    async def _restore_stored_map(self, handle: DeviceHandle) -> None:
+        """Seed a new handle's empty map from :attr:`map_store`, if one is configured.
+
+        A map the caller already supplied (e.g. restored from HA storage) is
+        left alone.  The restored map is only trusted once the device reports
+        a matching ``bol_hash`` — see ``_on_bol_hash_changed``.
+        """
+        device = handle.snapshot.raw
+        if self.map_store is None or not isinstance(device, MowingDevice) or device.map.root_hash_lists:
+            return
+        stored = await self.map_store.async_load(handle.device_name)
+        if stored is None:
+            return
+        device.map = stored.hash_list
+        _logger.debug(
+            "Restored stored map for %s (bol_hash=%d, %d areas)",
+            handle.device_name,
+            stored.bol_hash,
+            len(stored.hash_list.area),
+        )
+
+    async def _save_stored_map(self, device_name: str) -> None:
+        """Write *device_name*'s current map to :attr:`map_store`, if one is configured."""
+        if self.map_store is None:
+            return
+        device = self.get_device_by_name(device_name)
+        if not isinstance(device, MowingDevice):
+            return
+        try:
+            await self.map_store.async_save(device_name, device.map)
+        except OSError:
+            _logger.warning("Could not save map for %s", device_name, exc_info=True)
+
     def _setup_aliyun_transport(
         self, cloud_client: CloudIOTGateway, acct_session: AccountSession
     ) -> AliyunMQTTTransport:
@@ -1597,6 +1777,7 @@ class MammotionClient:
         user_account: int = 0,
         product_key: str = "",
         token_manager: TokenManager | None = None,
+        rate_limiter: AccountRateLimiter | None = None,
     ) -> None:
         """Register a single Aliyun device in the device registry."""
         await self._register_device_on_transport(
@@ -1606,6 +1787,7 @@ class MammotionClient:
             transport=transport,
             user_account=user_account,
             token_manager=token_manager,
+            rate_limiter=rate_limiter,
         )
         _logger.info("Aliyun device registered: %s (iot_id=%s)", device_name, iot_id)
 
@@ -1616,6 +1798,7 @@ class MammotionClient:
         user_account: int = 0,
         iot_id_override: str = "",
         token_manager: TokenManager | None = None,
+        rate_limiter: AccountRateLimiter | None = None,
     ) -> None:
         """Add MQTT topics and register a single Mammotion device in the device registry.
 
@@ -1639,6 +1822,7 @@ class MammotionClient:
             transport=transport,
             user_account=user_account,
             token_manager=token_manager,
+            rate_limiter=rate_limiter,
         )
         _logger.info("Mammotion device registered: %s (iot_id=%s)", record.device_name, iot_id)
 
@@ -1749,11 +1933,12 @@ class MammotionClient:
             return True
 
         mammotion_http = session.mammotion_http
-        device_list_resp = await mammotion_http.get_user_device_list()
+        # Fresh: the unbind is news the cached device lists may not reflect yet.
+        device_list_resp = await mammotion_http.get_user_device_list(fresh=True)
         owned_iot_id_map = {
             d.device_name: d.iot_id for d in (device_list_resp.data or []) if d.device_name and d.iot_id
         }
-        page_resp = await mammotion_http.get_user_device_page()
+        page_resp = await mammotion_http.get_user_device_page(fresh=True)
         records = (page_resp.data.records if page_resp.data else []) or []
         record = next((r for r in records if r.device_name == device_name), None)
         if record is None:
@@ -1833,6 +2018,7 @@ class MammotionClient:
             try:
                 await self._connect_iot(cloud_client)
             except Exception:  # noqa: BLE001
+                await cloud_client.close()
                 _logger.warning(
                     "restore_credentials: could not rebuild the Aliyun session for %s — "
                     "skipping the Aliyun transport this cycle (the HTTP login is unaffected)",
@@ -1840,6 +2026,9 @@ class MammotionClient:
                     exc_info=True,
                 )
                 return
+            except BaseException:
+                await cloud_client.close()
+                raise
             if (
                 cloud_client.aep_response is None
                 or cloud_client.region_response is None
@@ -1849,9 +2038,11 @@ class MammotionClient:
                 _logger.warning(
                     "restore_credentials: rebuilt Aliyun session for %s is incomplete — skipping its transport", account
                 )
+                await cloud_client.close()
                 return
 
         acct_session.cloud_client = cloud_client
+        cloud_client.rate_limiter = acct_session.rate_limiter
         token_manager = await self._ensure_token_manager(acct_session, mammotion_http)
         token_manager.attach_cloud_gateway(cloud_client)
         transport = self._setup_aliyun_transport(cloud_client, acct_session)
@@ -1881,6 +2072,7 @@ class MammotionClient:
                         ua,
                         device.product_key,
                         token_manager=acct_session.token_manager,
+                        rate_limiter=acct_session.rate_limiter,
                     )
                     known_ids.add(device.device_name)
 
@@ -1919,6 +2111,7 @@ class MammotionClient:
                                     ua,
                                     device.product_key,
                                     token_manager=acct_session.token_manager,
+                                    rate_limiter=acct_session.rate_limiter,
                                 )
                                 known_ids.add(device.device_name)
             except Exception:  # noqa: BLE001
@@ -1990,7 +2183,12 @@ class MammotionClient:
                 if record.device_name:
                     iot_id_override = owned_iot_id_map.get(record.device_name, "")
                     await self._register_mammotion_device(
-                        record, transport, ua, iot_id_override, token_manager=token_manager
+                        record,
+                        transport,
+                        ua,
+                        iot_id_override,
+                        token_manager=token_manager,
+                        rate_limiter=acct_session.rate_limiter,
                     )
                     known_ids.add(record.device_name)
 
@@ -2061,6 +2259,7 @@ class MammotionClient:
                     ua,
                     iot_id_override,
                     token_manager=acct_session.token_manager,  # type: ignore[arg-type]
+                    rate_limiter=acct_session.rate_limiter,
                 )
                 acct_session.device_ids.add(record.device_name)
 
@@ -2153,6 +2352,9 @@ class MammotionClient:
         *skip_area_names* suppresses step 1 (``get_area_name_list``); pass
         ``True`` for incremental mowing-time updates where area names are
         stable and the device may not respond to the query while busy.
+
+        Cloud syncs use :attr:`map_fetch_window` hashes in flight unless this
+        device's current firmware already stalled under pipelining.
         """
 
         if handle := self._device_registry.get_by_name(device_name):
@@ -2160,6 +2362,15 @@ class MammotionClient:
                 "start_map_sync [%s]: enqueuing MapFetchSaga (skip_area_names=%s)", device_name, skip_area_names
             )
             commands = handle.commands
+            over_ble = handle.is_transport_connected(TransportType.BLE)
+            firmware = handle.firmware_version
+            pipeline_window = self.map_fetch_window
+            if over_ble or self._strict_map_fetch_firmware.get(device_name) == firmware:
+                pipeline_window = 1
+
+            def _on_strict_fallback() -> None:
+                self._strict_map_fetch_firmware[device_name] = firmware
+
             saga = MapFetchSaga(
                 device_id=handle.device_id,
                 device_name=handle.device_name,
@@ -2173,8 +2384,10 @@ class MammotionClient:
                 get_bol_hash=lambda: (
                     locs[0].bol_hash if (locs := cast(MowerDevice, handle.snapshot.raw).report_data.locations) else None
                 ),
-                sync_type=2 if handle.is_transport_connected(TransportType.BLE) else 3,
+                sync_type=2 if over_ble else 3,
                 skip_area_names=skip_area_names,
+                pipeline_window=pipeline_window,
+                on_strict_fallback=_on_strict_fallback,
             )
 
             async def _on_map_complete() -> None:
@@ -2193,7 +2406,9 @@ class MammotionClient:
                     device.map.root_hash_lists = saga.result.root_hash_lists
                 device.map.update_hash_lists(device.map.hashlist)
                 if device.location.RTK.latitude != 0.0:
-                    device.map.generate_geojson(device.location.RTK, device.location.dock)
+                    # Build the map view off the event loop before subscribers read it.
+                    device.map.set_geojson_origin(device.location.RTK, device.location.dock)
+                    await device.map.async_geojson("generated_geojson", self.map_executor)
                 # Notify map_updated subscribers after a successful saga, matching
                 # ``handle.subscribe_map_updated`` 's docstring promise.  Without
                 # this emit, downstream subscribers (e.g. Mammotion-HA's area-switch
@@ -2202,6 +2417,7 @@ class MammotionClient:
                 # entities permanently missing even though the saga successfully
                 # populated ``device.map.area``.
                 await handle.emit_map_updated()
+                await self._save_stored_map(device_name)
 
             await handle.enqueue_saga(saga, on_complete=_on_map_complete)
         else:
@@ -2232,6 +2448,7 @@ class MammotionClient:
             if device := self.get_device_by_name(device_name):
                 device.map.plans_stale = False
                 device.map.plans_fetched = True
+            await self._save_stored_map(device_name)
 
         await handle.enqueue_saga(saga, on_complete=_on_plan_complete)
 
@@ -2292,7 +2509,7 @@ class MammotionClient:
             _logger.warning("send_svg: device '%s' not registered", device_name)
             return
 
-        chunks = chunk_svg_messages(svg_message)
+        chunks = await self.map_executor.run(chunk_svg_messages, svg_message)
         saga = SvgSendSaga(chunks=chunks, command_builder=handle.commands, send_command=handle.send_raw)
 
         async def _on_complete() -> None:
@@ -2366,7 +2583,9 @@ class MammotionClient:
             async def _on_mow_path_complete() -> None:
                 device = self.get_device_by_name(device_name)
                 if device is not None and device.location.RTK.latitude != 0.0:
-                    device.map.generate_mowing_geojson(device.location.RTK)
+                    device.map.set_geojson_origin(device.location.RTK)
+                    await device.map.async_geojson("generated_mow_path_geojson", self.map_executor)
+                await self._save_stored_map(device_name)
 
             await handle.enqueue_saga(saga, on_complete=_on_mow_path_complete)
 
@@ -2375,8 +2594,8 @@ class MammotionClient:
 
         Sends ``NavGetCommData(action=8, type=18)`` to the device and collects
         the multi-frame ``toapp_get_commondata_ack`` response.  On completion the
-        assembled ``list[CommDataCouple]`` is stored in
-        ``device.map.dynamics_line``, replacing any previous value.
+        assembled points are stored in ``device.map.dynamics_line`` (a
+        ``PointBuffer``), replacing any previous value.
 
         The saga is enqueued on the device's command queue, so it will not
         interrupt other in-progress commands.  Callers should rate-limit
@@ -2404,7 +2623,8 @@ class MammotionClient:
             device = self.get_device_by_name(device_name)
             if device is not None and saga.result:
                 device.map.update_dynamics_line(saga.result)
-                device.map.apply_dynamics_line_geojson(device.location.RTK)
+                device.map.set_geojson_origin(device.location.RTK)
+                handle.refresh_geojson()
 
         await handle.enqueue_saga(saga, on_complete=_on_complete)
 
@@ -2733,6 +2953,126 @@ class MammotionClient:
 
         await handle.queue.enqueue(_do_send, priority=Priority.NORMAL, skip_if_saga_active=skip_if_saga_active)
 
+    async def send_command_to_many(
+        self,
+        names: Iterable[str],
+        key: str,
+        *,
+        concurrency: int = FLEET_SEND_CONCURRENCY,
+        timeout: float = FLEET_SEND_TIMEOUT,
+        prefer_ble: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[FleetCommandResult]:
+        """Send the same command to several devices, yielding each result as it completes.
+
+        Unlike looping over :meth:`send_command_with_args`, the protobuf payload
+        is built once per device model (``key(**kwargs)`` only differs by model
+        and account, not by device), at most *concurrency* devices are in flight
+        at once, and every device gets a :class:`FleetCommandResult` instead of
+        errors being swallowed by its command queue.
+
+        Devices whose cloud transport is already rate-limited are reported as
+        ``RATE_LIMITED`` without being enqueued, so once one send trips a 429 the
+        remaining devices on that account short-circuit instead of piling up
+        behind the breaker.
+
+        Args:
+            names:       Registered device names; duplicates are sent once.
+            key:         Method name on :class:`MammotionCommand`.
+            concurrency: Maximum number of devices sending at the same time.
+            timeout:     Seconds to wait per device, including time queued behind
+                         a running saga.  A send that has not started by then is
+                         dropped rather than delivered late.
+            prefer_ble:  As for :meth:`send_command_with_args`.
+            **kwargs:    Passed to the command builder.
+
+        Raises:
+            AttributeError: if *key* is not a valid command.
+
+        """
+        getattr(MammotionCommand, key)  # fail fast on a bad key, before anything is enqueued
+
+        semaphore = asyncio.Semaphore(concurrency)
+        payloads: dict[tuple[DeviceType, int], bytes] = {}
+
+        def _payload(handle: DeviceHandle) -> bytes:
+            model = (DeviceType.value_of_str(handle.device_name), handle.user_account)
+            if (payload := payloads.get(model)) is None:
+                payload = payloads[model] = getattr(handle.commands, key)(**kwargs)
+            return payload
+
+        async def _send_one(name: str) -> FleetCommandResult:
+            handle = self._device_registry.get_by_name(name)
+            if handle is None:
+                return FleetCommandResult(name, FleetCommandStatus.SKIPPED, error=KeyError(name))
+            async with semaphore:
+                started = time.monotonic()
+
+                def _result(status: FleetCommandStatus, error: BaseException | None = None) -> FleetCommandResult:
+                    return FleetCommandResult(name, status, time.monotonic() - started, error)
+
+                try:
+                    transport = handle.active_transport(prefer_ble=prefer_ble)
+                except NoTransportAvailableError as exc:
+                    return _result(FleetCommandStatus.SKIPPED, exc)
+                if _send_blocked(handle, transport):
+                    return _result(FleetCommandStatus.RATE_LIMITED)
+
+                try:
+                    payload = _payload(handle)
+                except Exception as exc:  # noqa: BLE001 — reported per device, never raised mid-fleet
+                    return _result(FleetCommandStatus.FAILED, exc)
+                handle.record_user_command()
+                session = self._get_session_for_device(name)
+                done: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+
+                async def _do_send() -> None:
+                    if done.done():  # timed out while queued — don't deliver a stale command
+                        return
+                    delivered = False
+
+                    async def _on_sent(sent: bytes) -> None:
+                        nonlocal delivered
+                        # Compared by value: a layer between here and the bus may hand on a copy.
+                        delivered = delivered or sent == payload
+
+                    try:
+                        with handle.subscribe_sent(_on_sent):
+                            await self._send_with_auth_retry(
+                                lambda: handle.send_raw(payload, prefer_ble=prefer_ble),
+                                session,
+                            )
+                    except Exception as exc:
+                        if not done.done():
+                            done.set_exception(exc)
+                        raise
+                    finally:
+                        if not done.done():
+                            done.set_result(delivered)
+
+                await handle.queue.enqueue(_do_send, priority=Priority.NORMAL)
+                try:
+                    async with asyncio.timeout(timeout):
+                        delivered = await done
+                except TimeoutError:
+                    return _result(FleetCommandStatus.TIMEOUT)
+                except Exception as exc:  # noqa: BLE001
+                    return _result(FleetCommandStatus.FAILED, exc)
+                if delivered:
+                    return _result(FleetCommandStatus.SENT)
+                # send_raw logs and swallows a 429 / quota block; the transport's breaker records it.
+                if _send_blocked(handle, transport):
+                    return _result(FleetCommandStatus.RATE_LIMITED)
+                return _result(FleetCommandStatus.FAILED)
+
+        tasks = [asyncio.create_task(_send_one(name)) for name in dict.fromkeys(names)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+
     async def send_command_and_wait(
         self,
         name: str,
@@ -2741,6 +3081,7 @@ class MammotionClient:
         *,
         send_timeout: float = 5.0,
         prefer_ble: bool = True,
+        discriminator: Mapping[str, Any] | None = None,
         **kwargs: Any,
     ) -> Any:
         """Send a command and wait for the matching protobuf response.
@@ -2753,6 +3094,9 @@ class MammotionClient:
             key:            Method name on :class:`MammotionCommand`.
             expected_field: Protobuf oneof field name expected in response.
             send_timeout:   Seconds to wait per attempt.
+            discriminator:  Attribute values the response must also carry (e.g.
+                            ``{"hash": area_hash}``), so concurrent requests for
+                            the same field are told apart.
             **kwargs:       Arguments passed to the command builder.
 
         Raises:
@@ -2780,6 +3124,7 @@ class MammotionClient:
             send_fn=_send,
             expected_field=expected_field,
             send_timeout=send_timeout,
+            discriminator=discriminator,
         )
 
     def set_prefer_ble(self, device_id: str, *, prefer_ble: bool) -> None:
@@ -0,0 +1,196 @@
+"""On-disk cache of each device's map, so a restart doesn't re-fetch an unchanged map.
+
+A :class:`MapStore` keeps one file per device holding its :class:`HashList`
+— area / obstacle / path frames, the root hash manifest, area names, plans
+and the cached mow path — stamped with the ``bol_hash`` the frames add up
+to.  :class:`~pymammotion.client.MammotionClient` loads it when a device's
+handle is created; when the device then reports the same ``bol_hash`` the
+map is already synced and no ``MapFetchSaga`` runs.  When it reports a
+different one, ``HashList.invalidate_maps`` keeps the frames of every area
+that still exists, so only the edited hashes are fetched.
+
+File layout (little-endian)::
+
+    magic   4s  b"PMAP"
+    version H   FORMAT_VERSION
+    flags   H   reserved, 0
+    bol     Q   computed_bol_hash of the stored map
+    saved   d   time.time() at save
+    body        zlib(orjson(HashList.to_dict() minus generated GeoJSON))
+
+Generated GeoJSON is left out — it is derived from the frames and rebuilt
+against the current RTK position.  Files are written to a temporary name
+and renamed into place, so a crash mid-save leaves the previous map intact.
+A missing, truncated, corrupt or other-version file is a cache miss.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import logging
+import os
+from pathlib import Path
+import re
+import struct
+import tempfile
+import time
+from typing import Any
+import zlib
+
+import orjson
+
+from pymammotion.data.model.hash_list import HashList
+
+_logger = logging.getLogger(__name__)
+
+MAGIC = b"PMAP"
+#: Bump when the body layout changes; files of any other version are ignored.
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHQd")
+_U64_MASK = (1 << 64) - 1
+
+#: HashList fields derived from the frames (or live-only) that are not stored.
+DERIVED_MAP_FIELDS = (
+    "generated_geojson",
+    "geojson_yaw",
+    "generated_mow_path_geojson",
+    "generated_mow_progress_geojson",
+    "dynamics_line",
+    "generated_dynamics_line_geojson",
+    "_geojson_hashlist_snapshot",
+)
+
+_UNSAFE_NAME_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+
+class MapStoreError(ValueError):
+    """A stored map file is not a readable map of the current format."""
+
+
+@dataclass(frozen=True)
+class StoredMap:
+    """A map loaded from the store.
+
+    Attributes:
+        bol_hash: ``computed_bol_hash`` of the map when it was saved.
+        saved_at: ``time.time()`` of the save.
+        hash_list: The restored map.
+
+    """
+
+    bol_hash: int
+    saved_at: float
+    hash_list: HashList
+
+
+def encode_map(hash_list: HashList, saved_at: float | None = None) -> bytes:
+    """Serialise *hash_list* to the store's file format."""
+    payload = hash_list.to_dict()
+    for name in DERIVED_MAP_FIELDS:
+        payload.pop(name, None)
+    body = zlib.compress(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        0,
+        hash_list.computed_bol_hash & _U64_MASK,
+        time.time() if saved_at is None else saved_at,
+    )
+    return header + body
+
+
+def decode_map(data: bytes) -> StoredMap:
+    """Parse bytes written by :func:`encode_map`.
+
+    Raises:
+        MapStoreError: *data* is not a map file of :data:`FORMAT_VERSION`.
+
+    """
+    if len(data) < _HEADER.size:
+        msg = "map file is truncated"
+        raise MapStoreError(msg)
+    magic, version, _flags, bol_hash, saved_at = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        msg = "not a map file"
+        raise MapStoreError(msg)
+    if version != FORMAT_VERSION:
+        msg = f"map file version {version}, expected {FORMAT_VERSION}"
+        raise MapStoreError(msg)
+    try:
+        payload: dict[str, Any] = orjson.loads(zlib.decompress(data[_HEADER.size :]))
+        hash_list = HashList.from_dict(payload)
+    except Exception as exc:
+        msg = f"map file body is unreadable: {exc}"
+        raise MapStoreError(msg) from exc
+    return StoredMap(bol_hash=bol_hash, saved_at=saved_at, hash_list=hash_list)
+
+
+class MapStore:
+    """Directory of per-device map files.
+
+    The blocking methods do file I/O on the calling thread; the ``async_``
+    variants run them in a worker thread so the event loop is never held
+    up by serialising a large map.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        """Store map files under *directory* (created on first save)."""
+        self.directory = Path(directory)
+
+    def path_for(self, device_name: str) -> Path:
+        """Return the file a device's map is stored in."""
+        return self.directory / f"{_UNSAFE_NAME_CHARS.sub('_', device_name)}.pmap"
+
+    def save(self, device_name: str, hash_list: HashList) -> None:
+        """Write *hash_list* as *device_name*'s stored map, replacing any previous one atomically."""
+        data = encode_map(hash_list)
+        path = self.path_for(device_name)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.directory, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp:
+                tmp.write(data)
+                tmp.flush()
+                os.fsync(tmp.fileno())
+            Path(tmp_name).replace(path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                Path(tmp_name).unlink()
+            raise
+
+    def load(self, device_name: str) -> StoredMap | None:
+        """Return *device_name*'s stored map, or None when there is no usable one."""
+        path = self.path_for(device_name)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        except OSError:
+            _logger.warning("MapStore: could not read %s", path, exc_info=True)
+            return None
+        try:
+            return decode_map(data)
+        except MapStoreError as exc:
+            _logger.warning("MapStore: ignoring %s: %s", path, exc)
+            return None
+
+    def delete(self, device_name: str) -> None:
+        """Remove *device_name*'s stored map, if any."""
+        with contextlib.suppress(FileNotFoundError):
+            self.path_for(device_name).unlink()
+
+    async def async_save(self, device_name: str, hash_list: HashList) -> None:
+        """Save in a worker thread.
+
+        A detached copy is taken first: ``HashList`` containers are
+        copy-on-write, so the copy is a stable snapshot the worker can walk
+        while the event loop keeps applying frames to the live map.
+        """
+        await asyncio.to_thread(self.save, device_name, hash_list.detached_copy())
+
+    async def async_load(self, device_name: str) -> StoredMap | None:
+        """Load in a worker thread."""
+        return await asyncio.to_thread(self.load, device_name)
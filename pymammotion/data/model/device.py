@@ -4,7 +4,7 @@ import dataclasses
 from dataclasses import dataclass, field
 import math
 import time
-from typing import Any, ClassVar
+from typing import Any, ClassVar, Self
 
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 import orjson
@@ -66,6 +66,27 @@ class Device(DataClassORJSONMixin):
     #: :meth:`has_live_ota_push`.
     ota_progress_at: float = 0.0
 
+    def to_snapshot_bytes(self) -> bytes:
+        """Serialise this device to a compact binary snapshot (see :mod:`pymammotion.data.snapshot_codec`)."""
+        from pymammotion.data.snapshot_codec import to_snapshot_bytes
+
+        return to_snapshot_bytes(self)
+
+    @classmethod
+    def from_snapshot_bytes(cls, data: bytes) -> Self:
+        """Rebuild a device from :meth:`to_snapshot_bytes` output.
+
+        Returns the subclass that was saved; raises ``SnapshotError`` when that
+        is not a ``cls``, or when *data* is not a current-format snapshot.
+        """
+        from pymammotion.data.snapshot_codec import SnapshotError, from_snapshot_bytes
+
+        device = from_snapshot_bytes(data)
+        if not isinstance(device, cls):
+            msg = f"snapshot holds a {type(device).__name__}, not a {cls.__name__}"
+            raise SnapshotError(msg)
+        return device
+
     def has_live_ota_push(self) -> bool:
         """Return True when a device-pushed OTA frame is recent enough to still be trusted.
 
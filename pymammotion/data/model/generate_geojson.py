@@ -30,12 +30,15 @@ Icon features (RTK, dock) additionally carry ``iconImage`` /
 layer shape that the HA-Mammotion-Assets icon pack consumes.
 """
 
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 import json
 import logging
 import math
 from pathlib import Path
 from typing import Any, ClassVar
 
+import numpy as np
 from shapely.geometry import Point
 
 from pymammotion.data.model.hash_list import (
@@ -48,6 +51,8 @@ from pymammotion.data.model.hash_list import (
     NavGetCommData,
     SvgMessage,
 )
+from pymammotion.data.model.point_buffer import PointBuffer
+from pymammotion.utility.map import METERS_PER_DEGREE, enu_offsets_to_lonlat, polyline_stats
 
 logger = logging.getLogger(__name__)
 
@@ -280,9 +285,6 @@ POLYGON_TYPE_IDS: frozenset[int] = frozenset(
     {TYPE_MOWING_ZONE, TYPE_OBSTACLE, TYPE_VISUAL_SAFETY_ZONE, TYPE_VISUAL_OBSTACLE_ZONE}
 )
 
-# Coordinate conversion constants
-METERS_PER_DEGREE: int = 111320
-
 # Type aliases
 Coordinate = tuple[float, float]
 CoordinateList = list[list[float]]
@@ -294,9 +296,70 @@ LocationDict = dict[str, Coordinate]
 geometry_types: list[str] = GEOMETRY_TYPES
 
 
+@dataclass
+class FeatureCache:
+    """Per-hash memo of converted coordinates for :meth:`GeojsonGenerator.generate_geojson`.
+
+    Coordinate conversion and stats dominate map GeoJSON generation, and on a
+    large map almost every regeneration is triggered by one hash changing.
+    Entries are keyed by ``(type_name, hash)`` and only reused while the
+    ``FrameList`` is the *same object* holding the same number of frames —
+    ``HashList`` mutators are copy-on-write, so any frame change produces a new
+    ``FrameList``.  Names, descriptions and styles are rebuilt every run, so
+    labels that depend on other hashes (area names, per-type indices) stay
+    correct.
+
+    The whole cache is dropped when the RTK origin or yaw changes, and entries
+    for hashes not seen in a run are pruned at the end of it.  Cached
+    coordinate lists are shared between successive collections and must not be
+    mutated.
+    """
+
+    origin: tuple[float, float, float] | None = None
+    entries: dict[tuple[str, int], tuple[Any, int, CoordinateList, float, float]] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    _live: dict[tuple[str, int], tuple[Any, int, CoordinateList, float, float]] = field(
+        default_factory=dict, repr=False
+    )
+
+    def begin(self, rtk_location: Point, yaw: float) -> None:
+        """Start a generation run, discarding every entry if the origin or yaw moved."""
+        origin = (rtk_location.x, rtk_location.y, yaw)
+        if origin != self.origin:
+            self.origin = origin
+            self.entries = {}
+        self._live = {}
+
+    def lookup(self, key: tuple[str, int], frame_list: Any) -> tuple[CoordinateList, float, float] | None:
+        """Return ``(lonlat_coords, length, area)`` for *key* if *frame_list* is unchanged."""
+        entry = self.entries.get(key)
+        if entry is None or entry[0] is not frame_list or entry[1] != len(frame_list.data):
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._live[key] = entry
+        return entry[2], entry[3], entry[4]
+
+    def store(
+        self, key: tuple[str, int], frame_list: Any, lonlat_coords: CoordinateList, length: float, area: float
+    ) -> None:
+        """Record the converted geometry for *key* built from *frame_list*."""
+        self._live[key] = (frame_list, len(frame_list.data), lonlat_coords, length, area)
+
+    def end(self) -> None:
+        """Finish a run: keep only the entries looked up or stored during it."""
+        self.entries = self._live
+        self._live = {}
+
+
 class GeojsonGenerator:
     """Class for logging GeoJSON data."""
 
+    #: Point count from which coordinate conversion and stats use the NumPy batch
+    #: path; below it the per-point loop beats the cost of building the arrays.
+    VECTORISE_MIN_POINTS: ClassVar[int] = 64
+
     @staticmethod
     def is_overlapping(p: Point, placed_points: list[Point], min_distance: float = 0.00005) -> bool:
         """Check if point p is too close to any previously placed label."""
@@ -311,13 +374,20 @@ class GeojsonGenerator:
 
     @staticmethod
     def generate_geojson(
-        hash_list: HashList, rtk_location: Point, dock_location: Point, dock_rotation: int, yaw: float = 0.0
+        hash_list: HashList,
+        rtk_location: Point,
+        dock_location: Point,
+        dock_rotation: int,
+        yaw: float = 0.0,
+        cache: FeatureCache | None = None,
     ) -> GeoJSONCollection:
         """Generate GeoJSON from hash list data.
 
         Args:
             hash_list: HashList object containing map data
             rtk_location: Tuple of (longitude, latitude) for rtk position
+            cache: Optional per-hash geometry cache; when given, only hashes whose
+                frames changed since the previous call are re-converted.
             :param hash_list:
             :param rtk_location:
             :param dock_rotation:
@@ -327,9 +397,13 @@ class GeojsonGenerator:
         area_names = GeojsonGenerator._build_area_name_lookup(hash_list.area_name)
 
         geo_json: GeoJSONCollection = {"type": "FeatureCollection", "name": "Lawn Areas", "features": []}
+        if cache is not None:
+            cache.begin(rtk_location, yaw)
         GeojsonGenerator._add_rtk_and_dock(rtk_location, dock_location, dock_rotation, geo_json)
-        GeojsonGenerator._process_map_objects(hash_list, rtk_location, area_names, geo_json, yaw=yaw)
-        GeojsonGenerator._process_svg_map_objects(hash_list, rtk_location, geo_json, yaw=yaw)
+        GeojsonGenerator._process_map_objects(hash_list, rtk_location, area_names, geo_json, yaw=yaw, cache=cache)
+        GeojsonGenerator._process_svg_map_objects(hash_list, rtk_location, geo_json, yaw=yaw, cache=cache)
+        if cache is not None:
+            cache.end()
 
         # _save_geojson(geo_json)
         return geo_json
@@ -377,9 +451,7 @@ class GeojsonGenerator:
 
         # Convert local x/y → lon/lat.  Unlike polygon boundaries the dynamics
         # line must NOT be reversed — point order encodes time (start → current).
-        lonlat_coords: CoordinateList = [
-            list(GeojsonGenerator.lon_lat_delta(rtk_location, pt.x, pt.y, yaw)) for pt in dynamics_line
-        ]
+        lonlat_coords = GeojsonGenerator._to_lonlat_coords(dynamics_line, rtk_location, yaw=yaw)
         length, _ = GeojsonGenerator.map_object_stats(dynamics_line)
 
         properties: dict[str, Any] = {
@@ -484,12 +556,10 @@ class GeojsonGenerator:
                     type_by_hash.setdefault(packet.path_hash, packet.path_type)
 
         # Assemble points per hash in path_cur order.
-        points_by_hash: dict[int, list[CommDataCouple]] = {}
-        for path_hash, cur_map in packets_by_hash.items():
-            pts: list[CommDataCouple] = []
-            for cur in sorted(cur_map.keys()):
-                pts.extend(cur_map[cur].data_couple)
-            points_by_hash[path_hash] = pts
+        points_by_hash: dict[int, PointBuffer] = {
+            path_hash: PointBuffer.join(cur_map[cur].data_couple for cur in sorted(cur_map.keys()))
+            for path_hash, cur_map in packets_by_hash.items()
+        }
 
         def _hash_order(h: int) -> int:
             try:
@@ -505,9 +575,7 @@ class GeojsonGenerator:
 
             if is_active:
                 if path_pos is not None and (path_pos[0] != 0.0 or path_pos[1] != 0.0):
-                    remaining: list[CommDataCouple] = [CommDataCouple(x=path_pos[0], y=path_pos[1])] + all_points[
-                        now_index:
-                    ]
+                    remaining = PointBuffer.from_coords(path_pos[:2]) + all_points[now_index:]
                 else:
                     remaining = all_points[max(0, now_index - 1) :]
                 applied_index = now_index
@@ -595,6 +663,7 @@ class GeojsonGenerator:
         area_names: dict[int, str],
         geo_json: GeoJSONCollection,
         yaw: float = 0.0,
+        cache: FeatureCache | None = None,
     ) -> int:
         """Process all map objects and add them to GeoJSON.
 
@@ -609,6 +678,7 @@ class GeojsonGenerator:
             rtk_location: Tuple of (longitude, latitude) for rtk position
             area_names: Dictionary mapping hash to area name
             geo_json: GeoJSON collection to add features to
+            cache: Optional per-hash geometry cache (see :class:`FeatureCache`)
 
         Returns:
             Total number of frames processed
@@ -638,12 +708,18 @@ class GeojsonGenerator:
                     continue
 
                 index += 1
-                local_coords = GeojsonGenerator._collect_frame_coordinates(frame_list)
                 total_frames += len(frame_list.data)
 
-                lonlat_coords = GeojsonGenerator._convert_to_lonlat_coords(local_coords, rtk_location, yaw=yaw)
-                is_polygon = frame_list.data[0].type in POLYGON_TYPE_IDS
-                length, area = GeojsonGenerator.map_object_stats(local_coords, closed=is_polygon)
+                cached = cache.lookup((type_name, hash_key), frame_list) if cache is not None else None
+                if cached is not None:
+                    lonlat_coords, length, area = cached
+                else:
+                    local_coords = GeojsonGenerator._collect_frame_coordinates(frame_list)
+                    lonlat_coords = GeojsonGenerator._convert_to_lonlat_coords(local_coords, rtk_location, yaw=yaw)
+                    is_polygon = frame_list.data[0].type in POLYGON_TYPE_IDS
+                    length, area = GeojsonGenerator.map_object_stats(local_coords, closed=is_polygon)
+                    if cache is not None:
+                        cache.store((type_name, hash_key), frame_list, lonlat_coords, length, area)
 
                 feature = GeojsonGenerator._create_feature(
                     hash_key,
@@ -697,10 +773,13 @@ class GeojsonGenerator:
 
             # Group coordinates by path_type so each type becomes a separate feature.
             # path_type=0: main mow stripes (弓 arch), path_type=2: border passes (回 circular).
-            coords_by_path_type: dict[int, list[CommDataCouple]] = {}
+            packets_by_path_type: dict[int, list[PointBuffer]] = {}
             for mow_frame in ordered_mow_paths:
                 for packet in mow_frame.path_packets:
-                    coords_by_path_type.setdefault(packet.path_type, []).extend(packet.data_couple)
+                    packets_by_path_type.setdefault(packet.path_type, []).append(packet.data_couple)
+            coords_by_path_type = {
+                path_type: PointBuffer.join(parts) for path_type, parts in packets_by_path_type.items()
+            }
 
             for path_type, local_coords in coords_by_path_type.items():
                 lonlat_coords = GeojsonGenerator._convert_to_lonlat_coords(local_coords, rtk_location, yaw=yaw)
@@ -743,7 +822,11 @@ class GeojsonGenerator:
 
     @staticmethod
     def _process_svg_map_objects(
-        hash_list: HashList, rtk_location: Point, geo_json: GeoJSONCollection, yaw: float = 0.0
+        hash_list: HashList,
+        rtk_location: Point,
+        geo_json: GeoJSONCollection,
+        yaw: float = 0.0,
+        cache: FeatureCache | None = None,
     ) -> None:
         """Convert SVG tile overlays to GeoJSON Polygon features.
 
@@ -763,11 +846,17 @@ class GeojsonGenerator:
             if svg_frame is None:
                 continue
 
-            corners = GeojsonGenerator._svg_bounding_box(svg_frame, yaw)
-            lonlat_coords = GeojsonGenerator._convert_to_lonlat_coords(corners, rtk_location, yaw=yaw)
-            # Close the polygon ring
-            if lonlat_coords and lonlat_coords[0] != lonlat_coords[-1]:
-                lonlat_coords.append(lonlat_coords[0])
+            cached = cache.lookup(("svg", hash_key), frame_list) if cache is not None else None
+            if cached is not None:
+                lonlat_coords = cached[0]
+            else:
+                corners = GeojsonGenerator._svg_bounding_box(svg_frame, yaw)
+                lonlat_coords = GeojsonGenerator._convert_to_lonlat_coords(corners, rtk_location, yaw=yaw)
+                # Close the polygon ring
+                if lonlat_coords and lonlat_coords[0] != lonlat_coords[-1]:
+                    lonlat_coords.append(lonlat_coords[0])
+                if cache is not None:
+                    cache.store(("svg", hash_key), frame_list, lonlat_coords, 0.0, 0.0)
 
             style = SVG_DISABLED_STYLE if svg_frame.svg_message.hide_svg else SVG_ENABLED_STYLE
             properties: dict[str, Any] = {
@@ -811,24 +900,52 @@ class GeojsonGenerator:
         return True
 
     @staticmethod
-    def _collect_frame_coordinates(frame_list: FrameList) -> list[CommDataCouple]:
+    def _collect_frame_coordinates(frame_list: FrameList) -> PointBuffer:
         """Collect coordinates from all frames in a FrameList.
 
         Args:
             frame_list: FrameList containing frame data
 
         Returns:
-            List of coordinate dictionaries with 'x' and 'y' keys
+            All frames' points concatenated into one PointBuffer
+
+        """
+        # TODO svg message needs different transform
+        return PointBuffer.join(frame.data_couple for frame in frame_list.data if isinstance(frame, NavGetCommData))
+
+    @staticmethod
+    def _xy_arrays(coords: Sequence[CommDataCouple]) -> tuple[np.ndarray, np.ndarray]:
+        """Split *coords* into float64 x and y arrays for the batch helpers."""
+        if isinstance(coords, PointBuffer):
+            interleaved = np.frombuffer(coords, dtype=np.float64)
+            return interleaved[0::2], interleaved[1::2]
+        count = len(coords)
+        xs = np.fromiter((xy.x for xy in coords), dtype=np.float64, count=count)
+        ys = np.fromiter((xy.y for xy in coords), dtype=np.float64, count=count)
+        return xs, ys
+
+    @staticmethod
+    def _to_lonlat_coords(
+        local_coords: list[CommDataCouple],
+        rtk_location: Point,
+        x_offset: int = 0,
+        y_offset: int = 0,
+        yaw: float = 0.0,
+    ) -> CoordinateList:
+        """Convert local x,y coordinates to [lon, lat] pairs, keeping their order.
 
+        Large inputs (mow paths run to tens of thousands of points) go through
+        :func:`~pymammotion.utility.map.enu_offsets_to_lonlat` in one NumPy
+        pass; small ones use :meth:`lon_lat_delta` per point.  Both give the
+        same values.
         """
-        local_coords: list[CommDataCouple] = []
-        for frame in frame_list.data:
-            if isinstance(frame, NavGetCommData):
-                local_coords.extend(frame.data_couple)
-            # TODO svg message needs different transform
-            # elif isinstance(frame, SvgMessage):
-            #     local_coords.extend(frame.)
-        return local_coords
+        if len(local_coords) >= GeojsonGenerator.VECTORISE_MIN_POINTS:
+            xs, ys = GeojsonGenerator._xy_arrays(local_coords)
+            return enu_offsets_to_lonlat(xs + x_offset, ys + y_offset, rtk_location.x, rtk_location.y, yaw).tolist()
+        return [
+            list(GeojsonGenerator.lon_lat_delta(rtk_location, xy.x + x_offset, xy.y + y_offset, yaw))
+            for xy in local_coords
+        ]
 
     @staticmethod
     def _convert_to_lonlat_coords(
@@ -849,10 +966,7 @@ class GeojsonGenerator:
             List of [longitude, latitude] coordinate pairs
 
         """
-        lonlat_coords: CoordinateList = [
-            list(GeojsonGenerator.lon_lat_delta(rtk_location, xy.x + x_offset, xy.y + y_offset, yaw))
-            for xy in local_coords
-        ]
+        lonlat_coords = GeojsonGenerator._to_lonlat_coords(local_coords, rtk_location, x_offset, y_offset, yaw)
         lonlat_coords.reverse()  # GeoJSON polygons go clockwise
         return lonlat_coords
 
@@ -1170,6 +1284,8 @@ class GeojsonGenerator:
         # Point Object
         if len(coords) < 2:
             return 0.0, 0.0
+        if len(coords) >= GeojsonGenerator.VECTORISE_MIN_POINTS:
+            return polyline_stats(*GeojsonGenerator._xy_arrays(coords), closed=closed)
 
         def distance(p1: CommDataCouple, p2: CommDataCouple) -> float:
             """Calculate Euclidean distance between two points."""
@@ -2,20 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
+import copy
 import dataclasses
 from dataclasses import dataclass, field
 from enum import IntEnum
-from typing import TYPE_CHECKING, Any
+import operator
+from typing import TYPE_CHECKING, Any, Self
 
+from mashumaro import field_options
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 from shapely import Point
 
+from pymammotion.data.model.point_buffer import CommDataCouple, PointBuffer
 from pymammotion.proto import NavGetCommDataAck, NavGetHashListAck, SvgMessageAckT
 from pymammotion.utility.map import CoordinateConverter
 from pymammotion.utility.mur_mur_hash import MurMurHashUtil
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pymammotion.data.model.location import Dock, LocationPoint
+    from pymammotion.utility.executor import MapExecutor
 
 
 class PathType(IntEnum):
@@ -89,14 +97,6 @@ class PathType(IntEnum):
     """Vision-detected obstacle zone (Luba 2 Vision / Pro only)."""
 
 
-@dataclass
-class CommDataCouple:
-    """An (x, y) coordinate pair from a common-data map frame."""
-
-    x: float = 0.0
-    y: float = 0.0
-
-
 @dataclass
 class AreaLabelName(DataClassORJSONMixin):
     """User-visible label name for a mowing area."""
@@ -129,10 +129,15 @@ class NavGetCommData(DataClassORJSONMixin):
     current_frame: int = 0
     data_hash: int = 0
     data_len: int = 0
-    data_couple: list[CommDataCouple] = field(default_factory=list)
+    data_couple: PointBuffer = field(default_factory=PointBuffer)
     reserved: str = ""
     name_time: NavNameTime = field(default_factory=NavNameTime)
 
+    def __post_init__(self) -> None:
+        """Pack a caller-supplied list of points into a :class:`PointBuffer`."""
+        if not isinstance(self.data_couple, PointBuffer):
+            self.data_couple = PointBuffer(self.data_couple)
+
 
 @dataclass
 class MowPathPacket(DataClassORJSONMixin):
@@ -143,7 +148,12 @@ class MowPathPacket(DataClassORJSONMixin):
     path_total: int = 0
     path_cur: int = 0
     zone_hash: int = 0
-    data_couple: list[CommDataCouple] = field(default_factory=list)
+    data_couple: PointBuffer = field(default_factory=PointBuffer)
+
+    def __post_init__(self) -> None:
+        """Pack a caller-supplied list of points into a :class:`PointBuffer`."""
+        if not isinstance(self.data_couple, PointBuffer):
+            self.data_couple = PointBuffer(self.data_couple)
 
 
 @dataclass
@@ -200,8 +210,71 @@ class SvgMessage(DataClassORJSONMixin):
     svg_message: SvgMessageData = field(default_factory=SvgMessageData)
 
 
+def _frame_bit(frame_number: int) -> int:
+    """Return the bitmap bit for a frame number (frames are 1-based; bit 0 holds a stray frame 0)."""
+    return 1 << frame_number if frame_number >= 0 else 0
+
+
+def _clear_bits(bitmap: int, total_frame: int) -> list[int]:
+    """Return the frame numbers in ``1..total_frame`` whose bit is not set in *bitmap*."""
+    absent = ~bitmap & ((1 << (total_frame + 1)) - 2)
+    missing: list[int] = []
+    while absent:
+        low = absent & -absent
+        missing.append(low.bit_length() - 1)
+        absent ^= low
+    return missing
+
+
+class _FrameBitmap:
+    """Received-frame bookkeeping shared by the frame-list dataclasses.
+
+    Bit *n* of the bitmap is set once a frame with ``current_frame == n`` is in
+    ``data``, so "what's missing" is a mask test rather than a set build over
+    ``range(1, total_frame + 1)``.  The bitmap is a runtime cache, not a field:
+    it is never serialized or compared, and it records the ``data`` list it was
+    computed for so a list replaced (``dataclasses.replace``, ``from_dict``) or
+    appended to in place is simply rescanned on the next query.
+    """
+
+    if TYPE_CHECKING:
+        total_frame: int
+        data: list[Any]
+
+    def received_bitmap(self) -> int:
+        """Return the bitmap of frame numbers present in ``data``."""
+        data = self.data
+        cached = self.__dict__.get("_received")
+        if cached is None or cached[0] is not data or cached[1] != len(data):
+            bitmap = 0
+            for frame in data:
+                bitmap |= _frame_bit(frame.current_frame)
+            cached = (data, len(data), bitmap)
+            self.__dict__["_received"] = cached
+        return cached[2]
+
+    @property
+    def is_complete(self) -> bool:
+        """Return True when every frame ``1..total_frame`` has been received."""
+        return not self.missing_frames()
+
+    def missing_frames(self) -> list[int]:
+        """Return 1-based frame numbers absent from ``data``."""
+        if self.total_frame == len(self.data):
+            return []
+        return _clear_bits(self.received_bitmap(), self.total_frame)
+
+    def _with_frame(self, frame: Any) -> Self:
+        """Return a copy with *frame* appended and the bitmap carried over incrementally."""
+        bitmap = self.received_bitmap() | _frame_bit(frame.current_frame)
+        data = [*self.data, frame]
+        new = dataclasses.replace(self, data=data)  # type: ignore[type-var]
+        new.__dict__["_received"] = (data, len(data), bitmap)
+        return new
+
+
 @dataclass
-class FrameList(DataClassORJSONMixin):
+class FrameList(_FrameBitmap, DataClassORJSONMixin):
     """Accumulates the ordered frames for a single hash-keyed map data entry."""
 
     total_frame: int = 0
@@ -217,7 +290,7 @@ class FrameList(DataClassORJSONMixin):
 
 
 @dataclass
-class SvgFrameList(DataClassORJSONMixin):
+class SvgFrameList(_FrameBitmap, DataClassORJSONMixin):
     """Accumulates SvgMessage frames for a single SVG tile hash.
 
     Stored separately from FrameList so mashumaro can deserialize the
@@ -240,7 +313,7 @@ class EdgePoints(DataClassORJSONMixin):
     action: int = 0
     type: int = 0
     total_frame: int = 0
-    frames: dict[int, list[CommDataCouple]] = field(default_factory=dict)
+    frames: dict[int, PointBuffer] = field(default_factory=dict)
 
     @property
     def is_complete(self) -> bool:
@@ -252,12 +325,9 @@ class EdgePoints(DataClassORJSONMixin):
         return [f for f in range(1, self.total_frame + 1) if f not in self.frames]
 
     @property
-    def all_points(self) -> list[CommDataCouple]:
+    def all_points(self) -> PointBuffer:
         """Return all points concatenated in frame order."""
-        result: list[CommDataCouple] = []
-        for frame_num in sorted(self.frames):
-            result.extend(self.frames[frame_num])
-        return result
+        return PointBuffer.join(self.frames[frame_num] for frame_num in sorted(self.frames))
 
 
 @dataclass
@@ -365,7 +435,7 @@ class NavGetHashListData(DataClassORJSONMixin):
 
 
 @dataclass
-class RootHashList(DataClassORJSONMixin):
+class RootHashList(_FrameBitmap, DataClassORJSONMixin):
     """Top-level hash list grouping all hash IDs for a given sub-command type."""
 
     total_frame: int = 0
@@ -381,6 +451,99 @@ class AreaHashNameList(DataClassORJSONMixin):
     hash: int
 
 
+#: ``PathType`` → the ``HashList`` attribute holding that type's FrameLists.
+#: SVG is absent on purpose — see :meth:`HashList._get_path_type_mapping`.
+_PATH_TYPE_FIELDS: dict[int, str] = {
+    PathType.AREA: "area",
+    PathType.OBSTACLE: "obstacle",
+    PathType.PATH: "path",
+    PathType.TRANSFER_ZONE: "transfer_zone",
+    PathType.LINE: "line",
+    PathType.DUMP: "dump",
+    PathType.VISUAL_SAFETY_ZONE: "visual_safety_zone",
+    PathType.VISUAL_OBSTACLE_ZONE: "visual_obstacle_zone",
+    PathType.CORRIDOR_LINE: "corridor_line",
+    PathType.CORRIDOR_POINT: "corridor_point",
+    PathType.VIRTUAL_WALL: "virtual_wall",
+    PathType.NO_GO_ZONE_VARIANT: "no_go_zone_variant",
+    PathType.NO_GO_ZONE: "no_go_zone",
+}
+
+
+#: Per-type dicts :meth:`HashList.update_hash_lists` prunes to the root manifest.
+_MANIFEST_PRUNED_FIELDS = (
+    "area",
+    "path",
+    "obstacle",
+    "dump",
+    "svg",
+    "visual_safety_zone",
+    "visual_obstacle_zone",
+    "corridor_line",
+    "corridor_point",
+    "virtual_wall",
+)
+
+#: Per-type dicts whose frames complete an area-side (``sub_cmd != 3``) hash.
+_AREA_SIDE_FIELDS = tuple(attr for attr in _PATH_TYPE_FIELDS.values() if attr != "line")
+
+#: The ``HashList`` GeoJSON fields that are views of the frames, built by
+#: :meth:`HashList.async_geojson` (or the eager ``generate_*`` methods).
+GEOJSON_VIEWS: tuple[str, ...] = (
+    "generated_geojson",
+    "generated_mow_path_geojson",
+    "generated_mow_progress_geojson",
+    "generated_dynamics_line_geojson",
+)
+
+#: ``now_index`` steps per mow-progress rebuild: the progress view is rebuilt
+#: when the mower's path index enters a new bucket, not on every report.
+MOW_PROGRESS_INDEX_BUCKET = 5
+
+#: Containers ``GeojsonGenerator.generate_geojson`` reads.
+_MAP_VIEW_SOURCES = (
+    "area",
+    "path",
+    "obstacle",
+    "dump",
+    "corridor_line",
+    "corridor_point",
+    "virtual_wall",
+    "visual_safety_zone",
+    "visual_obstacle_zone",
+    "svg",
+    "area_name",
+    "root_hash_lists",
+)
+
+#: ``(sources, params)`` a view was built from: the copy-on-write containers it
+#: reads (compared by identity) and the scalar inputs (compared by value).
+_ViewKey = tuple[tuple[Any, ...], tuple[Any, ...]]
+
+
+def _same_key(a: _ViewKey | None, b: _ViewKey | None) -> bool:
+    if a is None or b is None:
+        return False
+    return a[1] == b[1] and len(a[0]) == len(b[0]) and all(map(operator.is_, a[0], b[0]))
+
+
+#: ``(sources, declared, incomplete)`` cached per sub_cmd by
+#: ``HashList.find_incomplete_hashes``: the containers the answer was computed
+#: from (compared by identity), every hash the manifest declares, and the
+#: incomplete ones in manifest order.
+_IncompleteEntry = tuple[tuple[Any, ...], frozenset[int], dict[int, None]]
+
+
+def _same_sources(a: tuple[Any, ...], b: tuple[Any, ...]) -> bool:
+    return len(a) == len(b) and all(map(operator.is_, a, b))
+
+
+def _build_detached_view(snapshot: HashList, name: str) -> tuple[dict[str, Any], float, frozenset[int]]:
+    """Build view *name* of *snapshot* in a worker; return what the live map adopts from it."""
+    view = snapshot._refresh_view(name)  # noqa: SLF001
+    return view, snapshot.geojson_yaw, snapshot._geojson_hashlist_snapshot  # noqa: SLF001
+
+
 @dataclass
 class HashList(DataClassORJSONMixin):
     """Map data store keyed by hash ID.
@@ -388,6 +551,16 @@ class HashList(DataClassORJSONMixin):
     ``root_hash_lists`` holds the device-reported manifest of hash IDs; the
     per-type dicts (``area``, ``path``, ``obstacle``, …) hold the actual
     frames as they arrive.
+
+    Containers are copy-on-write: every mutator rebinds the dicts/lists it
+    touches (path-copying down to the one ``FrameList`` / transaction that
+    changed) instead of mutating them in place.  A shallow ``copy.copy`` of a
+    HashList is therefore an independent snapshot that shares every untouched
+    sub-tree with its predecessor — which is what lets ``MowerStateReducer``
+    pay O(changed subtree) per map frame rather than deep-copying the map.
+    The one exception is the cover-path transaction being received, which
+    :meth:`update_mow_path` fills in place; :meth:`detached_copy` takes a
+    snapshot that is independent of it too.
     """
 
     root_hash_lists: list[RootHashList] = field(default_factory=list)
@@ -410,9 +583,13 @@ class HashList(DataClassORJSONMixin):
     plan: dict[str, Plan] = field(default_factory=dict)
     area_name: list[AreaHashNameList] = field(default_factory=list)
     current_mow_path: dict[int, dict[int, MowPath]] = field(default_factory=dict)
-    generated_geojson: dict[str, Any] = field(default_factory=dict)
+    generated_geojson: dict[str, Any] = field(
+        default_factory=dict, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
     geojson_yaw: float = 0.0  # RTK yaw (radians) used when generated_geojson was last built
-    generated_mow_path_geojson: dict[str, Any] = field(default_factory=dict)
+    generated_mow_path_geojson: dict[str, Any] = field(
+        default_factory=dict, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
     last_ub_path_hash: int = 0
     plans_stale: bool = False
     #: Set once a PlanFetchSaga completes, so an empty ``plan`` can be told apart
@@ -420,15 +597,19 @@ class HashList(DataClassORJSONMixin):
     #: ``init_cfg_hash`` changes from there, not by a timer.
     plans_fetched: bool = False
     edge_points: dict[int, EdgePoints] = field(default_factory=dict)  # hash → EdgePoints
-    dynamics_line: list[CommDataCouple] = field(default_factory=list)
+    dynamics_line: PointBuffer = field(default_factory=PointBuffer)
     """Assembled live mow-progress path from the latest type=18 fetch.
 
     (x, y) pairs in device-local coordinates.  Replaced wholesale on each
     successful fetch; empty when no session is active.
     """
-    generated_dynamics_line_geojson: dict[str, Any] = field(default_factory=dict)
-    """WGS-84 LineString of ``dynamics_line``, regenerated after each fetch."""
-    generated_mow_progress_geojson: dict[str, Any] = field(default_factory=dict)
+    generated_dynamics_line_geojson: dict[str, Any] = field(
+        default_factory=dict, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
+    """WGS-84 LineString of ``dynamics_line``, rebuilt off the loop after each fetch."""
+    generated_mow_progress_geojson: dict[str, Any] = field(
+        default_factory=dict, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
     """Completed portion of the planned mow path, sliced to ``now_index``."""
 
     #: Fallback storage for frames whose ``type`` isn't in ``PathType`` (e.g.
@@ -442,6 +623,30 @@ class HashList(DataClassORJSONMixin):
     #: the expensive feature-walk when the hashlist hasn't changed.
     _geojson_hashlist_snapshot: frozenset[int] = field(default_factory=frozenset)
 
+    #: Per-hash geometry cache (``generate_geojson.FeatureCache``) reused by
+    #: ``generate_geojson`` so a single changed hash doesn't re-convert the
+    #: whole map.  Runtime-only: never serialized, compared, or deep-copied.
+    _geojson_feature_cache: Any = field(
+        default=None, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
+
+    #: Inputs of the GeoJSON views: RTK ``(latitude, longitude, yaw)``,
+    #: dock ``(latitude, longitude, rotation)`` and mow progress ``(now_index,
+    #: ub_path_hash, path_pos_x, path_pos_y)``.  Runtime-only, like the cache.
+    _geojson_rtk: tuple[float, float, float] | None = field(
+        default=None, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
+    _geojson_dock: tuple[float, float, float] | None = field(
+        default=None, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
+    _mow_progress: tuple[int, int, int, int] | None = field(
+        default=None, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
+    #: View name → the ``_ViewKey`` it is current for.  Replaced, never mutated.
+    _geojson_keys: dict[str, Any] = field(
+        default_factory=dict, compare=False, repr=False, metadata=field_options(serialize="omit")
+    )
+
     def __deepcopy__(self, memo: dict[int, Any]) -> HashList:
         """Deepcopy that shares the four ``generated_*_geojson`` dicts by reference.
 
@@ -449,10 +654,11 @@ class HashList(DataClassORJSONMixin):
         the per-frame ``copy.deepcopy(current.map)`` in ``MowerStateReducer.apply``.
         They are ONLY ever replaced wholesale by the matching ``generate_*_geojson``
         methods — never mutated in place — so sharing references across copies
-        is safe.
+        is safe.  The feature cache is shared too: its entries are keyed by
+        FrameList identity, so the copy simply misses until it regenerates.
+        So are the view keys — they hold the original's containers, which the
+        copy's never are, so its views count as stale.
         """
-        import copy as _copy
-
         cls = self.__class__
         new = cls.__new__(cls)
         memo[id(self)] = new
@@ -461,13 +667,15 @@ class HashList(DataClassORJSONMixin):
             "generated_mow_path_geojson",
             "generated_mow_progress_geojson",
             "generated_dynamics_line_geojson",
+            "_geojson_feature_cache",
+            "_geojson_keys",
         }
         for f in dataclasses.fields(self):
             value = getattr(self, f.name)
             if f.name in shared_geojson:
-                object.__setattr__(new, f.name, value)
+                setattr(new, f.name, value)
             else:
-                object.__setattr__(new, f.name, _copy.deepcopy(value, memo))
+                setattr(new, f.name, copy.deepcopy(value, memo))
         return new
 
     def update_hash_lists(self, hashlist: list[int], bol_hash: int | None = None) -> None:
@@ -478,31 +686,26 @@ class HashList(DataClassORJSONMixin):
         # against.  A supplied 0 is forwarded: it means "device has no areas".
         if bol_hash is not None:
             self.invalidate_maps(bol_hash)
-        self.area = {hash_id: frames for hash_id, frames in self.area.items() if hash_id in hashlist}
-        self.path = {hash_id: frames for hash_id, frames in self.path.items() if hash_id in hashlist}
-        self.obstacle = {hash_id: frames for hash_id, frames in self.obstacle.items() if hash_id in hashlist}
-        self.dump = {hash_id: frames for hash_id, frames in self.dump.items() if hash_id in hashlist}
-        self.svg = {hash_id: frames for hash_id, frames in self.svg.items() if hash_id in hashlist}
-        self.visual_safety_zone = {
-            hash_id: frames for hash_id, frames in self.visual_safety_zone.items() if hash_id in hashlist
-        }
-        self.visual_obstacle_zone = {
-            hash_id: frames for hash_id, frames in self.visual_obstacle_zone.items() if hash_id in hashlist
-        }
-        self.corridor_line = {hash_id: frames for hash_id, frames in self.corridor_line.items() if hash_id in hashlist}
-        self.corridor_point = {
-            hash_id: frames for hash_id, frames in self.corridor_point.items() if hash_id in hashlist
-        }
-        self.virtual_wall = {hash_id: frames for hash_id, frames in self.virtual_wall.items() if hash_id in hashlist}
+        keep = set(hashlist)
+        # Only a container that loses an entry is rebound: the incomplete-hash cache
+        # and the GeoJSON view keys treat a rebound container as changed.
+        for attr in _MANIFEST_PRUNED_FIELDS:
+            target: dict[int, Any] = getattr(self, attr)
+            if not keep.issuperset(target):
+                setattr(self, attr, {hash_id: frames for hash_id, frames in target.items() if hash_id in keep})
         known_types = set(self._get_path_type_mapping())
-        self.unknown_type_frames = {t: bucket for t, bucket in self.unknown_type_frames.items() if t not in known_types}
-
-        area_hashes = list(self.area.keys())
-        for hash_id, plan_task in self.plan.copy().items():
-            for item in plan_task.zone_hashs:
-                if item not in area_hashes:
-                    self.plan.pop(hash_id)
-                    break
+        if not known_types.isdisjoint(self.unknown_type_frames):
+            self.unknown_type_frames = {
+                t: bucket for t, bucket in self.unknown_type_frames.items() if t not in known_types
+            }
+
+        plan = {
+            plan_id: plan_task
+            for plan_id, plan_task in self.plan.items()
+            if all(item in self.area for item in plan_task.zone_hashs)
+        }
+        if len(plan) != len(self.plan):
+            self.plan = plan
 
         # area_name is preserved here: orphans (whose hash is no longer in
         # self.area) are harmless because consumers key lookups by hash, and
@@ -613,14 +816,18 @@ class HashList(DataClassORJSONMixin):
         Used by the ``toapp_map_name_msg`` reducer path: when the app renames an
         area the device acks with one ``NavMapNameMsg`` (hash + new name) rather
         than re-sending the whole ``toapp_all_hash_name`` list, so we patch the
-        matching ``area_name`` entry in place, appending one if the hash is not
-        yet tracked.
+        matching ``area_name`` entry, appending one if the hash is not yet
+        tracked.
         """
-        for entry in self.area_name:
+        for index, entry in enumerate(self.area_name):
             if entry.hash == hash_id:
-                entry.name = name
+                self.area_name = [
+                    *self.area_name[:index],
+                    AreaHashNameList(name=name, hash=hash_id),
+                    *self.area_name[index + 1 :],
+                ]
                 return
-        self.area_name.append(AreaHashNameList(name=name, hash=hash_id))
+        self.area_name = [*self.area_name, AreaHashNameList(name=name, hash=hash_id)]
 
     def missing_hashlist(self, sub_cmd: int = 0) -> list[int]:
         """Return hash IDs declared in ``root_hash_lists`` for *sub_cmd* but not yet fetched."""
@@ -660,7 +867,29 @@ class HashList(DataClassORJSONMixin):
         key-presence and therefore treats a partially-fetched area as done.
         Callers that need to know "what still needs ``synchronize_hash_data``"
         should use this method so interrupted areas trigger a fresh fetch.
+
+        The answer is cached against the identity of the containers it was
+        computed from, and :meth:`update` carries it forward one hash at a
+        time, so the map saga asking after every hash doesn't rescan the map.
         """
+        cached = self.__dict__.get("_incomplete_hashes", {}).get(sub_cmd)
+        if cached is not None and _same_sources(cached[0], self._incomplete_sources(sub_cmd)):
+            return list(cached[2])
+        return list(self._scan_incomplete_hashes(sub_cmd))
+
+    def _incomplete_sources(self, sub_cmd: int) -> tuple[Any, ...]:
+        """Return the copy-on-write containers ``find_incomplete_hashes(sub_cmd)`` reads."""
+        if sub_cmd == 3:
+            return (self.root_hash_lists, self.line)
+        return (
+            self.root_hash_lists,
+            self.svg,
+            self.unknown_type_frames,
+            *(getattr(self, attr) for attr in _AREA_SIDE_FIELDS),
+        )
+
+    def _scan_incomplete_hashes(self, sub_cmd: int) -> dict[int, None]:
+        """Walk every declared hash of *sub_cmd*, cache the incomplete ones and return them in manifest order."""
         path_type_mapping = self._get_path_type_mapping()
         if sub_cmd == 3:
             lookup: dict[int, FrameList] = self.line
@@ -689,7 +918,8 @@ class HashList(DataClassORJSONMixin):
                     if parent and parent != data_hash:
                         svg_for_hash.setdefault(parent, []).append(svg_fl)
 
-        incomplete: list[int] = []
+        declared: set[int] = set()
+        incomplete: dict[int, None] = {}
         for root_list in self.root_hash_lists:
             if root_list.sub_cmd != sub_cmd:
                 continue
@@ -697,23 +927,74 @@ class HashList(DataClassORJSONMixin):
                 for hash_id in obj.data_couple:
                     if hash_id == 0:
                         continue
-                    area_entry = lookup.get(hash_id)
-                    svg_entries = svg_for_hash.get(hash_id, [])
-
-                    # Nothing fetched at all for this hash yet.
-                    if area_entry is None and not svg_entries:
-                        incomplete.append(hash_id)
-                        continue
+                    declared.add(hash_id)
+                    if self._is_incomplete(lookup.get(hash_id), svg_for_hash.get(hash_id, [])):
+                        incomplete[hash_id] = None
+        self._remember_incomplete(sub_cmd, (self._incomplete_sources(sub_cmd), frozenset(declared), incomplete))
+        return incomplete
 
-                    # Area/boundary data exists but is still partial.
-                    if area_entry is not None and self.find_missing_frames(area_entry):
-                        incomplete.append(hash_id)
-                        continue
+    @staticmethod
+    def _is_incomplete(area_entry: FrameList | None, svg_entries: list[SvgFrameList]) -> bool:
+        """Return True when a hash with these frame lists still needs fetching."""
+        # Nothing fetched at all for this hash yet.
+        if area_entry is None and not svg_entries:
+            return True
+        # Area/boundary data exists but is still partial.
+        if area_entry is not None and area_entry.missing_frames():
+            return True
+        # Any associated SVG tile (by data_hash or paternal_hash_a) is partial.
+        return any(fl.missing_frames() for fl in svg_entries)
 
-                    # Any associated SVG tile (by data_hash or paternal_hash_a) is partial.
-                    if any(self.find_missing_frames(fl) for fl in svg_entries):
-                        incomplete.append(hash_id)
-        return incomplete
+    def _hash_is_incomplete(self, hash_id: int, sub_cmd: int) -> bool:
+        """Return whether *hash_id* alone is incomplete, as :meth:`_scan_incomplete_hashes` would judge it."""
+        if sub_cmd == 3:
+            return self._is_incomplete(self.line.get(hash_id), [])
+        # The scan lets a later per-type dict override an earlier one, then falls
+        # back to the first unknown-type bucket holding the hash.
+        area_entry = next(
+            (target[hash_id] for attr in reversed(_AREA_SIDE_FIELDS) if hash_id in (target := getattr(self, attr))),
+            None,
+        )
+        if area_entry is None:
+            area_entry = next(
+                (bucket[hash_id] for bucket in self.unknown_type_frames.values() if hash_id in bucket), None
+            )
+        svg_entries = [
+            svg_fl
+            for data_hash, svg_fl in self.svg.items()
+            if data_hash == hash_id or (svg_fl.data and svg_fl.data[0].paternal_hash_a == hash_id)
+        ]
+        return self._is_incomplete(area_entry, svg_entries)
+
+    def _remember_incomplete(self, sub_cmd: int, entry: _IncompleteEntry | None) -> None:
+        """Rebind the incomplete-hash cache with *sub_cmd*'s entry replaced (dropped when None)."""
+        cache: dict[int, _IncompleteEntry] = self.__dict__.get("_incomplete_hashes", {})
+        cache = {key: value for key, value in cache.items() if key != sub_cmd}
+        if entry is not None:
+            cache[sub_cmd] = entry
+        self.__dict__["_incomplete_hashes"] = cache
+
+    def _carry_incomplete(self, before: dict[int, tuple[Any, ...]], touched: set[int]) -> None:
+        """Carry each cached incomplete set over a frame that changed only *touched* hashes.
+
+        *before* holds each cached sub_cmd's sources as they were before the frame
+        was stored; an entry that was already stale then is left for a rescan.  A
+        hash that completes is dropped from its set.  One that becomes incomplete
+        (a partial SVG tile arriving for a finished area) drops the whole entry:
+        the rescan puts it back in manifest order.
+        """
+        for sub_cmd, (sources, declared, incomplete) in self.__dict__.get("_incomplete_hashes", {}).items():
+            if not _same_sources(sources, before[sub_cmd]):
+                continue
+            regressed = False
+            for hash_id in touched & declared:
+                if self._hash_is_incomplete(hash_id, sub_cmd):
+                    regressed = regressed or hash_id not in incomplete
+                elif hash_id in incomplete:
+                    incomplete = {other: None for other in incomplete if other != hash_id}
+            self._remember_incomplete(
+                sub_cmd, None if regressed else (self._incomplete_sources(sub_cmd), declared, incomplete)
+            )
 
     def missing_root_hash_frame(self, hash_list: NavGetHashListAck) -> list[int]:
         """Return 1-based frame numbers missing from the RootHashList matching *hash_list*."""
@@ -735,26 +1016,25 @@ class HashList(DataClassORJSONMixin):
 
         Matching is by (total_frame, sub_cmd); within a match, by current_frame.
         """
-        target_root_list = next(
-            (
-                rhl
-                for rhl in self.root_hash_lists
-                if rhl.total_frame == hash_list.total_frame and rhl.sub_cmd == hash_list.sub_cmd
-            ),
-            None,
-        )
-
-        if target_root_list is None:
-            new_root_list = RootHashList(total_frame=hash_list.total_frame, sub_cmd=hash_list.sub_cmd, data=[hash_list])
-            self.root_hash_lists.append(new_root_list)
+        for root_index, rhl in enumerate(self.root_hash_lists):
+            if rhl.total_frame != hash_list.total_frame or rhl.sub_cmd != hash_list.sub_cmd:
+                continue
+            data = list(rhl.data)
+            for index, obj in enumerate(data):
+                if obj.current_frame == hash_list.current_frame:
+                    data[index] = hash_list
+                    break
+            else:
+                data.append(hash_list)
+            self.root_hash_lists = [
+                *self.root_hash_lists[:root_index],
+                dataclasses.replace(rhl, data=data),
+                *self.root_hash_lists[root_index + 1 :],
+            ]
             return
 
-        for index, obj in enumerate(target_root_list.data):
-            if obj.current_frame == hash_list.current_frame:
-                target_root_list.data[index] = hash_list
-                return
-
-        target_root_list.data.append(hash_list)
+        new_root_list = RootHashList(total_frame=hash_list.total_frame, sub_cmd=hash_list.sub_cmd, data=[hash_list])
+        self.root_hash_lists = [*self.root_hash_lists, new_root_list]
 
     def missing_hash_frame(self, hash_ack: NavGetHashListAck) -> list[int]:
         """Return missing frame numbers across every RootHashList matching ``hash_ack.sub_cmd``."""
@@ -791,7 +1071,13 @@ class HashList(DataClassORJSONMixin):
     def update_plan(self, plan: Plan) -> None:
         """Store *plan* by ``plan_id``; drop plans whose ``total_plan_num`` is zero."""
         if plan.total_plan_num != 0:
-            self.plan[plan.plan_id] = plan
+            self.plan = {**self.plan, plan.plan_id: plan}
+
+    def retain_plans(self, plan_ids: set[str]) -> None:
+        """Drop every stored plan whose ``plan_id`` key is not in *plan_ids*."""
+        if not self.plan.keys() - plan_ids:
+            return
+        self.plan = {plan_id: plan for plan_id, plan in self.plan.items() if plan_id in plan_ids}
 
     def _get_path_type_mapping(self) -> dict[int, dict[int, FrameList]]:
         """Return a ``PathType → per-type dict`` mapping for NavGetCommData dispatch.
@@ -799,21 +1085,7 @@ class HashList(DataClassORJSONMixin):
         SVG is intentionally excluded — SVG data arrives as SvgMessage (not
         NavGetCommData) and is stored in self.svg (dict[int, SvgFrameList]).
         """
-        return {
-            PathType.AREA: self.area,
-            PathType.OBSTACLE: self.obstacle,
-            PathType.PATH: self.path,
-            PathType.TRANSFER_ZONE: self.transfer_zone,
-            PathType.LINE: self.line,
-            PathType.DUMP: self.dump,
-            PathType.VISUAL_SAFETY_ZONE: self.visual_safety_zone,
-            PathType.VISUAL_OBSTACLE_ZONE: self.visual_obstacle_zone,
-            PathType.CORRIDOR_LINE: self.corridor_line,
-            PathType.CORRIDOR_POINT: self.corridor_point,
-            PathType.VIRTUAL_WALL: self.virtual_wall,
-            PathType.NO_GO_ZONE_VARIANT: self.no_go_zone_variant,
-            PathType.NO_GO_ZONE: self.no_go_zone,
-        }
+        return {path_type: getattr(self, attr) for path_type, attr in _PATH_TYPE_FIELDS.items()}
 
     def update(self, hash_data: NavGetCommData | SvgMessage) -> bool:
         """Route *hash_data* into the appropriate per-type dict and return whether it was new.
@@ -830,21 +1102,40 @@ class HashList(DataClassORJSONMixin):
         SvgMessage frames go to self.svg (SvgFrameList) via _add_svg_data.
         NavGetCommData with type=SVG is discarded — real SVG geometry only
         arrives as SvgMessage from toapp_svg_msg.
+
+        A cached :meth:`find_incomplete_hashes` answer is carried over the
+        frame by rechecking only the hash it belongs to.
         """
+        cache: dict[int, _IncompleteEntry] = self.__dict__.get("_incomplete_hashes", {})
+        if not cache:
+            return self._store_frame(hash_data)
+        before = {sub_cmd: self._incomplete_sources(sub_cmd) for sub_cmd in cache}
+        stored = self._store_frame(hash_data)
         if isinstance(hash_data, SvgMessage):
-            return self._add_svg_data(self.svg, hash_data)
+            tile = self.svg.get(hash_data.data_hash)
+            parent = tile.data[0].paternal_hash_a if tile is not None and tile.data else 0
+            touched = {hash_data.data_hash, parent}
+        else:
+            touched = {hash_data.hash}
+        self._carry_incomplete(before, touched)
+        return stored
+
+    def _store_frame(self, hash_data: NavGetCommData | SvgMessage) -> bool:
+        """Route *hash_data* into its per-type dict; see :meth:`update`."""
+        if isinstance(hash_data, SvgMessage):
+            self.svg, stored = self._add_svg_data(self.svg, hash_data)
+            return stored
 
         if hash_data.type == PathType.AREA:
-            result = self._add_hash_data(self.area, hash_data)
+            self.area, result = self._add_hash_data(self.area, hash_data)
             self.update_hash_lists(self.hashlist)
             return result
 
         # DYNAMICS_LINE is normally assembled by CommonDataSaga and stored via
         # update_dynamics_line; handle direct arrivals defensively here.
         if hash_data.type == PathType.DYNAMICS_LINE:
-            if hash_data.current_frame == 1:
-                self.dynamics_line = []
-            self.dynamics_line.extend(hash_data.data_couple)
+            previous = PointBuffer() if hash_data.current_frame == 1 else self.dynamics_line
+            self.dynamics_line = previous + hash_data.data_couple
             return True
 
         # NavGetCommData with type=SVG carries no geometry — real SVG geometry only
@@ -854,58 +1145,113 @@ class HashList(DataClassORJSONMixin):
         if hash_data.type == PathType.SVG:
             return False
 
-        path_type_mapping = self._get_path_type_mapping()
-        target_dict = path_type_mapping.get(hash_data.type)
-
-        if target_dict is not None:
-            return self._add_hash_data(target_dict, hash_data)
+        attr = _PATH_TYPE_FIELDS.get(hash_data.type)
+        if attr is not None:
+            new_dict, stored = self._add_hash_data(getattr(self, attr), hash_data)
+            setattr(self, attr, new_dict)
+            return stored
 
         # Unknown type — store under unknown_type_frames keyed by (type, hash)
         # so the hash is still considered "received" by find_incomplete_hashes.
-        bucket = self.unknown_type_frames.setdefault(hash_data.type, {})
-        return self._add_hash_data(bucket, hash_data)
+        bucket, stored = self._add_hash_data(self.unknown_type_frames.get(hash_data.type, {}), hash_data)
+        self.unknown_type_frames = {**self.unknown_type_frames, hash_data.type: bucket}
+        return stored
 
-    def update_dynamics_line(self, points: list[CommDataCouple]) -> None:
+    def update_dynamics_line(self, points: Iterable[CommDataCouple]) -> None:
         """Replace ``dynamics_line`` with *points*.
 
         The device always returns the full current-session path, not a delta.
         """
-        self.dynamics_line = points
+        self.dynamics_line = PointBuffer(points)
 
     def find_missing_mow_path_frames(self) -> dict[int, list[int]]:
         """Return ``{transaction_id: [missing_frame, …]}`` for incomplete transactions only."""
         missing_frames: dict[int, list[int]] = {}
-
-        if not self.current_mow_path:
-            return missing_frames
-
         for transaction_id, frames_by_index in self.current_mow_path.items():
-            if not frames_by_index:
+            total_frame = self._mow_path_total_frame(frames_by_index)
+            if total_frame == 0:
                 continue
+            missing = _clear_bits(self._mow_path_bitmap(transaction_id, frames_by_index), total_frame)
+            if missing:
+                missing_frames[transaction_id] = missing
+        return missing_frames
 
-            # Get total_frame from any MowPath object for this transaction_id
-            any_mow_path = next(iter(frames_by_index.values()))
-            total_frame = any_mow_path.total_frame
-
+    def missing_mow_path_frame_count(self) -> int:
+        """Return how many frames :meth:`find_missing_mow_path_frames` would list, without listing them."""
+        count = 0
+        for transaction_id, frames_by_index in self.current_mow_path.items():
+            total_frame = self._mow_path_total_frame(frames_by_index)
             if total_frame == 0:
                 continue
+            mask = (1 << (total_frame + 1)) - 2
+            count += total_frame - (self._mow_path_bitmap(transaction_id, frames_by_index) & mask).bit_count()
+        return count
 
-            expected_frames = set(range(1, total_frame + 1))
-            current_frames = set(frames_by_index.keys())
-            missing_for_transaction = sorted(expected_frames - current_frames)
+    @staticmethod
+    def _mow_path_total_frame(frames_by_index: dict[int, MowPath]) -> int:
+        """Return ``total_frame`` as reported by any frame of a transaction (0 when empty)."""
+        if not frames_by_index:
+            return 0
+        return next(iter(frames_by_index.values())).total_frame
 
-            if missing_for_transaction:
-                missing_frames[transaction_id] = missing_for_transaction
+    def _mow_path_bitmap(self, transaction_id: int, frames_by_index: dict[int, MowPath]) -> int:
+        """Return the received-frame bitmap for one ``current_mow_path`` transaction.
 
-        return missing_frames
+        Cached per transaction against the identity and size of its frame dict,
+        which :meth:`update_mow_path` only ever adds to, so a dict filled in
+        place is simply rescanned.  The cache itself is rebound, not mutated,
+        so shallow snapshots never see each other's.
+        """
+        cache: dict[int, tuple[dict[int, MowPath], int, int]] = self.__dict__.get("_mow_path_received", {})
+        cached = cache.get(transaction_id)
+        if cached is not None and cached[0] is frames_by_index and cached[1] == len(frames_by_index):
+            return cached[2]
+        bitmap = 0
+        for frame_number in frames_by_index:
+            bitmap |= _frame_bit(frame_number)
+        self._remember_mow_path_bitmap(transaction_id, frames_by_index, bitmap)
+        return bitmap
+
+    def _remember_mow_path_bitmap(self, transaction_id: int, frames_by_index: dict[int, MowPath], bitmap: int) -> None:
+        """Rebind the bitmap cache with one entry updated and dropped transactions pruned."""
+        cache: dict[int, tuple[dict[int, MowPath], int, int]] = self.__dict__.get("_mow_path_received", {})
+        live = self.current_mow_path
+        self.__dict__["_mow_path_received"] = {
+            **{tx: entry for tx, entry in cache.items() if tx in live},
+            transaction_id: (frames_by_index, len(frames_by_index), bitmap),
+        }
 
     def update_mow_path(self, path: MowPath) -> None:
-        """Store *path* at ``current_mow_path[transaction_id][current_frame]``."""
+        """Store *path* at ``current_mow_path[transaction_id][current_frame]``.
+
+        A cover path arrives as hundreds of frames per transaction, so the
+        transaction's frame dict is copied once, on its first frame here, and
+        filled in place after that — an exception to the copy-on-write rule
+        that shallow copies share it.  The outer dict is still rebound on every
+        frame.  :meth:`detached_copy` hands the dict back to copy-on-write
+        before a snapshot is read off the loop.
+        """
         # TODO check if we need to clear the current_mow_path first
         transaction_id = path.transaction_id
-        if transaction_id not in self.current_mow_path:
-            self.current_mow_path[transaction_id] = {}
-        self.current_mow_path[transaction_id][path.current_frame] = path
+        frames = self.current_mow_path.get(transaction_id)
+        owned: dict[int, dict[int, MowPath]] = self.__dict__.get("_mow_path_owned", {})
+        if frames is None or owned.get(transaction_id) is not frames:
+            frames = dict(frames or {})
+            self.__dict__["_mow_path_owned"] = {**owned, transaction_id: frames}
+        bitmap = self._mow_path_bitmap(transaction_id, frames) | _frame_bit(path.current_frame)
+        frames[path.current_frame] = path
+        self.current_mow_path = {**self.current_mow_path, transaction_id: frames}
+        self._remember_mow_path_bitmap(transaction_id, frames, bitmap)
+
+    def detached_copy(self) -> HashList:
+        """Return a shallow copy that is safe to read off the event loop.
+
+        :meth:`update_mow_path` fills the transaction it is receiving in place;
+        this copy takes that dict back out of its hands, so the next frame
+        copies it rather than growing a dict a worker thread is reading.
+        """
+        self.__dict__.pop("_mow_path_owned", None)
+        return copy.copy(self)
 
     def upsert_edge_frame(
         self,
@@ -914,78 +1260,75 @@ class HashList(DataClassORJSONMixin):
         edge_type: int,
         total_frame: int,
         current_frame: int,
-        points: list[CommDataCouple],
+        points: Iterable[CommDataCouple],
     ) -> None:
         """Insert or update one edge-point frame for *hash_key*.
 
         ``total_frame`` is refreshed on each call because the device can adjust
         it mid-stream.
         """
+        points = PointBuffer(points)
         existing = self.edge_points.get(hash_key)
         if existing is None:
-            existing = EdgePoints(
+            entry = EdgePoints(
                 hash=hash_key,
                 action=action,
                 type=edge_type,
                 total_frame=total_frame,
+                frames={current_frame: points},
             )
-            self.edge_points[hash_key] = existing
         else:
-            existing.total_frame = total_frame
-        existing.frames[current_frame] = points
+            entry = dataclasses.replace(
+                existing, total_frame=total_frame, frames={**existing.frames, current_frame: points}
+            )
+        self.edge_points = {**self.edge_points, hash_key: entry}
 
     def drop_incomplete_frames(self) -> None:
         """Drop ``area``/``path``/``obstacle`` entries missing any frame."""
-        for target in (self.area, self.path, self.obstacle):
-            for hash_id in [h for h, frame in target.items() if self.find_missing_frames(frame)]:
-                del target[hash_id]
+        for attr in ("area", "path", "obstacle"):
+            target: dict[int, FrameList] = getattr(self, attr)
+            setattr(self, attr, {h: frame for h, frame in target.items() if not self.find_missing_frames(frame)})
 
     @staticmethod
     def find_missing_frames(frame_list: FrameList | SvgFrameList | RootHashList | None) -> list[int]:
         """Return 1-based frame numbers absent from ``frame_list.data``."""
         if frame_list is None:
             return []
-
-        if frame_list.total_frame == len(frame_list.data):
-            return []
-        number_list = list(range(1, frame_list.total_frame + 1))
-
-        current_frames = {frame.current_frame for frame in frame_list.data}
-        return [num for num in number_list if num not in current_frames]
+        return frame_list.missing_frames()
 
     @staticmethod
-    def _add_svg_data(svg_dict: dict[int, SvgFrameList], hash_data: SvgMessage) -> bool:
-        """Insert *hash_data* into *svg_dict*; return True if anything was stored."""
+    def _add_svg_data(svg_dict: dict[int, SvgFrameList], hash_data: SvgMessage) -> tuple[dict[int, SvgFrameList], bool]:
+        """Return ``(svg_dict', stored)`` with *hash_data* path-copied into the tile's frame list.
+
+        *svg_dict* itself is never mutated; it is returned unchanged when the
+        frame was already present.
+        """
         entry = svg_dict.get(hash_data.data_hash)
         if entry is None:
-            svg_dict[hash_data.data_hash] = SvgFrameList(total_frame=hash_data.total_frame, data=[hash_data])
-            return True
-        if any(f.current_frame == hash_data.current_frame for f in entry.data):
-            return True
-        entry.data.append(hash_data)
-        return True
+            new_entry = SvgFrameList(total_frame=hash_data.total_frame, data=[hash_data])
+            return {**svg_dict, hash_data.data_hash: new_entry}, True
+        if entry.received_bitmap() & _frame_bit(hash_data.current_frame):
+            return svg_dict, True
+        return {**svg_dict, hash_data.data_hash: entry._with_frame(hash_data)}, True  # noqa: SLF001
 
     @staticmethod
-    def _add_hash_data(hash_dict: dict[int, FrameList], hash_data: NavGetCommData) -> bool:
-        """Insert *hash_data* into *hash_dict*; return True if anything was stored.
+    def _add_hash_data(hash_dict: dict[int, FrameList], hash_data: NavGetCommData) -> tuple[dict[int, FrameList], bool]:
+        """Return ``(hash_dict', stored)`` with *hash_data* path-copied into its FrameList.
 
         Creates a new FrameList for a first sighting, otherwise appends the
-        frame unless its ``current_frame`` is already present.
+        frame unless its ``current_frame`` is already present.  *hash_dict* and
+        the FrameList it holds are never mutated — only the dict and the one
+        FrameList on the path to the new frame are copied.
         """
-        if hash_dict.get(hash_data.hash, None) is None:
-            hash_dict[hash_data.hash] = FrameList(total_frame=hash_data.total_frame, data=[hash_data])
-            return True
+        entry = hash_dict.get(hash_data.hash, None)
+        if entry is None:
+            new_entry = FrameList(total_frame=hash_data.total_frame, data=[hash_data])
+            return {**hash_dict, hash_data.hash: new_entry}, True
 
-        if hash_data not in hash_dict[hash_data.hash].data:
-            exists = next(
-                (rhl for rhl in hash_dict[hash_data.hash].data if rhl.current_frame == hash_data.current_frame),
-                None,
-            )
-            if exists:
-                return True
-            hash_dict[hash_data.hash].data.append(hash_data)
-            return True
-        return False
+        if entry.received_bitmap() & _frame_bit(hash_data.current_frame):
+            # Same frame number already stored: an exact repeat is "not new".
+            return hash_dict, hash_data not in entry.data
+        return {**hash_dict, hash_data.hash: entry._with_frame(hash_data)}, True  # noqa: SLF001
 
     def is_map_synced(self, bol_hash: int) -> bool:
         """Return True when the local map state is fully in sync with the device.
@@ -1086,6 +1429,165 @@ class HashList(DataClassORJSONMixin):
         self.line = {h: frames for h, frames in self.line.items() if h == ub_path_hash}
         return ub_path_hash not in self.line
 
+    # ------------------------------------------------------------------
+    # GeoJSON views
+    #
+    # The four ``generated_*_geojson`` fields are views of the frames: callers
+    # record the inputs (cheap enough for the ~4 Hz report stream) and
+    # :meth:`async_geojson` rebuilds a stale view off the event loop.  Reading
+    # a field never builds — it returns the last view built.
+    # ------------------------------------------------------------------
+
+    def set_geojson_origin(self, rtk: LocationPoint, dock: Dock | None = None, yaw_threshold: float = 0.01) -> None:
+        """Record the RTK origin (and *dock*) the GeoJSON views are projected from.
+
+        Nothing is built here.  A yaw change within *yaw_threshold* radians
+        keeps the recorded origin, as in :meth:`geojson_needs_regeneration`.
+        """
+        current = self._geojson_rtk
+        if (
+            current is None
+            or current[0] != rtk.latitude
+            or current[1] != rtk.longitude
+            or abs(current[2] - rtk.yaw) > yaw_threshold
+        ):
+            self._geojson_rtk = (rtk.latitude, rtk.longitude, rtk.yaw)
+        if dock is not None:
+            self._geojson_dock = (dock.latitude, dock.longitude, dock.rotation)
+
+    def set_mow_progress(self, now_index: int, ub_path_hash: int, path_pos_x: int, path_pos_y: int) -> None:
+        """Record the mower's position on the mow path for ``generated_mow_progress_geojson``.
+
+        The view is rebuilt when *now_index* enters a new
+        :data:`MOW_PROGRESS_INDEX_BUCKET` or *ub_path_hash* changes.
+        """
+        self._mow_progress = (now_index, ub_path_hash, path_pos_x, path_pos_y)
+
+    def _view_key(self, name: str) -> _ViewKey | None:
+        """Return the key view *name* would be built for now, or None while its inputs are unset."""
+        rtk = self._geojson_rtk
+        if rtk is None:
+            return None
+        if name == "generated_geojson":
+            if self._geojson_dock is None:
+                return None
+            return tuple(getattr(self, source) for source in _MAP_VIEW_SOURCES), rtk + self._geojson_dock
+        if name == "generated_mow_path_geojson":
+            return (self.current_mow_path,), rtk
+        if name == "generated_mow_progress_geojson":
+            if self._mow_progress is None:
+                return None
+            now_index, ub_path_hash, _, _ = self._mow_progress
+            return (self.current_mow_path, self.root_hash_lists), (
+                *rtk,
+                now_index // MOW_PROGRESS_INDEX_BUCKET,
+                ub_path_hash,
+            )
+        return (self.dynamics_line,), rtk
+
+    def _mark_view_current(self, name: str) -> None:
+        if (key := self._view_key(name)) is not None:
+            self._geojson_keys = {**self._geojson_keys, name: key}
+
+    def stale_geojson_views(self) -> list[str]:
+        """Return the views whose recorded inputs changed since they were last built."""
+        keys = self._geojson_keys
+        return [
+            name
+            for name in GEOJSON_VIEWS
+            if (key := self._view_key(name)) is not None and not _same_key(key, keys.get(name))
+        ]
+
+    def adopt_geojson(self, built: HashList) -> None:
+        """Take over the views *built* (an earlier copy of this map) built for this map's current inputs.
+
+        Copy-on-write snapshots replace the map while a build runs on an older
+        copy; the newer one adopts whatever still matches its inputs.
+        """
+        keys = self._geojson_keys
+        adopted = {
+            name: key
+            for name, key in built._geojson_keys.items()
+            if not _same_key(keys.get(name), key) and _same_key(self._view_key(name), key)
+        }
+        if not adopted:
+            return
+        for name in adopted:
+            setattr(self, name, getattr(built, name))
+        if "generated_geojson" in adopted:
+            self.geojson_yaw = built.geojson_yaw
+            self._geojson_hashlist_snapshot = built._geojson_hashlist_snapshot
+        self._geojson_feature_cache = built._geojson_feature_cache
+        self._geojson_keys = {**keys, **adopted}
+
+    def _refresh_view(self, name: str) -> dict[str, Any]:
+        """Bring view *name* up to date with its recorded inputs, on the calling thread, and return it."""
+        key = self._view_key(name)
+        if key is not None and not _same_key(key, self._geojson_keys.get(name)):
+            self._build_view(name)
+            self._geojson_keys = {**self._geojson_keys, name: key}
+        return getattr(self, name)
+
+    def _build_view(self, name: str) -> None:
+        """Rebuild view *name* from the recorded inputs; keeps the stored view when they can't make one yet."""
+        latitude, longitude, yaw = self._geojson_rtk  # type: ignore[misc]
+        # "Unset" RTK is the exact-0.0 default — nothing can be projected from it.
+        if latitude == 0.0:
+            return
+        if name == "generated_geojson":
+            # An incomplete map (a fetch in progress) keeps the last complete view.  Not
+            # missing_hashlist: it ignores no-go zones and unknown-type frames, so such a
+            # map would never count as complete.
+            if self.area and not self.find_incomplete_hashes(0):
+                self._build_map_geojson(latitude, longitude, yaw, *self._geojson_dock)  # type: ignore[misc]
+        elif name == "generated_mow_path_geojson":
+            if self.current_mow_path and self.missing_mow_path_frame_count() == 0:
+                self._build_mow_path_geojson(latitude, longitude, yaw)
+        elif name == "generated_mow_progress_geojson":
+            self._build_mow_progress_geojson(latitude, longitude, yaw, *self._mow_progress)  # type: ignore[misc]
+        else:
+            self._build_dynamics_line_geojson(latitude, longitude, yaw)
+
+    async def async_geojson(self, name: str, executor: MapExecutor | None = None) -> dict[str, Any]:
+        """Return view *name*, building it off the event loop if it is out of date.
+
+        The build runs on a ``copy.copy`` snapshot — the containers are
+        copy-on-write, so nothing changes under the worker — on *executor*, or
+        in a worker thread when None, and its result is kept only if the
+        inputs did not move on while it ran.  The snapshot gets its own copy of
+        the feature cache, so a worker thread never shares one with builds on
+        the loop; the live map adopts the worker's cache with its result.  A
+        process pool gets the snapshot without the feature cache: pickling it
+        costs more than it saves.
+        """
+        if name not in GEOJSON_VIEWS:
+            msg = f"{name!r} is not a GeoJSON view"
+            raise ValueError(msg)
+        key = self._view_key(name)
+        if key is None or _same_key(key, self._geojson_keys.get(name)):
+            return getattr(self, name)
+        if self._geojson_feature_cache is None:
+            from pymammotion.data.model.generate_geojson import FeatureCache
+
+            self._geojson_feature_cache = FeatureCache()
+        snapshot = self.detached_copy()
+        in_process = executor is None or not executor.is_process
+        # FeatureCache runs replace its dicts rather than mutate them, so a shallow copy is private.
+        snapshot._geojson_feature_cache = copy.copy(self._geojson_feature_cache) if in_process else None  # noqa: SLF001
+        if executor is None:
+            view, yaw, hashes = await asyncio.to_thread(_build_detached_view, snapshot, name)
+        else:
+            view, yaw, hashes = await executor.run(_build_detached_view, snapshot, name)
+        if _same_key(self._view_key(name), key):
+            setattr(self, name, view)
+            if name == "generated_geojson":
+                self.geojson_yaw = yaw
+                self._geojson_hashlist_snapshot = hashes
+            self._geojson_keys = {**self._geojson_keys, name: key}
+            if in_process:
+                self._geojson_feature_cache = snapshot._geojson_feature_cache  # noqa: SLF001
+        return view
+
     def geojson_needs_regeneration(self, rtk: LocationPoint, yaw_threshold: float = 0.01) -> bool:
         """Return True if the stored GeoJSON is absent, has a stale RTK yaw, or has stale map hashes.
 
@@ -1096,10 +1598,10 @@ class HashList(DataClassORJSONMixin):
         Hash staleness is detected by comparing the current
         ``area_root_hashlist`` against the snapshot taken when the GeoJSON was
         last built.  If unchanged, the expensive per-feature hash walk is
-        skipped — the dominant cost on the ~4 Hz ``system_update_buf`` hot
-        path during mowing.
+        skipped.
         """
-        if not self.generated_geojson:
+        stored = self.generated_geojson
+        if not stored:
             return True
         if abs(rtk.yaw - self.geojson_yaw) > yaw_threshold:
             return True
@@ -1112,48 +1614,74 @@ class HashList(DataClassORJSONMixin):
         # references a hash that no longer exists on the device.
         geojson_hashes = {
             f["properties"]["hash"]
-            for f in self.generated_geojson.get("features", [])
+            for f in stored.get("features", [])
             if isinstance(f.get("properties"), dict) and f["properties"].get("hash") is not None
         }
         return bool(geojson_hashes - current_hashlist)
 
     def generate_geojson(self, rtk: LocationPoint, dock: Dock) -> Any:
-        """Rebuild ``generated_geojson`` from the cached frames."""
-        from pymammotion.data.model.generate_geojson import GeojsonGenerator
+        """Rebuild ``generated_geojson`` from the cached frames now, with *rtk* and *dock* as origin.
+
+        Only hashes whose FrameList changed since the last call (or every hash,
+        after an RTK origin/yaw change) have their coordinates re-converted; the
+        rest are spliced in from ``_geojson_feature_cache``.
+        """
+        self.set_geojson_origin(rtk, dock, yaw_threshold=0.0)
+        self._build_map_geojson(rtk.latitude, rtk.longitude, rtk.yaw, dock.latitude, dock.longitude, dock.rotation)
+        self._mark_view_current("generated_geojson")
+
+    def _build_map_geojson(
+        self,
+        latitude: float,
+        longitude: float,
+        yaw: float,
+        dock_latitude: float,
+        dock_longitude: float,
+        dock_rotation: float,
+    ) -> None:
+        from pymammotion.data.model.generate_geojson import FeatureCache, GeojsonGenerator
+
+        if self._geojson_feature_cache is None:
+            self._geojson_feature_cache = FeatureCache()
 
-        coordinator_converter = CoordinateConverter(rtk.latitude, rtk.longitude)
+        coordinator_converter = CoordinateConverter(latitude, longitude)
         RTK_real_loc = coordinator_converter.enu_to_lla(0, 0)
 
-        dock_location = coordinator_converter.enu_to_lla(dock.latitude, dock.longitude)
-        dock_rotation = coordinator_converter.get_transform_yaw_with_yaw(dock.rotation) + 180
+        dock_location = coordinator_converter.enu_to_lla(dock_latitude, dock_longitude)
+        dock_rotation = coordinator_converter.get_transform_yaw_with_yaw(dock_rotation) + 180
 
         self.generated_geojson = GeojsonGenerator.generate_geojson(
             self,
             Point(RTK_real_loc.latitude, RTK_real_loc.longitude),
             Point(dock_location.latitude, dock_location.longitude),
             int(dock_rotation),
-            yaw=rtk.yaw,
+            yaw=yaw,
+            cache=self._geojson_feature_cache,
         )
-        self.geojson_yaw = rtk.yaw
+        self.geojson_yaw = yaw
         # Record the hashlist used so the next geojson_needs_regeneration()
         # can short-circuit when state hasn't changed.
         self._geojson_hashlist_snapshot = frozenset(self.area_root_hashlist)
 
     def generate_mowing_geojson(self, rtk: LocationPoint) -> Any:
-        """Rebuild ``generated_mow_path_geojson`` from the cached mow-path frames."""
+        """Rebuild ``generated_mow_path_geojson`` from the cached mow-path frames now."""
+        self.set_geojson_origin(rtk, yaw_threshold=0.0)
+        self._build_mow_path_geojson(rtk.latitude, rtk.longitude, rtk.yaw)
+        self._mark_view_current("generated_mow_path_geojson")
+        return self.generated_mow_path_geojson
+
+    def _build_mow_path_geojson(self, latitude: float, longitude: float, yaw: float) -> None:
         from pymammotion.data.model.generate_geojson import GeojsonGenerator
 
-        coordinator_converter = CoordinateConverter(rtk.latitude, rtk.longitude)
+        coordinator_converter = CoordinateConverter(latitude, longitude)
         rtk_real_loc = coordinator_converter.enu_to_lla(0, 0)
 
         self.generated_mow_path_geojson = GeojsonGenerator.generate_mow_path_geojson(
             self,
             Point(rtk_real_loc.latitude, rtk_real_loc.longitude),
-            yaw=rtk.yaw,
+            yaw=yaw,
         )
 
-        return self.generated_mow_path_geojson
-
     def apply_mow_progress_geojson(
         self,
         rtk: LocationPoint,
@@ -1162,25 +1690,44 @@ class HashList(DataClassORJSONMixin):
         path_pos_x: int,
         path_pos_y: int,
     ) -> None:
-        """Slice ``current_mow_path`` to *now_index* and store as progress GeoJSON.
+        """Slice ``current_mow_path`` to *now_index* and store as progress GeoJSON now.
 
         No-op when RTK isn't fixed (``latitude == 0``), ``now_index`` is
         negative, or no mow path is cached.  ``path_pos_x``/``path_pos_y`` are
-        device-side integers scaled by 1e4.
+        device-side integers scaled by 1e4.  :meth:`set_mow_progress` records
+        the same inputs without building.
         """
-        from pymammotion.data.model.generate_geojson import GeojsonGenerator
-
+        self.set_geojson_origin(rtk, yaw_threshold=0.0)
+        self.set_mow_progress(now_index, ub_path_hash, path_pos_x, path_pos_y)
         # "Unset" RTK is the exact-0.0 default (radians).  Compare to 0.0, NOT round(lat, 0):
         # rounding to 0 decimals collapses everything within ~0.5 rad (~28°) of the equator to
         # 0 and would skip real fixes.
-        if rtk.latitude == 0.0 or now_index < 0 or not self.current_mow_path:
+        if rtk.latitude != 0.0:
+            self._build_mow_progress_geojson(
+                rtk.latitude, rtk.longitude, rtk.yaw, now_index, ub_path_hash, path_pos_x, path_pos_y
+            )
+        self._mark_view_current("generated_mow_progress_geojson")
+
+    def _build_mow_progress_geojson(
+        self,
+        latitude: float,
+        longitude: float,
+        yaw: float,
+        now_index: int,
+        ub_path_hash: int,
+        path_pos_x: int,
+        path_pos_y: int,
+    ) -> None:
+        from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+        if now_index < 0 or not self.current_mow_path:
             return
 
         raw_x = path_pos_x / 10000.0
         raw_y = path_pos_y / 10000.0
         path_pos = (raw_x, raw_y) if (raw_x != 0.0 or raw_y != 0.0) else None
 
-        conv = CoordinateConverter(rtk.latitude, rtk.longitude)
+        conv = CoordinateConverter(latitude, longitude)
         rtk_ll = conv.enu_to_lla(0, 0)
         self.generated_mow_progress_geojson = GeojsonGenerator.generate_mow_progress_geojson(
             self,
@@ -1188,23 +1735,29 @@ class HashList(DataClassORJSONMixin):
             Point(rtk_ll.latitude, rtk_ll.longitude),
             ub_path_hash=ub_path_hash,
             path_pos=path_pos,
-            yaw=rtk.yaw,
+            yaw=yaw,
         )
 
     def apply_dynamics_line_geojson(self, rtk: LocationPoint) -> None:
-        """Convert ``dynamics_line`` to a WGS-84 LineString GeoJSON.
+        """Convert ``dynamics_line`` to a WGS-84 LineString GeoJSON now.
 
         No-op when RTK isn't fixed or fewer than two points have been received.
         """
+        self.set_geojson_origin(rtk, yaw_threshold=0.0)
+        if rtk.latitude != 0.0:
+            self._build_dynamics_line_geojson(rtk.latitude, rtk.longitude, rtk.yaw)
+        self._mark_view_current("generated_dynamics_line_geojson")
+
+    def _build_dynamics_line_geojson(self, latitude: float, longitude: float, yaw: float) -> None:
         from pymammotion.data.model.generate_geojson import GeojsonGenerator
 
-        if rtk.latitude == 0.0 or len(self.dynamics_line) < 2:
+        if len(self.dynamics_line) < 2:
             return
 
-        conv = CoordinateConverter(rtk.latitude, rtk.longitude)
+        conv = CoordinateConverter(latitude, longitude)
         rtk_ll = conv.enu_to_lla(0, 0)
         self.generated_dynamics_line_geojson = GeojsonGenerator.generate_dynamics_line_geojson(
             self.dynamics_line,
             Point(rtk_ll.latitude, rtk_ll.longitude),
-            yaw=rtk.yaw,
+            yaw=yaw,
         )
@@ -0,0 +1,164 @@
+"""Compact storage for map point lists: ``CommDataCouple`` and ``PointBuffer``."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass
+from typing import Any, Self, overload
+
+from mashumaro.types import SerializableType
+
+
+@dataclass
+class CommDataCouple:
+    """An (x, y) coordinate pair from a common-data map frame."""
+
+    x: float = 0.0
+    y: float = 0.0
+
+
+class PointBuffer(Sequence[CommDataCouple], SerializableType):
+    """Immutable sequence of (x, y) points stored as one interleaved float64 ``array``.
+
+    Map frames, mow paths and edge points carry hundreds of thousands of
+    points per device; as ``list[CommDataCouple]`` each point is a Python
+    object (~100 bytes) that ``deepcopy`` has to visit.  A PointBuffer holds
+    them as ``[x0, y0, x1, y1, …]`` in 16 bytes per point and is never
+    mutated after construction, so copying shares it.
+
+    It behaves as a ``Sequence[CommDataCouple]`` — indexing, iteration,
+    ``len`` and equality against a list of couples all work, materialising
+    ``CommDataCouple`` objects on access — and exposes the raw buffer
+    (``memoryview(buf)`` / ``numpy.frombuffer(buf)``) for batch maths.
+
+    Serialises to the same ``[{"x": …, "y": …}, …]`` shape the plain list
+    did, so stored device caches load unchanged.
+    """
+
+    __slots__ = ("_coords",)
+
+    def __init__(self, points: Iterable[Any] = ()) -> None:
+        """Build from any iterable of objects with ``.x`` / ``.y`` (model or proto couples)."""
+        if isinstance(points, PointBuffer):
+            self._coords: array[float] = points._coords  # noqa: SLF001
+            return
+        coords: array[float] = array("d")
+        for point in points:
+            coords.append(point.x)
+            coords.append(point.y)
+        self._coords = coords
+
+    @classmethod
+    def from_coords(cls, coords: Iterable[float]) -> Self:
+        """Build from interleaved ``x0, y0, x1, y1, …`` values (copied into a new array)."""
+        buf = cls.__new__(cls)
+        buf._coords = array("d", coords)  # noqa: SLF001
+        if len(buf._coords) % 2:  # noqa: SLF001
+            msg = "interleaved coordinates must have an even length"
+            raise ValueError(msg)
+        return buf
+
+    @classmethod
+    def join(cls, parts: Iterable[Iterable[Any]]) -> Self:
+        """Concatenate several point sequences (buffers are joined without materialising points)."""
+        buf = cls.__new__(cls)
+        coords: array[float] = array("d")
+        for part in parts:
+            coords.extend(part._coords if isinstance(part, PointBuffer) else PointBuffer(part)._coords)  # noqa: SLF001
+        buf._coords = coords  # noqa: SLF001
+        return buf
+
+    @property
+    def coords(self) -> array[float]:
+        """The interleaved backing array.  Treat as read-only — buffers are shared between copies."""
+        return self._coords
+
+    def __buffer__(self, flags: int, /) -> memoryview:
+        """Expose the interleaved float64 data (``memoryview(buf)``, ``numpy.frombuffer(buf)``)."""
+        return memoryview(self._coords).toreadonly()
+
+    def __len__(self) -> int:
+        """Return the number of points."""
+        return len(self._coords) // 2
+
+    @overload
+    def __getitem__(self, index: int) -> CommDataCouple: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> PointBuffer: ...
+
+    def __getitem__(self, index: int | slice) -> CommDataCouple | PointBuffer:
+        """Return the point at *index*, or a new buffer for a slice."""
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step == 1:
+                return PointBuffer.from_coords(self._coords[2 * start : 2 * max(start, stop)])
+            return PointBuffer(self[i] for i in range(start, stop, step))
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            msg = "PointBuffer index out of range"
+            raise IndexError(msg)
+        return CommDataCouple(x=self._coords[2 * index], y=self._coords[2 * index + 1])
+
+    def __iter__(self) -> Iterator[CommDataCouple]:
+        """Yield each point as a new ``CommDataCouple``."""
+        coords = self._coords
+        for i in range(0, len(coords), 2):
+            yield CommDataCouple(x=coords[i], y=coords[i + 1])
+
+    def __eq__(self, other: object) -> bool:
+        """Compare point-wise with another buffer or any sequence of couples."""
+        if isinstance(other, PointBuffer):
+            return self._coords == other._coords
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other: Iterable[Any]) -> PointBuffer:
+        """Return a new buffer with *other*'s points appended."""
+        return PointBuffer.join((self, other))
+
+    def __radd__(self, other: Iterable[Any]) -> PointBuffer:
+        """Support ``list + buffer``."""
+        return PointBuffer.join((other, self))
+
+    def __copy__(self) -> Self:
+        """Buffers are immutable — a copy is the same object."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> Self:
+        """Buffers are immutable — a deep copy is the same object."""
+        return self
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle as the interleaved coordinate array."""
+        return PointBuffer.from_coords, (self._coords,)
+
+    def __repr__(self) -> str:
+        """Return ``PointBuffer(<n> points)``."""
+        return f"PointBuffer({len(self)} points)"
+
+    def _serialize(self) -> list[dict[str, float]]:
+        coords = self._coords
+        return [{"x": coords[i], "y": coords[i + 1]} for i in range(0, len(coords), 2)]
+
+    @classmethod
+    def _deserialize(cls, value: Any) -> PointBuffer:
+        if isinstance(value, PointBuffer):
+            return value
+        buf = cls.__new__(cls)
+        coords: array[float] = array("d")
+        for point in value:
+            if isinstance(point, dict):
+                coords.append(point.get("x", 0.0))
+                coords.append(point.get("y", 0.0))
+            else:
+                coords.append(point.x)
+                coords.append(point.y)
+        buf._coords = coords  # noqa: SLF001
+        return buf
@@ -0,0 +1,181 @@
+"""Direct betterproto2 message → model dataclass conversion.
+
+The reducer and sagas used to convert wire messages with
+``Model.from_dict(msg.to_dict(casing=SNAKE))``: one pass builds a dict of
+every field (a dict per point for map frames, int64s rendered as strings),
+and a second walks it back into dataclasses.  :func:`from_proto` reads the
+message's attributes straight into the model instead.
+
+Converters are built once per ``(model, message)`` class pair from the two
+classes' field metadata and cached.  They reproduce the dict round trip:
+
+* fields the message leaves at their proto default (``0``, ``""``, empty
+  list, unset sub-message) are not passed, so the model default applies;
+* fields are matched by the same snake-cased name ``to_dict`` emits, and
+  message fields the model does not declare are ignored;
+* nested messages, repeated messages and ``PointBuffer`` point lists are
+  converted recursively; enums into ``str`` fields take the enum's proto
+  name, and numbers into differently-typed fields get mashumaro's cast.
+
+A model with a field whose type pairing isn't handled here (e.g. a proto
+``map``) falls back to the ``to_dict``/``from_dict`` round trip
+for that class, so results never differ from the old path.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import dataclasses
+from functools import cache
+import types
+from typing import Any, TypeVar, Union, get_args, get_origin, get_type_hints
+
+import betterproto2
+
+from pymammotion.data.model.point_buffer import PointBuffer
+
+_M = TypeVar("_M")
+
+_INT_TYPES = frozenset(
+    {
+        "int32",
+        "int64",
+        "uint32",
+        "uint64",
+        "sint32",
+        "sint64",
+        "fixed32",
+        "fixed64",
+        "sfixed32",
+        "sfixed64",
+    }
+)
+_FLOAT_TYPES = frozenset({"float", "double"})
+_NUMERIC_TYPES = _INT_TYPES | _FLOAT_TYPES
+
+# Pairs whose proto value is already what the model field holds.
+_AS_IS = frozenset(
+    {(int, t) for t in _INT_TYPES}
+    | {(float, t) for t in _FLOAT_TYPES}
+    | {(str, "string"), (bool, "bool"), (bytes, "bytes")}
+)
+
+# How a field's proto default is recognised (and then skipped, as to_dict() does).
+_SCALAR = 0  # falsy value: 0, "", b"", False, empty PointBuffer source
+_MESSAGE = 1  # unset sub-message (None); a set one is always emitted, even if empty
+_REPEATED = 2  # empty list
+
+# (model field name, proto field name, value transform or None for as-is, kind)
+_FieldPlan = tuple[str, str, Callable[[Any], Any] | None, int]
+
+
+class _Unsupported(TypeError):
+    """The model/message pair has a field this module does not convert directly."""
+
+
+def from_proto(model_cls: type[_M], message: betterproto2.Message) -> _M:
+    """Build a *model_cls* instance from *message*, equivalent to ``from_dict(to_dict(casing=SNAKE))``."""
+    return _converter(model_cls, type(message))(message)
+
+
+@cache
+def _converter(model_cls: type[_M], proto_cls: type[betterproto2.Message]) -> Callable[[Any], _M]:
+    """Return the cached converter for one class pair (falls back to the dict round trip)."""
+    try:
+        plan = _plan(model_cls, proto_cls)
+    except _Unsupported:
+        from_dict = model_cls.from_dict  # type: ignore[attr-defined]
+        return lambda message: from_dict(message.to_dict(casing=betterproto2.Casing.SNAKE))
+
+    def _convert(message: Any) -> _M:
+        kwargs: dict[str, Any] = {}
+        for model_name, proto_name, transform, kind in plan:
+            value = getattr(message, proto_name)
+            # Proto defaults are omitted by to_dict(), leaving the model default in place.
+            if value is None if kind == _MESSAGE else not value:
+                continue
+            if kind == _REPEATED:
+                kwargs[model_name] = list(value) if transform is None else [transform(item) for item in value]
+            else:
+                kwargs[model_name] = value if transform is None else transform(value)
+        return model_cls(**kwargs)
+
+    return _convert
+
+
+def _plan(model_cls: type, proto_cls: type[betterproto2.Message]) -> list[_FieldPlan]:
+    """Pair each init field of *model_cls* with its message field and a value transform."""
+    if not dataclasses.is_dataclass(model_cls):
+        msg = f"{model_cls!r} is not a dataclass"
+        raise _Unsupported(msg)
+    proto_meta = getattr(proto_cls, "_betterproto", None)
+    if proto_meta is None:
+        # Not a generated message class (e.g. a duck-typed stand-in that only offers to_dict()).
+        msg = f"{proto_cls!r} has no betterproto2 metadata"
+        raise _Unsupported(msg)
+    proto_fields = {
+        betterproto2.Casing.SNAKE(name).rstrip("_"): (name, meta)
+        for name, meta in proto_meta.meta_by_field_name.items()
+    }
+    hints = get_type_hints(model_cls)
+    plan: list[_FieldPlan] = []
+    for field in dataclasses.fields(model_cls):
+        if not field.init or field.name not in proto_fields:
+            continue
+        proto_name, meta = proto_fields[field.name]
+        if meta.proto_type == "map":
+            msg = f"{model_cls.__name__}.{field.name}: map fields are not converted directly"
+            raise _Unsupported(msg)
+        model_type = _strip_optional(hints[field.name])
+        if meta.repeated:
+            if model_type is PointBuffer and meta.proto_type == "message":
+                plan.append((field.name, proto_name, PointBuffer, _SCALAR))
+                continue
+            if get_origin(model_type) is not list:
+                msg = f"{model_cls.__name__}.{field.name}: repeated field into {model_type!r}"
+                raise _Unsupported(msg)
+            (item_type,) = get_args(model_type)
+            item_proto_cls = proto_meta.cls_by_field.get(proto_name) if meta.proto_type == "message" else None
+            plan.append((field.name, proto_name, _transform(item_type, meta.proto_type, item_proto_cls), _REPEATED))
+            continue
+        if meta.proto_type == "message":
+            sub_proto_cls = proto_meta.cls_by_field.get(proto_name)
+            plan.append((field.name, proto_name, _transform(model_type, "message", sub_proto_cls), _MESSAGE))
+        else:
+            plan.append((field.name, proto_name, _transform(model_type, meta.proto_type, None), _SCALAR))
+    return plan
+
+
+def _transform(model_type: Any, proto_type: str, proto_cls: type | None) -> Callable[[Any], Any] | None:
+    """Return the transform for one value, ``None`` for as-is; raise _Unsupported otherwise."""
+    if proto_type == "message":
+        if proto_cls is None or not dataclasses.is_dataclass(model_type):
+            msg = f"message field into {model_type!r}"
+            raise _Unsupported(msg)
+        # A nested pair that can't be converted directly falls back on its own.
+        return _converter(model_type, proto_cls)
+    if proto_type == "enum" and model_type is str:
+        return _enum_json_name
+    if (model_type, proto_type) in _AS_IS:
+        return None
+    # mashumaro coerces int / float / str fields with the type's constructor.
+    if model_type in (int, float, str) and proto_type in _NUMERIC_TYPES | {"bool"}:
+        return model_type
+    msg = f"proto {proto_type} into {model_type!r}"
+    raise _Unsupported(msg)
+
+
+def _enum_json_name(value: Any) -> Any:
+    """Render an enum value the way ``to_dict`` does: its proto name, or the number if unknown."""
+    if not value.name:
+        return value.value
+    return value.proto_name or value.name
+
+
+def _strip_optional(tp: Any) -> Any:
+    """Return ``X`` for ``X | None`` / ``Optional[X]``, else *tp* unchanged."""
+    if get_origin(tp) in (Union, types.UnionType):
+        args = [arg for arg in get_args(tp) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return tp
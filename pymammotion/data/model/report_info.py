@@ -4,7 +4,6 @@ from dataclasses import dataclass, field
 from enum import StrEnum
 from typing import TYPE_CHECKING
 
-import betterproto2
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
 from pymammotion.data.model.enums import (
@@ -16,6 +15,7 @@ from pymammotion.data.model.enums import (
     SensorCheckState,
     SimCardStatus,
 )
+from pymammotion.data.model.proto_convert import from_proto
 
 if TYPE_CHECKING:
     from pymammotion.proto import ReportInfoData
@@ -628,35 +628,24 @@ class ReportData(DataClassORJSONMixin):
     def update(self, data: ReportInfoData) -> None:
         """Update only the fields present in the proto message, leaving absent fields unchanged."""
         if data.connect is not None:
-            self.connect = ConnectData.from_dict(data.connect.to_dict(casing=betterproto2.Casing.SNAKE))
+            self.connect = from_proto(ConnectData, data.connect)
         if data.dev is not None:
-            self.dev = DeviceData.from_dict(data.dev.to_dict(casing=betterproto2.Casing.SNAKE))
+            self.dev = from_proto(DeviceData, data.dev)
         if data.rtk is not None:
-            self.rtk = RTKData.from_dict(data.rtk.to_dict(casing=betterproto2.Casing.SNAKE))
+            self.rtk = from_proto(RTKData, data.rtk)
         if data.maintain is not None:
-            self.maintenance = Maintain.from_dict(data.maintain.to_dict(casing=betterproto2.Casing.SNAKE))
+            self.maintenance = from_proto(Maintain, data.maintain)
         if data.vio_to_app_info is not None:
-            self.vision_info = VisionInfo.from_dict(data.vio_to_app_info.to_dict(casing=betterproto2.Casing.SNAKE))
+            self.vision_info = from_proto(VisionInfo, data.vio_to_app_info)
         if data.locations:
-            self.locations = [
-                LocationData.from_dict(loc.to_dict(casing=betterproto2.Casing.SNAKE)) for loc in data.locations
-            ]
+            self.locations = [from_proto(LocationData, loc) for loc in data.locations]
         if data.work is not None:
-            self.work = WorkData.from_dict(data.work.to_dict(casing=betterproto2.Casing.SNAKE))
+            self.work = from_proto(WorkData, data.work)
         if data.basestation_info is not None:
-            self.basestation_info = BasestationInfo.from_dict(
-                data.basestation_info.to_dict(casing=betterproto2.Casing.SNAKE)
-            )
+            self.basestation_info = from_proto(BasestationInfo, data.basestation_info)
         if data.cutter_work_mode_info is not None:
-            self.cutter_work_mode_info = CutterWorkModeInfo.from_dict(
-                data.cutter_work_mode_info.to_dict(casing=betterproto2.Casing.SNAKE)
-            )
+            self.cutter_work_mode_info = from_proto(CutterWorkModeInfo, data.cutter_work_mode_info)
         if data.vision_point_info:
-            self.vision_point_info = [
-                VisionPointInfo.from_dict(vpi.to_dict(casing=betterproto2.Casing.SNAKE))
-                for vpi in data.vision_point_info
-            ]
+            self.vision_point_info = [from_proto(VisionPointInfo, vpi) for vpi in data.vision_point_info]
         if data.vision_statistic_info is not None:
-            self.vision_statistic_info = VisionStatisticInfo.from_dict(
-                data.vision_statistic_info.to_dict(casing=betterproto2.Casing.SNAKE)
-            )
+            self.vision_statistic_info = from_proto(VisionStatisticInfo, data.vision_statistic_info)
@@ -2,13 +2,10 @@ from base64 import b64decode
 from dataclasses import dataclass
 from typing import Annotated, Any, Literal
 
-from google.protobuf import json_format
 from mashumaro.config import BaseConfig
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 from mashumaro.types import Alias, SerializableType
 
-from pymammotion.proto import luba_msg_pb2
-
 
 class Base64EncodedProtobuf(SerializableType):
     """Mashumaro serializable type that decodes a base64-encoded LubaMsg protobuf string."""
@@ -33,9 +30,10 @@ class Base64EncodedProtobuf(SerializableType):
         if not isinstance(v, str):
             raise TypeError("string required")
         binary = b64decode(v, validate=True)
-        data = luba_msg_pb2.LubaMsg()
-        data.ParseFromString(binary)
-        return json_format.MessageToDict(data)
+        # Imported here: the generated message tables are only needed to decode.
+        from pymammotion.proto import LubaMsg
+
+        return LubaMsg().parse(binary).to_dict()
 
 
 @dataclass
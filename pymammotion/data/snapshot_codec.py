@@ -0,0 +1,183 @@
+"""Compact, versioned binary snapshots of a :class:`Device`, for hosts that persist device state.
+
+``Device.to_json`` writes the whole tree as JSON: every map point as an
+``{"x": …, "y": …}`` object, plus the generated GeoJSON, which alone is
+megabytes on a large map.  Restoring reparses all of it.  The snapshot
+format instead:
+
+* leaves out the map fields that are derived or live-only
+  (:data:`~pymammotion.data.map_store.DERIVED_MAP_FIELDS`) — the generated
+  GeoJSON views are rebuilt on first read once the origin is recorded again;
+* packs runs of float records — lists of dicts whose values are all floats,
+  such as ``data_couple`` points — and plain float lists column-wise into
+  one little-endian ``float64`` block, stored uncompressed — doubles barely
+  compress, and zlib over them costs more time than it saves.  The JSON
+  tree keeps a small placeholder in their place.
+
+File layout (little-endian)::
+
+    magic    4s  b"PDEV"
+    version  H   FORMAT_VERSION
+    flags    H   reserved, 0
+    json_len I   bytes of compressed JSON that follow
+    floats   I   float64 values in the float block
+    json         zlib(JSON tree)
+    float block  floats × float64
+
+The JSON root is ``{"kind": <Device subclass name>, "device": <tree>}``.
+Floats are stored at full precision, so a round trip reproduces every
+coordinate exactly.
+"""
+
+from __future__ import annotations
+
+from array import array
+import struct
+import sys
+from typing import Any
+import zlib
+
+import orjson
+
+from pymammotion.data.map_store import DERIVED_MAP_FIELDS
+from pymammotion.data.model.device import Device, MowerDevice, PoolCleanerDevice, RTKBaseStationDevice
+
+MAGIC = b"PDEV"
+#: Bump when the body layout changes; snapshots of any other version are rejected.
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+#: Placeholder key for a packed run.  Never a dataclass field name.
+_PACKED = "__packed__"
+#: Shortest run worth replacing with a placeholder.
+_MIN_RUN = 4
+#: zlib level for the JSON tree (the float block is stored raw — it barely compresses).
+_ZLIB_LEVEL = 6
+
+_KINDS: dict[str, type[Device]] = {
+    cls.__name__: cls for cls in (Device, MowerDevice, PoolCleanerDevice, RTKBaseStationDevice)
+}
+
+
+class SnapshotError(ValueError):
+    """Bytes are not a readable device snapshot of the current format."""
+
+
+def _float_columns(node: list[Any]) -> tuple[list[str], list[list[float]]] | None:
+    """Split *node* into per-key float columns when it is a run of same-keyed float records."""
+    first = node[0]
+    # Cheap rejection on the first record before scanning the whole run.
+    if not isinstance(first, dict) or not first or set(map(type, first.values())) != {float}:
+        return None
+    if set(map(type, node)) != {dict}:
+        return None
+    keys = list(first)
+    if set(map(len, node)) != {len(keys)}:
+        return None
+    try:
+        columns = [[item[key] for item in node] for key in keys]
+    except KeyError:
+        return None
+    if any(set(map(type, column)) != {float} for column in columns):
+        return None
+    return keys, columns
+
+
+def _pack(node: Any, floats: array[float]) -> Any:
+    """Return *node* with float runs moved into *floats*."""
+    if isinstance(node, dict):
+        return {key: _pack(value, floats) for key, value in node.items()}
+    if not isinstance(node, list):
+        return node
+    if len(node) >= _MIN_RUN:
+        if set(map(type, node)) == {float}:
+            offset = len(floats)
+            floats.extend(node)
+            return {_PACKED: [], "o": offset, "n": len(node)}
+        if (split := _float_columns(node)) is not None:
+            keys, columns = split
+            offset = len(floats)
+            for column in columns:
+                floats.extend(column)
+            return {_PACKED: keys, "o": offset, "n": len(node)}
+    return [_pack(item, floats) for item in node]
+
+
+def _unpack(node: Any, floats: array[float]) -> Any:
+    """Reverse :func:`_pack`."""
+    if isinstance(node, list):
+        return [_unpack(item, floats) for item in node]
+    if not isinstance(node, dict):
+        return node
+    keys = node.get(_PACKED)
+    if keys is None:
+        return {key: _unpack(value, floats) for key, value in node.items()}
+    offset, count = node["o"], node["n"]
+    if offset + count * max(1, len(keys)) > len(floats):
+        msg = "packed run points past the float block"
+        raise SnapshotError(msg)
+    if not keys:
+        return floats[offset : offset + count].tolist()
+    columns = [floats[offset + i * count : offset + (i + 1) * count].tolist() for i in range(len(keys))]
+    if len(keys) == 2:  # x/y points, the overwhelmingly common shape
+        first, second = keys
+        return [{first: a, second: b} for a, b in zip(*columns, strict=True)]
+    return [dict(zip(keys, row, strict=True)) for row in zip(*columns, strict=True)]
+
+
+def _stripped_tree(device: Device) -> dict[str, Any]:
+    tree = device.to_dict()
+    if isinstance(tree.get("map"), dict):
+        for name in DERIVED_MAP_FIELDS:
+            tree["map"].pop(name, None)
+    return tree
+
+
+def to_snapshot_bytes(device: Device) -> bytes:
+    """Serialise *device* to the snapshot format."""
+    floats: array[float] = array("d")
+    tree = _pack(_stripped_tree(device), floats)
+    json_bytes = zlib.compress(
+        orjson.dumps({"kind": type(device).__name__, "device": tree}, option=orjson.OPT_NON_STR_KEYS), _ZLIB_LEVEL
+    )
+    if sys.byteorder != "little":
+        floats.byteswap()
+    return _HEADER.pack(MAGIC, FORMAT_VERSION, 0, len(json_bytes), len(floats)) + json_bytes + floats.tobytes()
+
+
+def from_snapshot_bytes(data: bytes) -> Device:
+    """Rebuild a device from bytes written by :func:`to_snapshot_bytes`.
+
+    The result is an instance of the same ``Device`` subclass that was saved.
+
+    Raises:
+        SnapshotError: *data* is not a snapshot of :data:`FORMAT_VERSION`.
+
+    """
+    if len(data) < _HEADER.size:
+        msg = "snapshot is truncated"
+        raise SnapshotError(msg)
+    magic, version, _flags, json_len, float_count = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        msg = "not a device snapshot"
+        raise SnapshotError(msg)
+    if version != FORMAT_VERSION:
+        msg = f"snapshot version {version}, expected {FORMAT_VERSION}"
+        raise SnapshotError(msg)
+    floats: array[float] = array("d")
+    float_start = _HEADER.size + json_len
+    if len(data) != float_start + float_count * floats.itemsize:
+        msg = "snapshot has the wrong length"
+        raise SnapshotError(msg)
+    floats.frombytes(data[float_start:])
+    if sys.byteorder != "little":
+        floats.byteswap()
+    try:
+        root = orjson.loads(zlib.decompress(data[_HEADER.size : float_start]))
+        cls = _KINDS[root["kind"]]
+        return cls.from_dict(_unpack(root["device"], floats))
+    except SnapshotError:
+        raise
+    except Exception as exc:
+        msg = f"snapshot body is unreadable: {exc}"
+        raise SnapshotError(msg) from exc
@@ -1,9 +1,11 @@
 """Device handle and registry for PyMammotion."""
 
-from pymammotion.device.handle import DeviceHandle, DeviceRegistry
+from pymammotion.device.handle import DeliveryMode, DeliveryPolicy, DeviceHandle, DeviceRegistry
 from pymammotion.device.state_reducer import MowerStateReducer, PoolStateReducer, StateReducer, get_state_reducer
 
 __all__ = [
+    "DeliveryMode",
+    "DeliveryPolicy",
     "DeviceHandle",
     "DeviceRegistry",
     "MowerStateReducer",
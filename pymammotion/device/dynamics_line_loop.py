@@ -110,8 +110,9 @@ async def _enqueue_dynamics_line_saga(handle: DeviceHandle) -> None:
     """Enqueue a ``CommonDataSaga`` for the dynamics line and wire the update.
 
     On successful completion the assembled point list is stored on
-    ``device.map.dynamics_line`` and the WGS-84 geojson is regenerated using
-    the current RTK location, mirroring ``MammotionClient.get_dynamics_line``.
+    ``device.map.dynamics_line``, the current RTK location is recorded and the
+    WGS-84 geojson view is rebuilt on the handle's map executor, mirroring
+    ``MammotionClient.get_dynamics_line``.
     """
     saga = CommonDataSaga(
         command_builder=handle.commands,
@@ -127,7 +128,8 @@ async def _enqueue_dynamics_line_saga(handle: DeviceHandle) -> None:
         if not isinstance(raw, MowerDevice):
             return
         raw.map.update_dynamics_line(saga.result)
-        raw.map.apply_dynamics_line_geojson(raw.location.RTK)
+        raw.map.set_geojson_origin(raw.location.RTK)
+        handle.refresh_geojson()
 
     try:
         await handle.enqueue_saga(saga, on_complete=_on_complete)
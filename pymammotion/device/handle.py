@@ -6,12 +6,17 @@ import asyncio
 import base64
 import contextlib
 import dataclasses
+from dataclasses import dataclass
+from enum import StrEnum
+import heapq
 import logging
+import math
 import time
 from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 from mashumaro.exceptions import InvalidFieldValue, MissingField
 
+from pymammotion.account.rate_limit import RateLimitBucket
 from pymammotion.aliyun.exceptions import DeviceOfflineException, DeviceUnboundException, TooManyRequestsException
 from pymammotion.data.model.device import MowerDevice
 from pymammotion.data.mqtt.event import DeviceProtobufMsgEventParams
@@ -24,6 +29,7 @@ from pymammotion.device.state_reducer import StateReducer, get_state_reducer
 from pymammotion.mammotion.commands.mammotion_command import MammotionCommand
 from pymammotion.messaging.broker import DeviceMessageBroker
 from pymammotion.messaging.command_queue import DeviceCommandQueue, Priority
+from pymammotion.messaging.peek import peek_luba_msg
 from pymammotion.proto import LubaMsg, MsgDevice, RptAct, RptInfoType
 from pymammotion.state.device_state import (
     DeviceAvailability,
@@ -31,6 +37,7 @@ from pymammotion.state.device_state import (
     DeviceShutdownEvent,
     DeviceSnapshot,
     DeviceStateMachine,
+    fields_touched,
 )
 from pymammotion.transport.base import (
     BLEUnavailableError,
@@ -76,6 +83,10 @@ _RPT_ACK_TIMEOUT: float = 5.0
 #: gets polled for data it just sent.
 _REPORT_SNAPSHOT_DEBOUNCE: float = 15.0
 
+#: Top-level device fields whose writes can leave a map GeoJSON view stale:
+#: the frames themselves and the RTK origin / dock they are projected from.
+_GEOJSON_INPUTS: frozenset[str] = frozenset({"map", "location"})
+
 #: Channels sent in one-shot (count=1) polls AND in the BLE continuous stream.
 _REPORT_CHANNELS: list[RptInfoType] = [
     RptInfoType.RIT_DEV_STA,
@@ -88,27 +99,96 @@ _REPORT_CHANNELS: list[RptInfoType] = [
 ]
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
 
+    from pymammotion.account.rate_limit import AccountRateLimiter
     from pymammotion.data.model.device import Device, MowingDevice
     from pymammotion.data.mqtt.event import ThingEventMessage
     from pymammotion.data.mqtt.properties import MammotionPropertiesMessage, ThingPropertiesMessage
     from pymammotion.data.mqtt.status import ThingStatusMessage
+    from pymammotion.device.poll_scheduler import PollScheduler
     from pymammotion.device.readiness import ReadinessChecker, ReadinessStatus
     from pymammotion.messaging.saga import Saga
+    from pymammotion.utility.executor import MapExecutor
 
 _logger = logging.getLogger(__name__)
 
 
+class DeliveryMode(StrEnum):
+    """How a state-changed subscriber is fed snapshots; see :class:`DeliveryPolicy`."""
+
+    IMMEDIATE = "immediate"
+    DEBOUNCE = "debounce"
+    MAX_RATE = "max_rate"
+
+
+@dataclass(frozen=True, slots=True)
+class DeliveryPolicy:
+    """Per-subscriber delivery policy for :meth:`DeviceHandle.subscribe_state_changed`.
+
+    ``IMMEDIATE`` delivers every snapshot as it is emitted.  ``DEBOUNCE``
+    delivers the latest snapshot after ``interval`` seconds of silence, or
+    ``max_wait`` seconds after the first held one.  ``MAX_RATE`` delivers at
+    most one snapshot per ``interval`` seconds: the first immediately, then
+    the latest at the end of each window.
+
+    When ``fields`` is set, snapshots whose ``changed_fields`` touch none of
+    those dotted paths are ignored.  Held snapshots are coalesced with the
+    union of their ``changed_fields``, so a field-filtered subscriber never
+    misses a path touched by a superseded snapshot.
+    """
+
+    mode: DeliveryMode = DeliveryMode.IMMEDIATE
+    interval: float = 0.0
+    max_wait: float = 2.0
+    fields: frozenset[str] | None = None
+
+    @classmethod
+    def immediate(cls, fields: Iterable[str] | None = None) -> DeliveryPolicy:
+        """Deliver every (matching) snapshot as soon as it is emitted."""
+        return cls(fields=frozenset(fields) if fields is not None else None)
+
+    @classmethod
+    def debounced(cls, interval: float, max_wait: float = 2.0, fields: Iterable[str] | None = None) -> DeliveryPolicy:
+        """Coalesce bursts; deliver after *interval* s of quiet, at most *max_wait* s late."""
+        return cls(DeliveryMode.DEBOUNCE, interval, max_wait, frozenset(fields) if fields is not None else None)
+
+    @classmethod
+    def max_rate(cls, interval: float, fields: Iterable[str] | None = None) -> DeliveryPolicy:
+        """Deliver at most one snapshot every *interval* seconds (e.g. ``1.0`` for 1 Hz)."""
+        return cls(DeliveryMode.MAX_RATE, interval, fields=frozenset(fields) if fields is not None else None)
+
+    @classmethod
+    def on_fields(cls, *fields: str) -> DeliveryPolicy:
+        """Deliver immediately, but only snapshots that touch one of *fields*."""
+        return cls(fields=frozenset(fields))
+
+
+@dataclass(eq=False, slots=True)
+class _Subscriber:
+    """One state-changed subscription and its held snapshot."""
+
+    handler: Callable[[DeviceSnapshot], Awaitable[None]]
+    policy: DeliveryPolicy
+    pending: DeviceSnapshot | None = None
+    first_pending_at: float = 0.0
+    last_delivered_at: float = -math.inf
+    #: Deadline of the live timer entry; heap entries with another deadline are stale.
+    due: float | None = None
+
+
 class _DebouncedBus:
-    """Wraps EventBus[DeviceSnapshot] with optional debounce.
+    """State-changed bus with a :class:`DeliveryPolicy` per subscriber.
 
-    When debounce_interval > 0, rapid consecutive events are coalesced:
-    only the most recent snapshot is emitted after debounce_interval seconds
-    of silence, OR after max_debounce_wait seconds from the first suppressed
-    event (whichever comes first).
+    Subscribers registered without a policy get the handle-wide default:
+    debounced by ``debounce_interval`` (bounded by ``max_debounce_wait``)
+    when it is > 0, immediate otherwise.
 
-    When debounce_interval == 0 (default), events are emitted immediately.
+    Held snapshots are flushed from one timer per bus: a min-heap of
+    subscriber deadlines and a single ``loop.call_at`` handle armed for the
+    earliest.  Emits only update the heap; a flush runs every due
+    subscriber in one task.  A 1 Hz dashboard subscriber therefore costs
+    one task per second, not one per suppressed emit.
     """
 
     def __init__(
@@ -116,70 +196,142 @@ class _DebouncedBus:
         debounce_interval: float = 0.0,
         max_debounce_wait: float = 2.0,
     ) -> None:
-        """Initialise the debounced bus with optional debounce parameters."""
-        self._bus: EventBus[DeviceSnapshot] = EventBus()
-        self._debounce_interval = debounce_interval
-        self._max_debounce_wait = max_debounce_wait
-        self._pending_snapshot: DeviceSnapshot | None = None
-        self._debounce_task: asyncio.Task[None] | None = None
-        self._first_suppressed_at: float = 0.0
-
-    def subscribe(self, handler: Callable[[DeviceSnapshot], Awaitable[None]]) -> Subscription:
+        """Initialise the bus; the two arguments define the default policy."""
+        self._default_policy = (
+            DeliveryPolicy.debounced(debounce_interval, max_debounce_wait)
+            if debounce_interval > 0.0
+            else DeliveryPolicy.immediate()
+        )
+        self._subscribers: dict[int, _Subscriber] = {}
+        self._next_id = 0
+        self._deadlines: list[tuple[float, int, _Subscriber]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._timer_at: float = math.inf
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def subscribe(
+        self, handler: Callable[[DeviceSnapshot], Awaitable[None]], policy: DeliveryPolicy | None = None
+    ) -> Subscription:
         """Register a handler and return a Subscription for later cancellation."""
-        return self._bus.subscribe(handler)
+        sub_id = self._next_id
+        self._next_id += 1
+        self._subscribers[sub_id] = _Subscriber(handler, policy or self._default_policy)
 
-    async def emit(self, snapshot: DeviceSnapshot) -> None:
-        """Emit a snapshot, coalescing if debounce_interval > 0."""
-        if self._debounce_interval <= 0.0:
-            await self._bus.emit(snapshot)
-            return
+        def _remove() -> None:
+            if (sub := self._subscribers.pop(sub_id, None)) is not None:
+                sub.pending = None
+                sub.due = None
+
+        return Subscription(sub_id, _remove)
 
+    async def emit(self, snapshot: DeviceSnapshot) -> None:
+        """Offer *snapshot* to every subscriber according to its policy."""
         now = time.monotonic()
+        for sub in list(self._subscribers.values()):
+            policy = sub.policy
+            if policy.fields is not None and not fields_touched(snapshot.changed_fields, policy.fields):
+                continue
+            if policy.mode is DeliveryMode.IMMEDIATE:
+                await self._deliver(sub, snapshot, now)
+                continue
+
+            # Hold the snapshot, carrying forward paths a superseded one touched.
+            if sub.pending is None:
+                sub.first_pending_at = now
+                merged = snapshot
+            elif sub.pending.changed_fields <= snapshot.changed_fields:
+                merged = snapshot
+            else:
+                merged = dataclasses.replace(
+                    snapshot, changed_fields=sub.pending.changed_fields | snapshot.changed_fields
+                )
 
-        # If this is the start of a new burst, record the time
-        if self._pending_snapshot is None:
-            self._first_suppressed_at = now
-
-        self._pending_snapshot = snapshot
-
-        # Cancel any existing debounce task
-        if self._debounce_task is not None and not self._debounce_task.done():
-            self._debounce_task.cancel()
-
-        # Calculate effective sleep duration
-        elapsed = now - self._first_suppressed_at
-        remaining_max = self._max_debounce_wait - elapsed
-        if remaining_max <= 0:
-            # max_debounce_wait exceeded — emit immediately
-            to_emit = self._pending_snapshot
-            self._pending_snapshot = None
-            self._debounce_task = None
-            await self._bus.emit(to_emit)
+            if policy.mode is DeliveryMode.DEBOUNCE:
+                due = min(now + policy.interval, sub.first_pending_at + policy.max_wait)
+            elif sub.pending is None and now - sub.last_delivered_at >= policy.interval:
+                due = now  # MAX_RATE leading edge
+            else:
+                due = sub.last_delivered_at + policy.interval
+
+            if due <= now:
+                sub.pending = None
+                sub.due = None
+                await self._deliver(sub, merged, now)
+            else:
+                sub.pending = merged
+                self._schedule(sub, due)
+
+    def _schedule(self, sub: _Subscriber, due: float) -> None:
+        """Set *sub*'s deadline and re-arm the shared timer if it is now the earliest."""
+        if sub.due == due:
             return
+        sub.due = due
+        heapq.heappush(self._deadlines, (due, id(sub), sub))
+        if due < self._timer_at:
+            if self._timer is not None:
+                self._timer.cancel()
+            self._schedule_timer(due)
+
+    def _on_timer(self) -> None:
+        """Timer callback: collect every due subscriber and flush them in one task."""
+        self._timer = None
+        self._timer_at = math.inf
+        now = time.monotonic()
+        due: list[tuple[_Subscriber, DeviceSnapshot]] = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            deadline, _, sub = heapq.heappop(self._deadlines)
+            if sub.due != deadline or sub.pending is None:
+                continue  # superseded or cancelled
+            due.append((sub, sub.pending))
+            sub.pending = None
+            sub.due = None
+        while self._deadlines and self._deadlines[0][2].due != self._deadlines[0][0]:
+            heapq.heappop(self._deadlines)
+        if self._deadlines:
+            self._schedule_timer(self._deadlines[0][0])
+        if due:
+            previous = self._flush_task
+            self._flush_task = asyncio.get_running_loop().create_task(self._flush(due, previous))
+
+    def _schedule_timer(self, due: float) -> None:
+        """Arm the shared timer for *due* (monotonic seconds)."""
+        loop = asyncio.get_running_loop()
+        # Deadlines are on time.monotonic(); convert to the loop clock.
+        self._timer = loop.call_at(loop.time() + (due - time.monotonic()), self._on_timer)
+        self._timer_at = due
 
-        sleep_duration = min(self._debounce_interval, remaining_max)
-        self._debounce_task = asyncio.create_task(self._debounce_emit(sleep_duration))
+    async def _flush(self, due: list[tuple[_Subscriber, DeviceSnapshot]], previous: asyncio.Task[None] | None) -> None:
+        """Deliver held snapshots, after any earlier flush so per-subscriber order is kept."""
+        if previous is not None and not previous.done():
+            with contextlib.suppress(asyncio.CancelledError):
+                await previous
+        now = time.monotonic()
+        for sub, snapshot in due:
+            await self._deliver(sub, snapshot, now)
 
-    async def _debounce_emit(self, delay: float) -> None:
-        """Wait for delay seconds then emit the latest pending snapshot."""
+    @staticmethod
+    async def _deliver(sub: _Subscriber, snapshot: DeviceSnapshot, now: float) -> None:
+        sub.last_delivered_at = now
         try:
-            await asyncio.sleep(delay)
-        except asyncio.CancelledError:
-            return
-        snapshot = self._pending_snapshot
-        self._pending_snapshot = None
-        self._debounce_task = None
-        if snapshot is not None:
-            await self._bus.emit(snapshot)
+            await sub.handler(snapshot)
+        except Exception:
+            _logger.exception("state_changed handler raised an unhandled exception")
 
     async def stop(self) -> None:
-        """Cancel any pending debounce task without emitting."""
-        if self._debounce_task is not None and not self._debounce_task.done():
-            self._debounce_task.cancel()
+        """Drop every held snapshot and the shared timer without delivering."""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = None
+        self._timer_at = math.inf
+        self._deadlines.clear()
+        for sub in self._subscribers.values():
+            sub.pending = None
+            sub.due = None
+        task, self._flush_task = self._flush_task, None
+        if task is not None and not task.done():
+            task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
-                await self._debounce_task
-        self._debounce_task = None
-        self._pending_snapshot = None
+                await task
 
 
 class DeviceHandle:
@@ -232,7 +384,7 @@ class DeviceHandle:
         # get a PoolStateReducer (currently a stub); everything else gets the
         # full mower reducer. Decided once at construction so the per-message
         # hot path doesn't pay an isinstance check.  The saga-active callable
-        # lets the reducer skip eager geojson regen during map fetches.
+        # lets the reducer leave saga-owned map state alone during map fetches.
         self._reducer: StateReducer = get_state_reducer(device_name, is_saga_active=lambda: self.queue.is_saga_active)
         self._error_bus: EventBus[Exception] = EventBus()
         self._map_updated_bus: EventBus[None] = EventBus()
@@ -251,6 +403,17 @@ class DeviceHandle:
         #: Set by ``record_user_command`` to interrupt a long sleep and re-arm
         #: the activity loop immediately with the short window.
         self._rearm_event: asyncio.Event = asyncio.Event()
+        #: Client-owned scheduler that drives this handle's MQTT poll cadence in
+        #: place of a per-handle ``mqtt_activity_loop`` task.  Set before ``start()``.
+        self.poll_scheduler: PollScheduler | None = None
+        #: Token buckets of the owning account, shared with every other device on it.
+        #: Cloud commands spend an invoke token before dispatch; BLE sends are free.
+        self.rate_limiter: AccountRateLimiter | None = None
+        #: Client-owned pool the map's GeoJSON views are rebuilt on; a worker
+        #: thread when None.
+        self.map_executor: MapExecutor | None = None
+        #: Single-flight task of :meth:`refresh_geojson`.
+        self._geojson_task: asyncio.Task[None] | None = None
         #: True when the device name identifies an RTK base station.
         self._is_rtk: bool = DeviceType.is_rtk(device_name)
         #: True for Spino pool cleaners (PoolCleanerDevice).
@@ -315,10 +478,11 @@ class DeviceHandle:
             pass  # poll items use skip_if_saga_active=True; no explicit stop needed
 
         async def _on_saga_end() -> None:
-            self._rearm_event.set()  # wake poll loop to re-evaluate after saga
+            self._wake_poll()  # re-evaluate the poll after the saga
 
         self.queue.on_saga_start = _on_saga_start
         self.queue.on_saga_end = _on_saga_end
+        self.queue.admit = self._admit_command
 
         if mqtt_transport is not None:
             self._wire_transport(mqtt_transport)
@@ -364,7 +528,7 @@ class DeviceHandle:
                 else:
                     # Wake the MQTT loop immediately so it resumes heartbeating
                     # rather than sleeping out the rest of its 180 s idle period.
-                    self._rearm_event.set()
+                    self._wake_poll()
                     if state == TransportAvailability.DISCONNECTED:
                         # Cancel the BLE heartbeat loop so it stops retrying
                         # against a dead connection instead of exhausting all
@@ -583,7 +747,13 @@ class DeviceHandle:
           4. Apply LubaMsg to state via StateReducer
           5. Update DeviceStateMachine and emit the new snapshot
         """
-        # 1. Parse bytes → LubaMsg
+        # 1. Peek at the tags, then parse bytes → LubaMsg.  The peek costs a few
+        # microseconds and rejects frames that are not LubaMsg at all before the
+        # full decode, and names the leaf for logging without a to_dict().
+        peek = peek_luba_msg(payload)
+        if peek is None:
+            _logger.debug("← %s  ignored non-LubaMsg BLE notification (%d bytes)", self.device_name, len(payload))
+            return
         try:
             luba_msg = LubaMsg().parse(payload)
         except UnicodeDecodeError:
@@ -596,6 +766,7 @@ class DeviceHandle:
         # (packed repeated bytes misidentified as field 2/3) the payload is not
         # a LubaMsg — protobuf silently accepts alien wire formats, so we must
         # guard here rather than letting garbage propagate to the state machine.
+        # The peek already rejects the wire-type mismatch; this catches the rest.
         # NOTE: msgtype is intentionally NOT checked here — MsgCmdType.START == 0
         # is the protobuf default, so legitimate cloud messages that omit msgtype
         # would be incorrectly dropped.
@@ -603,16 +774,22 @@ class DeviceHandle:
             _logger.debug("← %s  ignored non-LubaMsg BLE notification (%d bytes)", self.device_name, len(payload))
             return
 
-        try:
-            _logger.debug("← %s  %s", self.device_name, luba_msg.to_dict(include_default_values=False))
-        except (ValueError, KeyError):
-            _logger.debug("← %s  <unparseable protobuf — unknown enum value>", self.device_name)
+        # to_dict() of a map frame costs milliseconds — only pay it when the
+        # line will be emitted, and never for bulky frames (the peek names them).
+        if _logger.isEnabledFor(logging.DEBUG):
+            if peek.is_bulky:
+                _logger.debug("← %s  %s", self.device_name, peek)
+            else:
+                try:
+                    _logger.debug("← %s  %s", self.device_name, luba_msg.to_dict(include_default_values=False))
+                except (ValueError, KeyError):
+                    _logger.debug("← %s  <unparseable protobuf — unknown enum value>", self.device_name)
         self._last_report_at = time.monotonic()
 
         # Stamp report-stream liveness separately from general inbound traffic: this is
         # what proves an RPT_START actually started the stream (see _wait_for_report_data)
         # and what the one-shot poll debounces against.
-        if (sys_msg := luba_msg.sys) is not None and sys_msg.toapp_report_data is not None:
+        if peek.leaf == "toapp_report_data" and peek.sub_msg == "sys":
             self._last_report_data_at = self._last_report_at
             self._report_data_event.set()
 
@@ -656,11 +833,20 @@ class DeviceHandle:
             return
 
         # 5. Update state machine and emit if anything in the model changed.
-        # _diff now walks `raw`, so deep-field mutations (e.g.
-        # report_data.dev.sys_status) correctly produce a non-empty `changed`.
-        snapshot, changed = self.state_machine.apply(updated_device, self._availability)
+        # _diff walks only the paths the reducer wrote, so deep-field mutations
+        # (e.g. report_data.dev.sys_status) produce a non-empty `changed`
+        # without comparing the untouched map / report sub-trees.
+        written = self._reducer.last_writes
+        snapshot, changed = self.state_machine.apply(updated_device, self._availability, written)
         if changed and not self._stopping:
             await self._state_changed_bus.emit(snapshot)
+        # A running saga rebuilds the views it fed when it completes.
+        if (
+            not self.queue.is_saga_active
+            and written is not None
+            and any(path.partition(".")[0] in _GEOJSON_INPUTS for path in written)
+        ):
+            self.refresh_geojson()
 
         # 6. Emit map_updated when the area set HA renders changes:
         #   - toapp_all_hash_name: wholesale area-name list (post-2025 / non-Luba1).
@@ -953,9 +1139,17 @@ class DeviceHandle:
     def subscribe_state_changed(
         self,
         handler: Callable[[DeviceSnapshot], Awaitable[None]],
+        policy: DeliveryPolicy | None = None,
     ) -> Subscription:
-        """Subscribe to state changes. Returns RAII Subscription handle."""
-        return self._state_changed_bus.subscribe(handler)
+        """Subscribe to state changes. Returns RAII Subscription handle.
+
+        *policy* chooses how this subscriber is fed (immediate, debounced,
+        rate-limited, field-filtered); without one it gets the handle's
+        ``debounce_interval`` default.  For example a dashboard can take
+        ``DeliveryPolicy.max_rate(1.0)`` while an automation takes
+        ``DeliveryPolicy.on_fields("mowing_state")``.
+        """
+        return self._state_changed_bus.subscribe(handler, policy)
 
     _UNSET: object = object()
 
@@ -963,15 +1157,28 @@ class DeviceHandle:
         self,
         getter: Callable[[DeviceSnapshot], _T],
         handler: Callable[[_T], Awaitable[None]],
+        fields: Iterable[str] | None = None,
     ) -> Subscription:
         """Fire handler only when the value returned by getter changes.
 
         The handler is not called on the first snapshot — only on subsequent
         snapshots where the extracted value differs from the previous one.
+
+        When *fields* is given (dotted paths such as ``report_data.work``),
+        snapshots whose ``changed_fields`` touch none of them are skipped
+        without calling *getter*.  The paths must cover everything *getter*
+        reads, or changes will be missed.
         """
         last: list[object] = [self._UNSET]
+        watched = frozenset(fields) if fields is not None else None
 
         async def _on_state(snapshot: DeviceSnapshot) -> None:
+            if (
+                watched is not None
+                and last[0] is not self._UNSET
+                and not fields_touched(snapshot.changed_fields, watched)
+            ):
+                return
             new_val = getter(snapshot)
             if last[0] is self._UNSET:
                 last[0] = new_val
@@ -1056,15 +1263,20 @@ class DeviceHandle:
     async def start(self) -> None:
         """Start the command queue processor and the MQTT activity loop.
 
-        RTK base stations and Spino pool cleaners skip the activity task entirely.
+        With a ``poll_scheduler`` set the handle joins it instead of running its
+        own activity task.  RTK base stations and Spino pool cleaners skip the
+        MQTT poll entirely.
         The BLE keepalive and polling loops are started exclusively by
         ``_on_ble_connected`` when the BLE availability listener observes a
         CONNECTED transition.
         """
         self._stopping = False
         self.queue.start()
-        if not self._skips_activity_loops and (self._keep_alive_task is None or self._keep_alive_task.done()):
-            self._keep_alive_task = asyncio.get_running_loop().create_task(mqtt_activity_loop(self))
+        if not self._skips_activity_loops:
+            if self.poll_scheduler is not None:
+                self.poll_scheduler.add(self)
+            elif self._keep_alive_task is None or self._keep_alive_task.done():
+                self._keep_alive_task = asyncio.get_running_loop().create_task(mqtt_activity_loop(self))
         # _dynamics_line_task is BLE-gated and starts/stops from _on_ble_connected
         # / the BLE availability handler — not from start().  Dynamics-line polling
         # only makes sense over BLE (10 s cadence would be MQTT-quota-expensive).
@@ -1107,6 +1319,11 @@ class DeviceHandle:
         """Restart the MQTT activity loop if it has exited or was never started."""
         if self._skips_activity_loops or self._stopping:
             return
+        if self.poll_scheduler is not None:
+            if self not in self.poll_scheduler:
+                _logger.debug("restart_keep_alive [%s]: rescheduling MQTT poll", self.device_name)
+                self.poll_scheduler.add(self)
+            return
         if self._keep_alive_task is None or self._keep_alive_task.done():
             _logger.debug("restart_keep_alive [%s]: restarting MQTT activity loop", self.device_name)
             self._keep_alive_task = asyncio.get_running_loop().create_task(mqtt_activity_loop(self))
@@ -1118,6 +1335,8 @@ class DeviceHandle:
         saga results, and user-initiated sends all continue to work.  No outbound
         polls are sent until ``start()`` is called again.
         """
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.remove(self)
         if self._keep_alive_task is not None and not self._keep_alive_task.done():
             self._keep_alive_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
@@ -1127,6 +1346,8 @@ class DeviceHandle:
     async def stop(self) -> None:
         """Stop the command queue, broker, debounce task, and disconnect all transports."""
         self._stopping = True
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.remove(self)
         if self._report_stream_timer is not None:
             self._report_stream_timer.cancel()
             self._report_stream_timer = None
@@ -1136,6 +1357,7 @@ class DeviceHandle:
             self._ble_polling_task,
             self._dynamics_line_task,
             self._ble_connect_task,
+            self._geojson_task,
         ):
             if task is not None and not task.done():
                 task.cancel()
@@ -1146,6 +1368,7 @@ class DeviceHandle:
         self._ble_polling_task = None
         self._dynamics_line_task = None
         self._ble_connect_task = None
+        self._geojson_task = None
         self._ble_stream_active = False
         await self.queue.stop()
         await self.broker.close()
@@ -1154,6 +1377,35 @@ class DeviceHandle:
             await transport.disconnect()
         self._transports.clear()
 
+    def refresh_geojson(self) -> None:
+        """Rebuild the map's stale GeoJSON views on :attr:`map_executor`, in the background.
+
+        Reading a view never builds it, so this is what brings them up to date
+        after new frames, a new RTK origin, mow progress or a dynamics line.
+        Calls made while a refresh runs are folded into it.
+        """
+        if self._stopping or (self._geojson_task is not None and not self._geojson_task.done()):
+            return
+        if not isinstance(self.snapshot.raw, MowerDevice) or not self.snapshot.raw.map.stale_geojson_views():
+            return
+        self._geojson_task = asyncio.get_running_loop().create_task(self._refresh_geojson())
+
+    async def _refresh_geojson(self) -> None:
+        try:
+            while not self._stopping:
+                built = cast("MowingDevice", self.snapshot.raw).map
+                stale = built.stale_geojson_views()
+                if not stale:
+                    return
+                for name in stale:
+                    await built.async_geojson(name, self.map_executor)
+                current = cast("MowingDevice", self.snapshot.raw).map
+                if current is not built:
+                    # The reducer swapped in a new map copy while the builds ran.
+                    current.adopt_geojson(built)
+        except Exception:
+            _logger.exception("refresh_geojson [%s]: GeoJSON build failed", self.device_name)
+
     def record_user_command(self) -> None:
         """Wake the poll loop for early re-evaluation.
 
@@ -1161,7 +1413,13 @@ class DeviceHandle:
         ``_rearm_event`` interrupts any in-progress sleep and the loop
         can re-evaluate immediately.
         """
+        self._wake_poll()
+
+    def _wake_poll(self) -> None:
+        """Interrupt the poll wait: set ``_rearm_event`` and pull in the scheduler deadline."""
         self._rearm_event.set()
+        if self.poll_scheduler is not None:
+            self.poll_scheduler.wake(self)
 
     def device_mode(self) -> _DeviceMode:
         """Return the coarse device-mode bucket used for cadence selection.
@@ -1460,11 +1718,19 @@ class DeviceHandle:
 
         await self.queue.enqueue(_send, priority=Priority.BACKGROUND, skip_if_saga_active=True)
 
-    async def _send_one_shot_report(self) -> None:
+    async def _send_one_shot_report(
+        self,
+        *,
+        on_sent: Callable[[], None] | None = None,
+        on_shed: Callable[[], None] | None = None,
+    ) -> None:
         """Enqueue a one-shot ``request_iot_sys(count=1)`` data refresh.
 
         Routes via the best available transport — BLE if connected and preferred,
         MQTT otherwise — matching the same transport-priority rules as user commands.
+
+        *on_sent* is called once the request has been handed to a transport;
+        *on_shed* if the account rate limit dropped it instead.
         """
         cmd_bytes = self.commands.request_iot_sys(
             rpt_act=RptAct.RPT_START,
@@ -1472,15 +1738,24 @@ class DeviceHandle:
             timeout=10_000,
             count=1,
         )
+        sent = False
+
+        async def _send_raw(payload: bytes) -> None:
+            nonlocal sent
+            await self.send_raw(payload)
+            if not sent and on_sent is not None:
+                sent = True
+                on_sent()
 
         async def _send() -> None:
-            await self._send_rpt_start_verified(cmd_bytes, self.send_raw)
+            await self._send_rpt_start_verified(cmd_bytes, _send_raw)
 
         await self.queue.enqueue(
             _send,
             priority=Priority.BACKGROUND,
             skip_if_saga_active=True,
             dedup_key="one_shot_report",
+            on_shed=on_shed,
         )
 
     async def request_reports(self, count: int = 1, timeout: int = 10_000) -> None:
@@ -1700,6 +1975,23 @@ class DeviceHandle:
                     exc_info=True,
                 )
 
+    async def _admit_command(self, priority: Priority) -> bool:
+        """Queue admission hook: spend an account invoke token unless the command goes over BLE.
+
+        An ``EMERGENCY`` command (stop, return to dock) never touches the bucket.  The
+        queue admits ``EXCLUSIVE`` items without this hook: a map sync's hundreds of
+        frames would drain an invoke budget in seconds, so :meth:`send_raw` charges
+        each of their cloud frames to the account's saga bucket instead.
+        """
+        if self.rate_limiter is None or priority == Priority.EMERGENCY:
+            return True
+        try:
+            if self.active_transport().transport_type is TransportType.BLE:
+                return True
+        except NoTransportAvailableError:
+            return True  # the send itself will fail; don't spend a token on it
+        return await self.rate_limiter.acquire(RateLimitBucket.INVOKE, priority)
+
     async def send_raw(self, payload: bytes, *, prefer_ble: bool | None = None) -> None:
         """Send raw bytes via the best available transport, with BLE fallback on offline."""
         _logger.debug(
@@ -1739,6 +2031,13 @@ class DeviceHandle:
             else:
                 raise
         _logger.debug("send_raw '%s': sending via %s", self.device_name, transport.transport_type.value)
+        if (
+            self.rate_limiter is not None
+            and self.queue.is_saga_active
+            and transport.transport_type is not TransportType.BLE
+        ):
+            # Only the saga holding the queue sends while it is active: pace its cloud frames.
+            await self.rate_limiter.acquire(RateLimitBucket.SAGA, Priority.EXCLUSIVE)
         try:
             await self._send_marked(transport, payload)
         except TransportRateLimitedError:
@@ -59,6 +59,88 @@ def poll_interval(handle: DeviceHandle) -> float:
     return _MQTT_POLL_INTERVAL[handle.device_mode()]
 
 
+def next_poll_delay(handle: DeviceHandle, last_poll_sent_at: float) -> float:
+    """Return how long to wait before *handle*'s next one-shot poll, or ``0.0`` to send it now.
+
+    One evaluation of the cadence rules :func:`mqtt_activity_loop` applies
+    each time it wakes; shared with
+    :class:`~pymammotion.device.poll_scheduler.PollScheduler`, which drives
+    the same rules for many devices from one task.  *last_poll_sent_at* is
+    the monotonic time of the caller's last poll for this device (0 if none).
+    """
+    interval = poll_interval(handle)
+
+    # While the BLE polling loop owns a continuous stream, there is nothing
+    # useful to do — fresh state is arriving over BLE.
+    if handle.ble_stream_active:
+        return _BLE_MODE_RECHECK_INTERVAL
+
+    # No usable transport (cloud reported device offline + no BLE,
+    # BLE in cooldown + no MQTT, or nothing registered).  Skip the
+    # poll attempt — ``_rearm_event`` fires on BLE state changes and
+    # ``mqtt_reported_offline`` clears on the next inbound MQTT frame,
+    # so both natural recovery signals already wake us.
+    if not handle.has_usable_transport:
+        _logger.debug(
+            "poll_loop [%s]: no usable transport (mqtt_offline=%s) — backing off %.0fs",
+            handle.device_name,
+            handle._availability.mqtt_reported_offline,  # noqa: SLF001
+            interval,
+        )
+        return interval
+
+    # Timer: the later of "last data received" and "last poll sent".
+    # Including last_poll_sent_at prevents spam when the device doesn't respond.
+    last_recv = max(
+        (t.last_received_monotonic for t in handle._transports.values()),  # noqa: SLF001
+        default=0.0,
+    )
+    last_activity = max(last_recv, last_poll_sent_at)
+    wait = interval - (time.monotonic() - last_activity)
+    if wait > 0:
+        return wait
+
+    if not handle._transports:  # noqa: SLF001
+        return interval
+
+    # Back off if MQTT sends are blocked and no BLE transport is connected.
+    # is_send_blocked applies the firmware exemption, so quota-free devices
+    # never park the poll loop on the self-imposed send window.
+    mqtt: Transport | None = None
+    for tt in (TransportType.CLOUD_ALIYUN, TransportType.CLOUD_MAMMOTION):
+        t = handle._transports.get(tt)  # noqa: SLF001
+        if t is not None:
+            mqtt = t
+            break
+    if mqtt is not None and mqtt.is_send_blocked(handle.firmware_version):
+        ble = handle._transports.get(TransportType.BLE)  # noqa: SLF001
+        if ble is None or not ble.is_connected:
+            # Back off only until sends are actually available again (the rolling
+            # window sliding under the limit, or the cloud ban expiring) so the loop
+            # resumes promptly instead of sleeping a flat _RATE_LIMITED_BACKOFF.
+            # Floored at 60 s to avoid a tight retry loop at the boundary and capped
+            # so a never-set release time can't park the loop forever.
+            backoff = min(_RATE_LIMITED_BACKOFF, max(60.0, mqtt.seconds_until_send_available()))
+            _logger.debug(
+                "poll_loop [%s]: MQTT rate-limited, no BLE — backing off %.0fs",
+                handle.device_name,
+                backoff,
+            )
+            return backoff
+
+    if handle.queue.is_saga_active or handle.in_no_request_mode():
+        _logger.debug("poll_loop [%s]: saga active or no-request mode — deferring", handle.device_name)
+        return interval
+
+    _logger.debug(
+        "poll_loop [%s]: %.0fs since last activity — one-shot poll due (interval=%.0fs)",
+        handle.device_name,
+        time.monotonic() - last_activity,
+        interval,
+    )
+    return 0.0
+
+
 async def mqtt_activity_loop(handle: DeviceHandle) -> None:
     """Periodic one-shot report-poll loop (MQTT-side cadence driver).
 
@@ -80,93 +162,18 @@ async def mqtt_activity_loop(handle: DeviceHandle) -> None:
 
     The loop is interruptible: ``record_user_command`` sets ``_rearm_event``
     to wake an in-progress sleep early for immediate re-evaluation.
+
+    Handles owned by a :class:`~pymammotion.client.MammotionClient` don't run
+    this loop; its :class:`~pymammotion.device.poll_scheduler.PollScheduler`
+    applies the same :func:`next_poll_delay` rules to every device instead.
     """
     last_poll_sent_at: float = 0.0
 
     while not handle._stopping:  # noqa: SLF001
-        interval = poll_interval(handle)
-
-        # While the BLE polling loop owns a continuous stream, this loop
-        # has nothing useful to do — fresh state is arriving over BLE.
-        if handle.ble_stream_active:
-            await handle.sleep_or_rearm(_BLE_MODE_RECHECK_INTERVAL)
+        delay = next_poll_delay(handle, last_poll_sent_at)
+        if delay > 0:
+            # Woken early (user command) or not: re-evaluate from the top.
+            await handle.sleep_or_rearm(delay)
             continue
-
-        # No usable transport (cloud reported device offline + no BLE,
-        # BLE in cooldown + no MQTT, or nothing registered).  Skip the
-        # poll attempt — ``_rearm_event`` fires on BLE state changes and
-        # ``mqtt_reported_offline`` clears on the next inbound MQTT frame,
-        # so both natural recovery signals already wake us.
-        if not handle.has_usable_transport:
-            _logger.debug(
-                "poll_loop [%s]: no usable transport (mqtt_offline=%s) — backing off %.0fs",
-                handle.device_name,
-                handle._availability.mqtt_reported_offline,  # noqa: SLF001
-                interval,
-            )
-            await handle.sleep_or_rearm(interval)
-            continue
-
-        # Timer: the later of "last data received" and "last poll sent".
-        # Including last_poll_sent_at prevents spam when the device doesn't respond.
-        last_recv = max(
-            (t.last_received_monotonic for t in handle._transports.values()),  # noqa: SLF001
-            default=0.0,
-        )
-        last_activity = max(last_recv, last_poll_sent_at)
-        wait = interval - (time.monotonic() - last_activity)
-
-        if wait > 0:
-            if await handle.sleep_or_rearm(wait):
-                continue  # rearmed by user command — re-evaluate immediately
-            last_recv = max(
-                (t.last_received_monotonic for t in handle._transports.values()),  # noqa: SLF001
-                default=0.0,
-            )
-            last_activity = max(last_recv, last_poll_sent_at)
-            if time.monotonic() - last_activity < interval:
-                continue
-
-        if not handle._transports:  # noqa: SLF001
-            await handle.sleep_or_rearm(interval)
-            continue
-
-        # Back off if MQTT sends are blocked and no BLE transport is connected.
-        # is_send_blocked applies the firmware exemption, so quota-free devices
-        # never park the poll loop on the self-imposed send window.
-        mqtt: Transport | None = None
-        for tt in (TransportType.CLOUD_ALIYUN, TransportType.CLOUD_MAMMOTION):
-            t = handle._transports.get(tt)  # noqa: SLF001
-            if t is not None:
-                mqtt = t
-                break
-        if mqtt is not None and mqtt.is_send_blocked(handle.firmware_version):
-            ble = handle._transports.get(TransportType.BLE)  # noqa: SLF001
-            if ble is None or not ble.is_connected:
-                # Back off only until sends are actually available again (the rolling
-                # window sliding under the limit, or the cloud ban expiring) so the loop
-                # resumes promptly instead of sleeping a flat _RATE_LIMITED_BACKOFF.
-                # Floored at 60 s to avoid a tight retry loop at the boundary and capped
-                # so a never-set release time can't park the loop forever.
-                backoff = min(_RATE_LIMITED_BACKOFF, max(60.0, mqtt.seconds_until_send_available()))
-                _logger.debug(
-                    "poll_loop [%s]: MQTT rate-limited, no BLE — backing off %.0fs",
-                    handle.device_name,
-                    backoff,
-                )
-                await handle.sleep_or_rearm(backoff)
-                continue
-
-        if handle.queue.is_saga_active or handle.in_no_request_mode():
-            _logger.debug("poll_loop [%s]: saga active or no-request mode — deferring", handle.device_name)
-            await handle.sleep_or_rearm(interval)
-            continue
-
-        _logger.debug(
-            "poll_loop [%s]: %.0fs since last activity — sending one-shot poll (interval=%.0fs)",
-            handle.device_name,
-            time.monotonic() - last_activity,
-            interval,
-        )
         last_poll_sent_at = time.monotonic()
         await handle._send_one_shot_report()  # noqa: SLF001
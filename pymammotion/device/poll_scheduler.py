@@ -0,0 +1,293 @@
+"""One task that drives the MQTT one-shot poll cadence for every device of a client.
+
+Run standalone, each ``DeviceHandle`` keeps its own :func:`mqtt_activity_loop`
+task asleep until its next poll.  With hundreds of devices in one process that
+is hundreds of timers firing independently — after a restart or a cloud
+reconnect they all come due together and the burst trips the Aliyun 429
+breaker for the whole account.
+
+:class:`PollScheduler` keeps every device's next deadline in one heap and
+evaluates due devices with the same :func:`next_poll_delay` rules the loop
+uses.  On top of that it:
+
+* **jitters** each re-arm forward by up to ``jitter`` × the wait, so devices
+  that came due together drift apart instead of staying in lockstep;
+* **rate-shapes** polls per account (``DeviceHandle.user_account``): polls
+  for one account are spaced at least ``60 / account_polls_per_minute``
+  seconds apart, and a device that comes due inside that gap is pushed to
+  the account's next free slot.  Handles without a cloud account
+  (``user_account`` 0, i.e. BLE-only) are not budgeted;
+* keeps **metrics** (:meth:`stats`): polls sent, shed and deferred, how late
+  due devices were picked up, and when the next one is due.  A poll counts as
+  sent once it reaches a transport, not when it is queued.
+
+``DeviceHandle.start`` registers with the scheduler when the client has set
+``handle.poll_scheduler``; ``record_user_command`` and the other rearm
+signals pull the device's deadline in to "now".
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+import heapq
+import logging
+import random
+import time
+from typing import TYPE_CHECKING
+
+from pymammotion.device.mqtt_loop import next_poll_delay
+
+if TYPE_CHECKING:
+    from pymammotion.device.handle import DeviceHandle
+
+_logger = logging.getLogger(__name__)
+
+#: Default per-account poll budget of :class:`PollScheduler`.
+DEFAULT_ACCOUNT_POLLS_PER_MINUTE: float = 30.0
+#: Default fraction of each wait added as random forward jitter.
+DEFAULT_POLL_JITTER: float = 0.1
+
+
+@dataclass(frozen=True)
+class PollSchedulerStats:
+    """Point-in-time counters of a :class:`PollScheduler`.
+
+    Attributes:
+        devices: Devices currently scheduled.
+        evaluations: Due devices evaluated since start.
+        polls_sent: One-shot polls handed to a transport.
+        polls_shed: One-shot polls dropped by the account rate limit.
+        polls_deferred: Due polls pushed back by the account budget.
+        wakeups: Deadlines pulled in by a rearm (user command, saga end, …).
+        max_lateness: Longest delay between a deadline and its evaluation (s).
+        mean_lateness: Average of the same (s).
+        next_due_in: Seconds until the earliest deadline, or None when idle.
+        polls_by_account: Polls sent per ``user_account``.
+
+    """
+
+    devices: int
+    evaluations: int
+    polls_sent: int
+    polls_shed: int
+    polls_deferred: int
+    wakeups: int
+    max_lateness: float
+    mean_lateness: float
+    next_due_in: float | None
+    polls_by_account: dict[int, int] = field(default_factory=dict)
+
+
+@dataclass(eq=False)
+class _Entry:
+    """Scheduling state for one device."""
+
+    handle: DeviceHandle
+    last_poll_sent_at: float = 0.0
+    #: Budget slot reserved for this device's deferred poll, if any.
+    reserved_slot: float | None = None
+    #: Sequence number of the entry's live heap item; any other item for it is stale.
+    generation: int = 0
+
+
+class PollScheduler:
+    """Heap-driven poll scheduler shared by all devices of a client."""
+
+    def __init__(
+        self,
+        *,
+        account_polls_per_minute: float = DEFAULT_ACCOUNT_POLLS_PER_MINUTE,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> None:
+        """Create an idle scheduler; its task starts with the first :meth:`add`.
+
+        Args:
+            account_polls_per_minute: Most one-shot polls sent per minute for
+                devices of one account.
+            jitter: Fraction of each wait (0 – 1) added as random forward jitter.
+
+        """
+        if account_polls_per_minute <= 0:
+            msg = "account_polls_per_minute must be positive"
+            raise ValueError(msg)
+        self._account_spacing = 60.0 / account_polls_per_minute
+        self._jitter = jitter
+        self._entries: dict[str, _Entry] = {}
+        #: (deadline, sequence, device_id) — sequence keeps equal deadlines FIFO and
+        #: identifies the live item (``_Entry.generation``); re-arming leaves the old one stale.
+        self._heap: list[tuple[float, int, str]] = []
+        self._sequence = 0
+        #: user_account → monotonic time before which no further poll may be sent.
+        self._account_next_slot: dict[int, float] = {}
+        self._wake = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._evaluations = 0
+        self._polls_sent = 0
+        self._polls_shed = 0
+        self._polls_deferred = 0
+        self._wakeups = 0
+        self._lateness_total = 0.0
+        self._max_lateness = 0.0
+        self._polls_by_account: dict[int, int] = {}
+
+    def add(self, handle: DeviceHandle) -> None:
+        """Schedule *handle*, due now.  Re-adding a scheduled device just re-arms it."""
+        if handle.device_id in self._entries:
+            self.wake(handle)
+            return
+        entry = _Entry(handle)
+        self._entries[handle.device_id] = entry
+        self._push(entry, time.monotonic())
+        self._ensure_running()
+
+    def remove(self, handle: DeviceHandle) -> None:
+        """Stop scheduling *handle*; its heap items are dropped lazily."""
+        self._entries.pop(handle.device_id, None)
+
+    def wake(self, handle: DeviceHandle) -> None:
+        """Re-evaluate *handle* now instead of at its current deadline."""
+        entry = self._entries.get(handle.device_id)
+        if entry is None or entry.handle is not handle:
+            return
+        self._wakeups += 1
+        self._push(entry, time.monotonic())
+
+    def __contains__(self, handle: object) -> bool:
+        """Return True when *handle* is scheduled."""
+        device_id = getattr(handle, "device_id", None)
+        return device_id in self._entries and self._entries[device_id].handle is handle
+
+    def stats(self) -> PollSchedulerStats:
+        """Return the current counters."""
+        self._drop_stale()
+        return PollSchedulerStats(
+            devices=len(self._entries),
+            evaluations=self._evaluations,
+            polls_sent=self._polls_sent,
+            polls_shed=self._polls_shed,
+            polls_deferred=self._polls_deferred,
+            wakeups=self._wakeups,
+            max_lateness=self._max_lateness,
+            mean_lateness=self._lateness_total / self._evaluations if self._evaluations else 0.0,
+            next_due_in=max(0.0, self._heap[0][0] - time.monotonic()) if self._heap else None,
+            polls_by_account=dict(self._polls_by_account),
+        )
+
+    async def stop(self) -> None:
+        """Cancel the scheduler task and forget every device."""
+        self._entries.clear()
+        self._heap.clear()
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    # ------------------------------------------------------------------
+
+    def _push(self, entry: _Entry, deadline: float) -> None:
+        self._sequence += 1
+        entry.generation = self._sequence
+        heapq.heappush(self._heap, (deadline, self._sequence, entry.handle.device_id))
+        if self._heap[0][1] == self._sequence:
+            # New earliest deadline: the sleeping task must recompute its timeout.
+            self._wake.set()
+
+    def _pop_due(self, now: float) -> tuple[_Entry, float] | None:
+        """Pop the earliest live item if it is due; return it with its deadline."""
+        while self._heap:
+            deadline, sequence, device_id = self._heap[0]
+            entry = self._entries.get(device_id)
+            if entry is None or entry.generation != sequence:
+                heapq.heappop(self._heap)
+                continue
+            if deadline > now:
+                return None
+            heapq.heappop(self._heap)
+            return entry, deadline
+        return None
+
+    def _drop_stale(self) -> None:
+        """Discard stale items at the top of the heap."""
+        while self._heap:
+            _, sequence, device_id = self._heap[0]
+            entry = self._entries.get(device_id)
+            if entry is not None and entry.generation == sequence:
+                return
+            heapq.heappop(self._heap)
+
+    def _ensure_running(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def _run(self) -> None:
+        while self._entries:
+            self._wake.clear()
+            now = time.monotonic()
+            while (due := self._pop_due(now)) is not None:
+                entry, deadline = due
+                lateness = now - deadline
+                self._evaluations += 1
+                self._lateness_total += lateness
+                self._max_lateness = max(self._max_lateness, lateness)
+                await self._evaluate(entry, now)
+                now = time.monotonic()
+            self._drop_stale()
+            timeout = self._heap[0][0] - now if self._heap else None
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._wake.wait(), timeout)
+
+    def _take_slot(self, entry: _Entry, account: int, now: float) -> bool:
+        """Claim *account*'s budget for *entry* now, or re-arm it at its slot and return False."""
+        if entry.reserved_slot is not None:
+            if entry.reserved_slot > now:
+                # Woken before its slot: the budget still holds it there.
+                self._push(entry, entry.reserved_slot)
+                return False
+            entry.reserved_slot = None
+            return True
+        slot = self._account_next_slot.get(account, 0.0)
+        if slot > now:
+            # Reserve the account's next free slot, so a burst of due devices
+            # is queued once each rather than re-deferred on every slot.
+            self._polls_deferred += 1
+            entry.reserved_slot = slot
+            self._account_next_slot[account] = slot + self._account_spacing
+            self._push(entry, slot)
+            return False
+        self._account_next_slot[account] = now + self._account_spacing
+        return True
+
+    def _count_sent(self, account: int) -> None:
+        self._polls_sent += 1
+        self._polls_by_account[account] = self._polls_by_account.get(account, 0) + 1
+
+    def _count_shed(self) -> None:
+        self._polls_shed += 1
+
+    async def _evaluate(self, entry: _Entry, now: float) -> None:
+        """Apply the poll rules to one due device and re-arm it."""
+        handle = entry.handle
+        if handle.is_stopping:
+            self.remove(handle)
+            return
+        delay = next_poll_delay(handle, entry.last_poll_sent_at)
+        if delay > 0:
+            self._push(entry, now + delay + random.uniform(0.0, self._jitter * delay))  # noqa: S311
+            return
+        account = handle.user_account
+        # Handles without a cloud account (BLE-only) have no 429 to avoid.
+        if account and not self._take_slot(entry, account, now):
+            return
+        entry.last_poll_sent_at = now
+        # Re-evaluated straight away: next_poll_delay now measures from this poll.
+        self._push(entry, now)
+        try:
+            await handle._send_one_shot_report(  # noqa: SLF001
+                on_sent=lambda: self._count_sent(account),
+                on_shed=self._count_shed,
+            )
+        except Exception:
+            _logger.exception("poll_scheduler [%s]: one-shot poll failed", handle.device_name)
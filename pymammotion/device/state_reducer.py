@@ -26,7 +26,6 @@ import betterproto2
 from pymammotion.data.model.device_info import DeviceFirmwares, SideLight
 from pymammotion.data.model.hash_list import (
     AreaHashNameList,
-    CommDataCouple,
     MowPath,
     NavGetCommData,
     NavGetHashListData,
@@ -44,6 +43,7 @@ from pymammotion.data.model.pool_state import (
     SpinoWorkMode,
     WallMaterial,
 )
+from pymammotion.data.model.proto_convert import from_proto
 from pymammotion.data.model.report_info import BaseScore
 from pymammotion.data.model.work import CurrentTaskSettings
 from pymammotion.data.mqtt.properties import OTAProgressItems
@@ -115,12 +115,36 @@ class StateReducer(ABC):
     def __init__(self, is_saga_active: Callable[[], bool] | None = None) -> None:
         """Initialise the reducer with an optional saga-active predicate.
 
-        When the callable returns True, expensive opportunistic work (e.g.
-        :meth:`HashList.generate_geojson`) is skipped — the saga's
-        ``on_complete`` hook regenerates it once at the end instead of paying
-        the cost on every frame.
+        When the callable returns True, work that would fight the saga (e.g.
+        invalidating ``root_hash_lists`` on a mid-fetch hash-name push) is
+        skipped — the saga owns that state until it completes.
         """
         self._is_saga_active: Callable[[], bool] = is_saga_active or (lambda: False)
+        self._last_writes: frozenset[str] | None = None
+
+    @property
+    def last_writes(self) -> frozenset[str] | None:
+        """Dotted device paths written by the most recent :meth:`apply`.
+
+        Passed to :meth:`DeviceStateMachine.apply` so only those sub-trees are
+        diffed.  None means the reducer does not track writes and every
+        top-level field must be considered.
+        """
+        return self._last_writes
+
+    def _record_writes(self, current: Device, device: Device, *paths: str) -> None:
+        """Record what the last :meth:`apply` wrote for :attr:`last_writes`.
+
+        *paths* are finer dotted paths a handler knows it wrote in place (e.g.
+        ``location.device``); every other top-level field that is no longer
+        shared with *current* is recorded whole, so nothing written is missed.
+        """
+        covered = {path.partition(".")[0] for path in paths}
+        self._last_writes = frozenset(paths).union(
+            f.name
+            for f in dataclasses.fields(device)
+            if f.name not in covered and getattr(device, f.name) is not getattr(current, f.name)
+        )
 
     @abstractmethod
     def apply(self, current: Device, message: LubaMsg) -> Device:
@@ -156,19 +180,25 @@ class MowerStateReducer(StateReducer):
     def apply(self, current: MowingDevice, message: LubaMsg) -> MowingDevice:  # type: ignore  # noqa: C901
         """Apply a decoded LubaMsg to the current state, return updated state.
 
-        Uses selective deep-copying: only the sub-trees that a given message type
-        can modify are deep-copied. All other sub-objects are shared with ``current``
-        via a shallow dataclasses.replace() copy, avoiding the cost of deep-copying
-        the large map data (HashList with area/path/obstacle dicts) on every message.
+        Uses selective copying: only the sub-trees that a given message type
+        can modify are copied. All other sub-objects are shared with ``current``
+        via a shallow dataclasses.replace() copy.  The map (``HashList``) is never
+        deep-copied: its mutators are copy-on-write, so a shallow ``copy.copy``
+        shares every area/path/obstacle FrameList with ``current`` and a map frame
+        only pays for the dict and FrameList on the path to the frame it inserts.
 
         The hot path during mowing is ``system_tard_state_tunnel`` (rapid state,
         ~4x/sec). That message only touches ``mowing_state`` and ``location``, so
         the expensive ``map`` object is never deep-copied for those messages.
 
+        The paths written are recorded on :attr:`last_writes`.
+
         Returns the updated copy regardless of whether anything changed.
         """
         res = betterproto2.which_one_of(message, "LubaSubMsg")
         sub_msg_type = res[0]
+        # Finer-than-top-level paths written in place; see _record_writes.
+        written: tuple[str, ...] = ()
 
         # Shallow copy — all sub-objects are initially shared with current
         device: MowingDevice = dataclasses.replace(current)
@@ -194,7 +224,8 @@ class MowerStateReducer(StateReducer):
                         | "toapp_all_hash_name"
                         | "toapp_edge_points"
                     ):
-                        device.map = copy.deepcopy(current.map)
+                        # HashList mutators path-copy what they touch — see its docstring.
+                        device.map = copy.copy(current.map)
                     case "todev_taskctrl_ack":
                         device.report_data = copy.deepcopy(current.report_data)
                     case "bidire_reqconver_path":
@@ -207,7 +238,7 @@ class MowerStateReducer(StateReducer):
                         device.work_session_result = copy.deepcopy(current.work_session_result)
                     case _:
                         # Unknown nav sub-message — defensively copy everything.
-                        device.map = copy.deepcopy(current.map)
+                        device.map = copy.copy(current.map)
                         device.work = copy.deepcopy(current.work)
                         device.mower_state = copy.deepcopy(current.mower_state)
                         device.non_work_hours = copy.deepcopy(current.non_work_hours)
@@ -224,6 +255,12 @@ class MowerStateReducer(StateReducer):
                         # run_state_update rebinds device.mowing_state wholesale;
                         # only location is mutated in-place.
                         device.location = copy.deepcopy(current.location)
+                        written = (
+                            "location.position_type",
+                            "location.orientation",
+                            "location.device",
+                            "location.work_zone",
+                        )
                     case "system_update_buf":
                         # buffer() mutates location, errors, and events in-place.
                         device.location = copy.deepcopy(current.location)
@@ -233,11 +270,15 @@ class MowerStateReducer(StateReducer):
                         # update_report_data always mutates report_data and location;
                         # map/work/device_firmwares are mutated conditionally — copy
                         # defensively since the condition isn't known in advance.
-                        device.report_data = copy.deepcopy(current.report_data)
+                        # ReportData.update rebinds every sub-object it writes and
+                        # the map / work / firmware writes are attribute rebinds, so
+                        # shallow copies suffice; location's RTK point is written
+                        # in place, and it is three points, so it stays a deepcopy.
+                        device.report_data = copy.copy(current.report_data)
                         device.location = copy.deepcopy(current.location)
-                        device.map = copy.deepcopy(current.map)
-                        device.work = copy.deepcopy(current.work)
-                        device.device_firmwares = copy.deepcopy(current.device_firmwares)
+                        device.map = copy.copy(current.map)
+                        device.work = copy.copy(current.work)
+                        device.device_firmwares = copy.copy(current.device_firmwares)
                     case "toapp_dev_fw_info":
                         # Only sys handler that touches both mower_state and device_firmwares.
                         device.mower_state = copy.deepcopy(current.mower_state)
@@ -309,6 +350,7 @@ class MowerStateReducer(StateReducer):
                 device.report_data = copy.deepcopy(current.report_data)
                 self._update_base_data(device, message)
 
+        self._record_writes(current, device, *written)
         return device
 
     # ------------------------------------------------------------------
@@ -366,37 +408,31 @@ class MowerStateReducer(StateReducer):
         match nav_msg[0]:
             case "toapp_gethash_ack":
                 hashlist_ack: NavGetHashListAck = nav_msg[1]  # type: ignore
-                device.map.update_root_hash_list(
-                    NavGetHashListData.from_dict(hashlist_ack.to_dict(casing=betterproto2.Casing.SNAKE))
-                )
+                device.map.update_root_hash_list(from_proto(NavGetHashListData, hashlist_ack))
             case "toapp_get_commondata_ack":
                 common_data: NavGetCommDataAck = nav_msg[1]  # type: ignore
-                device.map.update(NavGetCommData.from_dict(common_data.to_dict(casing=betterproto2.Casing.SNAKE)))
-                # Skip eager geojson regen during sagas — the saga's on_complete
-                # handler regenerates once after all frames arrive instead of
-                # paying the O(N) cost on every frame.
-                if not self._is_saga_active() and len(device.map.missing_hashlist(0)) == 0:
-                    device.map.generate_geojson(device.location.RTK, device.location.dock)
+                device.map.update(from_proto(NavGetCommData, common_data))
+                # The handle rebuilds the map GeoJSON off the loop once the map
+                # is complete; here only its inputs are recorded.
+                device.map.set_geojson_origin(device.location.RTK, device.location.dock)
             case "cover_path_upload":
                 mow_path: CoverPathUploadT = nav_msg[1]  # type: ignore
-                device.map.update_mow_path(MowPath.from_dict(mow_path.to_dict(casing=betterproto2.Casing.SNAKE)))
-                if not self._is_saga_active() and len(device.map.find_missing_mow_path_frames()) == 0:
-                    device.map.generate_mowing_geojson(device.location.RTK)
+                device.map.update_mow_path(from_proto(MowPath, mow_path))
+                device.map.set_geojson_origin(device.location.RTK)
             case "todev_planjob_set":
                 planjob: NavPlanJobSet = nav_msg[1]  # type: ignore
-                device.map.update_plan(Plan.from_dict(planjob.to_dict(casing=betterproto2.Casing.SNAKE)))
+                device.map.update_plan(from_proto(Plan, planjob))
             case "all_plan_task":
                 all_tasks: NavGetAllPlanTask = nav_msg[1]  # type: ignore
                 incoming_ids = {t.id for t in all_tasks.tasks}
                 # Remove plans that no longer exist on the device
-                for removed_id in set(device.map.plan.keys()) - incoming_ids:
-                    device.map.plan.pop(removed_id, None)
+                device.map.retain_plans(incoming_ids)
                 # Signal a re-fetch if any plan IDs are new
                 if incoming_ids - set(device.map.plan.keys()):
                     device.map.plans_stale = True
             case "toapp_svg_msg":
                 common_svg_data: SvgMessageAckT = nav_msg[1]  # type: ignore
-                device.map.update(SvgMessage.from_dict(common_svg_data.to_dict(casing=betterproto2.Casing.SNAKE)))
+                device.map.update(from_proto(SvgMessage, common_svg_data))
             case "toapp_all_hash_name":
                 hash_names: AppGetAllAreaHashName = nav_msg[1]  # type: ignore
                 # The area name list reflects the device's CURRENT areas.  When the
@@ -493,7 +529,7 @@ class MowerStateReducer(StateReducer):
                     edge_type=edge_msg.type,
                     total_frame=edge_msg.total_frame,
                     current_frame=edge_msg.current_frame,
-                    points=[CommDataCouple(x=p.x, y=p.y) for p in edge_msg.data_couple],
+                    points=edge_msg.data_couple,
                 )
             case "toapp_work_report_ack" | "toapp_work_report_upload":
                 work_report: WorkReportInfoAck = nav_msg[1]  # type: ignore
@@ -513,16 +549,10 @@ class MowerStateReducer(StateReducer):
         match sys_msg[0]:
             case "system_update_buf":
                 device.buffer(sys_msg[1])  # type: ignore
-                # If the RTK yaw just arrived or changed, regenerate any GeoJSON
-                # that was built without (or with a different) yaw correction.
-                # Skip during sagas — the saga's on_complete handler will
-                # regenerate with the correct yaw once the fetch is done.
-                if (
-                    not self._is_saga_active()
-                    and device.map.area
-                    and device.map.geojson_needs_regeneration(device.location.RTK)
-                ):
-                    device.map.generate_geojson(device.location.RTK, device.location.dock)
+                # If the RTK origin or yaw just arrived or changed, the handle
+                # rebuilds the GeoJSON views with it off the loop — nothing is
+                # built on this ~4 Hz path.
+                device.map.set_geojson_origin(device.location.RTK, device.location.dock)
             case "toapp_report_data":
                 device.update_report_data(sys_msg[1])  # type: ignore
             case "mow_to_app_info":
@@ -1469,8 +1499,8 @@ def get_state_reducer(device_name: str, is_saga_active: Callable[[], bool] | Non
     - :class:`MowerStateReducer` for all lawn mowers (the historical default)
 
     *is_saga_active* — optional callable returning True while a saga holds the
-    device's command queue.  Forwarded to the reducer so it can skip eager
-    geojson regeneration during fetches.
+    device's command queue.  Forwarded to the reducer so it can leave
+    saga-owned map state alone during fetches.
 
     Picked once per device at handle construction time so the hot path
     doesn't pay an isinstance check on every incoming message.
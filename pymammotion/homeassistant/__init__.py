@@ -1,3 +1,12 @@
-from pymammotion.homeassistant.mower_api import HomeAssistantMowerApi
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pymammotion.utility.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pymammotion.homeassistant.mower_api import HomeAssistantMowerApi
 
 __all__ = ["HomeAssistantMowerApi"]
+
+__getattr__, __dir__ = lazy_exports(__name__, {"HomeAssistantMowerApi": "pymammotion.homeassistant.mower_api"})
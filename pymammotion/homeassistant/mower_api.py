@@ -407,8 +407,8 @@ class HomeAssistantMowerApi:
           3. Collect all line hash frames.
           4. Fetch all cover_path_upload frames.
 
-        The cover path is stored in device.map.current_mow_path and
-        device.map.generated_mow_path_geojson on completion.
+        The cover path is stored in device.map.current_mow_path on completion;
+        device.map.generated_mow_path_geojson is built from it when first read.
         """
         if not operation_settings.areas:
             if device := self._mammotion.get_device_by_name(device_name):
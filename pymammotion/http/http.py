@@ -12,13 +12,14 @@ import json
 import logging
 import secrets
 import time
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Self, TypeVar, cast
 
 from aiohttp import ClientError, ClientSession, ClientTimeout, ContentTypeError
 import jwt
 from mashumaro.exceptions import InvalidFieldValue, MissingField
 from mashumaro.mixins.orjson import DataClassORJSONMixin
 
+from pymammotion.account.rate_limit import RateLimitBucket
 from pymammotion.const import (
     APP_VERSION,
     MAMMOTION_API_DOMAIN,
@@ -44,11 +45,25 @@ from pymammotion.http.model.http import (
 )
 from pymammotion.http.model.response_factory import response_factory
 from pymammotion.http.model.rtk import RTK
+from pymammotion.http.response_cache import (
+    ERROR_CODES,
+    OTA_FIRMWARE,
+    RTK_DEVICES,
+    USER_DEVICE_LIST,
+    USER_DEVICE_PAGE,
+    ResponseCache,
+    cached_response,
+    check_revalidation,
+    conditional_headers,
+)
+from pymammotion.http.session import HTTPSessionStats, SharedClientSession
 from pymammotion.transport.base import AuthError, ReLoginRequiredError
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Awaitable, Callable
 
+    from pymammotion.account.rate_limit import AccountRateLimiter
+
 T = TypeVar("T")
 _ModelT = TypeVar("_ModelT", bound=DataClassORJSONMixin)
 
@@ -178,7 +193,12 @@ def create_oauth_signature(
 
 
 class MammotionHTTP:
-    """HTTP client for the Mammotion cloud API (login, device list, MQTT credentials, OTA)."""
+    """HTTP client for the Mammotion cloud API (login, device list, MQTT credentials, OTA).
+
+    Without a host-supplied ``session`` it opens a shared keep-alive session on
+    first use.  :class:`MammotionClient` closes the instances it creates; any
+    other owner must call :meth:`close` or use the client as ``async with``.
+    """
 
     def __init__(
         self,
@@ -193,7 +213,9 @@ class MammotionHTTP:
         self.expires_in = 0.0
         self.code = 0
         self.msg = None
-        self._session: ClientSession | None = session  # None → new session per request
+        self._session: ClientSession | None = session  # None → the shared session below
+        #: Keep-alive session used when the host supplied none; see :meth:`close`.
+        self._shared_session = SharedClientSession(timeout=self._DEFAULT_HTTP_TIMEOUT)
         self.account = account
         # Stored for callers' convenience only.  NOTHING in this class may read it:
         # a session is minted from a password exclusively by an explicit, caller-
@@ -219,6 +241,13 @@ class MammotionHTTP:
         #: leaves the cached refresh token dead, forcing a password re-login on
         #: the next restart.
         self.on_login_refreshed: Callable[[], Awaitable[None]] | None = None
+        #: Token buckets of the owning account (set by the client).  Every request
+        #: spends an HTTP token before it is sent.
+        self.rate_limiter: AccountRateLimiter | None = None
+        #: Cache in front of the slow-changing endpoints (error codes, OTA, RTK,
+        #: device list/page).  The client replaces it with one shared by all its
+        #: accounts; None disables caching.
+        self.response_cache: ResponseCache | None = ResponseCache()
 
         # Add this method to generate a 10-digit random number
         def get_10_random() -> str:
@@ -236,13 +265,39 @@ class MammotionHTTP:
     _DEFAULT_HTTP_TIMEOUT: ClientTimeout = ClientTimeout(total=30)
 
     @asynccontextmanager
-    async def _client_session(self) -> AsyncIterator[ClientSession]:
-        """Yield the externally-provided session, or a fresh one that is closed after use."""
-        if self._session is not None:
-            yield self._session
-        else:
-            async with ClientSession(timeout=self._DEFAULT_HTTP_TIMEOUT) as session:
-                yield session
+    async def _client_session(
+        self, bucket: RateLimitBucket | None = RateLimitBucket.HTTP
+    ) -> AsyncIterator[ClientSession]:
+        """Yield the externally-provided session, or the shared keep-alive one.
+
+        A token is spent from the account's *bucket* first; pass None for calls
+        already metered elsewhere, and for authentication (login, token refresh,
+        logout) so a throttled account can always re-authenticate.
+        """
+        if bucket is not None and self.rate_limiter is not None:
+            await self.rate_limiter.acquire(bucket)
+        yield self._session if self._session is not None else self._shared_session.get()
+
+    @property
+    def session_stats(self) -> HTTPSessionStats | None:
+        """Connection-reuse counters of the shared session, or None when the host supplied one."""
+        return self._shared_session.stats if self._session is None else None
+
+    async def close(self) -> None:
+        """Close the shared keep-alive session, if one was opened.
+
+        A host-supplied session is left alone — its owner closes it.  The
+        instance stays usable: the next request opens a new shared session.
+        """
+        await self._shared_session.close()
+
+    async def __aenter__(self) -> Self:
+        """Use the client as an async context manager that closes it on exit."""
+        return self
+
+    async def __aexit__(self, *_exc_info: object) -> None:
+        """Close the shared keep-alive session; see :meth:`close`."""
+        await self.close()
 
     @classmethod
     def from_cache(
@@ -338,7 +393,8 @@ class MammotionHTTP:
         live" one because it is known to exist and answer — ``/user/oauth/check``
         returns 404 on live accounts, and treating that as a rejection made every
         restore refresh (spending the cached refresh token) and then re-login anyway.
-        The caller needs this list moments later regardless, so it costs nothing.
+        The caller needs this list moments later regardless — the fresh answer lands in
+        the response cache, so it costs nothing.
 
         Returns False when the session is genuinely unusable, so the caller can fall
         back to a full login.  Transient network failures are deliberately NOT
@@ -356,7 +412,7 @@ class MammotionHTTP:
             return False
 
         try:
-            await self.get_user_device_list()
+            await self.get_user_device_list(fresh=True)
         except (UnauthorizedExceptionError, AuthError, ReLoginRequiredError) as exc:
             # ensure_token_valid has already renewed a near-expiry token, so a
             # rejection here is the session itself, not the clock.
@@ -498,18 +554,21 @@ class MammotionHTTP:
         """Log in using email and password via the v2 OAuth endpoint."""
         return await self.login_v2(email, password)
 
+    @cached_response(ERROR_CODES, dict[str, ErrorInfo])
     @refresh_token_decorator
     async def get_all_error_codes(self) -> dict[str, ErrorInfo]:
-        """Retrieve and parse all error codes from the MAMMOTION API."""
+        """Retrieve and parse all error codes from the MAMMOTION API (cached, see :mod:`.response_cache`)."""
         async with self._client_session() as session:
             resp = await session.post(
                 f"{MAMMOTION_API_DOMAIN}/user-server/v1/code/record/export-data",
                 headers={
                     **self._headers,
+                    **conditional_headers(),
                     "Authorization": f"Bearer {self._require_login_info.access_token}",
                     "Content-Type": "application/json",
                 },
             )
+            check_revalidation(resp)
             if (resp.headers.get("Content-Type") or "").startswith("application/json"):
                 data = await resp.json()
                 if resp.status != HTTPStatus.OK.value:
@@ -544,7 +603,7 @@ class MammotionHTTP:
         the shared implementation used by both the proactive decorated path and
         the reactive force-refresh path in TokenManager.
         """
-        async with self._client_session() as session:
+        async with self._client_session(bucket=None) as session:
             resp = await session.post(
                 f"{MAMMOTION_DOMAIN}/authorization/code",
                 headers={
@@ -706,15 +765,17 @@ class MammotionHTTP:
 
         return Response(code=resp.status, msg="success")
 
+    @cached_response(OTA_FIRMWARE, Response[list[CheckDeviceVersion]])
     @refresh_token_decorator
     async def get_device_ota_firmware(self, iot_ids: list[str]) -> Response[list[CheckDeviceVersion]]:
-        """Check device firmware versions for a list of IoT IDs."""
+        """Check device firmware versions for a list of IoT IDs (cached)."""
         async with self._client_session() as session:
             resp = await session.post(
                 f"{MAMMOTION_API_DOMAIN}/device-server/v1/devices/version/check",
                 json={"deviceIds": iot_ids},
                 headers={
                     **self._headers,
+                    **conditional_headers(),
                     "App-Version": f"HA,{APP_VERSION}",
                     "Authorization": f"Bearer {self._require_login_info.access_token}",
                     "Content-Type": "application/json",
@@ -722,6 +783,7 @@ class MammotionHTTP:
                     "Client-Type": "1",
                 },
             )
+            check_revalidation(resp)
             if (resp.headers.get("Content-Type") or "").startswith("application/json"):
                 data = await resp.json()
 
@@ -754,22 +816,26 @@ class MammotionHTTP:
                 if resp.status != HTTPStatus.OK.value:
                     _LOGGER.warning("Failed to start OTA upgrade. Status code: %s, %s", resp.status, data)
                     return Response(code=resp.status, msg="start ota upgrade failed")
+                await self._invalidate_cache(OTA_FIRMWARE)
                 return response_factory(Response[str], data)
 
         return Response(code=200, msg="success")
 
+    @cached_response(RTK_DEVICES, Response[list[RTK]])
     @refresh_token_decorator
     async def get_rtk_devices(self) -> Response[list[RTK]]:
-        """Fetch stream subscription data from agora.io for a given IoT device."""
+        """Fetch the account's RTK base stations (cached)."""
         async with self._client_session() as session:
             resp = await session.get(
                 f"{MAMMOTION_API_DOMAIN}/device-server/v1/rtk/devices",
                 headers={
                     **self._headers,
+                    **conditional_headers(),
                     "Authorization": f"Bearer {self._require_login_info.access_token}",
                     "Content-Type": "application/json",
                 },
             )
+            check_revalidation(resp)
             if (resp.headers.get("Content-Type") or "").startswith("application/json"):
                 data = await resp.json()
                 if resp.status == HTTPStatus.OK.value:
@@ -779,10 +845,12 @@ class MammotionHTTP:
 
         return Response(code=200, msg="success", data=[])
 
-    @refresh_token_decorator
-    async def get_user_device_list(self) -> Response[list[DeviceInfo]]:
+    async def get_user_device_list(self, *, fresh: bool = False) -> Response[list[DeviceInfo]]:
         """Fetch the user's owned devices (shared devices are not returned).
 
+        Served from the response cache for a short while; pass *fresh* when the
+        server's current answer matters.
+
         Raises:
             UnauthorizedExceptionError: The server rejected the access token.  The
                 decorator above has already renewed it if it was near expiry, so a
@@ -792,17 +860,27 @@ class MammotionHTTP:
                 dead login from an empty device list.
 
         """
+        response = await self._fetch_user_device_list(fresh=fresh)
+        if response.data:
+            self.device_info = response.data
+        return response
+
+    @cached_response(USER_DEVICE_LIST, Response[list[DeviceInfo]])
+    @refresh_token_decorator
+    async def _fetch_user_device_list(self) -> Response[list[DeviceInfo]]:
         async with self._client_session() as session:
             resp = await session.get(
                 f"{MAMMOTION_API_DOMAIN}/device-server/v1/device/list",
                 headers={
                     **self._headers,
+                    **conditional_headers(),
                     "Authorization": f"Bearer {self._require_login_info.access_token}",
                     "Content-Type": "application/json",
                     "Client-Id": self.client_id,
                     "Client-Type": "1",
                 },
             )
+            check_revalidation(resp)
             resp_dict = (
                 await resp.json() if (resp.headers.get("Content-Type") or "").startswith("application/json") else {}
             )
@@ -818,9 +896,7 @@ class MammotionHTTP:
                 _LOGGER.warning("Failed to fetch user device list. Status code: %s, %s", resp.status, resp_dict)
                 return Response(code=resp.status, msg="get device list failed", data=[])
             if resp_dict:
-                response = response_factory(Response[list[DeviceInfo]], resp_dict)
-                self.device_info = response.data if response.data else self.device_info
-                return response
+                return response_factory(Response[list[DeviceInfo]], resp_dict)
 
         return Response(code=200, msg="success", data=[])
 
@@ -872,13 +948,26 @@ class MammotionHTTP:
                 if resp.status != HTTPStatus.OK.value:
                     _LOGGER.warning("Failed to confirm share. Status code: %s, %s", resp.status, resp_dict)
                     return Response(code=resp.status, msg="confirm share failed")
+                # Accepted shares add devices: the cached lists are out of date.
+                await self._invalidate_cache(USER_DEVICE_LIST)
+                await self._invalidate_cache(USER_DEVICE_PAGE)
                 return response_factory(Response[dict | bool], resp_dict)
 
         return Response(code=200, msg="success")
 
+    async def get_user_device_page(self, *, fresh: bool = False) -> Response[DeviceRecords]:
+        """Fetch the device list for a user, from either the new API or the newer-device API.
+
+        Cached like :meth:`get_user_device_list`; pass *fresh* to skip the cache.
+        """
+        response = await self._fetch_user_device_page(fresh=fresh)
+        if response.data:
+            self.device_records = response.data
+        return response
+
+    @cached_response(USER_DEVICE_PAGE, Response[DeviceRecords])
     @refresh_token_decorator
-    async def get_user_device_page(self) -> Response[DeviceRecords]:
-        """Fetch the device list for a user, from either the new API or the newer-device API."""
+    async def _fetch_user_device_page(self) -> Response[DeviceRecords]:
         async with self._client_session() as session:
             resp = await session.post(
                 f"{self.jwt_info.iot}/v1/user/device/page",
@@ -889,6 +978,7 @@ class MammotionHTTP:
                 },
                 headers={
                     **self._headers,
+                    **conditional_headers(),
                     "Authorization": f"Bearer {self._require_login_info.access_token}",
                     "Content-Type": "application/json",
                     "User-Agent": "okhttp/4.9.3",
@@ -896,13 +986,12 @@ class MammotionHTTP:
                     "Client-Type": "1",
                 },
             )
+            check_revalidation(resp)
             if resp.status != 200:
                 return Response.from_dict({"code": resp.status, "msg": "get device list failed"})
             if (resp.headers.get("Content-Type") or "").startswith("application/json"):
                 resp_dict = await resp.json()
-                response = response_factory(Response[DeviceRecords], resp_dict)
-                self.device_records = response.data if response.data else self.device_records
-                return response
+                return response_factory(Response[DeviceRecords], resp_dict)
 
         return Response(code=200, msg="success")
 
@@ -933,7 +1022,8 @@ class MammotionHTTP:
     async def mqtt_invoke(self, content: str, device_name: str, iot_id: str) -> Response[dict]:
         """Send mqtt commands to devices."""
         _LOGGER.debug(f"mqtt invoke content: {content}, {self.jwt_info.iot}")
-        async with self._client_session() as session:
+        # Metered as an invoke by the device's command queue, not as a REST call.
+        async with self._client_session(bucket=None) as session:
             resp = await session.post(
                 f"{self.jwt_info.iot}/v1/mqtt/rpc/thing/service/invoke",
                 json={
@@ -978,13 +1068,14 @@ class MammotionHTTP:
         """Invalidate the current session by calling the v3 logout endpoint."""
         if self.login_info is None:
             return
-        async with self._client_session() as session:
+        async with self._client_session(bucket=None) as session:
             await session.post(
                 f"{MAMMOTION_API_DOMAIN}/user-server/v3/user/logout",
                 headers=self.generate_headers(self._require_login_info.access_token),
             )
         self.login_info = None
         self._headers.pop("Authorization", None)
+        await self._invalidate_cache(None)
         # Any caller reading these after a logout should see "no creds" rather
         # than a JWT/expiry bound to the previous login.  Without this, a stale
         # MQTT JWT survives the logout and gets re-used until the next explicit
@@ -993,6 +1084,11 @@ class MammotionHTTP:
         self.expires_in = 0.0
         self.jwt_info = JWTTokenInfo("", "")
 
+    async def _invalidate_cache(self, endpoint: str | None) -> None:
+        """Drop this account's cached responses for *endpoint* (all of them when None)."""
+        if self.response_cache is not None:
+            await self.response_cache.invalidate(endpoint, self.account or "")
+
     async def _fire_login_refreshed(self) -> None:
         """Notify the on_login_refreshed listener that the login session rotated.
 
@@ -1007,7 +1103,7 @@ class MammotionHTTP:
         """Log in to the service using the provided account and password."""
         self.account = account
         self._password = password
-        async with self._client_session() as session:
+        async with self._client_session(bucket=None) as session:
             resp = await session.post(
                 f"{MAMMOTION_DOMAIN}/oauth/token",
                 headers={
@@ -1083,7 +1179,7 @@ class MammotionHTTP:
             timestamp=timestamp,
         )
 
-        async with self._client_session() as session:
+        async with self._client_session(bucket=None) as session:
             resp = await session.post(
                 f"{MAMMOTION_DOMAIN}/oauth2/token",
                 headers={
@@ -1186,7 +1282,7 @@ class MammotionHTTP:
             timestamp=timestamp,
         )
 
-        async with self._client_session() as session:
+        async with self._client_session(bucket=None) as session:
             resp = await session.post(
                 f"{MAMMOTION_DOMAIN}/oauth2/token",
                 headers={
@@ -0,0 +1,442 @@
+"""TTL response cache for the slow-changing Mammotion REST endpoints.
+
+The error catalogue, OTA firmware checks, RTK device list and the user's
+device list/page change rarely, but every caller used to fetch them again —
+a Home Assistant start with many coordinators downloaded and CSV-parsed the
+whole error catalogue once per coordinator.  :class:`ResponseCache` sits in
+front of those :class:`~pymammotion.http.http.MammotionHTTP` methods
+(see :func:`cached_response`):
+
+* **TTL per endpoint** — :data:`DEFAULT_CACHE_TTLS`, overridable through
+  ``ResponseCache.ttls``.  A TTL of 0 disables reuse but keeps the
+  single-flight below.
+* **Single-flight** — concurrent calls with the same key share one request;
+  fifty callers asking for the error catalogue at once cause exactly one.
+* **Conditional revalidation** — when a stale entry carries an ``ETag`` or
+  ``Last-Modified``, the refetch sends ``If-None-Match`` /
+  ``If-Modified-Since`` and a ``304`` renews the entry without a body.
+* **Two tiers** — an in-memory LRU, plus an optional persistent
+  :class:`ResponseStore` (:class:`DiskResponseStore`) so a restarted worker
+  starts warm.
+
+Entries are keyed by endpoint, account and call arguments.  Only successful
+results are stored (``Response.code == 0``, or a non-empty mapping).  Cached
+values are shared between callers and must be treated as read-only.  Pass
+``fresh=True`` to a cached method to skip the cache when the server's
+current answer matters (login validation, re-discovery after an unbind).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+import contextvars
+from dataclasses import dataclass
+from functools import cache, wraps
+import hashlib
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any, NamedTuple, Protocol, TypeVar
+
+from mashumaro.codecs import BasicDecoder, BasicEncoder
+from mashumaro.dialect import Dialect
+import orjson
+
+from pymammotion.http.model.http import Response
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Mapping
+
+    from aiohttp import ClientResponse
+
+T = TypeVar("T")
+
+_LOGGER = logging.getLogger(__name__)
+
+#: Endpoint names used as cache keys.
+ERROR_CODES = "error_codes"
+OTA_FIRMWARE = "ota_firmware"
+RTK_DEVICES = "rtk_devices"
+USER_DEVICE_LIST = "user_device_list"
+USER_DEVICE_PAGE = "user_device_page"
+
+#: Default time-to-live per endpoint (s).  The device list and page stay short:
+#: they are how a newly bound or shared device is discovered.
+DEFAULT_CACHE_TTLS: Mapping[str, float] = {
+    ERROR_CODES: 24 * 3600.0,
+    OTA_FIRMWARE: 600.0,
+    RTK_DEVICES: 600.0,
+    USER_DEVICE_LIST: 60.0,
+    USER_DEVICE_PAGE: 60.0,
+}
+#: Default size of the in-memory LRU tier.
+DEFAULT_CACHE_ENTRIES = 128
+
+
+class CacheKey(NamedTuple):
+    """Identity of one cached response."""
+
+    endpoint: str
+    account: str
+    #: JSON of the call arguments.
+    params: str
+
+
+@dataclass
+class CachedResponse:
+    """One stored response and the validators to revalidate it with."""
+
+    value: Any
+    #: Wall-clock time the entry was fetched or last revalidated.
+    stored_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+@dataclass(frozen=True)
+class ResponseCacheStats:
+    """Counters of a :class:`ResponseCache`.
+
+    Attributes:
+        hits: Calls served from a fresh entry, either tier.
+        misses: Calls that had to go to the server.
+        coalesced: Calls that joined another caller's in-flight request.
+        revalidated: Stale entries renewed by a ``304 Not Modified``.
+        evicted: Entries dropped from the memory tier to stay within its size.
+        entries: Entries in the memory tier now.
+
+    """
+
+    hits: int
+    misses: int
+    coalesced: int
+    revalidated: int
+    evicted: int
+    entries: int
+
+
+class ResponseStore(Protocol):
+    """Persistent tier of a :class:`ResponseCache`; values arrive already encoded to JSON types."""
+
+    async def load(self, key: CacheKey) -> CachedResponse | None:
+        """Return the stored entry for *key*, or None."""
+
+    async def save(self, key: CacheKey, entry: CachedResponse) -> None:
+        """Store *entry* under *key*, replacing any previous one."""
+
+    async def discard(self, endpoint: str | None, account: str) -> None:
+        """Drop every entry of *account* for *endpoint* (every endpoint when None)."""
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+class DiskResponseStore:
+    """:class:`ResponseStore` keeping one JSON file per entry in *directory*.
+
+    File I/O runs in a worker thread, never on the event loop.
+    """
+
+    def __init__(self, directory: str | Path) -> None:
+        """Store entries under *directory*, created on first save."""
+        self.directory = Path(directory)
+
+    def _path(self, key: CacheKey) -> Path:
+        return self.directory / f"{key.endpoint}__{_digest(key.account)}__{_digest(key.params)}.json"
+
+    async def load(self, key: CacheKey) -> CachedResponse | None:
+        """Return the entry for *key*; a missing, unreadable or colliding file is a miss."""
+        return await asyncio.to_thread(self._load, key)
+
+    def _load(self, key: CacheKey) -> CachedResponse | None:
+        try:
+            raw = orjson.loads(self._path(key).read_bytes())
+            if raw["key"] != list(key):
+                return None
+            return CachedResponse(raw["value"], raw["stored_at"], raw.get("etag"), raw.get("last_modified"))
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            _LOGGER.debug("response cache: unreadable entry for %s", key.endpoint, exc_info=True)
+            return None
+
+    async def save(self, key: CacheKey, entry: CachedResponse) -> None:
+        """Write the entry for *key*."""
+        await asyncio.to_thread(self._save, key, entry)
+
+    def _save(self, key: CacheKey, entry: CachedResponse) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(
+            orjson.dumps(
+                {
+                    "key": list(key),
+                    "value": entry.value,
+                    "stored_at": entry.stored_at,
+                    "etag": entry.etag,
+                    "last_modified": entry.last_modified,
+                }
+            )
+        )
+        tmp.replace(path)
+
+    async def discard(self, endpoint: str | None, account: str) -> None:
+        """Delete the matching entry files."""
+        await asyncio.to_thread(self._discard, endpoint, account)
+
+    def _discard(self, endpoint: str | None, account: str) -> None:
+        if not self.directory.is_dir():
+            return
+        for path in self.directory.glob(f"{endpoint or '*'}__{_digest(account)}__*.json"):
+            path.unlink(missing_ok=True)
+
+
+@dataclass
+class _Revalidation:
+    """Validators of the entry being refetched, and those the new response carried."""
+
+    etag: str | None = None
+    last_modified: str | None = None
+    new_etag: str | None = None
+    new_last_modified: str | None = None
+
+
+class _NotModifiedError(Exception):
+    """The server answered 304: the stale entry is still current."""
+
+
+_REVALIDATION: contextvars.ContextVar[_Revalidation | None] = contextvars.ContextVar(
+    "pymammotion_response_revalidation", default=None
+)
+
+
+def conditional_headers() -> dict[str, str]:
+    """Return ``If-None-Match`` / ``If-Modified-Since`` for the refetch in progress, if any.
+
+    Cached endpoints merge these into their request headers.
+    """
+    revalidation = _REVALIDATION.get()
+    headers: dict[str, str] = {}
+    if revalidation is not None:
+        if revalidation.etag:
+            headers["If-None-Match"] = revalidation.etag
+        if revalidation.last_modified:
+            headers["If-Modified-Since"] = revalidation.last_modified
+    return headers
+
+
+def check_revalidation(resp: ClientResponse) -> None:
+    """Record *resp*'s validators; on ``304 Not Modified`` end the fetch so the stale entry is renewed.
+
+    Cached endpoints call this right after the request returns.  Outside a
+    cached fetch it does nothing.
+    """
+    revalidation = _REVALIDATION.get()
+    if revalidation is None:
+        return
+    if resp.status == 304 and (revalidation.etag or revalidation.last_modified):
+        raise _NotModifiedError
+    revalidation.new_etag = resp.headers.get("ETag")
+    revalidation.new_last_modified = resp.headers.get("Last-Modified")
+
+
+def is_cacheable(value: object) -> bool:
+    """Return True for a storable result: a ``Response`` with code 0, or a non-empty mapping."""
+    if isinstance(value, Response):
+        return value.code == 0
+    return isinstance(value, dict) and bool(value)
+
+
+class _WireDialect(Dialect):
+    # Persist in the server's own field names: they are what the decoder reads back.
+    serialize_by_alias = True
+
+
+@cache
+def _encoder(value_type: Any) -> BasicEncoder[Any]:
+    return BasicEncoder(value_type, default_dialect=_WireDialect)
+
+
+@cache
+def _decoder(value_type: Any) -> BasicDecoder[Any]:
+    return BasicDecoder(value_type)
+
+
+class ResponseCache:
+    """Memory LRU plus optional persistent store, with single-flight fetches."""
+
+    def __init__(
+        self,
+        store: ResponseStore | None = None,
+        max_entries: int = DEFAULT_CACHE_ENTRIES,
+        ttls: Mapping[str, float] | None = None,
+    ) -> None:
+        """Create an empty cache.
+
+        Args:
+            store: Persistent tier, or None for memory only.
+            max_entries: Size of the memory tier.
+            ttls: Time-to-live per endpoint (s), merged over :data:`DEFAULT_CACHE_TTLS`.
+                Endpoints without a positive TTL are not reused.
+
+        """
+        if max_entries < 1:
+            msg = "max_entries must be at least 1"
+            raise ValueError(msg)
+        self.store = store
+        self.max_entries = max_entries
+        self.ttls: dict[str, float] = {**DEFAULT_CACHE_TTLS, **(ttls or {})}
+        self._entries: OrderedDict[CacheKey, CachedResponse] = OrderedDict()
+        self._inflight: dict[CacheKey, asyncio.Task[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._revalidated = 0
+        self._evicted = 0
+
+    def stats(self) -> ResponseCacheStats:
+        """Return the current counters."""
+        return ResponseCacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            coalesced=self._coalesced,
+            revalidated=self._revalidated,
+            evicted=self._evicted,
+            entries=len(self._entries),
+        )
+
+    async def get_or_fetch(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[T]],
+        value_type: Any,
+        *,
+        fresh: bool = False,
+        cacheable: Callable[[T], bool] = is_cacheable,
+    ) -> T:
+        """Return the cached value for *key*, or ``await fetch()`` and store the result.
+
+        Args:
+            key: Entry identity.
+            fetch: Performs the request; it runs once however many callers wait on it.
+            value_type: Type of the value, used to encode it for the persistent store.
+            fresh: Skip fresh entries and go to the server (still single-flight).
+            cacheable: Whether a fetched value may be stored.
+
+        """
+        ttl = self.ttls.get(key.endpoint, 0.0)
+        stale = await self._lookup(key, value_type) if ttl > 0 else None
+        if stale is not None and not fresh and time.time() - stale.stored_at < ttl:
+            self._hits += 1
+            return stale.value
+        task = self._inflight.get(key)
+        if task is None:
+            self._misses += 1
+            task = asyncio.get_running_loop().create_task(self._refresh(key, fetch, value_type, stale, cacheable))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        else:
+            self._coalesced += 1
+        # Shielded: one caller giving up must not cancel the request the others wait on.
+        return await asyncio.shield(task)
+
+    async def invalidate(self, endpoint: str | None = None, account: str = "") -> None:
+        """Drop *account*'s entries for *endpoint* (every endpoint when None) from both tiers."""
+        for key in [k for k in self._entries if k.account == account and endpoint in (None, k.endpoint)]:
+            del self._entries[key]
+        if self.store is not None:
+            await self.store.discard(endpoint, account)
+
+    async def _lookup(self, key: CacheKey, value_type: Any) -> CachedResponse | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            return entry
+        if self.store is None:
+            return None
+        stored = await self.store.load(key)
+        if stored is None:
+            return None
+        try:
+            entry = CachedResponse(
+                _decoder(value_type).decode(stored.value), stored.stored_at, stored.etag, stored.last_modified
+            )
+        except Exception:  # noqa: BLE001 — a persisted entry of an older schema is just a miss
+            _LOGGER.debug("response cache: stale schema for %s", key.endpoint, exc_info=True)
+            return None
+        self._remember(key, entry)
+        return entry
+
+    async def _refresh(
+        self,
+        key: CacheKey,
+        fetch: Callable[[], Awaitable[T]],
+        value_type: Any,
+        stale: CachedResponse | None,
+        cacheable: Callable[[T], bool],
+    ) -> T:
+        revalidation = _Revalidation()
+        if stale is not None:
+            revalidation.etag, revalidation.last_modified = stale.etag, stale.last_modified
+        # Runs in its own task, so the variable is private to this fetch.
+        _REVALIDATION.set(revalidation)
+        try:
+            value = await fetch()
+        except _NotModifiedError:
+            if stale is None:  # pragma: no cover — a 304 is only possible for a conditional request
+                raise
+            self._revalidated += 1
+            entry = CachedResponse(stale.value, time.time(), stale.etag, stale.last_modified)
+            await self._store(key, entry, value_type)
+            return stale.value
+        if self.ttls.get(key.endpoint, 0.0) > 0 and cacheable(value):
+            entry = CachedResponse(value, time.time(), revalidation.new_etag, revalidation.new_last_modified)
+            await self._store(key, entry, value_type)
+        return value
+
+    async def _store(self, key: CacheKey, entry: CachedResponse, value_type: Any) -> None:
+        self._remember(key, entry)
+        if self.store is None:
+            return
+        try:
+            encoded = CachedResponse(
+                _encoder(value_type).encode(entry.value), entry.stored_at, entry.etag, entry.last_modified
+            )
+            await self.store.save(key, encoded)
+        except Exception:  # noqa: BLE001 — the persistent tier is best effort
+            _LOGGER.warning("response cache: could not persist %s", key.endpoint, exc_info=True)
+
+    def _remember(self, key: CacheKey, entry: CachedResponse) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evicted += 1
+
+
+def cached_response(
+    endpoint: str, value_type: Any
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """Serve a ``MammotionHTTP`` method through its ``response_cache``.
+
+    The wrapped method gains a keyword-only ``fresh`` argument that bypasses
+    fresh entries.  Its positional and keyword arguments become part of the key.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        @wraps(func)
+        async def wrapper(self: Any, *args: Any, fresh: bool = False, **kwargs: Any) -> T:
+            response_cache: ResponseCache | None = self.response_cache
+            if response_cache is None:
+                return await func(self, *args, **kwargs)
+            key = CacheKey(
+                endpoint, self.account or "", orjson.dumps([args, kwargs], option=orjson.OPT_SORT_KEYS).decode()
+            )
+            return await response_cache.get_or_fetch(key, lambda: func(self, *args, **kwargs), value_type, fresh=fresh)
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,113 @@
+"""Keep-alive aiohttp session for :class:`~pymammotion.http.http.MammotionHTTP` when the host supplies none."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+    from types import SimpleNamespace
+
+    _TraceHandler = Callable[[aiohttp.ClientSession, SimpleNamespace, object], Awaitable[None]]
+
+#: Most connections the shared session keeps open in total.
+DEFAULT_HTTP_CONNECTION_LIMIT = 10
+#: Most connections to one host (the API and auth domains are separate hosts).
+DEFAULT_HTTP_CONNECTIONS_PER_HOST = 4
+#: Seconds an idle keep-alive connection is kept for reuse.
+DEFAULT_HTTP_KEEPALIVE_TIMEOUT = 30.0
+#: Seconds a resolved address is cached — aiohttp's own default is 10.
+DEFAULT_HTTP_DNS_TTL = 300
+
+
+@dataclass
+class HTTPSessionStats:
+    """Counters for :class:`SharedClientSession` — how often a warm connection was reused."""
+
+    sessions_opened: int = 0
+    requests: int = 0
+    connections_created: int = 0
+    connections_reused: int = 0
+    #: Requests that waited for a free connection because a limit was reached.
+    connections_queued: int = 0
+    dns_cache_hits: int = 0
+    dns_cache_misses: int = 0
+
+
+class SharedClientSession:
+    """One lazily-opened ``aiohttp.ClientSession`` reused for every REST call.
+
+    ``MammotionHTTP`` used to open and close a session per request when the
+    host passed none, so each call paid DNS, TCP and TLS again.  This keeps a
+    single session on a keep-alive connector with connection limits and a
+    long DNS cache, counting reuse in :attr:`stats` through an aiohttp trace
+    config.
+
+    The session is opened by the first :meth:`get`, on the running loop; a
+    later :meth:`get` after :meth:`close` — or from a different loop — opens a
+    fresh one.  The owner must call :meth:`close` when done.
+    """
+
+    def __init__(
+        self,
+        timeout: aiohttp.ClientTimeout,
+        limit: int = DEFAULT_HTTP_CONNECTION_LIMIT,
+        limit_per_host: int = DEFAULT_HTTP_CONNECTIONS_PER_HOST,
+        keepalive_timeout: float = DEFAULT_HTTP_KEEPALIVE_TIMEOUT,
+        dns_ttl: int = DEFAULT_HTTP_DNS_TTL,
+    ) -> None:
+        """Initialise without opening anything; *timeout* is the session's default request timeout."""
+        self._timeout = timeout
+        self._limit = limit
+        self._limit_per_host = limit_per_host
+        self._keepalive_timeout = keepalive_timeout
+        self._dns_ttl = dns_ttl
+        self._session: aiohttp.ClientSession | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.stats = HTTPSessionStats()
+
+    def get(self) -> aiohttp.ClientSession:
+        """Return the open session, opening one if needed.  It belongs to this object — do not close it."""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            # A session bound to a previous (finished) loop cannot be used or closed here.
+            connector = aiohttp.TCPConnector(
+                limit=self._limit,
+                limit_per_host=self._limit_per_host,
+                keepalive_timeout=self._keepalive_timeout,
+                ttl_dns_cache=self._dns_ttl,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=self._timeout, trace_configs=[self._trace_config()]
+            )
+            self._loop = loop
+            self.stats.sessions_opened += 1
+        return self._session
+
+    async def close(self) -> None:
+        """Close the session, if open.  A later :meth:`get` opens a new one."""
+        session, self._session, self._loop = self._session, None, None
+        if session is not None and not session.closed:
+            await session.close()
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        stats = self.stats
+
+        def _counter(name: str) -> _TraceHandler:
+            async def _count(_session: aiohttp.ClientSession, _ctx: SimpleNamespace, _params: object) -> None:
+                setattr(stats, name, getattr(stats, name) + 1)
+
+            return _count
+
+        trace = aiohttp.TraceConfig()
+        trace.on_request_start.append(_counter("requests"))
+        trace.on_connection_create_end.append(_counter("connections_created"))
+        trace.on_connection_reuseconn.append(_counter("connections_reused"))
+        trace.on_connection_queued_start.append(_counter("connections_queued"))
+        trace.on_dns_cache_hit.append(_counter("dns_cache_hits"))
+        trace.on_dns_cache_miss.append(_counter("dns_cache_misses"))
+        return trace
@@ -1,3 +1,14 @@
+import contextlib
+
+# betterproto2's first SerializeToString() probes pydantic via
+# pydantic.dataclasses.is_pydantic_dataclass; pydantic resolves .dataclasses through a
+# lazy module __getattr__ -> import_module, which Home Assistant flags as a blocking
+# call inside the event loop (Mammotion-HA #779).  Import it eagerly here — every
+# command is serialised by this class, and it is imported off the loop with the
+# client — so the first serialization is import-free.
+with contextlib.suppress(ImportError):
+    import pydantic.dataclasses  # noqa: F401
+
 from pymammotion.mammotion.commands.messages.basestation import MessageBasestation
 from pymammotion.mammotion.commands.messages.driver import MessageDriver
 from pymammotion.mammotion.commands.messages.media import MessageMedia
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from pymammotion.messaging.broker import DeviceMessageBroker
-from pymammotion.messaging.command_queue import DeviceCommandQueue, Priority
-from pymammotion.messaging.saga import Saga
-from pymammotion.transport.base import SagaFailedError, SagaInterruptedError
+from typing import TYPE_CHECKING
+
+from pymammotion.utility.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pymammotion.messaging.broker import DeviceMessageBroker
+    from pymammotion.messaging.command_queue import DeviceCommandQueue, Priority
+    from pymammotion.messaging.saga import Saga
+    from pymammotion.transport.base import SagaFailedError, SagaInterruptedError
 
 __all__ = [
     "DeviceCommandQueue",
@@ -15,3 +20,15 @@ __all__ = [
     "SagaFailedError",
     "SagaInterruptedError",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "DeviceCommandQueue": "pymammotion.messaging.command_queue",
+        "DeviceMessageBroker": "pymammotion.messaging.broker",
+        "Priority": "pymammotion.messaging.command_queue",
+        "Saga": "pymammotion.messaging.saga",
+        "SagaFailedError": "pymammotion.transport.base",
+        "SagaInterruptedError": "pymammotion.transport.base",
+    },
+)
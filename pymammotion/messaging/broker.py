@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import bisect
+import contextlib
+import copy
+from dataclasses import dataclass, field
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 import betterproto2
@@ -12,7 +16,7 @@ import betterproto2
 from pymammotion.transport.base import CommandTimeoutError, ConcurrentRequestError, EventBus, Subscription
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Mapping
 
 _logger = logging.getLogger(__name__)
 
@@ -30,12 +34,77 @@ _LUBA_SUB_GROUP: dict[str, str] = {
 }
 
 
+#: Upper bounds (seconds) of the :class:`LatencyHistogram` buckets; a final
+#: overflow bucket catches everything slower.
+LATENCY_BUCKETS: tuple[float, ...] = (0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+
 @dataclass
 class PendingRequest:
-    """A command awaiting a specific protobuf response field."""
+    """A command awaiting a specific protobuf response field.
+
+    ``discriminator`` narrows the match to responses whose leaf message (or,
+    failing that, the enclosing ``LubaMsg`` — e.g. ``seq``) carries the given
+    attribute values, so several requests for the same field can be in flight.
+    """
 
     expected_field: str
     future: asyncio.Future[Any]
+    discriminator: Mapping[str, Any] | None = None
+
+    def matches(self, leaf: Any, message: Any) -> bool:
+        """Return True when *leaf* / *message* carry every discriminator value."""
+        if not self.discriminator:
+            return True
+        missing = object()
+        for name, expected in self.discriminator.items():
+            value = getattr(leaf, name, missing)
+            if value is missing:
+                value = getattr(message, name, missing)
+            if value != expected:
+                return False
+        return True
+
+
+@dataclass
+class LatencyHistogram:
+    """Response-latency distribution of one expected field.
+
+    Latency is measured from the first send to the matching response, so it
+    includes any retries.  ``counts[i]`` holds responses no slower than
+    ``LATENCY_BUCKETS[i]``; the last entry is the overflow bucket.
+    """
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total: float = 0.0
+    max_latency: float = 0.0
+    timeouts: int = 0
+
+    @property
+    def count(self) -> int:
+        """Responses observed."""
+        return sum(self.counts)
+
+    @property
+    def mean(self) -> float:
+        """Mean latency (s), 0.0 before the first response."""
+        return self.total / self.count if self.count else 0.0
+
+    def observe(self, latency: float) -> None:
+        """Record one response *latency* (s)."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, latency)] += 1
+        self.total += latency
+        self.max_latency = max(self.max_latency, latency)
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the *q* quantile (``max_latency`` for the overflow bucket)."""
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else self.max_latency
+        return 0.0
 
 
 class DeviceMessageBroker:
@@ -46,17 +115,25 @@ class DeviceMessageBroker:
     - Unsolicited: device-initiated event → emitted to the event bus
 
     Correlation key is the protobuf oneof field name (e.g. 'toapp_gethash_ack'),
-    since Mammotion protocol has no request ID field. At most one pending
-    request per field name is allowed (ConcurrentRequestError otherwise).
+    since Mammotion protocol has no request ID field, optionally narrowed by a
+    discriminator — ``sub_cmd``, ``hash``, ``transaction_id``, ``seq``, … —
+    so several requests for one field can be outstanding at once.  Two waiters
+    with the same field *and* discriminator would be ambiguous and raise
+    ConcurrentRequestError.  A response goes to the oldest discriminated
+    waiter it matches, else to the field's catch-all waiter.
+
+    The pending table is only touched from the event loop and never across an
+    ``await``, so registration, lookup-and-resolve and cleanup are atomic
+    without a lock.
 
     One broker instance per device, shared across MQTT and BLE transports.
     """
 
     def __init__(self) -> None:
         """Initialise broker with empty pending-request table and event bus."""
-        self._pending: dict[str, PendingRequest] = {}
+        self._pending: dict[str, list[PendingRequest]] = {}
         self._event_bus: EventBus[Any] = EventBus()
-        self._lock = asyncio.Lock()
+        self._latency: dict[str, LatencyHistogram] = {}
 
     async def send_and_wait(
         self,
@@ -64,6 +141,8 @@ class DeviceMessageBroker:
         expected_field: str,
         send_timeout: float = 3.0,
         retries: int = 2,
+        *,
+        discriminator: Mapping[str, Any] | None = None,
     ) -> Any:
         """Send a command and wait for the matching protobuf response.
 
@@ -72,24 +151,30 @@ class DeviceMessageBroker:
             expected_field: Protobuf oneof field name expected in response.
             send_timeout: Seconds to wait per attempt before retrying.
             retries: Total send attempts before raising CommandTimeoutError.
+            discriminator: Attribute values the response must also carry, e.g.
+                ``{"hash": area_hash}`` or ``{"sub_cmd": 0}``.  Looked up on the
+                response's leaf message, then on the enclosing message.
 
         Returns:
             The LubaMsg response with the matching field set.
 
         Raises:
-            ConcurrentRequestError: Already waiting for same expected_field.
+            ConcurrentRequestError: Already waiting for same expected_field and discriminator.
             CommandTimeoutError: No response after all retry attempts.
 
         """
         loop = asyncio.get_running_loop()
         future: asyncio.Future[Any] = loop.create_future()
 
-        # Single lock block for check + insert so nothing can interleave between them.
-        async with self._lock:
-            if expected_field in self._pending:
-                msg = f"Already waiting for '{expected_field}'"
-                raise ConcurrentRequestError(msg)
-            self._pending[expected_field] = PendingRequest(expected_field=expected_field, future=future)
+        # Check + insert without an await in between: nothing can interleave.
+        waiters = self._pending.setdefault(expected_field, [])
+        if any(w.discriminator == discriminator for w in waiters):
+            msg = f"Already waiting for '{expected_field}'" + (f" {dict(discriminator)}" if discriminator else "")
+            raise ConcurrentRequestError(msg)
+        pending = PendingRequest(expected_field=expected_field, future=future, discriminator=discriminator)
+        waiters.append(pending)
+        histogram = self._latency.setdefault(expected_field, LatencyHistogram())
+        started = time.monotonic()
 
         try:
             for attempt in range(1, retries + 1):
@@ -104,7 +189,7 @@ class DeviceMessageBroker:
                     # per-attempt timeout — previously that swallowed real cancels
                     # and kept re-sending after shutdown was requested.
                     async with asyncio.timeout(send_timeout):
-                        return await asyncio.shield(future)
+                        response = await asyncio.shield(future)
                 except TimeoutError:
                     if attempt < retries:
                         _logger.debug(
@@ -114,21 +199,30 @@ class DeviceMessageBroker:
                             retries,
                         )
                     else:
+                        histogram.timeouts += 1
                         raise CommandTimeoutError(expected_field, retries) from None
+                else:
+                    histogram.observe(time.monotonic() - started)
+                    return response
         finally:
-            async with self._lock:
-                self._pending.pop(expected_field, None)
+            self._remove(pending)
             if not future.done():
                 future.cancel()
 
-    async def on_message(self, message: Any) -> None:
-        """Route an incoming message to a pending future or the event bus.
+    def _remove(self, pending: PendingRequest) -> None:
+        waiters = self._pending.get(pending.expected_field)
+        if waiters is None:
+            return
+        with contextlib.suppress(ValueError):
+            waiters.remove(pending)
+        if not waiters:
+            del self._pending[pending.expected_field]
 
-        Called by the transport layer for every incoming message.
-        Supports LubaMsg hierarchy (LubaSubMsg → SubNavMsg / SubSysMsg / …) as
-        well as a generic ``"payload"`` oneof group for test doubles.
-        """
+    @staticmethod
+    def _classify(message: Any) -> tuple[str | None, Any]:
+        """Return the correlation field name and leaf message of *message*."""
         field_name: str | None = None
+        leaf: Any = None
 
         # Try LubaMsg hierarchy first: LubaSubMsg → sub-group → leaf field
         try:
@@ -137,44 +231,66 @@ class DeviceMessageBroker:
                 sub_group = _LUBA_SUB_GROUP.get(sub_name)
                 if sub_group:
                     try:
-                        leaf_name, _ = betterproto2.which_one_of(sub_val, sub_group)
+                        leaf_name, leaf_val = betterproto2.which_one_of(sub_val, sub_group)
                         if leaf_name:
-                            field_name = leaf_name
+                            field_name, leaf = leaf_name, leaf_val
                     except Exception:  # noqa: BLE001, S110
                         pass
                 if field_name is None:
-                    field_name = sub_name  # fallback: top-level sub-msg name (e.g. "net", "mul")
+                    # fallback: top-level sub-msg name (e.g. "net", "mul")
+                    field_name, leaf = sub_name, sub_val
         except Exception:  # noqa: BLE001, S110
             pass
 
         # Fallback: generic "payload" oneof (used by test doubles and future protocols)
         if field_name is None:
             try:
-                field_name, _ = betterproto2.which_one_of(message, "payload")
+                field_name, leaf = betterproto2.which_one_of(message, "payload")
             except Exception:  # noqa: BLE001
                 _logger.debug("on_message: could not extract field name, treating as unsolicited")
 
+        return field_name, leaf
+
+    async def on_message(self, message: Any) -> None:
+        """Route an incoming message to a pending future or the event bus.
+
+        Called by the transport layer for every incoming message.
+        Supports LubaMsg hierarchy (LubaSubMsg → SubNavMsg / SubSysMsg / …) as
+        well as a generic ``"payload"`` oneof group for test doubles.
+        """
+        field_name, leaf = self._classify(message)
+
         if field_name:
-            # Hold the lock across the lookup AND the set_result: otherwise a
-            # late response can race the timeout cleanup in send_and_wait()'s
-            # finally block, calling set_result on an orphaned future and
-            # losing the response.
-            async with self._lock:
-                pending = self._pending.get(field_name)
-                if pending is not None and not pending.future.done():
-                    pending.future.set_result(message)
-                    return  # solicited — do NOT emit to event bus
+            # Lookup and set_result run with no await in between, so a late
+            # response can't race the timeout cleanup in send_and_wait() into
+            # resolving an orphaned future — once cleanup has run the waiter
+            # is gone and the response goes to the event bus.
+            target: PendingRequest | None = None
+            for pending in self._pending.get(field_name, ()):
+                if pending.future.done() or not pending.matches(leaf, message):
+                    continue
+                if pending.discriminator:
+                    target = pending
+                    break
+                target = target or pending
+            if target is not None:
+                target.future.set_result(message)
+                return  # solicited — do NOT emit to event bus
 
         await self._event_bus.emit(message)
 
+    def latency_stats(self) -> dict[str, LatencyHistogram]:
+        """Return a copy of the response-latency histogram of every expected field."""
+        return {name: copy.deepcopy(histogram) for name, histogram in self._latency.items()}
+
     def subscribe_unsolicited(self, handler: Callable[[Any], Awaitable[None]]) -> Subscription:
         """Subscribe to unsolicited (device-initiated) messages. Returns a Subscription RAII handle."""
         return self._event_bus.subscribe(handler)
 
     async def close(self) -> None:
         """Cancel all pending futures and clear state. Call on device shutdown."""
-        async with self._lock:
-            for pending in self._pending.values():
+        for waiters in self._pending.values():
+            for pending in waiters:
                 if not pending.future.done():
                     pending.future.cancel()
-            self._pending.clear()
+        self._pending.clear()
@@ -53,6 +53,7 @@ class _QueueItem:
     work: Callable[[], Awaitable[None]] = field(compare=False)
     skip_if_saga_active: bool = field(compare=False, default=False)
     dedup_key: str | None = field(compare=False, default=None)
+    on_shed: Callable[[], None] | None = field(compare=False, default=None)
     enqueued_at: float = field(compare=False, default_factory=time.monotonic)
 
 
@@ -90,6 +91,11 @@ class DeviceCommandQueue:
         #: Fired once the saga returns (success or failure).  Pair with ``on_saga_start``
         #: to restart the subscription after the saga yields the channel.
         self.on_saga_end: Callable[[], Awaitable[None]] | None = None
+        #: Account rate-limit admission, awaited just before a non-saga item is dispatched.
+        #: Returns False to shed the item (background work when the budget is spent);
+        #: may wait for a token.  Sagas bypass it: DeviceHandle.send_raw meters their
+        #: frames one by one against the account's saga bucket.
+        self.admit: Callable[[Priority], Awaitable[bool]] | None = None
 
     @property
     def is_saga_active(self) -> bool:
@@ -135,6 +141,7 @@ class DeviceCommandQueue:
         *,
         skip_if_saga_active: bool = False,
         dedup_key: str | None = None,
+        on_shed: Callable[[], None] | None = None,
     ) -> None:
         """Add work to the queue.
 
@@ -145,6 +152,9 @@ class DeviceCommandQueue:
         If dedup_key is given and an item with that key is already pending,
         the new item is silently dropped. Use for idempotent commands like
         RPT_START that should only be queued once at a time.
+
+        *on_shed* is called if the account rate limit sheds the item instead of
+        running it.
         """
         # EMERGENCY is never skipped or blocked
         if priority == Priority.EMERGENCY:
@@ -163,6 +173,7 @@ class DeviceCommandQueue:
             work=work,
             skip_if_saga_active=skip_if_saga_active,
             dedup_key=dedup_key,
+            on_shed=on_shed,
         )
         if dedup_key is not None:
             self._pending_dedup_keys.add(dedup_key)
@@ -266,6 +277,20 @@ class DeviceCommandQueue:
                 if item.priority > Priority.EMERGENCY:
                     await self._transport_gate.wait()
 
+                if (
+                    self.admit is not None
+                    and item.priority != Priority.EXCLUSIVE
+                    and not await self.admit(Priority(item.priority))
+                ):
+                    _logger.debug(
+                        "DeviceCommandQueue[%s]: account rate limit reached — shedding priority %d command",
+                        self._device_name,
+                        item.priority,
+                    )
+                    if item.on_shed is not None:
+                        item.on_shed()
+                    continue
+
                 _gateway_timeout_max = 3
                 for _attempt in range(1, _gateway_timeout_max + 1):
                     try:
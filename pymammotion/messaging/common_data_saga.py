@@ -35,7 +35,7 @@ class CommonDataSaga(Saga):
 
     Frame 1 of a dynamics-line response signals a new mowing session on the
     device; the caller (``MammotionClient.get_dynamics_line``) replaces the
-    stored ``device.map.dynamics_line`` list with the assembled result.
+    stored ``device.map.dynamics_line`` buffer with the assembled result.
 
     Attributes:
         result: Assembled list of ``CommDataCouple`` points from all frames,
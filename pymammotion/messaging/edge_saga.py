@@ -5,7 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from pymammotion.data.model.hash_list import CommDataCouple, EdgePoints
+from pymammotion.data.model.hash_list import EdgePoints
+from pymammotion.data.model.point_buffer import PointBuffer
 from pymammotion.messaging.saga import Saga
 
 if TYPE_CHECKING:
@@ -92,7 +93,7 @@ class EdgeMappingSaga(Saga):
                 else:
                     existing.total_frame = edge_msg.total_frame
 
-                points = [CommDataCouple(x=p.x, y=p.y) for p in edge_msg.data_couple]
+                points = PointBuffer(edge_msg.data_couple)
                 existing.frames[edge_msg.current_frame] = points
 
                 _logger.debug(
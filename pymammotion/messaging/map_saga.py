@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, Any
 
 from pymammotion.data.model.hash_list import AreaHashNameList, HashList
 from pymammotion.messaging.saga import Saga
-from pymammotion.messaging.transfers import ack_stream
+from pymammotion.messaging.transfers import SendWindow, ack_stream
 from pymammotion.transport.base import CommandTimeoutError
 
 if TYPE_CHECKING:
@@ -18,6 +18,10 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+#: Consecutive completed data items that leave the incomplete-hash count unchanged
+#: before step 4 gives up as stalled.
+_NO_PROGRESS_LIMIT = 10
+
 
 class MapFetchSaga(Saga):
     """Fetches the full device map: area names (non-Luba1), hash list, and all chunk data.
@@ -25,7 +29,8 @@ class MapFetchSaga(Saga):
     Execution order:
       1. Area names (non-Luba1) — re-requested on every run including retries.
       2-3. Root hash list frames (all sub_cmd=0 hashes)
-      4. Boundary/obstacle/path data for every hash ID in the list
+      4. Boundary/obstacle/path data for every hash ID in the list — one hash
+         at a time, or several at once when ``pipeline_window`` > 1
 
     Steps 2-4 use subscribe_unsolicited so that device-pushed frames are never
     dropped due to a race between receiving and registering a send_and_wait.
@@ -66,6 +71,8 @@ class MapFetchSaga(Saga):
         get_bol_hash: Callable[[], int | None] | None = None,
         sync_type: int = 3,
         skip_area_names: bool = False,
+        pipeline_window: int = 1,
+        on_strict_fallback: Callable[[], None] | None = None,
     ) -> None:
         """Initialise the saga with device info and transport helpers.
 
@@ -86,6 +93,12 @@ class MapFetchSaga(Saga):
         implying the full Luba-1 profile.  Use this for incremental updates
         during mowing where area names haven't changed and the device may not
         respond to the area-name query while busy.
+
+        *pipeline_window* > 1 opts into the pipelined step 4: that many hashes
+        are requested ahead and acks are sent without waiting for each round
+        trip (see :meth:`_fetch_hash_data_pipelined`).  The default of 1 keeps
+        the strict one-hash-at-a-time protocol.  *on_strict_fallback* is called
+        if the device stalls under pipelining and the saga reverts to strict.
         """
         self._device_id = device_id
         self._device_name = device_name
@@ -96,6 +109,8 @@ class MapFetchSaga(Saga):
         self._get_map = get_map
         self._get_bol_hash = get_bol_hash or (lambda: None)
         self._sync_type = sync_type  # 2 = BLE, 3 = IoT/MQTT
+        self._pipeline_window = max(1, pipeline_window)
+        self._on_strict_fallback = on_strict_fallback
 
         # Result — set on success, None until then
         self.result: HashList | None = None
@@ -232,97 +247,10 @@ class MapFetchSaga(Saga):
         #      restarts from frame 1.
         # ------------------------------------------------------------------
         with self._collect_frames(broker, self._COMM_FIELDS) as comm_queue:
-            _no_progress_limit = 10
-            no_progress = 0
-
-            # ``find_incomplete_hashes`` includes BOTH never-started hashes AND
-            # key-present-but-missing-frames hashes.  This is critical for saga
-            # resume — a previous run that got interrupted mid-area will have
-            # added a partial FrameList to ``device.map.area[hash]``; the saga
-            # must re-send ``synchronize_hash_data`` so the device re-streams
-            # the missing frames from scratch.
-            missing_hashes = self._get_map().find_incomplete_hashes(0)
-            current_hash: int | None = None
-            # Saga-local tracker of hashes whose `current_frame == total_frame`
-            # transaction we've observed.  Used to advance current_hash even
-            # when ``find_incomplete_hashes`` doesn't realise a hash is done
-            # (e.g. radar-only types like 23 that have no PathType entry).
-            addressed_hashes: set[int] = set()
-
-            if missing_hashes:
-                # Re-sync before the first per-hash request for the same reason as the
-                # root-list step — keep the device responsive when step 4 begins.
-                await self._send_ble_sync()
-                current_hash = missing_hashes[0]
-                _logger.debug("MapFetchSaga[%s]: fetching data for hash %d", self._device_name, current_hash)
-                cmd = self._command_builder.synchronize_hash_data(hash_num=current_hash)
-                await self._send_command(cmd)
-
-            while missing_hashes:
-                response = await self._next_frame(
-                    comm_queue, f"toapp_get_commondata_ack or toapp_svg_msg {current_hash}"
-                )
-
-                # State reducer has already applied this frame to device.map.
-                _comm_frame = self.extract_nav_frame(response, self._COMM_FIELDS)
-                if _comm_frame is None:
-                    continue
-                leaf_name, leaf_val = _comm_frame
-
-                # Ack every received frame, unconditionally and before any advancement
-                # logic — the ack tells the device "got this frame, send the next", so
-                # acking is what keeps the stream flowing regardless of which hash the
-                # frame is for.  Unlike the APK (HashDataManager.setRegionalData :1218
-                # suppresses the ack for a frame already in ``areaListMap``) we do NOT
-                # dedup — re-acking is idempotent, and acking unrelated/stale frames
-                # (dynamics_line type=18 mid-fetch, leftovers from a previous request)
-                # drains them so the device stops retransmitting with an incrementing
-                # ``dataHash`` and flooding MQTT.
-                await self._send_command(self._ack_frame(leaf_name, leaf_val))
-
-                # Ignore frames for hashes we aren't fetching right now (the device
-                # replays old data while processing our request, which would reset the
-                # step timeout without progress — APK setRegionalData :1245).
-                if not self._in_scope(leaf_name, leaf_val, missing_hashes, current_hash):
-                    continue
-
-                # Track per-hash completion locally so the advancement decision doesn't
-                # rely solely on find_incomplete_hashes (which can miss radar/unknown
-                # types — see addressed_hashes init comment).
-                frame_hash, parent_hash = self._frame_scope_hashes(leaf_name, leaf_val)
-                if leaf_val.current_frame >= leaf_val.total_frame and leaf_val.total_frame > 0:
-                    addressed_hashes.add(frame_hash)
-                    if leaf_name == "toapp_svg_msg":
-                        addressed_hashes.add(parent_hash)
-
-                if self._get_map().missing_frame(leaf_val):
-                    # More frames still needed for this transaction — the device sends
-                    # the next one in response to the ack above.
-                    continue
-
-                # Data item complete.  Drain any sibling frames for current_hash already
-                # queued (area boundary + SVG tiles arrive together) so area completion
-                # doesn't advance current_hash before the SVG tile is processed.
-                await self._drain_current_hash_frames(comm_queue, current_hash)
-
-                # Check whether the whole hash is done.  Filter find_incomplete_hashes by
-                # addressed_hashes so a hash whose only frame had an unknown type (e.g.
-                # radar type=23) doesn't keep us pinned to the same current_hash.
-                new_missing = [h for h in self._get_map().find_incomplete_hashes(0) if h not in addressed_hashes]
-                if len(new_missing) < len(missing_hashes):
-                    no_progress = 0
-                else:
-                    no_progress += 1
-                    if no_progress >= _no_progress_limit:
-                        raise CommandTimeoutError("map_sync_stall", no_progress)
-                missing_hashes = new_missing
-                # Only send synchronize_hash_data when moving to a new hash.
-                # Re-sending for the current hash would restart device streaming from frame 1.
-                if missing_hashes and missing_hashes[0] != current_hash:
-                    current_hash = missing_hashes[0]
-                    _logger.debug("MapFetchSaga[%s]: fetching data for hash %d", self._device_name, current_hash)
-                    cmd = self._command_builder.synchronize_hash_data(hash_num=current_hash)
-                    await self._send_command(cmd)
+            if self._pipeline_window > 1:
+                await self._fetch_hash_data_pipelined(comm_queue)
+            else:
+                await self._fetch_hash_data_strict(comm_queue)
 
         # If the device never returned area names and no names have been set yet,
         # fill in fallbacks from fetched area hashes.
@@ -346,6 +274,188 @@ class MapFetchSaga(Saga):
         )
         self.result = current_map
 
+    async def _fetch_hash_data_strict(self, comm_queue: asyncio.Queue[Any]) -> None:
+        """Step 4, one hash at a time: request it, ack each frame, move on once it is complete."""
+        no_progress = 0
+
+        # ``find_incomplete_hashes`` includes BOTH never-started hashes AND
+        # key-present-but-missing-frames hashes.  This is critical for saga
+        # resume — a previous run that got interrupted mid-area will have
+        # added a partial FrameList to ``device.map.area[hash]``; the saga
+        # must re-send ``synchronize_hash_data`` so the device re-streams
+        # the missing frames from scratch.
+        missing_hashes = self._get_map().find_incomplete_hashes(0)
+        current_hash: int | None = None
+        # Saga-local tracker of hashes whose `current_frame == total_frame`
+        # transaction we've observed.  Used to advance current_hash even
+        # when ``find_incomplete_hashes`` doesn't realise a hash is done
+        # (e.g. radar-only types like 23 that have no PathType entry).
+        addressed_hashes: set[int] = set()
+
+        if missing_hashes:
+            # Re-sync before the first per-hash request for the same reason as the
+            # root-list step — keep the device responsive when step 4 begins.
+            await self._send_ble_sync()
+            current_hash = missing_hashes[0]
+            _logger.debug("MapFetchSaga[%s]: fetching data for hash %d", self._device_name, current_hash)
+            cmd = self._command_builder.synchronize_hash_data(hash_num=current_hash)
+            await self._send_command(cmd)
+
+        while missing_hashes:
+            response = await self._next_frame(comm_queue, f"toapp_get_commondata_ack or toapp_svg_msg {current_hash}")
+
+            # State reducer has already applied this frame to device.map.
+            _comm_frame = self.extract_nav_frame(response, self._COMM_FIELDS)
+            if _comm_frame is None:
+                continue
+            leaf_name, leaf_val = _comm_frame
+
+            # Ack every received frame, unconditionally and before any advancement
+            # logic — the ack tells the device "got this frame, send the next", so
+            # acking is what keeps the stream flowing regardless of which hash the
+            # frame is for.  Unlike the APK (HashDataManager.setRegionalData :1218
+            # suppresses the ack for a frame already in ``areaListMap``) we do NOT
+            # dedup — re-acking is idempotent, and acking unrelated/stale frames
+            # (dynamics_line type=18 mid-fetch, leftovers from a previous request)
+            # drains them so the device stops retransmitting with an incrementing
+            # ``dataHash`` and flooding MQTT.
+            await self._send_command(self._ack_frame(leaf_name, leaf_val))
+
+            # Ignore frames for hashes we aren't fetching right now (the device
+            # replays old data while processing our request, which would reset the
+            # step timeout without progress — APK setRegionalData :1245).
+            if not self._in_scope(leaf_name, leaf_val, missing_hashes, current_hash):
+                continue
+
+            # Track per-hash completion locally so the advancement decision doesn't
+            # rely solely on find_incomplete_hashes (which can miss radar/unknown
+            # types — see addressed_hashes init comment).
+            frame_hash, parent_hash = self._frame_scope_hashes(leaf_name, leaf_val)
+            if leaf_val.current_frame >= leaf_val.total_frame and leaf_val.total_frame > 0:
+                addressed_hashes.add(frame_hash)
+                if leaf_name == "toapp_svg_msg":
+                    addressed_hashes.add(parent_hash)
+
+            if self._get_map().missing_frame(leaf_val):
+                # More frames still needed for this transaction — the device sends
+                # the next one in response to the ack above.
+                continue
+
+            # Data item complete.  Drain any sibling frames for current_hash already
+            # queued (area boundary + SVG tiles arrive together) so area completion
+            # doesn't advance current_hash before the SVG tile is processed.
+            await self._drain_current_hash_frames(comm_queue, current_hash)
+
+            # Check whether the whole hash is done.  Filter find_incomplete_hashes by
+            # addressed_hashes so a hash whose only frame had an unknown type (e.g.
+            # radar type=23) doesn't keep us pinned to the same current_hash.
+            new_missing = [h for h in self._get_map().find_incomplete_hashes(0) if h not in addressed_hashes]
+            if len(new_missing) < len(missing_hashes):
+                no_progress = 0
+            else:
+                no_progress += 1
+                if no_progress >= _NO_PROGRESS_LIMIT:
+                    raise CommandTimeoutError("map_sync_stall", no_progress)
+            missing_hashes = new_missing
+            # Only send synchronize_hash_data when moving to a new hash.
+            # Re-sending for the current hash would restart device streaming from frame 1.
+            if missing_hashes and missing_hashes[0] != current_hash:
+                current_hash = missing_hashes[0]
+                _logger.debug("MapFetchSaga[%s]: fetching data for hash %d", self._device_name, current_hash)
+                cmd = self._command_builder.synchronize_hash_data(hash_num=current_hash)
+                await self._send_command(cmd)
+
+    async def _fetch_hash_data_pipelined(self, comm_queue: asyncio.Queue[Any]) -> None:
+        """Step 4 with up to ``pipeline_window`` hashes streaming at once.
+
+        Over the cloud every ack and request is a full invoke round trip, and the
+        strict loop pays them back to back.  Here the next hashes are requested
+        before the current one finishes, and acks go out through a
+        :class:`SendWindow` so the loop reads the next frame while earlier
+        round trips are still in flight.  Each hash stream is still paced by
+        its own acks — the device sends frame N+1 of a hash only after the echo
+        of frame N — so what overlaps is the streams, not frames within one.
+
+        Firmware that does not serve concurrent streams shows up as a step
+        timeout.  The saga then drops to the strict loop for the rest of its
+        attempts and calls ``on_strict_fallback`` so the caller can remember it.
+        """
+        window = self._pipeline_window
+        missing_hashes = self._get_map().find_incomplete_hashes(0)
+        requested: set[int] = set()
+        in_flight: list[int] = []
+        addressed_hashes: set[int] = set()
+        no_progress = 0
+        try:
+            async with SendWindow(self._send_command, window) as sender:
+
+                async def _fill_window() -> None:
+                    for hash_id in missing_hashes:
+                        if len(in_flight) >= window:
+                            return
+                        if hash_id not in requested:
+                            requested.add(hash_id)
+                            in_flight.append(hash_id)
+                            _logger.debug("MapFetchSaga[%s]: fetching data for hash %d", self._device_name, hash_id)
+                            await sender.send(self._command_builder.synchronize_hash_data(hash_num=hash_id))
+
+                if missing_hashes:
+                    await self._send_ble_sync()
+                    await _fill_window()
+
+                while missing_hashes:
+                    response = await self._next_frame(
+                        comm_queue, f"toapp_get_commondata_ack or toapp_svg_msg {in_flight}"
+                    )
+                    _comm_frame = self.extract_nav_frame(response, self._COMM_FIELDS)
+                    if _comm_frame is None:
+                        continue
+                    leaf_name, leaf_val = _comm_frame
+
+                    # Acked unconditionally, as in the strict loop.
+                    await sender.send(self._ack_frame(leaf_name, leaf_val))
+
+                    frame_hash, parent_hash = self._frame_scope_hashes(leaf_name, leaf_val)
+                    if frame_hash not in requested and not (leaf_name == "toapp_svg_msg" and parent_hash in requested):
+                        continue
+                    if leaf_val.current_frame >= leaf_val.total_frame and leaf_val.total_frame > 0:
+                        addressed_hashes.add(frame_hash)
+                        if leaf_name == "toapp_svg_msg":
+                            addressed_hashes.add(parent_hash)
+
+                    if self._get_map().missing_frame(leaf_val):
+                        continue
+
+                    new_missing = [h for h in self._get_map().find_incomplete_hashes(0) if h not in addressed_hashes]
+                    if len(new_missing) < len(missing_hashes):
+                        no_progress = 0
+                    else:
+                        no_progress += 1
+                        if no_progress >= _NO_PROGRESS_LIMIT:
+                            raise CommandTimeoutError("map_sync_stall", no_progress)
+                    missing_hashes = new_missing
+                    still_missing = set(new_missing)
+                    in_flight[:] = [h for h in in_flight if h in still_missing]
+                    await _fill_window()
+
+                # The reducer applies frames before they reach the queue, so the map
+                # can read complete while other streams' last frames are still queued
+                # unacked — ack them too, or the device keeps retransmitting.
+                while not comm_queue.empty():
+                    queued = self.extract_nav_frame(comm_queue.get_nowait(), self._COMM_FIELDS)
+                    if queued is not None:
+                        await sender.send(self._ack_frame(*queued))
+        except CommandTimeoutError:
+            _logger.warning(
+                "MapFetchSaga[%s]: pipelined fetch (window %d) stalled — falling back to one hash at a time",
+                self._device_name,
+                window,
+            )
+            self._pipeline_window = 1
+            if self._on_strict_fallback is not None:
+                self._on_strict_fallback()
+            raise
+
     def _ack_frame(self, leaf_name: str, leaf_val: Any) -> bytes:
         """Build the per-frame ack for a comm-data (get_regional_data) or SVG (send_svg_response) frame."""
         if leaf_name == "toapp_svg_msg":
@@ -6,10 +6,9 @@ import logging
 import time
 from typing import TYPE_CHECKING, Any
 
-import betterproto2
-
 from pymammotion.data.model import GenerateRouteInformation
 from pymammotion.data.model.hash_list import HashList, MowPath
+from pymammotion.data.model.proto_convert import from_proto
 from pymammotion.messaging.saga import Saga
 from pymammotion.messaging.transfers import ack_stream
 from pymammotion.transport.base import CommandTimeoutError, SagaFailedError
@@ -154,9 +153,12 @@ class MowPathSaga(Saga):
             # breakpoint lines — a legitimate empty answer, not a failure.  We then
             # fall through to the zone_hashs fallback at the sub_cmd=3 check below.
             # Silence *mid*-stream still raises, since that is a real interruption.
+            # ``field`` must be the bare leaf name: ack_stream unwraps each frame by
+            # it, and any other string matches nothing — every frame then reads as
+            # "no response" and goes unacked, so a multi-frame list stops at frame 1.
             line_frames = await ack_stream(
                 hash_ack_queue,
-                field="toapp_gethash_ack(sub_cmd=3)",
+                field="toapp_gethash_ack",
                 ack=_ack,
                 timeout=self.step_timeout,
                 allow_empty=True,
@@ -248,9 +250,6 @@ class MowPathSaga(Saga):
 
         _NO_PROGRESS_LIMIT = 10
 
-        def _missing_frame_count() -> int:
-            return sum(len(v) for v in self._get_map().find_missing_mow_path_frames().values())
-
         with self._collect_frames(broker, "cover_path_upload") as path_queue:
             # Re-sync before the cover-path fetch begins — same reasoning as the route step.
             await self._send_ble_sync()
@@ -271,7 +270,7 @@ class MowPathSaga(Saga):
                 # (duplicates, stale tx, etc.).  Counter resets at the start of each batch so
                 # the first frame of a new batch (which inflates missing as the tx is created)
                 # is never the one that trips the guard.
-                prev_missing = _missing_frame_count()
+                prev_missing = self._get_map().missing_mow_path_frame_count()
                 no_progress = 0
 
                 while True:
@@ -279,7 +278,7 @@ class MowPathSaga(Saga):
 
                     path_frame = self.extract_nav_frame(frame_response, "cover_path_upload")
                     assert path_frame is not None  # noqa: S101 — the collector already filtered on this field
-                    mow_path = MowPath.from_dict(path_frame[1].to_dict(casing=betterproto2.Casing.SNAKE))
+                    mow_path = from_proto(MowPath, path_frame[1])
 
                     if mow_path.transaction_id not in current_run_tx_ids:
                         _logger.debug(
@@ -299,7 +298,7 @@ class MowPathSaga(Saga):
                         len(hash_batches),
                     )
 
-                    new_missing = _missing_frame_count()
+                    new_missing = self._get_map().missing_mow_path_frame_count()
                     if new_missing < prev_missing:
                         no_progress = 0
                     else:
@@ -308,7 +307,7 @@ class MowPathSaga(Saga):
                             raise CommandTimeoutError("mow_path_stall", no_progress)
                     prev_missing = new_missing
 
-                    if not self._get_map().find_missing_mow_path_frames():
+                    if new_missing == 0:
                         break
 
         self.result = self._get_map().current_mow_path
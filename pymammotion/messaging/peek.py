@@ -0,0 +1,173 @@
+"""Wire-level peek at a LubaMsg: which sub-message and leaf it carries, without a full parse.
+
+``LubaMsg().parse`` decodes every nested field — for a map frame that is
+hundreds of ``CommDataCouple`` objects — before anything knows what the
+frame is.  :func:`peek_luba_msg` walks only the protobuf tags: the envelope's
+scalar fields are skipped, the ``LubaSubMsg`` field is located, and the first
+oneof field inside it names the leaf (``toapp_report_data``,
+``toapp_get_commondata_ack``, …).  No payload bytes are copied.
+
+Field numbers are taken from the generated classes' betterproto2 metadata,
+so the tables follow the ``.proto`` files without being maintained by hand.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+
+from pymammotion.proto import LubaMsg
+
+# Protobuf wire types.
+_VARINT = 0
+_FIXED64 = 1
+_LEN = 2
+_FIXED32 = 5
+
+# LubaMsg envelope fields that must be varints (enum fields).  A payload that
+# carries them with any other wire type is not a LubaMsg — the full parse
+# would accept it and fill the field with garbage (see DeviceHandle.on_raw_message).
+_ENVELOPE_ENUM_FIELDS = frozenset({1, 2, 3, 4})
+
+#: Leaves whose full decode is expensive (point lists, path uploads, hash lists).
+BULKY_LEAVES: frozenset[str] = frozenset(
+    {
+        "toapp_get_commondata_ack",
+        "cover_path_upload",
+        "toapp_svg_msg",
+        "toapp_edge_points",
+        "toapp_gethash_ack",
+        "bidire_reqconver_path",
+    }
+)
+
+
+class _PeekError(ValueError):
+    """The wire bytes are not well-formed protobuf."""
+
+
+@dataclass(frozen=True, slots=True)
+class LubaMsgPeek:
+    """What a LubaMsg frame carries, read from its tags alone.
+
+    Attributes:
+        sub_msg: ``LubaSubMsg`` field name (``"nav"``, ``"sys"``, …), or None if unset.
+        leaf: Oneof field name inside the sub-message (``"toapp_report_data"``), or None.
+        size: Payload length in bytes.
+
+    """
+
+    sub_msg: str | None
+    leaf: str | None
+    size: int
+
+    @property
+    def is_bulky(self) -> bool:
+        """Return True for leaves that are expensive to decode (map and path frames)."""
+        return self.leaf in BULKY_LEAVES
+
+    def __str__(self) -> str:
+        """Return ``sub_msg.leaf`` (or ``?`` for missing parts) and the size."""
+        return f"{self.sub_msg or '?'}.{self.leaf or '?'} ({self.size} bytes)"
+
+
+@cache
+def _sub_msg_fields() -> dict[int, tuple[str, type]]:
+    """Map each ``LubaSubMsg`` field number to its name and message class."""
+    meta = LubaMsg._betterproto  # noqa: SLF001
+    return {
+        field.number: (name, meta.cls_by_field[name])
+        for name, field in meta.meta_by_field_name.items()
+        if field.group == "LubaSubMsg"
+    }
+
+
+@cache
+def _oneof_fields(cls: type) -> dict[int, str]:
+    """Map each oneof member's field number to its name for sub-message *cls*."""
+    meta = cls._betterproto  # type: ignore[attr-defined]
+    return {field.number: name for name, field in meta.meta_by_field_name.items() if field.group is not None}
+
+
+def _read_varint(buf: memoryview, pos: int) -> tuple[int, int]:
+    """Decode the varint at *pos*; return ``(value, next_pos)``."""
+    result = 0
+    shift = 0
+    end = len(buf)
+    while pos < end:
+        byte = buf[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+        if shift >= 64:
+            break
+    msg = "truncated or oversized varint"
+    raise _PeekError(msg)
+
+
+def _skip(buf: memoryview, pos: int, wire_type: int) -> int:
+    """Return the position just past a field value of *wire_type* starting at *pos*."""
+    if wire_type == _VARINT:
+        return _read_varint(buf, pos)[1]
+    if wire_type == _LEN:
+        length, pos = _read_varint(buf, pos)
+        end = pos + length
+    elif wire_type == _FIXED64:
+        end = pos + 8
+    elif wire_type == _FIXED32:
+        end = pos + 4
+    else:
+        msg = f"unsupported wire type {wire_type}"
+        raise _PeekError(msg)
+    if end > len(buf):
+        msg = "field runs past end of buffer"
+        raise _PeekError(msg)
+    return end
+
+
+def _first_oneof(buf: memoryview, cls: type) -> str | None:
+    """Return the name of the first oneof member present in the encoded *cls* message."""
+    members = _oneof_fields(cls)
+    pos = 0
+    end = len(buf)
+    while pos < end:
+        tag, pos = _read_varint(buf, pos)
+        if (name := members.get(tag >> 3)) is not None:
+            return name
+        pos = _skip(buf, pos, tag & 0x7)
+    return None
+
+
+def peek_luba_msg(payload: bytes | bytearray | memoryview) -> LubaMsgPeek | None:
+    """Identify the sub-message and leaf of an encoded LubaMsg without decoding it.
+
+    Returns None when *payload* is not well-formed protobuf or its envelope
+    enum fields carry the wrong wire type — i.e. it is not a LubaMsg frame.
+    """
+    buf = memoryview(payload)
+    sub_fields = _sub_msg_fields()
+    sub_msg: str | None = None
+    leaf: str | None = None
+    pos = 0
+    end = len(buf)
+    try:
+        while pos < end:
+            tag, pos = _read_varint(buf, pos)
+            number, wire_type = tag >> 3, tag & 0x7
+            if number in _ENVELOPE_ENUM_FIELDS and wire_type != _VARINT:
+                return None
+            if (sub := sub_fields.get(number)) is not None and wire_type == _LEN:
+                length, start = _read_varint(buf, pos)
+                pos = start + length
+                if pos > end:
+                    return None
+                # Last occurrence wins, as in a full parse.
+                sub_msg = sub[0]
+                leaf = _first_oneof(buf[start:pos], sub[1])
+                continue
+            pos = _skip(buf, pos, wire_type)
+    except _PeekError:
+        return None
+    return LubaMsgPeek(sub_msg=sub_msg, leaf=leaf, size=end)
@@ -5,9 +5,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-import betterproto2
-
 from pymammotion.data.model.hash_list import Plan
+from pymammotion.data.model.proto_convert import from_proto
 from pymammotion.messaging.saga import Saga
 from pymammotion.messaging.transfers import indexed_fetch
 
@@ -62,10 +61,10 @@ class PlanFetchSaga(Saga):
                 plan_queue,
                 field="todev_planjob_set",
                 request=_request,
-                total_of=lambda f: Plan.from_dict(f.to_dict(casing=betterproto2.Casing.SNAKE)).total_plan_num,
+                total_of=lambda f: from_proto(Plan, f).total_plan_num,
                 timeout=self.step_timeout,
             ):
-                plan = Plan.from_dict(wire.to_dict(casing=betterproto2.Casing.SNAKE))
+                plan = from_proto(Plan, wire)
                 if plan.plan_id:
                     self.result[plan.plan_id] = plan
 
@@ -21,13 +21,17 @@ Two shapes are covered:
 ``indexed_fetch``
     The app asks for item *i* and the device answers with exactly one frame.
     Used for stored plans, where the first response carries the total.
+
+:class:`SendWindow` is the one shared piece of pipelining: it lets a saga keep
+several sends (acks, next-item requests) in flight instead of awaiting each
+cloud round trip before reading the next frame.
 """
 
 from __future__ import annotations
 
 import asyncio
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Self
 
 import betterproto2
 
@@ -35,6 +39,7 @@ from pymammotion.transport.base import CommandTimeoutError
 
 if TYPE_CHECKING:
     from collections.abc import AsyncIterator, Awaitable, Callable
+    from types import TracebackType
 
 _logger = logging.getLogger(__name__)
 
@@ -210,3 +215,70 @@ async def indexed_fetch(
         _logger.debug("indexed_fetch(%s): requesting %d/%d", field, index + 1, total)
         await request(index)
         yield await _await_frame(queue, field=field, envelope=envelope, timeout=timeout, current_frame=index + 1)
+
+
+class SendWindow:
+    """Run up to *size* sends concurrently; used as an async context manager.
+
+    :meth:`send` returns as soon as the payload is dispatched, blocking only
+    while *size* earlier sends are still awaiting their round trip, so the
+    caller can go back to reading frames.  A failed send is re-raised from the
+    next :meth:`send` call, or on exit.  Leaving the block normally waits for
+    every outstanding send; leaving it with an exception cancels them.
+
+    With ``size == 1`` each send is awaited before the next starts — the
+    strict, one-round-trip-at-a-time behaviour.
+    """
+
+    def __init__(self, send: Callable[[bytes], Awaitable[None]], size: int) -> None:
+        """Wrap *send*, allowing *size* (at least 1) round trips in flight."""
+        self._send = send
+        self._slots = asyncio.Semaphore(max(1, size))
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._failure: BaseException | None = None
+
+    async def __aenter__(self) -> Self:
+        """Return the window."""
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        """Wait for outstanding sends, or cancel them if the block raised."""
+        if exc is not None:
+            for task in self._tasks:
+                task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if exc is None:
+            self._raise_failure()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of sends dispatched but not yet finished."""
+        return len(self._tasks)
+
+    async def send(self, payload: bytes) -> None:
+        """Dispatch *payload*, waiting only for a free slot."""
+        self._raise_failure()
+        await self._slots.acquire()
+        task = asyncio.get_running_loop().create_task(self._run(payload))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run(self, payload: bytes) -> None:
+        try:
+            await self._send(payload)
+        except Exception as exc:  # noqa: BLE001 — surfaced to the caller by _raise_failure
+            if self._failure is None:
+                self._failure = exc
+        finally:
+            self._slots.release()
+
+    def _raise_failure(self) -> None:
+        if self._failure is not None:
+            failure, self._failure = self._failure, None
+            raise failure
@@ -0,0 +1,48 @@
+"""Offline fleet simulator: virtual mowers speaking LubaMsg over an in-process broker.
+
+Register a few hundred simulated devices on a real ``MammotionClient`` to
+measure throughput, saga latency and memory per device without hardware::
+
+    from pymammotion.simulator import SimulatedFleet
+
+    fleet = SimulatedFleet(client)
+    await fleet.spawn(300)
+    fleet.start_telemetry()
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pymammotion.utility.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pymammotion.simulator.broker import BrokerStats, InProcessBroker, SimulatedTransport
+    from pymammotion.simulator.fleet import SimulatedFleet
+    from pymammotion.simulator.maps import SimulatedMap, synthetic_map
+    from pymammotion.simulator.mower import VirtualMower, VirtualMowerStats
+
+__all__ = [
+    "BrokerStats",
+    "InProcessBroker",
+    "SimulatedFleet",
+    "SimulatedMap",
+    "SimulatedTransport",
+    "VirtualMower",
+    "VirtualMowerStats",
+    "synthetic_map",
+]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "BrokerStats": ".broker",
+        "InProcessBroker": ".broker",
+        "SimulatedTransport": ".broker",
+        "SimulatedFleet": ".fleet",
+        "SimulatedMap": ".maps",
+        "synthetic_map": ".maps",
+        "VirtualMower": ".mower",
+        "VirtualMowerStats": ".mower",
+    },
+)
@@ -0,0 +1,219 @@
+"""In-process stand-in for the cloud MQTT broker and the client transport that talks to it.
+
+:class:`InProcessBroker` plays the cloud: it routes app → device commands to
+the :class:`~pymammotion.simulator.mower.VirtualMower` attached under the
+target iot_id, and device → app frames to every connected
+:class:`SimulatedTransport`.  Payloads cross it as serialised ``LubaMsg``
+bytes, exactly as they would over the real broker.
+
+Each mower has an inbox worked by its own task, so a slow consumer on one
+mower never holds up another, and commands reach each mower in send order.
+An optional fixed *latency* delays every command, modelling the invoke round
+trip without any randomness.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass
+import logging
+from typing import TYPE_CHECKING
+
+from pymammotion.aliyun.exceptions import DeviceOfflineException
+from pymammotion.transport.base import Transport, TransportAvailability, TransportError, TransportType
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pymammotion.simulator.mower import VirtualMower
+
+_logger = logging.getLogger(__name__)
+
+#: Code carried by the DeviceOfflineException raised for an unknown iot_id (Aliyun's "device offline").
+_DEVICE_OFFLINE_CODE = 6205
+
+
+@dataclass(frozen=True)
+class BrokerStats:
+    """Traffic through an :class:`InProcessBroker`.
+
+    Attributes:
+        devices:       Mowers attached.
+        to_device:     Commands delivered to mowers.
+        to_app:        Frames delivered to transports.
+        bytes_to_app:  Total payload bytes of those frames.
+        queued:        Commands waiting in mower inboxes right now.
+
+    """
+
+    devices: int
+    to_device: int
+    to_app: int
+    bytes_to_app: int
+    queued: int
+
+
+class InProcessBroker:
+    """Routes ``LubaMsg`` bytes between simulated transports and virtual mowers."""
+
+    def __init__(self, *, latency: float = 0.0) -> None:
+        """Create an empty broker; *latency* seconds delay every app → device command."""
+        self.latency = latency
+        self._mowers: dict[str, VirtualMower] = {}
+        self._inboxes: dict[str, asyncio.Queue[bytes]] = {}
+        self._workers: dict[str, asyncio.Task[None]] = {}
+        self._transports: list[SimulatedTransport] = []
+        self._to_device = 0
+        self._to_app = 0
+        self._bytes_to_app = 0
+
+    @property
+    def mowers(self) -> list[VirtualMower]:
+        """Attached mowers, in attach order."""
+        return list(self._mowers.values())
+
+    def attach(self, mower: VirtualMower) -> None:
+        """Bring *mower* online under its iot_id."""
+        iot_id = mower.iot_id
+
+        async def _publish(payload: bytes) -> None:
+            await self._deliver(iot_id, payload)
+
+        mower.publish = _publish
+        self._mowers[iot_id] = mower
+        inbox: asyncio.Queue[bytes] = asyncio.Queue()
+        self._inboxes[iot_id] = inbox
+        self._workers[iot_id] = asyncio.get_running_loop().create_task(self._work(mower, inbox))
+
+    async def detach(self, iot_id: str) -> None:
+        """Take a mower offline; commands to it then raise DeviceOfflineException."""
+        mower = self._mowers.pop(iot_id, None)
+        self._inboxes.pop(iot_id, None)
+        if mower is not None:
+            mower.publish = None
+        if (worker := self._workers.pop(iot_id, None)) is not None:
+            worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await worker
+
+    async def close(self) -> None:
+        """Detach every mower."""
+        for iot_id in list(self._mowers):
+            await self.detach(iot_id)
+
+    def subscribe(self, transport: SimulatedTransport) -> None:
+        """Start delivering device frames to *transport*."""
+        if transport not in self._transports:
+            self._transports.append(transport)
+
+    def unsubscribe(self, transport: SimulatedTransport) -> None:
+        """Stop delivering device frames to *transport*."""
+        if transport in self._transports:
+            self._transports.remove(transport)
+
+    def publish_to_device(self, iot_id: str, payload: bytes) -> None:
+        """Queue *payload* for the mower behind *iot_id*, after the broker's latency."""
+        inbox = self._inboxes.get(iot_id)
+        if inbox is None:
+            raise DeviceOfflineException(_DEVICE_OFFLINE_CODE, iot_id)
+        if self.latency > 0:
+            asyncio.get_running_loop().call_later(self.latency, inbox.put_nowait, payload)
+        else:
+            inbox.put_nowait(payload)
+
+    def stats(self) -> BrokerStats:
+        """Return a snapshot of the traffic counters."""
+        return BrokerStats(
+            devices=len(self._mowers),
+            to_device=self._to_device,
+            to_app=self._to_app,
+            bytes_to_app=self._bytes_to_app,
+            queued=sum(inbox.qsize() for inbox in self._inboxes.values()),
+        )
+
+    async def _work(self, mower: VirtualMower, inbox: asyncio.Queue[bytes]) -> None:
+        """Feed *mower* its commands one at a time, in arrival order."""
+        while True:
+            payload = await inbox.get()
+            self._to_device += 1
+            try:
+                await mower.handle(payload)
+            except Exception:
+                _logger.exception("VirtualMower[%s]: command handler failed", mower.device_name)
+
+    async def _deliver(self, iot_id: str, payload: bytes) -> None:
+        self._to_app += 1
+        self._bytes_to_app += len(payload)
+        for transport in self._transports:
+            await transport.deliver(iot_id, payload)
+
+
+class SimulatedTransport(Transport):
+    """Account-level cloud transport connected to an :class:`InProcessBroker`.
+
+    Stands in for :class:`~pymammotion.transport.mqtt.MQTTTransport`: one
+    instance serves every device of an account, ``send`` addresses a device
+    by iot_id, and inbound frames reach the client through
+    ``on_device_message(iot_id, payload)``.  The simulated cloud keeps no
+    send quota, so sends are not counted against one.
+    """
+
+    on_device_message: Callable[[str, bytes], Awaitable[None]] | None = None
+    on_device_notification: Callable[[str, str], Awaitable[None]] | None = None
+
+    def __init__(self, broker: InProcessBroker, transport_type: TransportType = TransportType.CLOUD_MAMMOTION) -> None:
+        """Create a disconnected transport on *broker*, posing as *transport_type*."""
+        super().__init__()
+        self._broker = broker
+        self._transport_type = transport_type
+        self._availability = TransportAvailability.DISCONNECTED
+
+    @property
+    def transport_type(self) -> TransportType:
+        """The cloud transport type this instance poses as."""
+        return self._transport_type
+
+    @property
+    def is_connected(self) -> bool:
+        """True while subscribed to the broker."""
+        return self._availability is TransportAvailability.CONNECTED
+
+    @property
+    def availability(self) -> TransportAvailability:
+        """Current availability state of this transport."""
+        return self._availability
+
+    async def connect(self) -> None:
+        """Subscribe to the broker and notify availability listeners."""
+        if self.is_connected:
+            return
+        self._broker.subscribe(self)
+        self._availability = TransportAvailability.CONNECTED
+        await self._fire_availability_listeners(self._availability)
+
+    async def disconnect(self) -> None:
+        """Unsubscribe from the broker.  Idempotent — every handle on the account calls it on stop."""
+        if not self.is_connected:
+            return
+        self._broker.unsubscribe(self)
+        self._availability = TransportAvailability.DISCONNECTED
+        await self._fire_availability_listeners(self._availability)
+
+    async def send(self, payload: bytes, iot_id: str = "", firmware_version: str = "1.0.0.0") -> None:  # noqa: ARG002 — Transport.send signature
+        """Hand *payload* to the broker for the device behind *iot_id*."""
+        if not self.is_connected:
+            msg = "SimulatedTransport.send() while disconnected"
+            raise TransportError(msg)
+        if not iot_id:
+            msg = "SimulatedTransport.send() requires a non-empty iot_id"
+            raise TransportError(msg)
+        self._broker.publish_to_device(iot_id, payload)
+
+    async def deliver(self, iot_id: str, payload: bytes) -> None:
+        """Receive a device frame from the broker and pass it to the client."""
+        self._mark_received()
+        if self.on_device_message is not None:
+            await self.on_device_message(iot_id, payload)
+        elif self.on_message is not None:
+            await self.on_message(payload)
@@ -0,0 +1,124 @@
+"""N virtual mowers registered on a real :class:`~pymammotion.client.MammotionClient`."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import TYPE_CHECKING
+
+from pymammotion.simulator.broker import InProcessBroker, SimulatedTransport
+from pymammotion.simulator.maps import SimulatedMap, synthetic_map
+from pymammotion.simulator.mower import VirtualMower
+
+if TYPE_CHECKING:
+    from pymammotion.account.rate_limit import AccountRateLimiter
+    from pymammotion.client import MammotionClient
+
+_logger = logging.getLogger(__name__)
+
+#: Seconds between telemetry frames — the 4 Hz rapid-state cadence of a mowing device.
+DEFAULT_TELEMETRY_INTERVAL = 0.25
+#: Device-name prefix of spawned mowers (a Luba 2 name, so the client builds a MowerDevice).
+DEFAULT_NAME_PREFIX = "Luba-VSsim"
+
+
+class SimulatedFleet:
+    """Spawn virtual mowers and register each on *client* as a cloud device.
+
+    The client sees ordinary devices behind one account-level transport: a
+    :class:`~pymammotion.device.handle.DeviceHandle` per mower, commands through
+    its queue and sagas, and frames through the state reducer.  Everything
+    stays in-process, so throughput, saga latency and memory per device can
+    be measured offline for a few hundred devices::
+
+        fleet = SimulatedFleet(client)
+        await fleet.spawn(200)
+        fleet.start_telemetry()
+        await client.start_map_sync(fleet.mowers[0].device_name)
+        ...
+        await fleet.stop()
+        await client.stop()
+
+    One ticker task drives the 4 Hz telemetry of every mower.
+    """
+
+    def __init__(
+        self,
+        client: MammotionClient,
+        broker: InProcessBroker | None = None,
+        *,
+        rate_limiter: AccountRateLimiter | None = None,
+    ) -> None:
+        """Attach to *client*; a broker with no latency is created when none is given."""
+        self.client = client
+        self.broker = broker if broker is not None else InProcessBroker()
+        self.transport = SimulatedTransport(self.broker)
+        self.mowers: list[VirtualMower] = []
+        self._rate_limiter = rate_limiter
+        self._telemetry_task: asyncio.Task[None] | None = None
+        client._wire_transport_callbacks(self.transport)  # noqa: SLF001
+
+    async def spawn(
+        self,
+        count: int,
+        sim_map: SimulatedMap | None = None,
+        *,
+        name_prefix: str = DEFAULT_NAME_PREFIX,
+        product_key: str = "",
+    ) -> list[VirtualMower]:
+        """Create *count* mowers serving *sim_map*, register them and connect the transport.
+
+        Mowers share *sim_map* (a :func:`~pymammotion.simulator.maps.synthetic_map`
+        by default).  Names and iot_ids continue numbering across calls.
+        """
+        sim_map = sim_map if sim_map is not None else synthetic_map()
+        spawned = []
+        for _ in range(count):
+            index = len(self.mowers)
+            mower = VirtualMower(f"{name_prefix}{index:05d}", f"sim-iot-{index:05d}", sim_map, index=index)
+            self.broker.attach(mower)
+            await self.client._register_device_on_transport(  # noqa: SLF001
+                device_name=mower.device_name,
+                iot_id=mower.iot_id,
+                product_key=product_key,
+                transport=self.transport,
+                user_account=0,
+                token_manager=None,
+                rate_limiter=self._rate_limiter,
+            )
+            self.mowers.append(mower)
+            spawned.append(mower)
+        # Connecting after registration fires CONNECTED to every new handle's listener.
+        await self.transport.connect()
+        _logger.debug("SimulatedFleet: spawned %d mower(s), %d total", count, len(self.mowers))
+        return spawned
+
+    def start_telemetry(self, interval: float = DEFAULT_TELEMETRY_INTERVAL) -> None:
+        """Stream ``system_tard_state_tunnel`` + ``toapp_report_data`` from every mower each *interval*."""
+        if self._telemetry_task is None or self._telemetry_task.done():
+            self._telemetry_task = asyncio.get_running_loop().create_task(self._telemetry_loop(interval))
+
+    async def stop_telemetry(self) -> None:
+        """Stop the telemetry ticker."""
+        task, self._telemetry_task = self._telemetry_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def stop(self) -> None:
+        """Stop telemetry, take every mower offline and disconnect the transport."""
+        await self.stop_telemetry()
+        await self.broker.close()
+        await self.transport.disconnect()
+
+    async def _telemetry_loop(self, interval: float) -> None:
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while True:
+            for mower in self.broker.mowers:
+                await mower.emit_telemetry()
+            # Fixed-rate schedule: a slow tick shortens the next sleep instead of drifting.
+            next_tick += interval
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
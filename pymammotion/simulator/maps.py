@@ -0,0 +1,159 @@
+"""Map and cover-path content served by a :class:`~pymammotion.simulator.mower.VirtualMower`.
+
+A :class:`SimulatedMap` is the device-side database a mower streams to the
+app: the root hash list, the boundary frames of every hash, the area names
+and the cover-path frames of every breakpoint line.  Frames are protobuf
+messages shared read-only by every mower serving the map, so a fleet of a
+few hundred mowers holds one copy of the geometry.
+
+Build one from a JSON capture (:meth:`SimulatedMap.from_capture`) or
+synthesise one (:func:`synthetic_map`).  Both are deterministic — no RNG, no
+clock.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from functools import cached_property
+import json
+import math
+from typing import TYPE_CHECKING
+
+from pymammotion.data.model.hash_list import PathType
+from pymammotion.proto import CommDataCouple, CoverPathPacketT, CoverPathUploadT, NavGetCommDataAck
+from pymammotion.utility.mur_mur_hash import MurMurHashUtil
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+#: First hash ID of a synthetic map's areas; obstacles and lines follow in their own ranges.
+SYNTHETIC_AREA_HASH_BASE = 1_000_000
+SYNTHETIC_OBSTACLE_HASH_BASE = 2_000_000
+SYNTHETIC_LINE_HASH_BASE = 3_000_000
+
+
+@dataclass(eq=False)
+class SimulatedMap:
+    """Everything a mower serves during map and mow-path syncs.
+
+    Attributes:
+        frames:      Root hash → its ``toapp_get_commondata_ack`` frames, in
+                     frame order.  Key order is the root hash list order.
+        names:       Area hash → name, answered to ``get_area_name_list``.
+        cover_paths: Line hash → its ``cover_path_upload`` frame (the first path
+                     packet's ``path_hash`` is the line hash).
+
+    """
+
+    frames: dict[int, list[NavGetCommDataAck]] = field(default_factory=dict)
+    names: dict[int, str] = field(default_factory=dict)
+    cover_paths: dict[int, CoverPathUploadT] = field(default_factory=dict)
+
+    @property
+    def root_hashes(self) -> list[int]:
+        """Hash IDs of the root (sub_cmd 0) hash list, in device order."""
+        return list(self.frames)
+
+    @property
+    def line_hashes(self) -> list[int]:
+        """Hash IDs of the breakpoint-line (sub_cmd 3) hash list."""
+        return list(self.cover_paths)
+
+    @cached_property
+    def bol_hash(self) -> int:
+        """Checksum of the root hash list, as reported in ``toapp_report_data`` locations."""
+        hashes = [h for h in self.frames if h != 0]
+        return int(MurMurHashUtil.hash_unsigned_list(hashes)) if hashes else 0
+
+    @classmethod
+    def from_capture(cls, path: Path) -> SimulatedMap:
+        """Load a JSON capture holding ``area_frames`` and ``mow_path_frames`` lists.
+
+        Each list holds protobuf dicts as produced by ``to_dict()`` on the
+        received ``NavGetCommDataAck`` / ``CoverPathUploadT`` frames.
+        """
+        raw = json.loads(path.read_text())
+        sim_map = cls()
+        for frame_dict in raw.get("area_frames", []):
+            frame = NavGetCommDataAck.from_dict(frame_dict)
+            sim_map.frames.setdefault(frame.hash, []).append(frame)
+        for frames in sim_map.frames.values():
+            frames.sort(key=lambda f: f.current_frame)
+        area_hashes = [h for h, frames in sim_map.frames.items() if frames[0].type == PathType.AREA]
+        sim_map.names = {h: f"area {i + 1}" for i, h in enumerate(area_hashes)}
+        for frame_dict in raw.get("mow_path_frames", []):
+            upload = CoverPathUploadT.from_dict(frame_dict)
+            if upload.path_packets:
+                sim_map.cover_paths[upload.path_packets[0].path_hash] = upload
+        return sim_map
+
+
+def _ring(cx: float, cy: float, radius: float, count: int, phase: int) -> list[CommDataCouple]:
+    """Return *count* points on a slightly wobbly ring around (*cx*, *cy*)."""
+    points = []
+    for i in range(count):
+        angle = 2 * math.pi * i / count
+        r = radius * (1.0 + 0.05 * math.sin(7 * angle + phase))
+        points.append(CommDataCouple(x=cx + r * math.cos(angle), y=cy + r * math.sin(angle)))
+    return points
+
+
+def _boundary_frames(
+    hash_id: int, type_code: int, points: list[CommDataCouple], frames: int
+) -> list[NavGetCommDataAck]:
+    """Split *points* across *frames* boundary frames for one hash."""
+    per_frame = math.ceil(len(points) / frames)
+    return [
+        NavGetCommDataAck(
+            pver=1,
+            action=8,
+            type=type_code,
+            hash=hash_id,
+            paternal_hash_b=1,
+            total_frame=frames,
+            current_frame=frame + 1,
+            data_len=len(points[frame * per_frame : (frame + 1) * per_frame]),
+            data_couple=points[frame * per_frame : (frame + 1) * per_frame],
+        )
+        for frame in range(frames)
+    ]
+
+
+def synthetic_map(
+    areas: int = 4,
+    frames_per_area: int = 2,
+    points_per_frame: int = 60,
+    obstacles: int = 1,
+) -> SimulatedMap:
+    """Return a map of *areas* areas and *obstacles* obstacles laid out on a 40 m grid.
+
+    Every area also gets one breakpoint line whose cover path is a short
+    zig-zag across it, so mow-path syncs have something to fetch.
+    """
+    sim_map = SimulatedMap()
+    for i in range(areas):
+        hash_id = SYNTHETIC_AREA_HASH_BASE + i
+        cx, cy = (i % 10) * 40.0, (i // 10) * 40.0
+        points = _ring(cx, cy, radius=15.0, count=frames_per_area * points_per_frame, phase=i)
+        sim_map.frames[hash_id] = _boundary_frames(hash_id, PathType.AREA, points, frames_per_area)
+        sim_map.names[hash_id] = f"area {i + 1}"
+        line_hash = SYNTHETIC_LINE_HASH_BASE + i
+        zigzag = [CommDataCouple(x=cx - 10.0 + 2.0 * step, y=cy + (5.0 if step % 2 else -5.0)) for step in range(11)]
+        sim_map.cover_paths[line_hash] = CoverPathUploadT(
+            pver=1,
+            sub_cmd=3,
+            total_frame=1,
+            current_frame=1,
+            total_path_num=1,
+            valid_path_num=1,
+            data_hash=line_hash,
+            data_len=len(zigzag),
+            path_packets=[
+                CoverPathPacketT(path_hash=line_hash, path_total=1, path_cur=1, zone_hash=hash_id, data_couple=zigzag)
+            ],
+        )
+    for i in range(obstacles):
+        hash_id = SYNTHETIC_OBSTACLE_HASH_BASE + i
+        points = _ring((i % 10) * 40.0 + 5.0, (i // 10) * 40.0, radius=2.0, count=32, phase=i)
+        sim_map.frames[hash_id] = _boundary_frames(hash_id, PathType.OBSTACLE, points, 1)
+    return sim_map
@@ -0,0 +1,267 @@
+"""Device side of the simulator: one virtual mower answering the real LubaMsg protocol."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import logging
+import math
+from typing import TYPE_CHECKING
+
+import betterproto2
+
+from pymammotion.proto import (
+    AppGetAllAreaHashName,
+    AreaHashName,
+    CoverPathUploadT,
+    LubaMsg,
+    MctlNav,
+    MctlSys,
+    MsgAttr,
+    MsgCmdType,
+    MsgDevice,
+    NavGetHashListAck,
+    NavReqCoverPath,
+    ReportInfoData,
+    RptAct,
+    RptDevLocation,
+    RptDevStatus,
+    RptRtk,
+    RptWork,
+    SystemTardStateTunnelMsg,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from pymammotion.proto import AppRequestCoverPathsT, NavGetCommData, NavGetHashList, NavMapNameMsg, ReportInfoCfg
+    from pymammotion.simulator.maps import SimulatedMap
+
+_logger = logging.getLogger(__name__)
+
+#: Hash IDs per ``toapp_gethash_ack`` frame.
+HASH_LIST_FRAME_SIZE = 20
+#: ``sys_status`` the mower reports while mowing.
+_SYS_STATUS_MOWING = 13
+#: Radius (m) of the circle the mower drives while streaming telemetry.
+_TRACK_RADIUS = 10.0
+#: Telemetry ticks per lap of that circle.
+_TICKS_PER_LAP = 240
+
+
+@dataclass
+class VirtualMowerStats:
+    """Message counters for one :class:`VirtualMower`.
+
+    Attributes:
+        received:  LubaMsg commands received from the app.
+        sent:      LubaMsg frames sent to the app (replies and telemetry).
+        telemetry: Of ``sent``, the ``system_tard_state_tunnel`` / ``toapp_report_data`` frames.
+        ignored:   Commands the simulator does not model (dropped without reply).
+
+    """
+
+    received: int = 0
+    sent: int = 0
+    telemetry: int = 0
+    ignored: int = 0
+
+
+class VirtualMower:
+    """A mower that serves *sim_map* over the real protocol.
+
+    It parses every command as a ``LubaMsg`` and answers the ones the client's
+    sagas depend on, with the same pacing as firmware:
+
+    * ``todev_gethash`` (sub_cmd 0 / 3) streams the root / line hash list one
+      frame per ``get_hash_response`` echo.
+    * ``todev_get_commondata`` (sub_cmd 1) starts a hash's boundary stream;
+      each ``get_regional_data`` echo (sub_cmd 2) releases the next frame.
+      Several hashes can stream at once.
+    * ``toapp_map_name_msg`` (hash 0) answers with ``toapp_all_hash_name``.
+    * ``bidire_reqconver_path`` confirms the route; ``app_request_cover_paths``
+      streams one ``cover_path_upload`` transaction for the requested lines.
+    * ``todev_report_cfg`` with ``RPT_START`` answers with one report at once.
+
+    :meth:`emit_telemetry` sends one ``system_tard_state_tunnel`` and one
+    ``toapp_report_data`` frame; :class:`~pymammotion.simulator.fleet.SimulatedFleet`
+    calls it at 4 Hz.  Position and battery follow a fixed circuit, so every
+    run produces the same bytes.
+
+    *publish* delivers a frame to the app; the broker sets it on attach.
+    """
+
+    def __init__(self, device_name: str, iot_id: str, sim_map: SimulatedMap, *, index: int = 0) -> None:
+        """Create a mower serving *sim_map*; *index* staggers its telemetry phase within a fleet."""
+        self.device_name = device_name
+        self.iot_id = iot_id
+        self.sim_map = sim_map
+        self.publish: Callable[[bytes], Awaitable[None]] | None = None
+        self.stats = VirtualMowerStats()
+        self._tick = index * 7
+        self._seq = 0
+        self._hash_list_frames: list[NavGetHashListAck] = []
+
+    # ------------------------------------------------------------------
+    # App → device
+    # ------------------------------------------------------------------
+
+    async def handle(self, payload: bytes) -> None:
+        """Answer one command from the app."""
+        self.stats.received += 1
+        msg = LubaMsg().parse(payload)
+        sub_name, sub_msg = betterproto2.which_one_of(msg, "LubaSubMsg")
+        if sub_name == "nav":
+            leaf_name, leaf = betterproto2.which_one_of(sub_msg, "SubNavMsg")
+            handled = await self._on_nav(leaf_name, leaf)
+        elif sub_name == "sys":
+            leaf_name, leaf = betterproto2.which_one_of(sub_msg, "SubSysMsg")
+            handled = await self._on_sys(leaf_name, leaf)
+        else:
+            # net (todev_ble_sync and friends) needs no reply.
+            handled = sub_name == "net"
+        if not handled:
+            self.stats.ignored += 1
+
+    async def _on_nav(self, leaf_name: str, leaf: object) -> bool:
+        match leaf_name:
+            case "todev_gethash":
+                await self._on_gethash(leaf)  # type: ignore[arg-type]
+            case "todev_get_commondata":
+                await self._on_commondata(leaf)  # type: ignore[arg-type]
+            case "toapp_map_name_msg":
+                await self._on_area_names(leaf)  # type: ignore[arg-type]
+            case "bidire_reqconver_path":
+                await self._on_route(leaf)  # type: ignore[arg-type]
+            case "app_request_cover_paths":
+                await self._on_cover_paths(leaf)  # type: ignore[arg-type]
+            case "todev_svg_msg":
+                return True  # tile acks; the simulator serves no SVG tiles
+            case _:
+                return False
+        return True
+
+    async def _on_sys(self, leaf_name: str, leaf: object) -> bool:
+        if leaf_name != "todev_report_cfg":
+            return False
+        cfg: ReportInfoCfg = leaf  # type: ignore[assignment]
+        if cfg.act == RptAct.RPT_START:
+            await self._send_sys(MctlSys(toapp_report_data=self._report()))
+        return True
+
+    async def _on_gethash(self, request: NavGetHashList) -> None:
+        if request.sub_cmd in (0, 3):
+            hashes = self.sim_map.root_hashes if request.sub_cmd == 0 else self.sim_map.line_hashes
+            chunks = [hashes[i : i + HASH_LIST_FRAME_SIZE] for i in range(0, len(hashes), HASH_LIST_FRAME_SIZE)]
+            self._hash_list_frames = [
+                NavGetHashListAck(
+                    pver=1,
+                    sub_cmd=request.sub_cmd,
+                    total_frame=len(chunks),
+                    current_frame=i + 1,
+                    hash_len=len(chunk),
+                    data_couple=chunk,
+                )
+                for i, chunk in enumerate(chunks)
+            ]
+            if self._hash_list_frames:
+                await self._send_nav(MctlNav(toapp_gethash_ack=self._hash_list_frames[0]))
+        elif request.sub_cmd == 2 and request.current_frame < len(self._hash_list_frames):
+            await self._send_nav(MctlNav(toapp_gethash_ack=self._hash_list_frames[request.current_frame]))
+
+    async def _on_commondata(self, request: NavGetCommData) -> None:
+        frames = self.sim_map.frames.get(request.hash)
+        if not frames:
+            return
+        if request.sub_cmd == 1:
+            await self._send_nav(MctlNav(toapp_get_commondata_ack=frames[0]))
+        elif request.sub_cmd == 2 and request.current_frame < len(frames):
+            await self._send_nav(MctlNav(toapp_get_commondata_ack=frames[request.current_frame]))
+
+    async def _on_area_names(self, request: NavMapNameMsg) -> None:
+        if request.hash != 0:
+            return
+        hashnames = [AreaHashName(hash=h, name=name) for h, name in self.sim_map.names.items()]
+        await self._send_nav(
+            MctlNav(toapp_all_hash_name=AppGetAllAreaHashName(device_id=self.iot_id, hashnames=hashnames))
+        )
+
+    async def _on_route(self, request: NavReqCoverPath) -> None:
+        confirm = NavReqCoverPath(
+            pver=1, sub_cmd=request.sub_cmd, zone_hashs=request.zone_hashs, path_hash=self.sim_map.bol_hash, result=0
+        )
+        await self._send_nav(MctlNav(bidire_reqconver_path=confirm))
+
+    async def _on_cover_paths(self, request: AppRequestCoverPathsT) -> None:
+        uploads = [self.sim_map.cover_paths[h] for h in request.hash_list if h in self.sim_map.cover_paths]
+        for i, upload in enumerate(uploads):
+            frame = CoverPathUploadT(
+                pver=upload.pver,
+                sub_cmd=upload.sub_cmd,
+                total_frame=len(uploads),
+                current_frame=i + 1,
+                total_path_num=upload.total_path_num,
+                valid_path_num=upload.valid_path_num,
+                data_hash=upload.data_hash,
+                transaction_id=request.transaction_id,
+                data_len=upload.data_len,
+                path_packets=upload.path_packets,
+            )
+            await self._send_nav(MctlNav(cover_path_upload=frame))
+
+    # ------------------------------------------------------------------
+    # Device → app
+    # ------------------------------------------------------------------
+
+    async def emit_telemetry(self) -> None:
+        """Send one rapid-state frame and one report frame, then advance along the circuit."""
+        await self._send_sys(MctlSys(system_tard_state_tunnel=SystemTardStateTunnelMsg(tard_state_data=self._rapid())))
+        await self._send_sys(MctlSys(toapp_report_data=self._report()))
+        self.stats.telemetry += 2
+        self._tick += 1
+
+    def _position(self) -> tuple[float, float, float]:
+        """Return (x, y, heading) in metres / radians at the current tick."""
+        angle = 2 * math.pi * (self._tick % _TICKS_PER_LAP) / _TICKS_PER_LAP
+        return _TRACK_RADIUS * math.cos(angle), _TRACK_RADIUS * math.sin(angle), angle + math.pi / 2
+
+    def _rapid(self) -> list[int]:
+        """Return ``tard_state_data``: RTK fix, satellites, and position in fixed-point 1e-4 units."""
+        x, y, heading = self._position()
+        zone = self.sim_map.root_hashes[0] if self.sim_map.frames else 0
+        return [4, 1, 30, 10, 50, 50, 20, round(x * 1e4), round(y * 1e4), round(heading * 1e4), 1, zone]
+
+    def _report(self) -> ReportInfoData:
+        x, y, heading = self._position()
+        lap_progress = (self._tick % _TICKS_PER_LAP) * 100 // _TICKS_PER_LAP
+        return ReportInfoData(
+            dev=RptDevStatus(sys_status=_SYS_STATUS_MOWING, battery_val=100 - lap_progress // 2),
+            rtk=RptRtk(status=4, gps_stars=30),
+            locations=[
+                RptDevLocation(
+                    real_pos_x=round(x * 1e4),
+                    real_pos_y=round(y * 1e4),
+                    real_toward=round(heading * 1e4),
+                    bol_hash=self.sim_map.bol_hash,
+                )
+            ],
+            work=RptWork(area=lap_progress, progress=lap_progress),
+        )
+
+    async def _send_nav(self, nav: MctlNav) -> None:
+        await self._send(LubaMsg(msgtype=MsgCmdType.NAV, nav=nav))
+
+    async def _send_sys(self, sys: MctlSys) -> None:
+        await self._send(LubaMsg(msgtype=MsgCmdType.EMBED_SYS, sys=sys))
+
+    async def _send(self, msg: LubaMsg) -> None:
+        if self.publish is None:
+            _logger.debug("VirtualMower[%s]: not attached to a broker, dropping frame", self.device_name)
+            return
+        self._seq = (self._seq + 1) & 255
+        msg.sender = MsgDevice.DEV_MAINCTL
+        msg.rcver = MsgDevice.DEV_MOBILEAPP
+        msg.msgattr = MsgAttr.RESP
+        msg.seqs = self._seq
+        msg.version = 1
+        self.stats.sent += 1
+        await self.publish(bytes(msg))
@@ -7,12 +7,14 @@ from dataclasses import dataclass
 from datetime import UTC, datetime
 from enum import Enum
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pymammotion.transport.base import TransportAvailability
 from pymammotion.utility.constant.device_constant import WorkMode
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from pymammotion.data.model.device import Device
 
 _logger = logging.getLogger(__name__)
@@ -82,17 +84,74 @@ class DeviceSnapshot:
     enabled: bool
     battery_level: int
     raw: Device  # full underlying device — use for fields not yet in snapshot
+    changed_fields: frozenset[str] = frozenset()  # vs. the previous snapshot — see DeviceStateMachine.apply
 
 
 @dataclass(frozen=True)
 class StateChangedEvent:
-    """Emitted when device state changes between two snapshots."""
+    """Emitted when device state changes between two snapshots.
+
+    ``changed_fields`` holds snapshot field names plus dotted paths into
+    ``raw`` (``report_data``, ``report_data.dev``, ``report_data.dev.battery_val``)
+    — every ancestor of a changed leaf is included, so membership tests work
+    at any depth down to the first non-dataclass value.
+    """
 
     device_id: str
     old: DeviceSnapshot
     new: DeviceSnapshot
     changed_fields: frozenset[str]
 
+    def touches(self, *paths: str) -> bool:
+        """Return True if any of *paths* is in :attr:`changed_fields`."""
+        return fields_touched(self.changed_fields, paths)
+
+
+def fields_touched(changed_fields: frozenset[str], paths: Iterable[str]) -> bool:
+    """Return True if any dotted path in *paths* is in *changed_fields*."""
+    return any(path in changed_fields for path in paths)
+
+
+_MISSING: Any = object()
+
+
+def _resolve(obj: object, path: str) -> Any:
+    """Follow a dotted attribute *path* from *obj*; ``_MISSING`` if any hop is absent."""
+    for part in path.split("."):
+        obj = getattr(obj, part, _MISSING)
+        if obj is _MISSING:
+            break
+    return obj
+
+
+def _walk_changes(path: str, old: Any, new: Any, out: set[str]) -> bool:
+    """Add the dotted paths under *path* whose values differ to *out*; return True if any did.
+
+    Identical objects are skipped without looking inside — the reducer shares
+    untouched sub-trees by identity, so the walk only descends along the
+    sub-objects that were actually copied.  Dataclasses with value equality
+    are walked field by field; anything else is a leaf compared with ``!=``.
+    """
+    if old is new:
+        return False
+    if (
+        type(old) is type(new)
+        and dataclasses.is_dataclass(old)
+        and not isinstance(old, type)
+        and old.__dataclass_params__.eq  # type: ignore[attr-defined]
+    ):
+        changed = False
+        for f in dataclasses.fields(old):
+            if f.compare and _walk_changes(f"{path}.{f.name}", getattr(old, f.name), getattr(new, f.name), out):
+                changed = True
+        if changed:
+            out.add(path)
+        return changed
+    if old != new:
+        out.add(path)
+        return True
+    return False
+
 
 @dataclass(frozen=True)
 class ConnectionStateChangedEvent:
@@ -147,16 +206,24 @@ class DeviceStateMachine:
         self,
         updated_device: Device,
         availability: DeviceAvailability,
+        written: Iterable[str] | None = None,
     ) -> tuple[DeviceSnapshot, frozenset[str]]:
         """Apply an updated device and return (new_snapshot, changed_fields).
 
         changed_fields is the set of snapshot field names that changed value,
-        excluding 'sequence', 'timestamp', and 'raw'.
+        excluding 'sequence', 'timestamp', 'raw' and 'changed_fields', plus
+        the dotted paths into the device that changed (see :meth:`_diff`).
+        It is also stored on the returned snapshot's ``changed_fields``.
         Returns (new_snapshot, frozenset()) if no observable fields changed.
+
+        *written* is the set of dotted device paths the caller wrote (usually
+        :attr:`StateReducer.last_writes`); only those sub-trees are diffed.
+        When None, every top-level device field is a candidate.
         """
         self._sequence += 1
         new = self._make_snapshot(updated_device, availability)
-        changed = self._diff(self._current, new)
+        changed = self._diff(self._current, new, written)
+        new = dataclasses.replace(new, changed_fields=changed)
         self._current = new
         return new, changed
 
@@ -189,19 +256,21 @@ class DeviceStateMachine:
             raw=device,
         )
 
-    def _diff(self, old: DeviceSnapshot, new: DeviceSnapshot) -> frozenset[str]:
+    def _diff(self, old: DeviceSnapshot, new: DeviceSnapshot, written: Iterable[str] | None = None) -> frozenset[str]:
         """Return the names of changed fields across snapshot + device model.
 
         Walks both the snapshot's promoted summary fields (``connection_state``,
-        ``online``, ``enabled``, ``battery_level``) AND the top-level fields of
-        ``raw`` (the underlying Device), so deep mutations such as
-        ``report_data.dev.sys_status`` are detected.
+        ``online``, ``enabled``, ``battery_level``) AND ``raw`` (the underlying
+        Device), so deep mutations such as ``report_data.dev.sys_status`` are
+        detected and reported as ``report_data``, ``report_data.dev`` and
+        ``report_data.dev.sys_status``.
 
         The state reducer shares unchanged sub-trees with the previous snapshot
-        by identity, so the ``is`` check short-circuits the expensive recursive
-        dataclass ``__eq__`` for most fields on every incoming message.
+        by identity, so the walk skips them with an ``is`` check and only
+        descends along what was copied; *written* narrows the starting points
+        further to the paths the reducer says it wrote.
         """
-        skip: frozenset[str] = frozenset({"sequence", "timestamp", "raw"})
+        skip: frozenset[str] = frozenset({"sequence", "timestamp", "raw", "changed_fields"})
         changed: set[str] = set()
         for f in dataclasses.fields(old):
             if f.name in skip:
@@ -209,9 +278,11 @@ class DeviceStateMachine:
             if getattr(old, f.name) != getattr(new, f.name):
                 changed.add(f.name)
         if dataclasses.is_dataclass(old.raw) and dataclasses.is_dataclass(new.raw):
-            for f in dataclasses.fields(old.raw):
-                old_val = getattr(old.raw, f.name)
-                new_val = getattr(new.raw, f.name)
-                if old_val is not new_val and old_val != new_val:
-                    changed.add(f.name)
+            roots = [f.name for f in dataclasses.fields(old.raw)] if written is None else written
+            for root in roots:
+                if _walk_changes(root, _resolve(old.raw, root), _resolve(new.raw, root), changed):
+                    parent, _, _ = root.rpartition(".")
+                    while parent:
+                        changed.add(parent)
+                        parent, _, _ = parent.rpartition(".")
         return frozenset(changed)
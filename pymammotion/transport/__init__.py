@@ -1,26 +1,35 @@
-"""Transport layer for PyMammotion — abstractions for MQTT and BLE connections."""
+"""Transport layer for PyMammotion — abstractions for MQTT and BLE connections.
+
+The Aliyun MQTT transport (and the paho/protobuf stack behind it) is only
+imported when ``AliyunMQTTTransport`` or ``AliyunMQTTConfig`` is first used.
+"""
 
 from __future__ import annotations
 
-from pymammotion.transport.aliyun_mqtt import AliyunMQTTConfig, AliyunMQTTTransport
-from pymammotion.transport.base import (
-    AuthError,
-    BLEUnavailableError,
-    CommandTimeoutError,
-    ConcurrentRequestError,
-    EventBus,
-    NoBLEAddressKnownError,
-    NoTransportAvailableError,
-    ReLoginRequiredError,
-    SagaFailedError,
-    SagaInterruptedError,
-    Subscription,
-    Transport,
-    TransportAvailability,
-    TransportError,
-    TransportRateLimitedError,
-    TransportType,
-)
+from typing import TYPE_CHECKING
+
+from pymammotion.utility.lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pymammotion.transport.aliyun_mqtt import AliyunMQTTConfig, AliyunMQTTTransport
+    from pymammotion.transport.base import (
+        AuthError,
+        BLEUnavailableError,
+        CommandTimeoutError,
+        ConcurrentRequestError,
+        EventBus,
+        NoBLEAddressKnownError,
+        NoTransportAvailableError,
+        ReLoginRequiredError,
+        SagaFailedError,
+        SagaInterruptedError,
+        Subscription,
+        Transport,
+        TransportAvailability,
+        TransportError,
+        TransportRateLimitedError,
+        TransportType,
+    )
 
 __all__ = [
     "AliyunMQTTConfig",
@@ -42,3 +51,27 @@ __all__ = [
     "TransportRateLimitedError",
     "TransportType",
 ]
+
+__getattr__, __dir__ = lazy_exports(
+    __name__,
+    {
+        "AliyunMQTTConfig": "pymammotion.transport.aliyun_mqtt",
+        "AliyunMQTTTransport": "pymammotion.transport.aliyun_mqtt",
+        "AuthError": "pymammotion.transport.base",
+        "BLEUnavailableError": "pymammotion.transport.base",
+        "CommandTimeoutError": "pymammotion.transport.base",
+        "ConcurrentRequestError": "pymammotion.transport.base",
+        "EventBus": "pymammotion.transport.base",
+        "NoBLEAddressKnownError": "pymammotion.transport.base",
+        "NoTransportAvailableError": "pymammotion.transport.base",
+        "ReLoginRequiredError": "pymammotion.transport.base",
+        "SagaFailedError": "pymammotion.transport.base",
+        "SagaInterruptedError": "pymammotion.transport.base",
+        "Subscription": "pymammotion.transport.base",
+        "Transport": "pymammotion.transport.base",
+        "TransportAvailability": "pymammotion.transport.base",
+        "TransportError": "pymammotion.transport.base",
+        "TransportRateLimitedError": "pymammotion.transport.base",
+        "TransportType": "pymammotion.transport.base",
+    },
+)
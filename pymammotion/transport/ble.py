@@ -531,7 +531,7 @@ class BLETransport(Transport):
         if self._message is None:
             return
 
-        result = self._message.parseNotification(bytes(data))
+        result = self._message.parseNotification(data)
         if result != 0:
             # result == 1  → fragment received, waiting for more
             # result == 2  → duplicate sequence, already processed
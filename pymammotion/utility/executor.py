@@ -0,0 +1,232 @@
+"""Worker pool for CPU-heavy map work, and an event-loop lag probe to check it pays off.
+
+Building the GeoJSON of a large map, chunking an SVG tile or rendering a map
+PNG takes tens to hundreds of milliseconds of pure Python.  Done on the event
+loop, that time is stolen from every device in the process: BLE heartbeats
+and MQTT receives queue up behind it.  :class:`MapExecutor` runs such work on
+a worker pool instead:
+
+* ``ExecutorKind.THREAD`` (the default) — a small thread pool.  Cheap to
+  start, shares memory with the loop; the loop still competes for the GIL,
+  but gets it back between bytecodes instead of waiting for the whole build.
+* ``ExecutorKind.PROCESS`` — a ``spawn`` process pool.  Sidesteps the GIL
+  entirely, at the price of pickling the callable's arguments and result:
+  the callable must be a module-level function and its inputs picklable.
+
+:class:`LoopLagMonitor` measures how late the loop wakes from a short sleep —
+the stall every other coroutine sees — so the effect of moving work off the
+loop can be read from :meth:`LoopLagMonitor.stats` rather than guessed.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import contextlib
+from dataclasses import dataclass
+from enum import StrEnum
+import logging
+import multiprocessing
+import time
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+#: Default worker count of a :class:`MapExecutor`.
+DEFAULT_MAP_WORKERS = 2
+#: Default sampling interval of a :class:`LoopLagMonitor` (s).
+DEFAULT_LAG_INTERVAL = 0.1
+#: Default lag above which a :class:`LoopLagMonitor` sample counts as a stall (s).
+DEFAULT_STALL_THRESHOLD = 0.1
+
+
+class ExecutorKind(StrEnum):
+    """Pool a :class:`MapExecutor` runs work on."""
+
+    THREAD = "thread"
+    PROCESS = "process"
+
+
+@dataclass(frozen=True)
+class MapExecutorStats:
+    """Counters of a :class:`MapExecutor`.
+
+    Attributes:
+        submitted: Calls handed to the pool.
+        failed: Calls that raised.
+        running: Calls submitted and not yet finished.
+        total_time: Seconds from submission to result, summed over finished calls.
+        max_time: Longest single call, queueing included (s).
+
+    """
+
+    submitted: int
+    failed: int
+    running: int
+    total_time: float
+    max_time: float
+
+
+class MapExecutor:
+    """Runs CPU-heavy map derivations off the event loop."""
+
+    def __init__(self, kind: ExecutorKind = ExecutorKind.THREAD, max_workers: int = DEFAULT_MAP_WORKERS) -> None:
+        """Create an executor; its pool is started by the first :meth:`run`.
+
+        Args:
+            kind: Thread or process pool (see the module docstring).
+            max_workers: Size of the pool.
+
+        """
+        if max_workers < 1:
+            msg = "max_workers must be at least 1"
+            raise ValueError(msg)
+        self.kind = kind
+        self.max_workers = max_workers
+        self._pool: Executor | None = None
+        self._submitted = 0
+        self._failed = 0
+        self._running = 0
+        self._total_time = 0.0
+        self._max_time = 0.0
+
+    @property
+    def is_process(self) -> bool:
+        """True when work crosses a process boundary, so inputs and results are pickled."""
+        return self.kind == ExecutorKind.PROCESS
+
+    def _ensure_pool(self) -> Executor:
+        if self._pool is None:
+            if self.is_process:
+                # spawn, not fork: forking a process that runs an event loop and
+                # transport threads copies their locks in whatever state they are in.
+                self._pool = ProcessPoolExecutor(self.max_workers, mp_context=multiprocessing.get_context("spawn"))
+            else:
+                self._pool = ThreadPoolExecutor(self.max_workers, thread_name_prefix="pymammotion-map")
+        return self._pool
+
+    async def run(self, fn: Callable[..., T], /, *args: Any) -> T:
+        """Return ``fn(*args)``, computed on the pool."""
+        loop = asyncio.get_running_loop()
+        self._submitted += 1
+        self._running += 1
+        started = time.monotonic()
+        try:
+            return await loop.run_in_executor(self._ensure_pool(), fn, *args)
+        except Exception:
+            self._failed += 1
+            raise
+        finally:
+            self._running -= 1
+            elapsed = time.monotonic() - started
+            self._total_time += elapsed
+            self._max_time = max(self._max_time, elapsed)
+
+    def stats(self) -> MapExecutorStats:
+        """Return the current counters."""
+        return MapExecutorStats(
+            submitted=self._submitted,
+            failed=self._failed,
+            running=self._running,
+            total_time=self._total_time,
+            max_time=self._max_time,
+        )
+
+    def shutdown(self) -> None:
+        """Stop the pool without waiting; queued calls are cancelled.  A later :meth:`run` starts a new one."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+@dataclass(frozen=True)
+class LoopLagStats:
+    """Event-loop lag measured by a :class:`LoopLagMonitor`.
+
+    Attributes:
+        samples: Wake-ups measured.
+        last_lag: Lag of the latest wake-up (s).
+        mean_lag: Average lag (s).
+        max_lag: Worst lag (s).
+        stalls: Wake-ups at least ``stall_threshold`` late.
+
+    """
+
+    samples: int
+    last_lag: float
+    mean_lag: float
+    max_lag: float
+    stalls: int
+
+
+class LoopLagMonitor:
+    """Samples how late the event loop wakes from a fixed sleep."""
+
+    def __init__(
+        self, interval: float = DEFAULT_LAG_INTERVAL, stall_threshold: float = DEFAULT_STALL_THRESHOLD
+    ) -> None:
+        """Create an idle monitor; :meth:`start` begins sampling every *interval* seconds."""
+        if interval <= 0:
+            msg = "interval must be positive"
+            raise ValueError(msg)
+        self.interval = interval
+        self.stall_threshold = stall_threshold
+        self._task: asyncio.Task[None] | None = None
+        self.reset()
+
+    @property
+    def running(self) -> bool:
+        """True while the sampling task is alive."""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """Start sampling on the running loop; a no-op when already running."""
+        if not self.running:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling; the counters are kept."""
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+        self._task = None
+
+    def reset(self) -> None:
+        """Clear the counters."""
+        self._samples = 0
+        self._last_lag = 0.0
+        self._total_lag = 0.0
+        self._max_lag = 0.0
+        self._stalls = 0
+
+    def stats(self) -> LoopLagStats:
+        """Return the counters."""
+        return LoopLagStats(
+            samples=self._samples,
+            last_lag=self._last_lag,
+            mean_lag=self._total_lag / self._samples if self._samples else 0.0,
+            max_lag=self._max_lag,
+            stalls=self._stalls,
+        )
+
+    def _observe(self, lag: float) -> None:
+        self._samples += 1
+        self._last_lag = lag
+        self._total_lag += lag
+        self._max_lag = max(self._max_lag, lag)
+        if lag >= self.stall_threshold:
+            self._stalls += 1
+            _logger.debug("event loop stalled for %.0f ms", lag * 1000)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            due = loop.time() + self.interval
+            await asyncio.sleep(self.interval)
+            self._observe(max(0.0, loop.time() - due))
@@ -0,0 +1,46 @@
+"""PEP 562 lazy re-exports for package ``__init__`` modules.
+
+A package that re-exports names from its submodules would otherwise import
+every one of them — and everything they import — the moment anything under
+it is touched.  :func:`lazy_exports` builds the module-level ``__getattr__``
+and ``__dir__`` that resolve each name on first access instead and cache it
+in the package namespace, so later lookups are ordinary attribute reads::
+
+    __getattr__, __dir__ = lazy_exports(__name__, {"DeviceMessageBroker": ".broker"})
+
+Keep the same names under ``if TYPE_CHECKING:`` imports so type checkers and
+IDEs still see them.
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+
+def lazy_exports(package: str, exports: Mapping[str, str]) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """Return ``(__getattr__, __dir__)`` resolving *exports* of *package* on first access.
+
+    Args:
+        package: ``__name__`` of the package.
+        exports: Exported name → module defining it; a leading ``.`` is relative to *package*.
+
+    """
+
+    def __getattr__(name: str) -> Any:  # noqa: N807
+        module_name = exports.get(name)
+        if module_name is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        value = getattr(importlib.import_module(module_name, package), name)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        return sorted({*vars(sys.modules[package]), *exports})
+
+    return __getattr__, __dir__
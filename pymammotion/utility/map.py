@@ -13,6 +13,9 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+#: Metres per degree of latitude in the flat-earth projection used for map GeoJSON.
+METERS_PER_DEGREE: int = 111320
+
 
 class CoordinateConverter:
     """Converts between ENU (East-North-Up) and LLA (Latitude-Longitude-Altitude) coordinate systems.
@@ -245,6 +248,61 @@ class CoordinateConverter:
         self.yaw = math.radians(yaw_degrees)
 
 
+def enu_offsets_to_lonlat(
+    x: NDArray[np.float64],
+    y: NDArray[np.float64],
+    origin_lat_deg: float,
+    origin_lon_deg: float,
+    yaw: float = 0.0,
+) -> NDArray[np.float64]:
+    """Convert arrays of device-local offsets (metres) to an ``(n, 2)`` array of ``[lon, lat]``.
+
+    Batch form of ``GeojsonGenerator.lon_lat_delta`` with the same operation
+    order, so results match it exactly: rotate (x, y) by *yaw* to geographic
+    East/North, then apply the flat-earth projection around the origin.
+
+    Args:
+        x: X offsets in metres (device local frame).
+        y: Y offsets in metres (device local frame).
+        origin_lat_deg: Latitude of the RTK origin in degrees.
+        origin_lon_deg: Longitude of the RTK origin in degrees.
+        yaw: RTK heading in radians.
+
+    Returns:
+        Array of shape ``(len(x), 2)`` holding ``[longitude, latitude]`` rows.
+
+    """
+    cos_yaw = math.cos(yaw)
+    sin_yaw = math.sin(yaw)
+    east = cos_yaw * x - sin_yaw * y
+    north = sin_yaw * x + cos_yaw * y
+    lonlat = np.empty((len(x), 2), dtype=np.float64)
+    lonlat[:, 0] = origin_lon_deg + east / (METERS_PER_DEGREE * math.cos(math.radians(origin_lat_deg)))
+    lonlat[:, 1] = origin_lat_deg + north / METERS_PER_DEGREE
+    return lonlat
+
+
+def polyline_stats(x: NDArray[np.float64], y: NDArray[np.float64], closed: bool = False) -> tuple[float, float]:
+    """Return ``(length, area)`` in metres / square metres for a polyline given as coordinate arrays.
+
+    Batch form of ``GeojsonGenerator.map_object_stats``: the area (shoelace)
+    is only non-zero for a closed ring — explicit (first point repeated) or
+    declared via *closed*, in which case the closing segment is also counted
+    in the length.
+    """
+    if len(x) < 2:
+        return 0.0, 0.0
+    length = float(np.hypot(np.diff(x), np.diff(y)).sum())
+    if x[0] != x[-1] or y[0] != y[-1]:
+        if not closed:
+            return length, 0.0
+        length += math.hypot(x[0] - x[-1], y[0] - y[-1])
+        x = np.append(x, x[0])
+        y = np.append(y, y[0])
+    area = 0.5 * abs(float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1])))
+    return length, area
+
+
 # Usage example
 if __name__ == "__main__":
     # Initialize converter with reference point
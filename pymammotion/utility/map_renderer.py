@@ -8,12 +8,15 @@ from io import BytesIO
 import math
 from pathlib import Path
 import tempfile
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
 from PIL import Image, ImageColor, ImageDraw
 
+if TYPE_CHECKING:
+    from pymammotion.utility.executor import MapExecutor
+
 CANVAS_SIZE = (1024, 768)
 BACKGROUND = (245, 245, 245, 255)
 AREA_FILL = (59, 191, 97, 75)
@@ -95,8 +98,11 @@ async def render_map_png(
     tile_cache_dir: str | None = None,
     mower_location: Any | None = None,
     mower_trail: list[tuple[float, float]] | None = None,
+    executor: MapExecutor | None = None,
 ) -> bytes:
-    """Render a Mammotion GeoJSON map into a static PNG."""
+    """Render a Mammotion GeoJSON map into a static PNG, on *executor* or a worker thread."""
+    if executor is not None:
+        return await executor.run(_render_map_png_sync, geojson, tile_cache_dir, mower_location, mower_trail)
     return await asyncio.to_thread(_render_map_png_sync, geojson, tile_cache_dir, mower_location, mower_trail)
 
 
@@ -22,7 +22,7 @@ from pymammotion.http.model.http import (
     MQTTConnection,
     Response,
 )
-from pymammotion.transport.base import TransportType
+from pymammotion.transport.base import LoginFailedError, TransportType
 
 
 # ---------------------------------------------------------------------------
@@ -247,6 +247,27 @@ async def test_incomplete_aliyun_rebuild_skips_the_transport() -> None:
     mock_setup.assert_not_called()
     assert acct_session.aliyun_transport is None
 
+
+@pytest.mark.parametrize(
+    "connect_iot",
+    [AsyncMock(side_effect=ConnectionError("aliyun down")), AsyncMock()],
+    ids=["connect_raises", "incomplete_session"],
+)
+async def test_abandoned_aliyun_rebuild_closes_the_gateway(connect_iot: AsyncMock) -> None:
+    client = MammotionClient()
+    acct_session = AccountSession(account_id="user@test.com", email="user@test.com", password="pass")
+    acct_session.mammotion_http = _populated_mammotion_http()
+    gateway = MagicMock(aep_response=None, close=AsyncMock())
+    gateway_cls = MagicMock(return_value=gateway)
+    gateway_cls.from_cache = AsyncMock(return_value=None)
+
+    with patch("pymammotion.client.CloudIOTGateway", gateway_cls), patch.object(client, "_connect_iot", connect_iot):
+        await client._restore_aliyun("user@test.com", {}, acct_session, check_for_new_devices=False)
+
+    gateway.close.assert_awaited_once()
+    assert acct_session.cloud_client is None
+
+
 async def test_restore_aliyun_refreshes_session_before_device_list() -> None:
     """_restore_aliyun must check/refresh the Aliyun session before listing devices.
 
@@ -932,6 +953,7 @@ async def test_relogin_does_not_revoke_the_session_it_is_replacing() -> None:
     acct_session.mammotion_http = old_http
     old_cloud = MagicMock()
     old_cloud.sign_out = AsyncMock()
+    old_cloud.close = AsyncMock()
     acct_session.cloud_client = old_cloud
     await client._account_registry.register(acct_session)
 
@@ -950,5 +972,59 @@ async def test_relogin_does_not_revoke_the_session_it_is_replacing() -> None:
 
     old_http.logout.assert_not_awaited()
     old_cloud.sign_out.assert_not_awaited()
+    # Local pooled connections are released even when the session isn't revoked.
+    old_cloud.close.assert_awaited_once()
     # The replacement is still what the account ends up with.
     assert client._account_registry.get("u@x.com").mammotion_http is new_http  # type: ignore[union-attr]
+
+
+@pytest.mark.parametrize("failing_call", ["login_v2", "get_user_device_list", "get_user_device_page"])
+async def test_failed_login_closes_the_http_session(failing_call: str) -> None:
+    """An exception anywhere in the login must not leak the new keep-alive session."""
+    client = MammotionClient()
+    http = _make_mock_http()
+    http.login_v2 = AsyncMock(return_value=MagicMock(code=0))
+    http.close = AsyncMock()
+    setattr(http, failing_call, AsyncMock(side_effect=ConnectionError("down")))
+
+    with patch("pymammotion.client.MammotionHTTP", return_value=http), pytest.raises(ConnectionError):
+        await client.login_and_initiate_cloud("u@x.com", "pass")
+
+    http.close.assert_awaited_once()
+    assert client._account_registry.get("u@x.com") is None
+
+
+async def test_rejected_login_closes_the_http_session() -> None:
+    client = MammotionClient()
+    http = _make_mock_http()
+    http.login_v2 = AsyncMock(return_value=MagicMock(code=1, msg="bad password"))
+    http.close = AsyncMock()
+
+    with patch("pymammotion.client.MammotionHTTP", return_value=http), pytest.raises(LoginFailedError):
+        await client.login_and_initiate_cloud("u@x.com", "pass")
+
+    http.close.assert_awaited_once()
+
+
+@pytest.mark.parametrize("aep_response", [MagicMock(), None], ids=["connect_raises", "incomplete_session"])
+async def test_failed_aliyun_setup_during_login_closes_the_gateway(aep_response: MagicMock | None) -> None:
+    client = MammotionClient()
+    http = _make_mock_http()
+    http.login_v2 = AsyncMock(return_value=MagicMock(code=0))
+    http.close = AsyncMock()
+    http.get_user_shared_device_page = AsyncMock(return_value=MagicMock(data=MagicMock(records=[MagicMock()])))
+    gateway = MagicMock(aep_response=aep_response, close=AsyncMock())
+    gateway.get_shared_notice_list = AsyncMock(return_value=MagicMock(data=None))
+    connect_iot = AsyncMock(side_effect=ConnectionError("aliyun down") if aep_response is not None else None)
+
+    with (
+        patch("pymammotion.client.MammotionHTTP", return_value=http),
+        patch("pymammotion.client.CloudIOTGateway", return_value=gateway),
+        patch.object(client, "_connect_iot", connect_iot),
+        pytest.raises((ConnectionError, RuntimeError)),
+    ):
+        await client.login_and_initiate_cloud("u@x.com", "pass")
+
+    connect_iot.assert_awaited_once_with(gateway)
+    gateway.close.assert_awaited_once()
+    http.close.assert_awaited_once()
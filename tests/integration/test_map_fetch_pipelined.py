@@ -0,0 +1,155 @@
+"""MapFetchSaga step 4 against a simulated cloud device: strict vs pipelined.
+
+Every command the saga sends costs one invoke round trip (``RTT``) before the
+device reacts to it — exactly the Aliyun cost model that makes the strict
+one-hash-at-a-time fetch slow.  The device streams each requested hash frame by
+frame, sending frame N+1 only after the echo of frame N.
+
+The device counts how many hash requests are outstanding (requested, last frame
+not yet echoed) and how many sends are on the wire at once, so the tests check
+the window depth itself rather than wall-clock time.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+from pymammotion.data.model.hash_list import HashList, NavGetCommData, NavGetHashListData
+from pymammotion.data.model.proto_convert import from_proto
+from pymammotion.messaging.broker import DeviceMessageBroker
+from pymammotion.messaging.map_saga import MapFetchSaga
+from pymammotion.proto import CommDataCouple, LubaMsg, MctlNav, NavGetCommDataAck, NavGetHashListAck
+
+RTT = 0.01
+HASHES = [1000 + i for i in range(6)]
+FRAMES_PER_HASH = 4
+
+
+def _command_builder() -> MagicMock:
+    """Builder whose payloads name the command and its arguments, for the simulated device."""
+    cb = MagicMock()
+    cb.send_todev_ble_sync.side_effect = lambda sync_type: ("ble_sync",)
+    cb.get_all_boundary_hash_list.side_effect = lambda sub_cmd: ("hash_list",)
+    cb.get_hash_response.side_effect = lambda total_frame, current_frame: ("hash_list_ack",)
+    cb.synchronize_hash_data.side_effect = lambda hash_num: ("sync", hash_num)
+    cb.get_regional_data.side_effect = lambda regional_data: (
+        "ack",
+        regional_data.hash,
+        regional_data.current_frame,
+        regional_data.total_frame,
+    )
+    return cb
+
+
+class _SimulatedDevice:
+    """Cloud-connected mower serving map frames; optionally one hash stream at a time."""
+
+    def __init__(self, broker: DeviceMessageBroker, hash_list: HashList, *, concurrent_streams: bool = True) -> None:
+        self._broker = broker
+        self._map = hash_list
+        self._concurrent = concurrent_streams
+        self._streaming: set[int] = set()
+        self.sends = 0
+        self.max_in_flight = 0
+        self._in_flight = 0
+        self._outstanding: set[int] = set()
+        self.max_outstanding = 0
+
+    async def send(self, command: Any) -> None:
+        self.sends += 1
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(RTT)
+        finally:
+            self._in_flight -= 1
+        kind, *args = command
+        if kind == "hash_list":
+            ack = NavGetHashListAck(pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=HASHES)
+            self._map.update_root_hash_list(from_proto(NavGetHashListData, ack))
+            await self._broker.on_message(LubaMsg(nav=MctlNav(toapp_gethash_ack=ack)))
+        elif kind == "sync":
+            (hash_id,) = args
+            if self._streaming and not self._concurrent:
+                return  # busy with another hash: the request is dropped
+            self._streaming.add(hash_id)
+            self._outstanding.add(hash_id)
+            self.max_outstanding = max(self.max_outstanding, len(self._outstanding))
+            await self._push_frame(hash_id, 1)
+        elif kind == "ack":
+            hash_id, current, total = args
+            if current < total:
+                await self._push_frame(hash_id, current + 1)
+            else:
+                self._streaming.discard(hash_id)
+
+    async def _push_frame(self, hash_id: int, current: int) -> None:
+        frame = NavGetCommDataAck(
+            pver=1,
+            action=8,
+            type=0,
+            hash=hash_id,
+            total_frame=FRAMES_PER_HASH,
+            current_frame=current,
+            data_couple=[CommDataCouple(x=float(current), y=0.0)],
+        )
+        if current == FRAMES_PER_HASH:
+            self._outstanding.discard(hash_id)  # the request is answered once its last frame is out
+        # The state reducer applies each frame before the saga's queue sees it.
+        self._map.update(from_proto(NavGetCommData, frame))
+        await self._broker.on_message(LubaMsg(nav=MctlNav(toapp_get_commondata_ack=frame)))
+
+
+async def _fetch(window: int, *, concurrent_streams: bool = True) -> tuple[MapFetchSaga, _SimulatedDevice, list[int]]:
+    broker = DeviceMessageBroker()
+    hash_list = HashList()
+    device = _SimulatedDevice(broker, hash_list, concurrent_streams=concurrent_streams)
+    fallbacks: list[int] = []
+    saga = MapFetchSaga(
+        device_id="dev",
+        device_name="Luba-VSsim",
+        is_luba1=True,
+        command_builder=_command_builder(),
+        send_command=device.send,
+        get_map=lambda: hash_list,
+        pipeline_window=window,
+        on_strict_fallback=lambda: fallbacks.append(window),
+    )
+    saga.step_timeout = 0.5
+    await asyncio.wait_for(saga.execute(broker), timeout=20)
+    return saga, device, fallbacks
+
+
+def _assert_complete(saga: MapFetchSaga) -> None:
+    assert saga.result is not None
+    assert sorted(saga.result.area) == HASHES
+    assert all(saga.result.area[h].is_complete for h in HASHES)
+
+
+@pytest.mark.parametrize("window", [2, 3])
+async def test_pipelined_fetch_overlaps_round_trips(window: int) -> None:
+    strict, strict_device, _ = await _fetch(window=1)
+    piped, piped_device, fallbacks = await _fetch(window=window)
+
+    _assert_complete(strict)
+    _assert_complete(piped)
+    assert not fallbacks
+    # Same commands on the wire — pipelining reorders them, it doesn't add any.
+    assert piped_device.sends == strict_device.sends
+    # Strict keeps one hash request outstanding and one send on the wire; the
+    # pipeline keeps its whole window of requests outstanding, never more.
+    assert strict_device.max_outstanding == 1
+    assert strict_device.max_in_flight == 1
+    assert piped_device.max_outstanding == window
+
+
+async def test_device_without_concurrent_streams_falls_back_to_strict() -> None:
+    saga, _device, fallbacks = await _fetch(window=3, concurrent_streams=False)
+
+    _assert_complete(saga)
+    assert fallbacks == [3]
+    assert saga._pipeline_window == 1  # noqa: SLF001
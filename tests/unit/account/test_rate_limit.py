@@ -0,0 +1,194 @@
+"""Tests for the per-account token-bucket rate limiter."""
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pymammotion.account.rate_limit import (
+    AccountRateLimiter,
+    BucketConfig,
+    RateLimitBucket,
+    RateLimitConfig,
+    TokenBucket,
+)
+from pymammotion.account.registry import AccountSession
+from pymammotion.client import MammotionClient
+from pymammotion.device.handle import DeviceHandle
+from pymammotion.messaging.command_queue import Priority
+from pymammotion.transport.base import TransportType
+
+# ---------------------------------------------------------------------------
+# TokenBucket
+# ---------------------------------------------------------------------------
+
+
+async def test_burst_is_granted_immediately() -> None:
+    bucket = TokenBucket(rate_per_minute=60, burst=3)
+    for _ in range(3):
+        assert await asyncio.wait_for(bucket.acquire(), 0.05)
+    stats = bucket.stats()
+    assert stats.consumed == 3
+    assert stats.waited == 0
+
+
+async def test_background_is_shed_when_empty() -> None:
+    bucket = TokenBucket(rate_per_minute=1, burst=1)
+    assert await bucket.acquire(Priority.BACKGROUND)
+    assert not await bucket.acquire(Priority.BACKGROUND)
+    assert bucket.stats().shed == 1
+
+
+async def test_emergency_overdraws_instead_of_waiting() -> None:
+    bucket = TokenBucket(rate_per_minute=1, burst=1)
+    await bucket.acquire()
+    assert await asyncio.wait_for(bucket.acquire(Priority.EMERGENCY), 0.05)
+    assert bucket.stats().tokens < 0
+
+
+async def test_waiters_are_served_by_priority_then_fifo() -> None:
+    bucket = TokenBucket(rate_per_minute=1200, burst=1)  # one token every 50 ms
+    await bucket.acquire()
+    order: list[str] = []
+
+    async def take(name: str, priority: Priority) -> None:
+        await bucket.acquire(priority)
+        order.append(name)
+
+    tasks = [
+        asyncio.create_task(take("normal-1", Priority.NORMAL)),
+        asyncio.create_task(take("normal-2", Priority.NORMAL)),
+        asyncio.create_task(take("exclusive", Priority.EXCLUSIVE)),
+    ]
+    await asyncio.wait_for(asyncio.gather(*tasks), 1.0)
+
+    assert order == ["exclusive", "normal-1", "normal-2"]
+    stats = bucket.stats()
+    assert stats.waited == 3
+    assert stats.max_wait >= 0.04
+    assert stats.waiting == 0
+
+
+async def test_cancelled_waiter_does_not_hold_up_the_queue() -> None:
+    bucket = TokenBucket(rate_per_minute=1200, burst=1)
+    await bucket.acquire()
+    cancelled = asyncio.create_task(bucket.acquire(Priority.EXCLUSIVE))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    assert await asyncio.wait_for(bucket.acquire(), 0.5)
+
+
+async def test_tokens_handed_back_on_cancellation_never_exceed_burst() -> None:
+    bucket = TokenBucket(rate_per_minute=1, burst=1)
+    await bucket.acquire()
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    bucket._tokens = 1.0  # noqa: SLF001
+    bucket._serve()  # noqa: SLF001 — granted, but the waiter has not resumed yet
+    bucket._tokens = 1.0  # noqa: SLF001 — and the bucket refilled meanwhile
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    assert bucket._tokens == 1.0  # noqa: SLF001
+    assert bucket.stats().consumed == 1
+
+
+def test_rejects_non_positive_settings() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        TokenBucket(rate_per_minute=0, burst=1)
+
+
+# ---------------------------------------------------------------------------
+# AccountRateLimiter / wiring
+# ---------------------------------------------------------------------------
+
+
+async def test_buckets_are_independent() -> None:
+    limiter = AccountRateLimiter(
+        RateLimitConfig(invoke=BucketConfig(rate_per_minute=1, burst=1), http=BucketConfig(rate_per_minute=1, burst=1))
+    )
+    assert await limiter.acquire(RateLimitBucket.INVOKE, Priority.BACKGROUND)
+    assert not await limiter.acquire(RateLimitBucket.INVOKE, Priority.BACKGROUND)
+    assert await limiter.acquire(RateLimitBucket.HTTP, Priority.BACKGROUND)
+
+    stats = limiter.stats()
+    assert stats[RateLimitBucket.INVOKE].shed == 1
+    assert stats[RateLimitBucket.HTTP].consumed == 1
+    assert stats[RateLimitBucket.PROPERTIES].consumed == 0
+
+
+def test_rate_limiting_is_opt_in() -> None:
+    client = MammotionClient()
+    assert client._new_rate_limiter() is None  # noqa: SLF001
+    assert AccountSession(account_id="a").rate_limiter is None
+
+    client.rate_limit_config = RateLimitConfig()
+    first, second = client._new_rate_limiter(), client._new_rate_limiter()  # noqa: SLF001
+    assert isinstance(first, AccountRateLimiter)
+    assert first is not second
+
+
+async def test_handle_spends_invoke_tokens_only_for_cloud_sends() -> None:
+    handle = DeviceHandle(device_id="dev1", device_name="Luba-RL", initial_device=MagicMock())
+    limiter = AccountRateLimiter(RateLimitConfig(invoke=BucketConfig(rate_per_minute=1, burst=1)))
+    handle.rate_limiter = limiter
+    transport = MagicMock()
+    handle.active_transport = MagicMock(return_value=transport)  # type: ignore[method-assign]
+
+    transport.transport_type = TransportType.BLE
+    assert await handle._admit_command(Priority.BACKGROUND)  # noqa: SLF001
+    assert limiter.stats()[RateLimitBucket.INVOKE].consumed == 0
+
+    transport.transport_type = TransportType.CLOUD_ALIYUN
+    assert await handle._admit_command(Priority.BACKGROUND)  # noqa: SLF001
+    assert not await handle._admit_command(Priority.BACKGROUND)  # noqa: SLF001
+    assert limiter.stats()[RateLimitBucket.INVOKE].shed == 1
+
+
+async def test_emergency_commands_never_touch_the_invoke_bucket() -> None:
+    handle = DeviceHandle(device_id="dev1", device_name="Luba-RL", initial_device=MagicMock())
+    limiter = AccountRateLimiter(RateLimitConfig(invoke=BucketConfig(rate_per_minute=1, burst=1)))
+    handle.rate_limiter = limiter
+    handle.active_transport = MagicMock(return_value=MagicMock(transport_type=TransportType.CLOUD_ALIYUN))  # type: ignore[method-assign]
+
+    for _ in range(3):
+        assert await handle._admit_command(Priority.EMERGENCY)  # noqa: SLF001
+    assert limiter.stats()[RateLimitBucket.INVOKE].consumed == 0
+
+
+async def test_saga_frames_spend_the_saga_budget_not_the_invoke_budget() -> None:
+    handle = DeviceHandle(device_id="dev1", device_name="Luba-RL", initial_device=MagicMock())
+    limiter = AccountRateLimiter(
+        RateLimitConfig(
+            invoke=BucketConfig(rate_per_minute=1, burst=1), saga=BucketConfig(rate_per_minute=1200, burst=3)
+        )
+    )
+    handle.rate_limiter = limiter
+    handle.active_transport = MagicMock(return_value=MagicMock(transport_type=TransportType.CLOUD_ALIYUN))  # type: ignore[method-assign]
+    handle._send_marked = AsyncMock()  # type: ignore[method-assign]  # noqa: SLF001
+    handle.queue = MagicMock(is_saga_active=True)
+
+    for _ in range(5):
+        await asyncio.wait_for(handle.send_raw(b"frame", prefer_ble=False), 0.5)
+
+    assert handle._send_marked.await_count == 5  # noqa: SLF001
+    stats = limiter.stats()
+    assert stats[RateLimitBucket.INVOKE].consumed == 0
+    assert stats[RateLimitBucket.SAGA].consumed == 5
+    assert stats[RateLimitBucket.SAGA].waited == 2  # the burst went straight out, the rest were paced
+
+
+async def test_saga_frames_over_ble_are_not_metered() -> None:
+    handle = DeviceHandle(device_id="dev1", device_name="Luba-RL", initial_device=MagicMock())
+    limiter = AccountRateLimiter(RateLimitConfig(saga=BucketConfig(rate_per_minute=1, burst=1)))
+    handle.rate_limiter = limiter
+    handle.active_transport = MagicMock(return_value=MagicMock(transport_type=TransportType.BLE))  # type: ignore[method-assign]
+    handle._send_marked = AsyncMock()  # type: ignore[method-assign]  # noqa: SLF001
+    handle.queue = MagicMock(is_saga_active=True)
+
+    for _ in range(3):
+        await asyncio.wait_for(handle.send_raw(b"frame", prefer_ble=True), 0.5)
+
+    assert limiter.stats()[RateLimitBucket.SAGA].consumed == 0
\ No newline at end of file
@@ -0,0 +1,104 @@
+"""Tests for TeaSessionPool and its use by TeaCore.async_do_action.
+
+A local plain-HTTP aiohttp server stands in for the gateway; the handler records
+each request's client port so connection reuse is observable.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from aiohttp import web
+from Tea.request import TeaRequest
+
+from pymammotion.aliyun.cloud_gateway import CloudIOTGateway
+from pymammotion.aliyun.tea.core import TeaCore
+from pymammotion.aliyun.tea.session_pool import TeaSessionPool
+
+
+@asynccontextmanager
+async def _standin() -> AsyncIterator[tuple[int, list[int]]]:
+    """Run a local HTTP stand-in; yield (port, client_ports_seen)."""
+    peers: list[int] = []
+
+    async def _handler(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername")[1])  # type: ignore[union-attr]
+        return web.json_response({"code": 200})
+
+    app = web.Application()
+    app.router.add_post("/thing/service/invoke", _handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield runner.addresses[0][1], peers
+    finally:
+        await runner.cleanup()
+
+
+def _request(port: int) -> TeaRequest:
+    request = TeaRequest()
+    request.protocol = "http"
+    request.method = "POST"
+    request.port = port
+    request.pathname = "/thing/service/invoke"
+    request.headers = {"host": "127.0.0.1"}
+    request.body = "{}"
+    return request
+
+
+async def test_pooled_requests_share_one_session_and_connection() -> None:
+    pool = TeaSessionPool()
+    async with _standin() as (port, peers):
+        try:
+            for _ in range(3):
+                response = await TeaCore.async_do_action(_request(port), pool=pool)
+                assert response.status_code == 200
+        finally:
+            await pool.close()
+
+    assert pool.stats.sessions_opened == 1
+    assert pool.stats.requests == 3
+    assert len(set(peers)) == 1  # keep-alive: every request rode the same TCP connection
+
+
+async def test_unpooled_requests_open_a_connection_each() -> None:
+    async with _standin() as (port, peers):
+        for _ in range(2):
+            await TeaCore.async_do_action(_request(port))
+    assert len(set(peers)) == 2
+
+
+async def test_idle_sessions_are_evicted_on_next_checkout() -> None:
+    pool = TeaSessionPool(idle_timeout=0.0)
+    try:
+        first = await pool.session_for("http://127.0.0.1:1/")
+        second = await pool.session_for("http://127.0.0.1:1/")
+    finally:
+        await pool.close()
+
+    assert first is not second
+    assert first.closed
+    assert pool.stats.sessions_evicted == 1
+
+
+async def test_sessions_are_keyed_per_endpoint() -> None:
+    pool = TeaSessionPool()
+    try:
+        a = await pool.session_for("http://127.0.0.1:1/x")
+        b = await pool.session_for("http://127.0.0.1:1/y")
+        c = await pool.session_for("http://127.0.0.1:2/x")
+    finally:
+        await pool.close()
+
+    assert a is b
+    assert a is not c
+    assert a.closed and c.closed
+
+
+async def test_gateway_close_closes_its_pool() -> None:
+    gateway = CloudIOTGateway.__new__(CloudIOTGateway)
+    session = await gateway.http_pool.session_for("http://127.0.0.1:1/")
+    await gateway.close()
+    assert session.closed
@@ -12,7 +12,9 @@ from __future__ import annotations
 
 from unittest.mock import AsyncMock, MagicMock
 
-from pymammotion.bluetooth.ble_message import FRAG_CONTENT_LEN, MAX_DATA_LEN, BleMessage
+import pytest
+
+from pymammotion.bluetooth.ble_message import CRC_TB, FRAG_CONTENT_LEN, MAX_DATA_LEN, BleMessage
 from pymammotion.bluetooth.data.framectrldata import FrameCtrlData
 
 CUSTOM_DATA_TYPE = (19 << 2) | 1  # getTypeValue(1, 19) — pkgType=data, subType=custom data
@@ -124,3 +126,79 @@ async def test_256_byte_payload_splits_into_two_frames() -> None:
     assert not FrameCtrlData(last[1]).hasFrag()
     assert last[3] == 256 - FRAG_CONTENT_LEN
     assert await _reassemble(frames) == payload
+
+
+# ---------------------------------------------------------------------------
+# CRC and checksummed frames
+# ---------------------------------------------------------------------------
+
+
+def _table_crc(initial: int, data: bytes) -> int:
+    """The original per-byte CRC_TB loop, kept as the reference."""
+    crc = (~initial) & 0xFFFF
+    for byte in data:
+        crc = ((crc << 8) ^ CRC_TB[byte ^ (crc >> 8)]) & 0xFFFF
+    return (~crc) & 0xFFFF
+
+
+@pytest.mark.parametrize("initial", [0, 1, 0x1234, 0xFFFF])
+@pytest.mark.parametrize("data", [b"", b"\x00", bytes(range(256)), bytes(i * 7 % 256 for i in range(1000))])
+def test_calc_crc_matches_table_reference(initial: int, data: bytes) -> None:
+    assert BleMessage.calc_crc(initial, data) == _table_crc(initial, data)
+    assert BleMessage.calc_crc(initial, memoryview(data)) == _table_crc(initial, data)
+
+
+async def test_checksummed_fragments_round_trip() -> None:
+    sender, frames = _make_sender()
+    sender.mChecksum = True
+    payload = bytes(i % 251 for i in range(700))
+
+    await sender.post_custom_data_bytes(payload)
+
+    assert all(FrameCtrlData(frame[1]).isChecksum() for frame in frames)
+    assert all(len(frame) == HEADER_LEN + frame[3] + 2 for frame in frames)
+    assert await _reassemble(frames) == payload
+
+
+@pytest.mark.parametrize("offset", [HEADER_LEN, -2, -1], ids=["payload", "crc_low", "crc_high"])
+async def test_corrupted_checksum_is_rejected(offset: int) -> None:
+    sender, frames = _make_sender()
+    sender.mChecksum = True
+    await sender.post_custom_data_bytes(b"hello")
+
+    corrupted = bytearray(frames[0])
+    corrupted[offset] ^= 0xFF
+    assert BleMessage(MagicMock()).parseNotification(corrupted) == -4
+
+
+async def test_corrupted_fragment_discards_the_partial_frame() -> None:
+    sender, frames = _make_sender()
+    sender.mChecksum = True
+    await sender.post_custom_data_bytes(bytes(700))
+    receiver = BleMessage(MagicMock())
+
+    assert receiver.parseNotification(frames[0]) == 1
+    corrupted = bytearray(frames[1])
+    corrupted[-1] ^= 0xFF
+    assert receiver.parseNotification(corrupted) == -4
+    assert receiver.notification.mDataLen == 0
+
+
+def test_calc_crc_rejects_out_of_range_initial() -> None:
+    with pytest.raises(ValueError, match="between 0 and 65535"):
+        BleMessage.calc_crc(0x10000, b"")
+    with pytest.raises(TypeError):
+        BleMessage.calc_crc(0, "text")  # type: ignore[arg-type]
+
+
+def test_first_fragment_preallocates_the_whole_frame() -> None:
+    """The reassembly buffer is sized from the first fragment's length prefix and never regrown."""
+    receiver = BleMessage(MagicMock())
+    total = 700
+    frame = bytes([CUSTOM_DATA_TYPE, 0x10, 0, MAX_DATA_LEN]) + total.to_bytes(2, "little") + bytes(FRAG_CONTENT_LEN)
+
+    assert receiver.parseNotification(frame) == 1
+
+    buffer = receiver.notification.mData
+    assert len(buffer) == total
+    assert receiver.notification.mDataLen == FRAG_CONTENT_LEN
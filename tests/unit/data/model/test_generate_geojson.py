@@ -1,18 +1,23 @@
 """Tests for HashList GeoJSON generation using real device fixture data."""
 from __future__ import annotations
 
+import asyncio
+import copy
 import json
 from pathlib import Path
 
 import pytest
 
 from pymammotion.data.model.hash_list import (
+    GEOJSON_VIEWS,
+    MOW_PROGRESS_INDEX_BUCKET,
     AreaHashNameList,
     FrameList,
     HashList,
     MowPath,
     MowPathPacket,
     NavGetCommData,
+    NavGetHashListData,
     CommDataCouple,
 )
 from pymammotion.data.model.location import Dock, LocationPoint
@@ -1188,3 +1193,293 @@ def test_empty_area_name_falls_back_to_zone_template() -> None:
         props = feat["properties"]
         assert props["title"], f"title is empty for area feature with hash {props.get('hash')}"
         assert props["Name"] == props["title"]
+
+
+# ---------------------------------------------------------------------------
+# Incremental regeneration — per-hash FeatureCache
+# ---------------------------------------------------------------------------
+
+
+def _three_zone_map() -> tuple[HashList, LocationPoint, Dock]:
+    fixture = _load_fixture()
+    rtk = LocationPoint(latitude=fixture["rtk"]["latitude"], longitude=fixture["rtk"]["longitude"])
+    dock = Dock(latitude=fixture["dock"]["latitude"], longitude=fixture["dock"]["longitude"], rotation=fixture["dock"]["rotation"])
+    square = [(0.0, 0.0), (5.0, 0.0), (5.0, 5.0), (0.0, 5.0)]
+    hash_list = HashList()
+    _install_frame(hash_list.area, _make_frame(0, 101, square))
+    _install_frame(hash_list.area, _make_frame(0, 102, [(x + 10, y) for x, y in square]))
+    _install_frame(hash_list.obstacle, _make_frame(1, 201, [(1.0, 1.0), (2.0, 1.0), (2.0, 2.0)]))
+    return hash_list, rtk, dock
+
+
+def test_regeneration_reconverts_only_the_changed_hash() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.generate_geojson(rtk, dock)
+    cache = hash_list._geojson_feature_cache
+    assert (cache.hits, cache.misses) == (0, 3)
+
+    before = {f["properties"].get("hash"): f for f in hash_list.generated_geojson["features"]}
+    # Copy-on-write edit of the obstacle only.
+    moved = _make_frame(1, 201, [(1.0, 1.0), (3.0, 1.0), (3.0, 3.0)])
+    hash_list.obstacle = {**hash_list.obstacle, 201: FrameList(total_frame=1, sub_cmd=0, data=[moved])}
+    hash_list.generate_geojson(rtk, dock)
+    after = {f["properties"].get("hash"): f for f in hash_list.generated_geojson["features"]}
+
+    assert (cache.hits, cache.misses) == (2, 4)
+    assert after[101]["geometry"]["coordinates"][0] is before[101]["geometry"]["coordinates"][0]
+    assert after[201]["geometry"] != before[201]["geometry"]
+
+    fresh, _, _ = _three_zone_map()
+    fresh.obstacle = hash_list.obstacle
+    fresh.generate_geojson(rtk, dock)
+    assert hash_list.generated_geojson == fresh.generated_geojson
+
+
+def test_yaw_change_invalidates_every_cached_feature() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.generate_geojson(rtk, dock)
+    cache = hash_list._geojson_feature_cache
+
+    rtk.yaw = 0.5
+    hash_list.generate_geojson(rtk, dock)
+
+    assert cache.hits == 0
+    assert cache.misses == 6
+
+
+def test_labels_follow_other_hashes_and_removed_hashes_are_pruned() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.generate_geojson(rtk, dock)
+
+    hash_list.area_name = [AreaHashNameList(name="Front", hash=101)]
+    hash_list.area = {h: fl for h, fl in hash_list.area.items() if h != 102}
+    hash_list.generate_geojson(rtk, dock)
+
+    titles = {f["properties"].get("hash"): f["properties"]["title"] for f in hash_list.generated_geojson["features"]}
+    assert titles[101] == "Front"
+    assert 102 not in titles
+    assert set(hash_list._geojson_feature_cache.entries) == {("area", 101), ("obstacle", 201)}
+
+
+# ---------------------------------------------------------------------------
+# Views — never built on read, rebuilt by async_geojson when their inputs move
+# ---------------------------------------------------------------------------
+
+
+async def test_reading_a_view_never_builds_it() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.set_geojson_origin(rtk, dock)
+
+    assert hash_list.generated_geojson == {}
+    assert "generated_geojson" in hash_list.stale_geojson_views()
+
+    view = await hash_list.async_geojson("generated_geojson")
+    assert {f["properties"].get("hash") for f in view["features"]} >= {101, 102, 201}
+    assert hash_list.generated_geojson is view
+    assert "generated_geojson" not in hash_list.stale_geojson_views()
+    assert await hash_list.async_geojson("generated_geojson") is view
+
+    hash_list.area = {h: fl for h, fl in hash_list.area.items() if h != 102}
+    assert hash_list.generated_geojson is view
+    rebuilt = await hash_list.async_geojson("generated_geojson")
+    assert 102 not in {f["properties"].get("hash") for f in rebuilt["features"]}
+
+
+def test_views_are_not_serialised() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.generate_geojson(rtk, dock)
+
+    payload = hash_list.to_dict()
+    assert not set(GEOJSON_VIEWS) & set(payload)
+
+
+async def test_small_yaw_jitter_keeps_the_map_view() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.generate_geojson(rtk, dock)
+    view = hash_list.generated_geojson
+
+    rtk.yaw += 0.005
+    hash_list.set_geojson_origin(rtk, dock)
+    assert "generated_geojson" not in hash_list.stale_geojson_views()
+
+    rtk.yaw += 0.5
+    hash_list.set_geojson_origin(rtk, dock)
+    assert await hash_list.async_geojson("generated_geojson") is not view
+    assert hash_list.geojson_yaw == rtk.yaw
+
+
+async def test_incomplete_map_keeps_the_last_view() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.generate_geojson(rtk, dock)
+    view = hash_list.generated_geojson
+
+    hash_list.update_root_hash_list(
+        NavGetHashListData(pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=[101, 102, 201, 999])
+    )
+    assert await hash_list.async_geojson("generated_geojson") is view
+
+
+async def test_map_with_a_no_go_zone_builds_its_view() -> None:
+    """A type-23 root hash counts as fetched, so the view matches the eager build."""
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.update(_make_frame(23, 2002, [(20.0, 0.0), (24.0, 0.0), (24.0, 4.0)]))
+    hash_list.update_root_hash_list(
+        NavGetHashListData(pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=[101, 102, 201, 2002])
+    )
+    assert hash_list.missing_hashlist(0) == [2002]  # the key-presence check ignores no-go zones
+    assert hash_list.find_incomplete_hashes(0) == []
+
+    hash_list.set_geojson_origin(rtk, dock)
+    view = await hash_list.async_geojson("generated_geojson")
+
+    eager, _, _ = _three_zone_map()
+    eager.no_go_zone = hash_list.no_go_zone
+    eager.root_hash_lists = hash_list.root_hash_lists
+    eager.generate_geojson(rtk, dock)
+    assert view["features"]
+    assert view == eager.generated_geojson
+
+
+async def test_mow_progress_view_rebuilds_per_now_index_bucket() -> None:
+    device = _device_with_mow_path(0.3)
+    device.map.set_geojson_origin(device.location.RTK)
+    device.map.set_mow_progress(0, 0, 0, 0)
+    view = await device.map.async_geojson("generated_mow_progress_geojson")
+    assert view["features"]
+
+    device.map.set_mow_progress(MOW_PROGRESS_INDEX_BUCKET - 1, 0, 0, 0)
+    assert "generated_mow_progress_geojson" not in device.map.stale_geojson_views()
+
+    device.map.set_mow_progress(MOW_PROGRESS_INDEX_BUCKET, 0, 0, 0)
+    assert device.map.generated_mow_progress_geojson is view
+    assert await device.map.async_geojson("generated_mow_progress_geojson") is not view
+
+
+async def test_view_without_recorded_origin_is_never_stale() -> None:
+    device = _device_with_mow_path(0.3)
+    device.map.update_dynamics_line([CommDataCouple(x=0.0, y=0.0), CommDataCouple(x=1.0, y=1.0)])
+    assert device.map.stale_geojson_views() == []
+    assert await device.map.async_geojson("generated_dynamics_line_geojson") == {}
+
+    device.map.set_geojson_origin(device.location.RTK)
+    view = await device.map.async_geojson("generated_dynamics_line_geojson")
+    assert view["type"] == "FeatureCollection"
+
+
+async def test_newer_copy_adopts_views_built_on_an_older_one() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.set_geojson_origin(rtk, dock)
+    newer = copy.copy(hash_list)
+    moved = copy.copy(hash_list)
+    moved.area = {h: fl for h, fl in hash_list.area.items() if h != 102}
+
+    view = await hash_list.async_geojson("generated_geojson")
+    newer.adopt_geojson(hash_list)
+    moved.adopt_geojson(hash_list)
+
+    assert newer.generated_geojson is view
+    assert "generated_geojson" not in newer.stale_geojson_views()
+    # Its frames moved on since the build started, so the view does not fit it.
+    assert moved.generated_geojson == {}
+    assert "generated_geojson" in moved.stale_geojson_views()
+
+
+async def test_async_geojson_builds_off_the_loop_and_keeps_the_result() -> None:
+    hash_list, rtk, dock = _three_zone_map()
+    hash_list.set_geojson_origin(rtk, dock)
+
+    view = await hash_list.async_geojson("generated_geojson")
+
+    assert view["features"]
+    assert hash_list.generated_geojson is view
+    assert hash_list.geojson_yaw == rtk.yaw
+    with pytest.raises(ValueError, match="not a GeoJSON view"):
+        await hash_list.async_geojson("area")
+
+
+# ---------------------------------------------------------------------------
+# NumPy batch transform — must match the per-point path
+# ---------------------------------------------------------------------------
+
+
+def _fixture_points() -> list[CommDataCouple]:
+    fixture = _load_fixture()
+    return [CommDataCouple(x=c["x"], y=c["y"]) for raw in fixture["area_frames"] for c in raw["data_couple"]]
+
+
+@pytest.mark.parametrize("closed", [False, True])
+def test_batch_transform_and_stats_match_per_point_path(monkeypatch: pytest.MonkeyPatch, closed: bool) -> None:
+    from shapely.geometry import Point
+
+    from pymammotion.data.model.generate_geojson import GeojsonGenerator
+
+    points = _fixture_points()
+    rtk = Point(-36.7395, 174.6252)
+    assert len(points) >= GeojsonGenerator.VECTORISE_MIN_POINTS
+
+    batch_coords = GeojsonGenerator._convert_to_lonlat_coords(points, rtk, yaw=0.7)
+    batch_stats = GeojsonGenerator.map_object_stats(points, closed=closed)
+    monkeypatch.setattr(GeojsonGenerator, "VECTORISE_MIN_POINTS", len(points) + 1)
+    loop_coords = GeojsonGenerator._convert_to_lonlat_coords(points, rtk, yaw=0.7)
+    loop_stats = GeojsonGenerator.map_object_stats(points, closed=closed)
+
+    assert batch_coords == loop_coords
+    assert batch_stats == pytest.approx(loop_stats, rel=1e-12)
+    assert (batch_stats[1] > 0) is closed
+
+
+# ---------------------------------------------------------------------------
+# DeviceHandle.refresh_geojson — builds stale views off the loop
+# ---------------------------------------------------------------------------
+
+
+async def test_handle_refresh_builds_stale_views_and_hands_them_to_the_current_map() -> None:
+    import dataclasses
+    from unittest.mock import patch
+
+    from pymammotion.data.model import hash_list as hash_list_module
+    from pymammotion.device.handle import DeviceHandle
+
+    device = _device_with_mow_path(0.3)
+    handle = DeviceHandle(device_id="dev1", device_name="Luba-View", initial_device=device)
+    device.map.set_geojson_origin(device.location.RTK)
+    device.map.set_mow_progress(0, 0, 0, 0)
+
+    stale = device.map.stale_geojson_views()
+    built: list[str] = []
+
+    def _counting_build(snapshot: HashList, name: str):
+        built.append(name)
+        return build(snapshot, name)
+
+    build = hash_list_module._build_detached_view
+    with patch.object(hash_list_module, "_build_detached_view", _counting_build):
+        handle.refresh_geojson()
+        task = handle._geojson_task
+        assert task is not None
+        await asyncio.sleep(0)  # the first build is now running on the original map
+        # A report lands while the builds run: the reducer swaps in a map copy.
+        swapped = dataclasses.replace(device)
+        swapped.map = copy.copy(device.map)
+        handle.state_machine.apply(swapped, handle._availability)
+        await task
+
+    assert built == stale  # adopted by the new copy, not built again for it
+
+    current = handle.snapshot.raw.map
+    assert current is swapped.map
+    assert current.generated_mow_path_geojson["features"]
+    assert current.generated_mow_progress_geojson["features"]
+    assert current.stale_geojson_views() == []
+    await handle.stop()
+
+
+async def test_serialising_a_device_does_not_build_its_views() -> None:
+    device = _device_with_mow_path(0.3)
+    device.map.set_geojson_origin(device.location.RTK)
+
+    payload = device.to_dict()
+
+    assert device.map.generated_mow_path_geojson == {}
+    assert "generated_mow_path_geojson" in device.map.stale_geojson_views()
+    assert not set(GEOJSON_VIEWS) & set(payload["map"])
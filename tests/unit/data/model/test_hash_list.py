@@ -7,6 +7,7 @@ Grouped by the method under test:
   * HashList.find_incomplete_hashes
   * HashList.update_hash_lists (area-name preservation / pruning)
   * HashList.invalidate_breakpoint_line
+  * Received-frame bitmaps (frame lists and mow-path transactions)
 
 GeoJSON generation lives in test_generate_geojson.py (it mirrors
 generate_geojson.py); saga/state-reducer flows live in their own modules.
@@ -16,14 +17,18 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from pymammotion.data.model.hash_list import (
     AreaHashNameList,
     FrameList,
     HashList,
+    MowPath,
     NavGetCommData,
     NavGetHashListData,
     NavNameTime,
     PathType,
+    SvgMessage,
 )
 
 
@@ -528,6 +533,44 @@ class TestFindIncompleteHashes:
         hl.update(_comm_frame(501, type_code=99))
         assert hl.find_incomplete_hashes(0) == []
 
+    def test_update_carries_the_answer_without_rescanning(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        hl = HashList()
+        hl.update_root_hash_list(_root([600, 601, 602]))
+        assert hl.find_incomplete_hashes(0) == [600, 601, 602]
+        scans: list[int] = []
+        original = HashList._scan_incomplete_hashes  # noqa: SLF001
+        monkeypatch.setattr(
+            HashList, "_scan_incomplete_hashes", lambda self, sub_cmd: scans.append(sub_cmd) or original(self, sub_cmd)
+        )
+
+        hl.update(_comm_frame(601, PathType.AREA, current=1, total=2))
+        assert hl.find_incomplete_hashes(0) == [600, 601, 602]
+        hl.update(_comm_frame(601, PathType.AREA, current=2, total=2))
+        hl.update(_comm_frame(600, PathType.OBSTACLE))
+        assert hl.find_incomplete_hashes(0) == [602]
+        assert scans == []
+
+    def test_partial_svg_tile_reopens_a_finished_area(self) -> None:
+        hl = HashList()
+        hl.update_root_hash_list(_root([700, 701]))
+        hl.update(_comm_frame(700, PathType.AREA))
+        assert hl.find_incomplete_hashes(0) == [701]
+        hl.update(SvgMessage(data_hash=900, paternal_hash_a=700, total_frame=2, current_frame=1))
+        assert hl.find_incomplete_hashes(0) == [700, 701]
+        hl.update(SvgMessage(data_hash=900, paternal_hash_a=700, total_frame=2, current_frame=2))
+        assert hl.find_incomplete_hashes(0) == [701]
+
+    def test_answer_follows_containers_replaced_outside_update(self) -> None:
+        hl = HashList()
+        hl.update_root_hash_list(_root([800, 801]))
+        hl.update(_comm_frame(800, PathType.AREA))
+        hl.update(_comm_frame(801, PathType.AREA))
+        assert hl.find_incomplete_hashes(0) == []
+        hl.area = {800: hl.area[800]}
+        assert hl.find_incomplete_hashes(0) == [801]
+        hl.update_root_hash_list(NavGetHashListData(pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=[802]))
+        assert hl.find_incomplete_hashes(0) == [802]
+
 
 # ---------------------------------------------------------------------------
 # HashList.update_hash_lists — prunes geometry to the manifest, preserves names
@@ -826,3 +869,152 @@ class TestLuba3SnapshotAreaNames:
     def test_survives_a_storage_round_trip(self) -> None:
         restored = HashList.from_dict(json.loads(json.dumps(self._snapshot().to_dict())))
         assert {a.hash: a.name for a in restored.computed_areas} == dict((h, n) for n, h in self._NAMES)
+
+
+# ---------------------------------------------------------------------------
+# Copy-on-write: a shallow copy.copy() is an independent snapshot
+# ---------------------------------------------------------------------------
+
+
+class TestCopyOnWrite:
+    """Mutators rebind what they touch so shallow copies never observe writes."""
+
+    def _seeded(self) -> HashList:
+        hl = HashList()
+        hl.update_root_hash_list(_root([1, 2]))
+        hl.update(_comm_frame(1, PathType.AREA, current=1, total=2))
+        hl.update(_comm_frame(2, PathType.AREA))
+        return hl
+
+    def test_new_frame_leaves_predecessor_untouched(self) -> None:
+        import copy
+
+        before = self._seeded()
+        after = copy.copy(before)
+        after.update(_comm_frame(1, PathType.AREA, current=2, total=2))
+        assert len(before.area[1].data) == 1
+        assert len(after.area[1].data) == 2
+        # Only the FrameList on the path to the new frame is copied.
+        assert after.area[2] is before.area[2]
+        assert after.area[1] is not before.area[1]
+
+    def test_duplicate_frame_does_not_copy(self) -> None:
+        import copy
+
+        before = self._seeded()
+        after = copy.copy(before)
+        after.update(_comm_frame(2, PathType.AREA))
+        assert after.area[2] is before.area[2]
+
+    def test_root_hash_list_frame_replaces_without_mutation(self) -> None:
+        import copy
+
+        before = self._seeded()
+        after = copy.copy(before)
+        after.update_root_hash_list(_root([1, 2, 3]))
+        assert before.hashlist == [1, 2]
+        assert after.hashlist == [1, 2, 3]
+
+    def test_area_name_upsert_leaves_predecessor_untouched(self) -> None:
+        import copy
+
+        before = _make_hash_list(area_name=[AreaHashNameList(name="One", hash=111)])
+        after = copy.copy(before)
+        after.upsert_area_name(111, "Renamed")
+        assert before.area_name[0].name == "One"
+        assert after.area_name[0].name == "Renamed"
+
+    def test_unknown_type_and_edge_frames_are_path_copied(self) -> None:
+        import copy
+
+        before = HashList()
+        after = copy.copy(before)
+        after.update(_comm_frame(5, 99))
+        after.upsert_edge_frame(7, action=0, edge_type=0, total_frame=2, current_frame=1, points=[])
+        assert before.unknown_type_frames == {}
+        assert before.edge_points == {}
+        assert 5 in after.unknown_type_frames[99]
+        assert after.edge_points[7].frames == {1: []}
+
+
+# ---------------------------------------------------------------------------
+# Received-frame bitmaps
+# ---------------------------------------------------------------------------
+
+
+def _mow_frame(transaction_id: int, current: int, total: int) -> MowPath:
+    return MowPath(transaction_id=transaction_id, current_frame=current, total_frame=total)
+
+
+class TestFrameBitmaps:
+    """Missing-frame queries read bitmaps maintained as frames are inserted."""
+
+    def test_out_of_order_frames_report_the_gaps(self) -> None:
+        hl = HashList()
+        for current in (5, 1, 3):
+            hl.update(_comm_frame(1, PathType.AREA, current=current, total=6))
+        assert hl.area[1].missing_frames() == [2, 4, 6]
+        assert not hl.area[1].is_complete
+        for current in (6, 2, 4):
+            hl.update(_comm_frame(1, PathType.AREA, current=current, total=6))
+        assert hl.area[1].missing_frames() == []
+        assert hl.area[1].is_complete
+
+    def test_in_place_append_is_picked_up(self) -> None:
+        frames = FrameList(total_frame=3, data=[NavGetCommData(current_frame=1)])
+        assert frames.missing_frames() == [2, 3]
+        frames.data.append(NavGetCommData(current_frame=3))
+        assert frames.missing_frames() == [2]
+
+    def test_restored_frame_list_is_rescanned(self) -> None:
+        hl = HashList()
+        hl.update(_comm_frame(1, PathType.AREA, current=2, total=3))
+        restored = HashList.from_dict(hl.to_dict())
+        assert HashList.find_missing_frames(restored.area[1]) == [1, 3]
+
+    def test_mow_path_missing_frames_and_count_agree(self) -> None:
+        hl = HashList()
+        hl.update_mow_path(_mow_frame(10, current=2, total=4))
+        hl.update_mow_path(_mow_frame(20, current=1, total=1))
+        assert hl.find_missing_mow_path_frames() == {10: [1, 3, 4]}
+        assert hl.missing_mow_path_frame_count() == 3
+        for current in (1, 3, 4):
+            hl.update_mow_path(_mow_frame(10, current=current, total=4))
+        assert hl.find_missing_mow_path_frames() == {}
+        assert hl.missing_mow_path_frame_count() == 0
+
+    def test_mow_path_transaction_is_copied_once_then_filled_in_place(self) -> None:
+        import copy
+
+        hl = HashList()
+        hl.update_mow_path(_mow_frame(10, current=1, total=3))
+        frames = hl.current_mow_path[10]
+        later = copy.copy(hl)  # what the reducer does per frame
+        later.update_mow_path(_mow_frame(10, current=2, total=3))
+        later.update_mow_path(_mow_frame(10, current=3, total=3))
+        assert later.current_mow_path[10] is frames
+        assert later.current_mow_path is not hl.current_mow_path
+        assert later.missing_mow_path_frame_count() == 0
+
+    def test_mow_path_restored_transaction_is_copied_before_filling(self) -> None:
+        hl = HashList()
+        hl.update_mow_path(_mow_frame(10, current=1, total=2))
+        restored = HashList.from_dict(hl.to_dict())
+        frames = restored.current_mow_path[10]
+        restored.update_mow_path(_mow_frame(10, current=2, total=2))
+        assert restored.current_mow_path[10] is not frames
+        assert list(frames) == [1]
+
+    def test_mow_path_detached_snapshot_keeps_its_own_count(self) -> None:
+        hl = HashList()
+        hl.update_mow_path(_mow_frame(10, current=1, total=2))
+        snapshot = hl.detached_copy()
+        hl.update_mow_path(_mow_frame(10, current=2, total=2))
+        assert snapshot.missing_mow_path_frame_count() == 1
+        assert hl.missing_mow_path_frame_count() == 0
+
+    def test_dropped_transaction_no_longer_counts(self) -> None:
+        hl = HashList()
+        hl.update_mow_path(_mow_frame(10, current=1, total=5))
+        hl.current_mow_path.pop(10)
+        assert hl.missing_mow_path_frame_count() == 0
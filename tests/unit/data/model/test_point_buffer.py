@@ -0,0 +1,107 @@
+"""Unit tests for pymammotion.data.model.point_buffer (PointBuffer) and its use in HashList."""
+
+from __future__ import annotations
+
+import copy
+import pickle
+
+import numpy as np
+import pytest
+
+from pymammotion.data.model.hash_list import (
+    CommDataCouple,
+    HashList,
+    MowPathPacket,
+    NavGetCommData,
+    PathType,
+)
+from pymammotion.data.model.point_buffer import PointBuffer
+from pymammotion.proto import CommDataCouple as CommDataCoupleProto
+
+POINTS = [CommDataCouple(x=1.0, y=2.0), CommDataCouple(x=3.5, y=-4.0), CommDataCouple(x=0.0, y=9.25)]
+
+
+# ---------------------------------------------------------------------------
+# Sequence behaviour
+# ---------------------------------------------------------------------------
+
+
+def test_behaves_like_a_list_of_couples() -> None:
+    buf = PointBuffer(POINTS)
+    assert len(buf) == 3
+    assert buf == POINTS
+    assert list(buf) == POINTS
+    assert buf[1] == CommDataCouple(x=3.5, y=-4.0)
+    assert buf[-1] == POINTS[-1]
+    assert buf[1:] == POINTS[1:]
+    assert buf[::2] == POINTS[::2]
+    assert isinstance(buf[1:], PointBuffer)
+    with pytest.raises(IndexError):
+        buf[3]
+
+
+def test_accepts_proto_couples_and_concatenates() -> None:
+    buf = PointBuffer(CommDataCoupleProto(x=p.x, y=p.y) for p in POINTS)
+    assert buf == POINTS
+    assert buf + POINTS[:1] == [*POINTS, POINTS[0]]
+    assert POINTS[:1] + buf == [POINTS[0], *POINTS]
+    assert PointBuffer.join([buf, [], buf[:1]]) == [*POINTS, POINTS[0]]
+
+
+def test_from_coords_rejects_odd_length() -> None:
+    assert PointBuffer.from_coords([1.0, 2.0]) == [CommDataCouple(x=1.0, y=2.0)]
+    with pytest.raises(ValueError, match="even length"):
+        PointBuffer.from_coords([1.0, 2.0, 3.0])
+
+
+def test_exposes_interleaved_float64_buffer() -> None:
+    arr = np.frombuffer(PointBuffer(POINTS), dtype=np.float64)
+    assert arr.tolist() == [1.0, 2.0, 3.5, -4.0, 0.0, 9.25]
+    assert not arr.flags.writeable
+
+
+def test_copies_share_the_immutable_buffer() -> None:
+    buf = PointBuffer(POINTS)
+    assert copy.copy(buf) is buf
+    assert copy.deepcopy(buf) is buf
+    assert PointBuffer(buf).coords is buf.coords
+    assert pickle.loads(pickle.dumps(buf)) == buf
+
+
+# ---------------------------------------------------------------------------
+# Model integration
+# ---------------------------------------------------------------------------
+
+
+def test_models_pack_lists_and_keep_the_json_shape() -> None:
+    frame = NavGetCommData(hash=1, type=PathType.AREA, total_frame=1, current_frame=1, data_couple=POINTS)
+    assert isinstance(frame.data_couple, PointBuffer)
+    assert frame.to_dict()["data_couple"] == [{"x": p.x, "y": p.y} for p in POINTS]
+    assert NavGetCommData.from_json(frame.to_json()) == frame
+    assert isinstance(MowPathPacket(data_couple=POINTS).data_couple, PointBuffer)
+
+
+def test_hash_list_round_trips_points_through_dict() -> None:
+    hash_list = HashList()
+    hash_list.update(NavGetCommData(hash=7, type=PathType.AREA, total_frame=1, current_frame=1, data_couple=POINTS))
+    hash_list.update_dynamics_line(POINTS)
+    hash_list.upsert_edge_frame(hash_key=9, action=0, edge_type=0, total_frame=2, current_frame=2, points=POINTS[1:])
+    hash_list.upsert_edge_frame(hash_key=9, action=0, edge_type=0, total_frame=2, current_frame=1, points=POINTS[:1])
+
+    restored = HashList.from_dict(hash_list.to_dict())
+
+    assert restored.area[7].data[0].data_couple == POINTS
+    assert isinstance(restored.dynamics_line, PointBuffer)
+    assert restored.dynamics_line == POINTS
+    assert restored.edge_points[9].all_points == POINTS
+
+
+def test_dynamics_line_frames_accumulate() -> None:
+    hash_list = HashList()
+    for current_frame, chunk in ((1, POINTS[:2]), (2, POINTS[2:])):
+        hash_list.update(
+            NavGetCommData(
+                hash=3, type=PathType.DYNAMICS_LINE, total_frame=2, current_frame=current_frame, data_couple=chunk
+            )
+        )
+    assert hash_list.dynamics_line == POINTS
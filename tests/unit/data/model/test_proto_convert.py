@@ -0,0 +1,100 @@
+"""from_proto must produce exactly what Model.from_dict(msg.to_dict(casing=SNAKE)) did."""
+
+from __future__ import annotations
+
+import dataclasses
+import random
+from typing import Any
+
+import betterproto2
+import pytest
+
+from pymammotion import proto
+from pymammotion.data.model import report_info
+from pymammotion.data.model.hash_list import MowPath, NavGetCommData, NavGetHashListData, Plan, SvgMessage
+from pymammotion.data.model.point_buffer import PointBuffer
+from pymammotion.data.model.proto_convert import from_proto
+
+_REPORT = proto.ReportInfoData._betterproto.cls_by_field
+
+PAIRS: list[tuple[type, type]] = [
+    (NavGetHashListData, proto.NavGetHashListAck),
+    (NavGetCommData, proto.NavGetCommDataAck),
+    (SvgMessage, proto.SvgMessageAckT),
+    (MowPath, proto.CoverPathUploadT),
+    (Plan, proto.NavPlanJobSet),
+    (report_info.ConnectData, _REPORT["connect"]),
+    (report_info.DeviceData, _REPORT["dev"]),
+    (report_info.RTKData, _REPORT["rtk"]),
+    (report_info.Maintain, _REPORT["maintain"]),
+    (report_info.VisionInfo, _REPORT["vio_to_app_info"]),
+    (report_info.LocationData, _REPORT["locations"]),
+    (report_info.WorkData, _REPORT["work"]),
+    (report_info.BasestationInfo, _REPORT["basestation_info"]),
+    (report_info.CutterWorkModeInfo, _REPORT["cutter_work_mode_info"]),
+    (report_info.VisionPointInfo, _REPORT["vision_point_info"]),
+    (report_info.VisionStatisticInfo, _REPORT["vision_statistic_info"]),
+]
+
+_INT_RANGES = {"int32": 2**31 - 1, "uint32": 2**32 - 1, "fixed32": 2**32 - 1, "sint32": 2**31 - 1}
+
+
+def _random_scalar(rng: random.Random, proto_type: str, enum_cls: Any) -> Any:
+    if rng.random() < 0.3:
+        return enum_cls(0) if proto_type == "enum" else {"string": "", "bool": False, "bytes": b""}.get(proto_type, 0)
+    if proto_type == "enum":
+        return rng.choice(list(enum_cls))
+    if proto_type in ("float", "double"):
+        return round(rng.uniform(-1000, 1000), 3)
+    if proto_type == "bool":
+        return True
+    if proto_type == "string":
+        return rng.choice(["area", "Front Lawn", "x"])
+    if proto_type == "bytes":
+        return bytes(rng.randrange(256) for _ in range(4))
+    return rng.randrange(0, _INT_RANGES.get(proto_type, 2**40))
+
+
+def _random_message(rng: random.Random, cls: type, depth: int = 0) -> Any:
+    meta = cls._betterproto
+    kwargs: dict[str, Any] = {}
+    for name, field in meta.meta_by_field_name.items():
+        sub_cls = meta.cls_by_field.get(name)
+        if field.proto_type == "map" or (field.group is not None and rng.random() < 0.5):
+            continue
+        if field.proto_type == "message":
+            if depth > 3 or rng.random() < 0.2:
+                continue
+            make = lambda: _random_message(rng, sub_cls, depth + 1)  # noqa: E731
+        else:
+            make = lambda: _random_scalar(rng, field.proto_type, sub_cls)  # noqa: E731
+        kwargs[name] = [make() for _ in range(rng.randrange(0, 4))] if field.repeated else make()
+    return cls(**kwargs)
+
+
+def _fields(model: Any) -> dict[str, Any]:
+    # Some models (NavGetHashListData) are declared eq=False, so compare field by field.
+    return {f.name: getattr(model, f.name) for f in dataclasses.fields(model)}
+
+
+@pytest.mark.parametrize(("model_cls", "proto_cls"), PAIRS, ids=lambda c: c.__name__)
+def test_from_proto_matches_dict_round_trip(model_cls: type, proto_cls: type) -> None:
+    rng = random.Random(proto_cls.__name__)
+    for _ in range(50):
+        message = _random_message(rng, proto_cls)
+        expected = model_cls.from_dict(message.to_dict(casing=betterproto2.Casing.SNAKE))
+        assert _fields(from_proto(model_cls, message)) == _fields(expected)
+
+
+def test_default_message_keeps_model_defaults() -> None:
+    assert from_proto(report_info.DeviceData, proto.RptDevStatus()) == report_info.DeviceData()
+
+
+def test_map_frame_points_land_in_a_point_buffer() -> None:
+    ack = proto.NavGetCommDataAck(hash=2**40, data_couple=[proto.CommDataCouple(x=1.5, y=-2.0)] * 3)
+
+    frame = from_proto(NavGetCommData, ack)
+
+    assert isinstance(frame.data_couple, PointBuffer)
+    assert frame.hash == 2**40
+    assert len(frame.data_couple) == 3
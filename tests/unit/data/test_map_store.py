@@ -0,0 +1,198 @@
+"""Unit tests for pymammotion.data.map_store (on-disk map cache) and the client's warm start."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+import struct
+from pathlib import Path
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pymammotion.client import MammotionClient
+from pymammotion.data.map_store import FORMAT_VERSION, MapStore, MapStoreError, decode_map, encode_map
+from pymammotion.data.model.device import MowingDevice
+from pymammotion.data.model.hash_list import (
+    AreaHashNameList,
+    CommDataCouple,
+    HashList,
+    MowPath,
+    NavGetCommData,
+    NavGetHashListData,
+    Plan,
+)
+
+_AREAS = [1001, 1002, 1003]
+
+
+def _synced_map() -> HashList:
+    """A complete three-area map with names, a plan and a cached mow path."""
+    hl = HashList()
+    hl.update_root_hash_list(
+        NavGetHashListData(pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=list(_AREAS))
+    )
+    for i, hash_id in enumerate(_AREAS):
+        hl.update(
+            NavGetCommData(
+                pver=1,
+                action=8,
+                type=0,
+                hash=hash_id,
+                total_frame=1,
+                current_frame=1,
+                data_couple=[CommDataCouple(x=float(i), y=0.5), CommDataCouple(x=float(i) + 1, y=2.25)],
+            )
+        )
+    hl.area_name = [AreaHashNameList(name=f"Zone {h}", hash=h) for h in _AREAS]
+    hl.update_plan(Plan(plan_id="p1", task_name="Front", zone_hashs=[_AREAS[0]]))
+    hl.update_mow_path(MowPath(transaction_id=7, current_frame=1, total_frame=1))
+    hl.generated_geojson = {"type": "FeatureCollection", "features": [{"id": 1}]}
+    return hl
+
+
+class TestEncoding:
+    def test_round_trip_keeps_frames_names_plans_and_mow_path(self) -> None:
+        original = _synced_map()
+        stored = decode_map(encode_map(original, saved_at=123.5))
+
+        restored = stored.hash_list
+        assert stored.saved_at == 123.5
+        assert stored.bol_hash == original.computed_bol_hash
+        assert restored.is_map_synced(original.computed_bol_hash)
+        assert restored.area == original.area
+        assert list(restored.area[_AREAS[1]].data[0].data_couple) == [
+            CommDataCouple(x=1.0, y=0.5),
+            CommDataCouple(x=2.0, y=2.25),
+        ]
+        assert restored.area_name == original.area_name
+        assert restored.plan == original.plan
+        assert restored.current_mow_path == original.current_mow_path
+
+    def test_generated_geojson_is_not_stored(self) -> None:
+        restored = decode_map(encode_map(_synced_map())).hash_list
+        assert restored.generated_geojson == {}
+        assert restored.geojson_needs_regeneration(MowingDevice().location.RTK)
+
+    @pytest.mark.parametrize(
+        ("corrupt", "match"),
+        [
+            (lambda data: b"", "truncated"),
+            (lambda data: b"PMAP", "truncated"),
+            (lambda data: b"XXXX" + data[4:], "not a map file"),
+            (lambda data: data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:], "version"),
+            (lambda data: data[:-10], "body is unreadable"),
+        ],
+        ids=["empty", "header_only", "bad_magic", "other_version", "truncated_body"],
+    )
+    def test_rejects_other_versions_and_garbage(self, corrupt: Callable[[bytes], bytes], match: str) -> None:
+        with pytest.raises(MapStoreError, match=match):
+            decode_map(corrupt(encode_map(_synced_map())))
+
+
+class TestMapStore:
+    def test_save_then_load(self, tmp_path: Path) -> None:
+        store = MapStore(tmp_path / "maps")
+        store.save("Luba-ABC", _synced_map())
+
+        stored = store.load("Luba-ABC")
+        assert stored is not None
+        assert set(stored.hash_list.area) == set(_AREAS)
+
+    def test_missing_and_corrupt_files_are_a_miss(self, tmp_path: Path) -> None:
+        store = MapStore(tmp_path)
+        assert store.load("Luba-ABC") is None
+
+        store.path_for("Luba-ABC").write_bytes(b"PMAP\x01\x00garbage")
+        assert store.load("Luba-ABC") is None
+
+    def test_save_replaces_atomically_and_leaves_no_temp_files(self, tmp_path: Path) -> None:
+        store = MapStore(tmp_path)
+        store.save("Luba-ABC", HashList())
+        store.save("Luba-ABC", _synced_map())
+
+        assert [p.name for p in tmp_path.iterdir()] == [store.path_for("Luba-ABC").name]
+        stored = store.load("Luba-ABC")
+        assert stored is not None
+        assert stored.hash_list.area
+
+    def test_device_names_are_sanitised_into_the_directory(self, tmp_path: Path) -> None:
+        store = MapStore(tmp_path)
+        assert store.path_for("../Luba/ABC").parent == tmp_path
+
+    def test_delete(self, tmp_path: Path) -> None:
+        store = MapStore(tmp_path)
+        store.save("Luba-ABC", _synced_map())
+        store.delete("Luba-ABC")
+        store.delete("Luba-ABC")  # already gone — no error
+        assert store.load("Luba-ABC") is None
+
+    async def test_async_save_and_load(self, tmp_path: Path) -> None:
+        store = MapStore(tmp_path)
+        await store.async_save("Luba-ABC", _synced_map())
+        stored = await store.async_load("Luba-ABC")
+        assert stored is not None
+        assert stored.hash_list.area_name
+
+
+# ---------------------------------------------------------------------------
+# Client warm start
+# ---------------------------------------------------------------------------
+
+
+async def _ble_device(client: MammotionClient, name: str, initial: MowingDevice | None = None) -> MowingDevice:
+    handle = await client.add_ble_only_device(
+        device_id=name,
+        device_name=name,
+        initial_device=initial or MowingDevice(name=name),
+        ble_address="AA:BB:CC:DD:EE:FF",
+    )
+    return handle.snapshot.raw  # type: ignore[return-value]
+
+
+async def test_client_restores_stored_map_when_handle_is_created(tmp_path: Path) -> None:
+    MapStore(tmp_path).save("Luba-warm", _synced_map())
+    client = MammotionClient()
+    client.map_store = MapStore(tmp_path)
+
+    device = await _ble_device(client, "Luba-warm")
+
+    assert device.map.is_map_synced(_synced_map().computed_bol_hash)
+
+
+async def test_client_keeps_a_caller_supplied_map(tmp_path: Path) -> None:
+    MapStore(tmp_path).save("Luba-own", _synced_map())
+    client = MammotionClient()
+    client.map_store = MapStore(tmp_path)
+    own = MowingDevice(name="Luba-own")
+    own.map.update_root_hash_list(NavGetHashListData(sub_cmd=0, total_frame=1, current_frame=1, data_couple=[42]))
+
+    device = await _ble_device(client, "Luba-own", own)
+
+    assert device.map.area_root_hashlist == [42]
+
+
+async def test_unchanged_bol_hash_skips_map_sync(tmp_path: Path) -> None:
+    """A restored map whose hash matches the device's report triggers no MapFetchSaga."""
+    MapStore(tmp_path).save("Luba-skip", _synced_map())
+    client = MammotionClient()
+    client.map_store = MapStore(tmp_path)
+    await _ble_device(client, "Luba-skip")
+    client.start_map_sync = AsyncMock()  # type: ignore[method-assign]
+    handle = client.mower("Luba-skip")
+    assert handle is not None
+    handlers: list[object] = []
+
+    def _capture(getter: object, handler: object, fields: object = None) -> object:
+        handlers.append(handler)
+        return AsyncMock()
+
+    handle.watch_field = _capture  # type: ignore[method-assign]
+    client.setup_device_watchers("Luba-skip")
+    bol_handlers = [h for h in handlers if getattr(h, "__name__", "") == "_on_bol_hash_changed"]
+    assert len(bol_handlers) == 1
+
+    await bol_handlers[0](_synced_map().computed_bol_hash)  # type: ignore[operator]
+    client.start_map_sync.assert_not_called()
+
+    await bol_handlers[0](_synced_map().computed_bol_hash + 1)  # type: ignore[operator]
+    client.start_map_sync.assert_awaited_once()
@@ -0,0 +1,81 @@
+"""Unit tests for pymammotion.data.snapshot_codec (binary device snapshots)."""
+
+from __future__ import annotations
+
+import struct
+
+import pytest
+
+from pymammotion.data.model.device import Device, MowerDevice, PoolCleanerDevice, RTKBaseStationDevice
+from pymammotion.data.model.hash_list import CommDataCouple, HashList, NavGetCommData, NavGetHashListData
+from pymammotion.data.snapshot_codec import FORMAT_VERSION, SnapshotError, from_snapshot_bytes, to_snapshot_bytes
+
+_AREAS = [2001, 2002]
+
+
+def _mower() -> MowerDevice:
+    device = MowerDevice(name="Luba-Snap")
+    device.location.RTK.latitude = 0.9075712110370514
+    device.location.RTK.longitude = 0.06981317007977318
+    hl: HashList = device.map
+    hl.update_root_hash_list(
+        NavGetHashListData(pver=1, sub_cmd=0, total_frame=1, current_frame=1, data_couple=list(_AREAS))
+    )
+    for i, hash_id in enumerate(_AREAS):
+        hl.update(
+            NavGetCommData(
+                pver=1,
+                action=8,
+                type=0,
+                hash=hash_id,
+                total_frame=1,
+                current_frame=1,
+                data_couple=[CommDataCouple(x=0.1 * k + i, y=0.2 * k + 1 / 3) for k in range(50)],
+            )
+        )
+    hl.generated_geojson = {"type": "FeatureCollection", "features": [{"id": 1}]}
+    return device
+
+
+def test_mower_round_trip_is_exact() -> None:
+    original = _mower()
+    restored = MowerDevice.from_snapshot_bytes(original.to_snapshot_bytes())
+
+    assert isinstance(restored, MowerDevice)
+    assert restored.name == original.name
+    assert restored.map.area == original.map.area
+    assert restored.map.is_map_synced(original.map.computed_bol_hash)
+    assert restored.location == original.location
+
+
+def test_generated_geojson_is_left_out() -> None:
+    restored = from_snapshot_bytes(to_snapshot_bytes(_mower()))
+    assert isinstance(restored, MowerDevice)
+    assert restored.map.generated_geojson == {}
+    assert restored.map.geojson_needs_regeneration(restored.location.RTK)
+
+
+def test_points_are_packed_not_written_as_json() -> None:
+    device = _mower()
+    assert len(device.to_snapshot_bytes()) < len(device.to_jsonb()) / 2
+
+
+@pytest.mark.parametrize("device", [Device(name="x"), PoolCleanerDevice(name="Spino-1"), RTKBaseStationDevice(name="RTK1")])
+def test_other_device_kinds_round_trip(device: Device) -> None:
+    restored = Device.from_snapshot_bytes(device.to_snapshot_bytes())
+    assert type(restored) is type(device)
+    assert restored == device
+
+
+def test_wrong_subclass_is_rejected() -> None:
+    with pytest.raises(SnapshotError, match="PoolCleanerDevice"):
+        MowerDevice.from_snapshot_bytes(PoolCleanerDevice(name="Spino-1").to_snapshot_bytes())
+
+
+def test_rejects_other_versions_and_garbage() -> None:
+    data = _mower().to_snapshot_bytes()
+    other_version = data[:4] + struct.pack("<H", FORMAT_VERSION + 1) + data[6:]
+
+    for bad in (b"", b"PDEV", b"XXXX" + data[4:], other_version, data[:-8], data[:30] + b"\x00" * (len(data) - 30)):
+        with pytest.raises(SnapshotError):
+            from_snapshot_bytes(bad)
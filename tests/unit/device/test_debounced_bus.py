@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
+import dataclasses
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from pymammotion.device.handle import _DebouncedBus
+from pymammotion.device.handle import DeliveryPolicy, _DebouncedBus
 from pymammotion.state.device_state import DeviceAvailability, DeviceConnectionState, DeviceSnapshot
 
 
@@ -136,25 +137,136 @@ async def test_max_debounce_wait_forces_emission() -> None:
 
 
 # ---------------------------------------------------------------------------
-# Test 4: stop() cancels pending task without calling handler
+# Test 4: stop() cancels the pending timer without calling handler
 # ---------------------------------------------------------------------------
 
 
-async def test_stop_cancels_pending_task_without_calling_handler() -> None:
-    """stop() cancels the pending debounce task; handler must NOT be called."""
-    bus = _DebouncedBus(debounce_interval=1.0, max_debounce_wait=5.0)
+async def test_stop_cancels_pending_timer_without_calling_handler() -> None:
+    """stop() drops the held snapshot and the shared timer; handler must NOT be called."""
+    bus = _DebouncedBus(debounce_interval=0.05, max_debounce_wait=5.0)
     handler = AsyncMock()
     bus.subscribe(handler)
 
     snap = make_snapshot(seq=1)
     await bus.emit(snap)
 
-    # Task is pending but hasn't fired (1s sleep)
-    assert bus._debounce_task is not None
-    assert not bus._debounce_task.done()
+    # Snapshot is held and the timer armed, but it hasn't fired
+    assert bus._timer is not None
 
     await bus.stop()
+    await asyncio.sleep(0.1)
+
+    # After stop, nothing was delivered and no timer remains
+    assert handler.await_count == 0
+    assert bus._timer is None
+
+
+# ---------------------------------------------------------------------------
+# Test 5: coalesced snapshots carry the union of changed_fields
+# ---------------------------------------------------------------------------
+
+
+async def test_debounce_unions_changed_fields_across_burst() -> None:
+    """A field changed only by a superseded snapshot must still be reported."""
+    bus = _DebouncedBus(debounce_interval=0.05, max_debounce_wait=2.0)
+    handler = AsyncMock()
+    bus.subscribe(handler)
+
+    snap1 = dataclasses.replace(make_snapshot(seq=1), changed_fields=frozenset({"location", "location.device"}))
+    snap2 = dataclasses.replace(make_snapshot(seq=2), changed_fields=frozenset({"mowing_state"}))
+    await bus.emit(snap1)
+    await bus.emit(snap2)
+    await asyncio.sleep(0.15)
+
+    emitted = handler.call_args_list[0].args[0]
+    assert emitted.sequence == 2
+    assert emitted.changed_fields == frozenset({"location", "location.device", "mowing_state"})
+
+
+# ---------------------------------------------------------------------------
+# Per-subscriber delivery policies
+# ---------------------------------------------------------------------------
+
+
+def _touching(seq: int, *fields: str) -> DeviceSnapshot:
+    return dataclasses.replace(make_snapshot(seq=seq), changed_fields=frozenset(fields))
+
+
+async def test_policies_are_independent_per_subscriber() -> None:
+    """An immediate subscriber sees every emit while a debounced one on the same bus sees the last."""
+    bus = _DebouncedBus()
+    immediate = AsyncMock()
+    debounced = AsyncMock()
+    bus.subscribe(immediate)
+    bus.subscribe(debounced, DeliveryPolicy.debounced(0.05))
+
+    for seq in range(1, 4):
+        await bus.emit(make_snapshot(seq=seq))
+    assert immediate.await_count == 3
+    assert debounced.await_count == 0
+
+    await asyncio.sleep(0.12)
+    assert debounced.await_count == 1
+    assert debounced.call_args.args[0].sequence == 3
+
+
+async def test_max_rate_delivers_leading_then_latest_per_window() -> None:
+    bus = _DebouncedBus()
+    handler = AsyncMock()
+    bus.subscribe(handler, DeliveryPolicy.max_rate(0.1))
+
+    await bus.emit(_touching(1, "location"))
+    await bus.emit(_touching(2, "mowing_state"))
+    await bus.emit(_touching(3, "location"))
+
+    # Leading edge immediately; the rest held for the window.
+    assert [c.args[0].sequence for c in handler.call_args_list] == [1]
+    await asyncio.sleep(0.15)
+    assert [c.args[0].sequence for c in handler.call_args_list] == [1, 3]
+    assert handler.call_args.args[0].changed_fields == frozenset({"location", "mowing_state"})
+
+
+async def test_on_fields_skips_snapshots_that_touch_nothing_watched() -> None:
+    bus = _DebouncedBus(debounce_interval=1.0)  # handle-wide default doesn't apply to explicit policies
+    handler = AsyncMock()
+    bus.subscribe(handler, DeliveryPolicy.on_fields("mowing_state"))
+
+    await bus.emit(_touching(1, "location"))
+    await bus.emit(_touching(2, "mowing_state"))
+
+    assert [c.args[0].sequence for c in handler.call_args_list] == [2]
+
+
+async def test_one_timer_and_no_task_per_suppressed_emit() -> None:
+    """A burst of held emits arms one timer and spawns one flush task, however many subscribers wait."""
+    bus = _DebouncedBus()
+    handlers = [AsyncMock() for _ in range(5)]
+    for handler in handlers:
+        bus.subscribe(handler, DeliveryPolicy.max_rate(0.05))
+
+    await bus.emit(make_snapshot(seq=0))  # leading edge for every subscriber
+    tasks_before = len(asyncio.all_tasks())
+    for seq in range(1, 50):
+        await bus.emit(make_snapshot(seq=seq))
+    assert len(asyncio.all_tasks()) == tasks_before
+    assert bus._timer is not None
+
+    # Poll rather than sleep a fixed 0.1 s: a loaded machine can fire the timer late.
+    for _ in range(100):
+        if all(h.await_count == 2 for h in handlers):
+            break
+        await asyncio.sleep(0.02)
+    assert all(h.await_count == 2 for h in handlers)
+    assert all(h.call_args.args[0].sequence == 49 for h in handlers)
+
+
+async def test_cancelled_subscription_drops_its_held_snapshot() -> None:
+    bus = _DebouncedBus()
+    handler = AsyncMock()
+    sub = bus.subscribe(handler, DeliveryPolicy.debounced(0.05))
+
+    await bus.emit(make_snapshot(seq=1))
+    sub.cancel()
+    await asyncio.sleep(0.1)
 
-    # After stop, the task is done (cancelled) and handler was NOT called
     assert handler.await_count == 0
-    assert bus._pending_snapshot is None
@@ -9,7 +9,12 @@ import pytest
 from pymammotion.aliyun.exceptions import DeviceOfflineException, DeviceUnboundException
 from pymammotion.device.handle import DeviceHandle, DeviceRegistry
 from pymammotion.proto import LubaMsg as RealLubaMsg
-from pymammotion.state.device_state import DeviceAvailability, DeviceConnectionState, TransportAvailability
+from pymammotion.state.device_state import (
+    DeviceAvailability,
+    DeviceConnectionState,
+    DeviceSnapshot,
+    TransportAvailability,
+)
 from pymammotion.transport.base import NoTransportAvailableError, TransportType
 
 
@@ -314,7 +319,7 @@ async def test_incoming_message_clears_reported_offline(transport_type: Transpor
     _patch_raw_message_internals(handle)
     with patch("pymammotion.device.handle.LubaMsg") as mock_luba:
         mock_luba.return_value.parse.return_value = RealLubaMsg()
-        await handle.on_raw_message(b"\x00", transport_type)
+        await handle.on_raw_message(bytes(RealLubaMsg()), transport_type)
 
     assert handle.availability.mqtt_reported_offline is False
     assert handle.availability.is_available is True
@@ -342,8 +347,8 @@ async def test_ble_message_does_not_clear_reported_offline() -> None:
 
     _patch_raw_message_internals(handle)
     with patch("pymammotion.device.handle.LubaMsg") as mock_luba:
-        mock_luba.return_value.parse.return_value = MagicMock()
-        await handle.on_raw_message(b"\x00", TransportType.BLE)
+        mock_luba.return_value.parse.return_value = RealLubaMsg()
+        await handle.on_raw_message(bytes(RealLubaMsg()), TransportType.BLE)
 
     # BLE message must not clear the MQTT offline flag
     assert handle.availability.mqtt_reported_offline is True
@@ -509,6 +514,59 @@ async def test_on_raw_message_emits_even_when_diff_is_empty() -> None:
     assert handle.snapshot.raw.mower_state.rain_detection is True
 
 
+async def test_on_raw_message_snapshot_carries_changed_paths() -> None:
+    """The emitted snapshot names the deep paths the message changed."""
+    from pymammotion.data.model.device import MowerDevice
+    from pymammotion.proto import LubaMsg, MctlNav, NavSysParamMsg
+
+    handle = DeviceHandle(
+        device_id="dev-paths",
+        device_name="Luba-Paths",
+        initial_device=MowerDevice(name="Luba-Paths", online=True),
+    )
+    received: list[DeviceSnapshot] = []
+
+    async def _handler(snapshot: DeviceSnapshot) -> None:
+        received.append(snapshot)
+
+    handle.subscribe_state_changed(_handler)
+    await handle.on_raw_message(bytes(LubaMsg(nav=MctlNav(nav_sys_param_cmd=NavSysParamMsg(id=3, context=1)))))
+
+    assert received[0].changed_fields == frozenset({"mower_state", "mower_state.rain_detection"})
+
+
+async def test_watch_field_with_fields_skips_getter_for_unrelated_changes() -> None:
+    from pymammotion.data.model.device import MowerDevice
+    from pymammotion.proto import LubaMsg, MctlNav, NavSysParamMsg
+
+    handle = DeviceHandle(
+        device_id="dev-watch",
+        device_name="Luba-Watch",
+        initial_device=MowerDevice(name="Luba-Watch", online=True),
+    )
+    getter_calls: list[int] = []
+    fired: list[int] = []
+
+    def _getter(snapshot: DeviceSnapshot) -> int:
+        getter_calls.append(snapshot.sequence)
+        return snapshot.raw.mower_state.turning_mode
+
+    async def _handler(value: int) -> None:
+        fired.append(value)
+
+    handle.watch_field(_getter, _handler, fields=("mower_state.turning_mode",))
+
+    async def _send(param_id: int, context: int) -> None:
+        await handle.on_raw_message(bytes(LubaMsg(nav=MctlNav(nav_sys_param_cmd=NavSysParamMsg(id=param_id, context=context)))))
+
+    await _send(3, 1)  # first snapshot seeds the baseline
+    await _send(3, 0)  # rain_detection only — getter skipped
+    await _send(6, 2)  # turning_mode changes — handler fires
+
+    assert len(getter_calls) == 2
+    assert fired == [2]
+
+
 # ---------------------------------------------------------------------------
 # MQTT unusable when mqtt_reported_offline: active_transport skips MQTT
 # ---------------------------------------------------------------------------
@@ -599,7 +657,7 @@ async def _emit_via_raw_message(handle: DeviceHandle, msg: RealLubaMsg) -> None:
     _patch_raw_message_internals(handle)
     with patch("pymammotion.device.handle.LubaMsg") as mock_luba:
         mock_luba.return_value.parse.return_value = msg
-        await handle.on_raw_message(b"\x00", TransportType.CLOUD_ALIYUN)
+        await handle.on_raw_message(bytes(msg), TransportType.CLOUD_ALIYUN)
 
 
 async def test_map_updated_emitted_on_area_name_list() -> None:
@@ -0,0 +1,209 @@
+"""Tests for PollScheduler — the shared MQTT poll driver."""
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from pymammotion.device.handle import DeviceHandle
+from pymammotion.device.poll_scheduler import PollScheduler
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _fake_handle(device_id: str, account: int = 1) -> MagicMock:
+    """A handle stand-in whose one-shot poll records when it was sent."""
+    handle = MagicMock()
+    handle.device_id = device_id
+    handle.device_name = device_id
+    handle.user_account = account
+    handle.is_stopping = False
+    handle.sent_at = []
+
+    async def _send(*, on_sent=None, on_shed=None) -> None:
+        handle.sent_at.append(time.monotonic())
+        on_sent()
+
+    handle._send_one_shot_report = AsyncMock(side_effect=_send)
+    return handle
+
+
+def _poll_once(handle: object, last_poll_sent_at: float) -> float:
+    """next_poll_delay stand-in: due until polled once, then an hour away."""
+    return 0.0 if last_poll_sent_at == 0.0 else 3600.0
+
+
+async def _until(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not reached")
+        await asyncio.sleep(0.005)
+
+
+# ---------------------------------------------------------------------------
+# Scheduling
+# ---------------------------------------------------------------------------
+
+
+async def test_burst_for_one_account_is_spaced_by_the_budget() -> None:
+    """Devices due together are polled one budget slot apart, each deferred once at most."""
+    scheduler = PollScheduler(account_polls_per_minute=1200)  # 50 ms slots
+    handles = [_fake_handle(f"dev{i}") for i in range(5)]
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        for handle in handles:
+            scheduler.add(handle)
+        await _until(lambda: all(h.sent_at for h in handles))
+        await scheduler.stop()
+
+    sent = sorted(h.sent_at[0] for h in handles)
+    assert all(b - a >= 0.045 for a, b in zip(sent, sent[1:]))
+    stats = scheduler.stats()
+    assert stats.polls_sent == 5
+    assert stats.polls_deferred == 4
+    assert stats.polls_by_account == {1: 5}
+
+
+async def test_accounts_have_separate_budgets() -> None:
+    scheduler = PollScheduler(account_polls_per_minute=1)  # one poll per minute per account
+    handles = [_fake_handle(f"dev{i}", account=i) for i in range(3)]
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        for handle in handles:
+            scheduler.add(handle)
+        await _until(lambda: all(h.sent_at for h in handles))
+        await scheduler.stop()
+
+    assert scheduler.stats().polls_deferred == 0
+
+
+async def test_ble_only_handles_are_not_budgeted() -> None:
+    """user_account 0 has no cloud quota, so its polls are never spaced."""
+    scheduler = PollScheduler(account_polls_per_minute=1)
+    handles = [_fake_handle(f"ble{i}", account=0) for i in range(3)]
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        for handle in handles:
+            scheduler.add(handle)
+        await _until(lambda: all(h.sent_at for h in handles))
+        await scheduler.stop()
+
+    stats = scheduler.stats()
+    assert stats.polls_deferred == 0
+    assert stats.polls_by_account == {0: 3}
+
+
+async def test_shed_polls_are_not_counted_as_sent() -> None:
+    scheduler = PollScheduler(account_polls_per_minute=6000)
+    shed, sent = _fake_handle("shed"), _fake_handle("sent")
+
+    async def _shed(*, on_sent=None, on_shed=None) -> None:
+        shed.sent_at.append(time.monotonic())
+        on_shed()
+
+    shed._send_one_shot_report = AsyncMock(side_effect=_shed)
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        scheduler.add(shed)
+        scheduler.add(sent)
+        await _until(lambda: bool(shed.sent_at and sent.sent_at))
+        await scheduler.stop()
+
+    stats = scheduler.stats()
+    assert stats.polls_sent == 1
+    assert stats.polls_shed == 1
+    assert stats.polls_by_account == {1: 1}
+
+
+async def test_failed_send_is_not_counted_as_sent() -> None:
+    scheduler = PollScheduler()
+    handle = _fake_handle("dev1")
+    handle._send_one_shot_report = AsyncMock(side_effect=RuntimeError("boom"))
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        scheduler.add(handle)
+        await _until(lambda: handle._send_one_shot_report.await_count == 1)
+        await scheduler.stop()
+
+    assert scheduler.stats().polls_sent == 0
+
+
+async def test_wake_pulls_the_deadline_in() -> None:
+    scheduler = PollScheduler()
+    handle = _fake_handle("dev1")
+    due = False
+
+    def _delay(_handle: object, _last: float) -> float:
+        return 0.0 if due else 3600.0
+
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _delay):
+        scheduler.add(handle)
+        await _until(lambda: scheduler.stats().evaluations == 1)
+        assert scheduler.stats().next_due_in > 3000
+
+        due = True
+        scheduler.wake(handle)
+        await _until(lambda: bool(handle.sent_at))
+        await scheduler.stop()
+
+    assert scheduler.stats().wakeups == 1
+
+
+async def test_removed_and_stopping_handles_are_dropped() -> None:
+    scheduler = PollScheduler()
+    kept, removed, stopping = _fake_handle("kept"), _fake_handle("removed", 2), _fake_handle("stopping", 3)
+    stopping.is_stopping = True
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        for handle in (kept, removed, stopping):
+            scheduler.add(handle)
+        scheduler.remove(removed)
+        await _until(lambda: bool(kept.sent_at))
+        await asyncio.sleep(0.01)
+
+        assert removed not in scheduler
+        assert stopping not in scheduler
+        assert kept in scheduler
+        assert scheduler.stats().devices == 1
+        await scheduler.stop()
+
+    removed._send_one_shot_report.assert_not_awaited()
+    stopping._send_one_shot_report.assert_not_awaited()
+
+
+async def test_failed_poll_does_not_stop_the_scheduler() -> None:
+    scheduler = PollScheduler(account_polls_per_minute=6000)
+    failing, healthy = _fake_handle("failing"), _fake_handle("healthy")
+    failing._send_one_shot_report = AsyncMock(side_effect=RuntimeError("boom"))
+    with patch("pymammotion.device.poll_scheduler.next_poll_delay", _poll_once):
+        scheduler.add(failing)
+        scheduler.add(healthy)
+        await _until(lambda: bool(healthy.sent_at))
+        await scheduler.stop()
+
+
+def test_rejects_non_positive_budget() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        PollScheduler(account_polls_per_minute=0)
+
+
+# ---------------------------------------------------------------------------
+# DeviceHandle integration
+# ---------------------------------------------------------------------------
+
+
+async def test_handle_joins_scheduler_instead_of_running_its_own_loop() -> None:
+    handle = DeviceHandle(device_id="dev1", device_name="Luba-Sched", initial_device=MagicMock())
+    scheduler = MagicMock(spec=PollScheduler)
+    handle.poll_scheduler = scheduler
+
+    await handle.start()
+    scheduler.add.assert_called_once_with(handle)
+    assert handle._keep_alive_task is None  # noqa: SLF001
+
+    handle.record_user_command()
+    scheduler.wake.assert_called_once_with(handle)
+    assert handle._rearm_event.is_set()  # noqa: SLF001
+
+    await handle.stop()
+    scheduler.remove.assert_called_with(handle)
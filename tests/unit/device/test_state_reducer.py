@@ -108,7 +108,7 @@ import tracemalloc
 from pymammotion.data.model.device import MowerDevice
 from pymammotion.data.model.hash_list import CommDataCouple, NavGetCommData
 from pymammotion.device.state_reducer import MowerStateReducer
-from pymammotion.proto import LubaMsg, MctlNav, NavSysParamMsg
+from pymammotion.proto import LubaMsg, MctlNav, NavGetCommDataAck, NavSysParamMsg
 
 
 def _make_device_with_large_map(points_per_frame: int = 500) -> MowerDevice:
@@ -173,6 +173,46 @@ def test_retained_snapshots_do_not_balloon_on_nav_sys_param() -> None:
     )
 
 
+def test_commondata_frame_shares_untouched_frame_lists() -> None:
+    """A map frame path-copies only the FrameList it lands in; siblings stay shared."""
+    reducer = MowerStateReducer()
+    current = MowerDevice(name="Luba-Test")
+    current.map.update(NavGetCommData(type=0, hash=1, total_frame=2, current_frame=1))
+    current.map.update(NavGetCommData(type=0, hash=2, total_frame=1, current_frame=1))
+    msg = LubaMsg(
+        nav=MctlNav(toapp_get_commondata_ack=NavGetCommDataAck(type=0, hash=1, total_frame=2, current_frame=2))
+    )
+    updated = reducer.apply(current, msg)
+    assert updated.map is not current.map
+    assert updated.map.area[2] is current.map.area[2]
+    assert len(updated.map.area[1].data) == 2
+    assert len(current.map.area[1].data) == 1
+
+
+def test_rapid_state_records_fine_grained_writes() -> None:
+    """system_tard_state_tunnel records the location leaves it writes, not the whole location."""
+    from pymammotion.proto import MctlSys, SystemTardStateTunnelMsg
+
+    reducer = MowerStateReducer()
+    current = MowerDevice(name="Luba-Test", online=True)
+    msg = LubaMsg(sys=MctlSys(system_tard_state_tunnel=SystemTardStateTunnelMsg(tard_state_data=[4, 1, 20] + [0] * 9)))
+    reducer.apply(current, msg)
+    writes = reducer.last_writes
+    assert writes is not None
+    assert "mowing_state" in writes
+    assert "location.device" in writes
+    assert "location" not in writes
+    assert "map" not in writes
+
+
+def test_nav_frame_records_map_write_only() -> None:
+    reducer = MowerStateReducer()
+    current = MowerDevice(name="Luba-Test", online=True)
+    msg = LubaMsg(nav=MctlNav(toapp_get_commondata_ack=NavGetCommDataAck(type=0, hash=1, total_frame=2, current_frame=1)))
+    reducer.apply(current, msg)
+    assert reducer.last_writes == frozenset({"map"})
+
+
 # ===========================================================================
 # Tests that ReportData.update() only mutates fields present in the proto message.
 # ===========================================================================
@@ -47,7 +47,7 @@ def _make_client_with_handle(
 
     captured_handlers: list = []
 
-    def _watch_field(_getter, handler):
+    def _watch_field(_getter, handler, fields=None):
         captured_handlers.append(handler)
         sub = MagicMock()
         sub.cancel = MagicMock()
@@ -26,7 +26,7 @@ def _make_http_with_session() -> MammotionHTTP:
     mock_session.post = AsyncMock()
 
     @asynccontextmanager
-    async def _fake_session() -> object:  # type: ignore[misc]
+    async def _fake_session(*_args: object, **_kwargs: object) -> object:  # type: ignore[misc]
         yield mock_session
 
     http._client_session = _fake_session  # type: ignore[method-assign]
@@ -78,7 +78,7 @@ def _make_http_with_get(status: int, json_data: dict) -> MammotionHTTP:
     mock_session.get = AsyncMock(return_value=resp)
 
     @asynccontextmanager
-    async def _fake_session() -> object:  # type: ignore[misc]
+    async def _fake_session(*_args: object, **_kwargs: object) -> object:  # type: ignore[misc]
         yield mock_session
 
     http._client_session = _fake_session  # type: ignore[method-assign]
@@ -0,0 +1,92 @@
+"""Tests for the keep-alive session MammotionHTTP uses when the host supplies none.
+
+A local plain-HTTP aiohttp server stands in for the Mammotion API; the handler
+records each request's client port so connection reuse is observable.
+"""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from aiohttp import ClientSession, web
+
+from pymammotion.http.http import MammotionHTTP
+
+
+@asynccontextmanager
+async def _standin() -> AsyncIterator[tuple[str, list[int]]]:
+    """Run a local HTTP stand-in; yield (base_url, client_ports_seen)."""
+    peers: list[int] = []
+
+    async def _handler(request: web.Request) -> web.Response:
+        peers.append(request.transport.get_extra_info("peername")[1])  # type: ignore[union-attr]
+        return web.json_response({"code": 0})
+
+    app = web.Application()
+    app.router.add_get("/ping", _handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    try:
+        yield f"http://127.0.0.1:{runner.addresses[0][1]}", peers
+    finally:
+        await runner.cleanup()
+
+
+async def _ping(http: MammotionHTTP, base_url: str) -> None:
+    async with http._client_session() as session, session.get(f"{base_url}/ping") as resp:  # noqa: SLF001
+        assert (await resp.json())["code"] == 0
+
+
+async def test_requests_reuse_one_session_and_connection() -> None:
+    http = MammotionHTTP()
+    async with _standin() as (base_url, peers):
+        try:
+            for _ in range(3):
+                await _ping(http, base_url)
+        finally:
+            await http.close()
+
+    stats = http.session_stats
+    assert stats is not None
+    assert stats.sessions_opened == 1
+    assert stats.requests == 3
+    assert stats.connections_created == 1
+    assert stats.connections_reused == 2
+    assert len(set(peers)) == 1  # keep-alive: every request rode the same TCP connection
+
+
+async def test_close_is_idempotent_and_next_request_reopens() -> None:
+    http = MammotionHTTP()
+    await http.close()  # nothing opened yet
+    async with _standin() as (base_url, _peers):
+        try:
+            await _ping(http, base_url)
+            await http.close()
+            await http.close()
+            await _ping(http, base_url)
+        finally:
+            await http.close()
+
+    assert http.session_stats is not None
+    assert http.session_stats.sessions_opened == 2
+
+
+async def test_host_session_is_used_and_never_closed() -> None:
+    async with ClientSession() as host_session, _standin() as (base_url, _peers):
+        http = MammotionHTTP(session=host_session)
+        await _ping(http, base_url)
+        await http.close()
+
+        assert not host_session.closed
+        assert http.session_stats is None
+
+
+async def test_context_manager_closes_the_shared_session() -> None:
+    async with _standin() as (base_url, _peers):
+        async with MammotionHTTP() as http:
+            await _ping(http, base_url)
+            async with http._client_session() as session:  # noqa: SLF001
+                pass
+        assert session.closed
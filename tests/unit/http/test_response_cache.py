@@ -0,0 +1,193 @@
+"""Tests for the REST response cache in front of MammotionHTTP's slow-changing endpoints."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+import csv
+import dataclasses
+import io
+import time
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock
+
+from pymammotion.http.http import MammotionHTTP
+from pymammotion.http.model.http import ErrorInfo
+from pymammotion.http.response_cache import (
+    ERROR_CODES,
+    USER_DEVICE_LIST,
+    CacheKey,
+    DiskResponseStore,
+    ResponseCache,
+)
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _error_catalogue_csv() -> str:
+    names = [f.name for f in dataclasses.fields(ErrorInfo)]
+    out = io.StringIO()
+    writer = csv.DictWriter(out, fieldnames=names, lineterminator="\n")
+    writer.writeheader()
+    for code in ("1001", "1002"):
+        writer.writerow({name: code if name == "code" else f"{name}-{code}" for name in names})
+    return out.getvalue()
+
+
+def _resp(status: int, body: dict | None, headers: dict[str, str] | None = None) -> MagicMock:
+    resp = MagicMock()
+    resp.status = status
+    resp.headers = {"Content-Type": "application/json", **(headers or {})}
+    resp.json = AsyncMock(return_value=body)
+    return resp
+
+
+def _make_http(*responses: MagicMock, delay: float = 0.0, cache: ResponseCache | None = None) -> MammotionHTTP:
+    """A logged-in MammotionHTTP whose session answers every request with *responses* in turn."""
+    http = MammotionHTTP(account="user@example.com")
+    http.login_info = MagicMock(access_token="tok", refresh_token="ref")  # type: ignore[assignment]
+    http.expires_in = time.time() + 86400
+    if cache is not None:
+        http.response_cache = cache
+    queue = list(responses)
+
+    async def _request(*_args: object, **_kwargs: object) -> MagicMock:
+        await asyncio.sleep(delay)
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    session = MagicMock()
+    session.get = AsyncMock(side_effect=_request)
+    session.post = AsyncMock(side_effect=_request)
+
+    @asynccontextmanager
+    async def _fake_session(*_args: object, **_kwargs: object) -> object:  # type: ignore[misc]
+        yield session
+
+    http._client_session = _fake_session  # type: ignore[method-assign]
+    http.mock_session = session  # type: ignore[attr-defined]
+    return http
+
+
+def _device_list(*names: str) -> dict:
+    return {"code": 0, "msg": "ok", "data": [{"deviceName": n, "iotId": f"iot-{n}"} for n in names]}
+
+
+# ---------------------------------------------------------------------------
+# Single-flight and TTL
+# ---------------------------------------------------------------------------
+
+
+async def test_concurrent_error_catalogue_requests_cause_one_fetch() -> None:
+    http = _make_http(_resp(200, {"data": _error_catalogue_csv()}), delay=0.01)
+
+    results = await asyncio.gather(*(http.get_all_error_codes() for _ in range(50)))
+
+    assert http.mock_session.post.await_count == 1  # type: ignore[attr-defined]
+    assert all(result is results[0] for result in results)
+    assert sorted(results[0]) == ["1001", "1002"]
+    stats = http.response_cache.stats()  # type: ignore[union-attr]
+    assert (stats.misses, stats.coalesced) == (1, 49)
+
+    await http.get_all_error_codes()
+    assert http.mock_session.post.await_count == 1  # type: ignore[attr-defined]
+    assert http.response_cache.stats().hits == 1  # type: ignore[union-attr]
+
+
+async def test_expired_entry_is_refetched_and_fresh_bypasses_the_cache() -> None:
+    http = _make_http(_resp(200, _device_list("Luba-1")), _resp(200, _device_list("Luba-1", "Luba-2")))
+
+    first = await http.get_user_device_list()
+    assert await http.get_user_device_list() is first
+    assert http.mock_session.get.await_count == 1  # type: ignore[attr-defined]
+
+    second = await http.get_user_device_list(fresh=True)
+    assert [d.device_name for d in second.data or []] == ["Luba-1", "Luba-2"]
+    assert [d.device_name for d in http.device_info] == ["Luba-1", "Luba-2"]
+
+    http.response_cache.ttls[USER_DEVICE_LIST] = 0.0  # type: ignore[union-attr]
+    await http.get_user_device_list()
+    assert http.mock_session.get.await_count == 3  # type: ignore[attr-defined]
+
+
+async def test_failures_are_not_cached() -> None:
+    http = _make_http(_resp(500, {"code": 500, "msg": "boom"}), _resp(200, {"data": _error_catalogue_csv()}))
+
+    assert await http.get_all_error_codes() == {}
+    assert len(await http.get_all_error_codes()) == 2
+    assert http.mock_session.post.await_count == 2  # type: ignore[attr-defined]
+
+
+async def test_confirm_share_invalidates_the_device_list() -> None:
+    http = _make_http(
+        _resp(200, _device_list("Luba-1")),
+        _resp(200, {"code": 0, "msg": "ok", "data": True}),
+        _resp(200, _device_list("Luba-1", "Luba-2")),
+    )
+
+    await http.get_user_device_list()
+    await http.confirm_share("batch", [1])
+    refreshed = await http.get_user_device_list()
+
+    assert [d.device_name for d in refreshed.data or []] == ["Luba-1", "Luba-2"]
+
+
+async def test_no_cache_means_every_call_goes_to_the_server() -> None:
+    http = _make_http(_resp(200, _device_list("Luba-1")))
+    http.response_cache = None
+
+    await http.get_user_device_list()
+    await http.get_user_device_list()
+
+    assert http.mock_session.get.await_count == 2  # type: ignore[attr-defined]
+
+
+# ---------------------------------------------------------------------------
+# Conditional revalidation
+# ---------------------------------------------------------------------------
+
+
+async def test_stale_entry_with_etag_is_revalidated_by_304() -> None:
+    http = _make_http(
+        _resp(200, {"data": _error_catalogue_csv()}, {"ETag": '"v1"'}),
+        _resp(304, None),
+    )
+    first = await http.get_all_error_codes()
+    http.response_cache.ttls[ERROR_CODES] = 1e-9  # type: ignore[union-attr]
+    await asyncio.sleep(0.001)
+
+    second = await http.get_all_error_codes()
+
+    assert second is first
+    _, kwargs = http.mock_session.post.await_args  # type: ignore[attr-defined]
+    assert kwargs["headers"]["If-None-Match"] == '"v1"'
+    assert http.response_cache.stats().revalidated == 1  # type: ignore[union-attr]
+
+
+# ---------------------------------------------------------------------------
+# Persistent tier
+# ---------------------------------------------------------------------------
+
+
+async def test_disk_store_warms_a_new_cache_and_invalidate_removes_it(tmp_path: Path) -> None:
+    http = _make_http(_resp(200, _device_list("Luba-1")), cache=ResponseCache(store=DiskResponseStore(tmp_path)))
+    first = await http.get_user_device_list()
+    assert len(list(tmp_path.glob("user_device_list__*.json"))) == 1
+
+    restarted = _make_http(_resp(500, {}), cache=ResponseCache(store=DiskResponseStore(tmp_path)))
+    warm = await restarted.get_user_device_list()
+
+    assert warm == first
+    assert restarted.mock_session.get.await_count == 0  # type: ignore[attr-defined]
+    assert [d.device_name for d in restarted.device_info] == ["Luba-1"]
+
+    await restarted.logout()
+    assert list(tmp_path.glob("*.json")) == []
+
+
+async def test_disk_store_ignores_unreadable_entries(tmp_path: Path) -> None:
+    store = DiskResponseStore(tmp_path)
+    key = CacheKey(ERROR_CODES, "acct", "[]")
+    store._path(key).write_bytes(b"not json")  # noqa: SLF001
+
+    assert await store.load(key) is None
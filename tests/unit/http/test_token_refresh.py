@@ -26,6 +26,7 @@ from aiohttp import ClientError, ContentTypeError
 import jwt as pyjwt
 import pytest
 
+from pymammotion.account.rate_limit import RateLimitBucket
 from pymammotion.http.http import MammotionHTTP
 from pymammotion.transport.base import ReLoginRequiredError
 
@@ -67,7 +68,7 @@ def _make_http(status: int = 200, json_data: dict | None = None, json_exc: Excep
     mock_session.post = AsyncMock(return_value=resp)
 
     @asynccontextmanager
-    async def _fake_session() -> object:  # type: ignore[misc]
+    async def _fake_session(*_args: object, **_kwargs: object) -> object:  # type: ignore[misc]
         yield mock_session
 
     http._client_session = _fake_session  # type: ignore[method-assign]
@@ -321,3 +322,22 @@ def test_handle_expiry_is_gone() -> None:
     """handle_expiry re-logged in from a stored password on any 401 — it must stay removed."""
     assert not hasattr(MammotionHTTP, "handle_expiry")
     assert not hasattr(MammotionHTTP, "refresh_login")
+
+
+async def test_login_and_refresh_are_never_rate_limited() -> None:
+    """Auth calls pass bucket=None so a throttled account can still re-authenticate."""
+    http = _make_http(json_data=_login_payload())
+    buckets: list[RateLimitBucket | None] = []
+    canned = http._client_session
+
+    @asynccontextmanager
+    async def _recording(bucket: RateLimitBucket | None = RateLimitBucket.HTTP) -> object:  # type: ignore[misc]
+        buckets.append(bucket)
+        async with canned() as session:
+            yield session
+
+    http._client_session = _recording  # type: ignore[method-assign]
+    await http.login_v2("a@b.c", "pw")
+    await http._refresh_token_v2_locked()
+
+    assert buckets == [None, None]
@@ -115,3 +115,140 @@ async def test_close_cancels_pending_futures() -> None:
     with pytest.raises(asyncio.CancelledError):
         await waiter
     assert len(broker._pending) == 0
+
+
+# ---------------------------------------------------------------------------
+# Discriminated correlation
+# ---------------------------------------------------------------------------
+
+
+def _payload_msg(field: str, **leaf_attrs: object) -> MagicMock:
+    msg = MagicMock()
+    msg.field = field
+    msg.leaf = MagicMock(**leaf_attrs)
+    return msg
+
+
+def _which_one_of(message: MagicMock, group: str) -> tuple[str, object]:
+    if group == "payload":
+        return message.field, message.leaf
+    return "", None
+
+
+async def _wait_registered(broker: DeviceMessageBroker, field: str, count: int) -> None:
+    while len(broker._pending.get(field, ())) < count:
+        await asyncio.sleep(0)
+
+
+async def test_discriminated_requests_for_one_field_resolve_independently() -> None:
+    broker = DeviceMessageBroker()
+
+    async def send_fn() -> None:
+        pass
+
+    with patch("betterproto2.which_one_of", side_effect=_which_one_of):
+        first = asyncio.create_task(
+            broker.send_and_wait(send_fn, "toapp_gethash_ack", send_timeout=1.0, retries=1, discriminator={"hash": 1})
+        )
+        second = asyncio.create_task(
+            broker.send_and_wait(send_fn, "toapp_gethash_ack", send_timeout=1.0, retries=1, discriminator={"hash": 2})
+        )
+        await _wait_registered(broker, "toapp_gethash_ack", 2)
+
+        reply_two = _payload_msg("toapp_gethash_ack", hash=2)
+        reply_one = _payload_msg("toapp_gethash_ack", hash=1)
+        await broker.on_message(reply_two)
+        await broker.on_message(reply_one)
+
+        assert await first is reply_one
+        assert await second is reply_two
+    assert broker._pending == {}
+
+
+async def test_discriminator_falls_back_to_envelope_attribute() -> None:
+    broker = DeviceMessageBroker()
+
+    async def send_fn() -> None:
+        pass
+
+    with patch("betterproto2.which_one_of", side_effect=_which_one_of):
+        waiter = asyncio.create_task(
+            broker.send_and_wait(send_fn, "toapp_devinfo_resp", send_timeout=1.0, retries=1, discriminator={"seq": 7})
+        )
+        await _wait_registered(broker, "toapp_devinfo_resp", 1)
+        reply = _payload_msg("toapp_devinfo_resp")
+        del reply.leaf.seq
+        reply.seq = 7
+        await broker.on_message(reply)
+        assert await waiter is reply
+
+
+async def test_specific_waiter_wins_over_catch_all_and_unmatched_goes_to_bus() -> None:
+    broker = DeviceMessageBroker()
+    received: list[object] = []
+
+    async def handler(msg: object) -> None:
+        received.append(msg)
+
+    async def send_fn() -> None:
+        pass
+
+    broker.subscribe_unsolicited(handler)
+    with patch("betterproto2.which_one_of", side_effect=_which_one_of):
+        catch_all = asyncio.create_task(broker.send_and_wait(send_fn, "toapp_svg_msg", send_timeout=1.0, retries=1))
+        specific = asyncio.create_task(
+            broker.send_and_wait(send_fn, "toapp_svg_msg", send_timeout=1.0, retries=1, discriminator={"hash": 5})
+        )
+        await _wait_registered(broker, "toapp_svg_msg", 2)
+
+        for_specific = _payload_msg("toapp_svg_msg", hash=5)
+        await broker.on_message(for_specific)
+        assert await specific is for_specific
+        assert not catch_all.done()
+
+        other = _payload_msg("toapp_svg_msg", hash=9)
+        await broker.on_message(other)
+        assert await catch_all is other
+
+        stray = _payload_msg("toapp_svg_msg", hash=9)
+        await broker.on_message(stray)
+    assert received == [stray]
+
+
+async def test_same_discriminator_twice_raises() -> None:
+    broker = DeviceMessageBroker()
+
+    async def send_fn() -> None:
+        pass
+
+    first = asyncio.create_task(
+        broker.send_and_wait(send_fn, "toapp_gethash_ack", send_timeout=1.0, retries=1, discriminator={"sub_cmd": 0})
+    )
+    await _wait_registered(broker, "toapp_gethash_ack", 1)
+    with pytest.raises(ConcurrentRequestError):
+        await broker.send_and_wait(send_fn, "toapp_gethash_ack", retries=1, discriminator={"sub_cmd": 0})
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+    assert broker._pending == {}
+
+
+async def test_latency_histogram_records_responses_and_timeouts() -> None:
+    broker = DeviceMessageBroker()
+
+    async def send_fn() -> None:
+        pass
+
+    with patch("betterproto2.which_one_of", side_effect=_which_one_of):
+        waiter = asyncio.create_task(broker.send_and_wait(send_fn, "toapp_gethash_ack", send_timeout=1.0, retries=1))
+        await _wait_registered(broker, "toapp_gethash_ack", 1)
+        await broker.on_message(_payload_msg("toapp_gethash_ack"))
+        await waiter
+        with pytest.raises(CommandTimeoutError):
+            await broker.send_and_wait(send_fn, "toapp_gethash_ack", send_timeout=0.01, retries=1)
+
+    histogram = broker.latency_stats()["toapp_gethash_ack"]
+    assert histogram.count == 1
+    assert histogram.counts[0] == 1
+    assert histogram.timeouts == 1
+    assert histogram.quantile(0.5) == 0.1
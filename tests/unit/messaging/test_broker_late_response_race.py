@@ -12,7 +12,7 @@ performed *outside* the lock. That left a window where:
      ``InvalidStateError`` and (worse) silently losing the response.
 
 These tests pin the new behaviour: the lookup-and-resolve happens atomically
-inside the lock; late responses are routed to the event bus instead, and the
+(no ``await`` between them on the event loop); late responses are routed to the event bus instead, and the
 broker is left in a clean state ready for the next request.
 """
 
@@ -156,9 +156,8 @@ async def test_set_result_race_with_cancel_in_finally() -> None:
     ``InvalidStateError`` — losing the response and crashing the transport's
     on_message dispatcher.
 
-    We force this interleaving by holding the lock manually so that the
-    timeout finally's lock acquisition queues *after* on_message's lookup
-    but runs *before* on_message's set_result.
+    We force this interleaving by capturing the pending future ourselves,
+    letting the timeout cleanup run, and only then delivering the response.
     """
     broker = DeviceMessageBroker()
     field = "toapp_gethash_ack"
@@ -179,7 +178,7 @@ async def test_set_result_race_with_cancel_in_finally() -> None:
             if field in broker._pending:
                 break
         assert field in broker._pending
-        pending = broker._pending[field]
+        pending = broker._pending[field][0]
 
         # Capture the future BEFORE timeout cleanup, simulating an
         # on_message that already finished the lookup.
@@ -194,7 +193,7 @@ async def test_set_result_race_with_cancel_in_finally() -> None:
         assert captured_future.cancelled() or captured_future.done()
 
         # The buggy code path would now do `captured_future.set_result(msg)`.
-        # The fix ensures on_message rechecks under the lock, sees the slot
+        # The fix ensures on_message looks the slot up afresh, sees it
         # is gone, and routes to the event bus instead.
         received: list[object] = []
 
@@ -179,3 +179,60 @@ async def test_fifo_within_same_priority() -> None:
     await asyncio.sleep(0.1)
     assert order == [0, 1, 2]
     await q.stop()
+
+
+async def test_admit_hook_sheds_refused_items_and_skips_sagas() -> None:
+    """Items the admission hook refuses are dropped; sagas are never offered to it."""
+    q = DeviceCommandQueue()
+    broker = DeviceMessageBroker()
+    offered: list[Priority] = []
+
+    async def admit(priority: Priority) -> bool:
+        offered.append(priority)
+        return priority != Priority.BACKGROUND
+
+    class QuickSaga(Saga):
+        name = "quick"
+
+        async def _run(self, b: DeviceMessageBroker) -> None:
+            pass
+
+    q.admit = admit
+    q.start()
+    executed: list[str] = []
+
+    async def normal() -> None:
+        executed.append("normal")
+
+    async def background() -> None:
+        executed.append("background")
+
+    await q.enqueue_saga(QuickSaga(), broker)
+    await q.enqueue(background, priority=Priority.BACKGROUND)
+    await q.enqueue(normal)
+    await asyncio.sleep(0.2)
+
+    assert executed == ["normal"]
+    assert offered == [Priority.NORMAL, Priority.BACKGROUND]
+    await q.stop()
+
+
+async def test_on_shed_fires_only_for_shed_items() -> None:
+    q = DeviceCommandQueue()
+
+    async def admit(priority: Priority) -> bool:
+        return priority != Priority.BACKGROUND
+
+    q.admit = admit
+    q.start()
+    shed: list[str] = []
+
+    async def work() -> None:
+        pass
+
+    await q.enqueue(work, priority=Priority.BACKGROUND, on_shed=lambda: shed.append("background"))
+    await q.enqueue(work, on_shed=lambda: shed.append("normal"))
+    await asyncio.sleep(0.1)
+
+    assert shed == ["background"]
+    await q.stop()
@@ -0,0 +1,98 @@
+"""Tests for peek_luba_msg — wire-level sub-message/leaf identification."""
+
+from __future__ import annotations
+
+import betterproto2
+import pytest
+
+from pymammotion.messaging.peek import LubaMsgPeek, peek_luba_msg
+from pymammotion.proto import (
+    CommDataCouple,
+    LubaMsg,
+    MctlNav,
+    MctlSys,
+    MsgAttr,
+    MsgCmdType,
+    MsgDevice,
+    NavGetCommDataAck,
+    ReportInfoData,
+    RptDevStatus,
+)
+
+
+def _every_leaf() -> list[tuple[str, str, LubaMsg]]:
+    """One LubaMsg per (sub-message, oneof leaf) pair, each leaf at its default value."""
+    meta = LubaMsg._betterproto
+    cases = []
+    for sub_name, sub_field in meta.meta_by_field_name.items():
+        if sub_field.group != "LubaSubMsg":
+            continue
+        sub_cls = meta.cls_by_field[sub_name]
+        sub_meta = sub_cls._betterproto
+        for leaf_name, leaf_field in sub_meta.meta_by_field_name.items():
+            if leaf_field.group is None:
+                continue
+            leaf_cls = sub_meta.cls_by_field.get(leaf_name)
+            if leaf_field.proto_type == "message":
+                leaf_value = leaf_cls()
+            elif leaf_field.proto_type == "enum":
+                leaf_value = leaf_cls(0)
+            else:
+                leaf_value = 0
+            cases.append((sub_name, leaf_name, LubaMsg(**{sub_name: sub_cls(**{leaf_name: leaf_value})})))
+    return cases
+
+
+@pytest.mark.parametrize(("sub_name", "leaf_name", "msg"), _every_leaf(), ids=lambda v: v if isinstance(v, str) else "")
+def test_peek_agrees_with_full_parse(sub_name: str, leaf_name: str, msg: LubaMsg) -> None:
+    payload = bytes(msg)
+    parsed = LubaMsg().parse(payload)
+    parsed_sub, _ = betterproto2.which_one_of(parsed, "LubaSubMsg")
+    assert parsed_sub == sub_name
+
+    peek = peek_luba_msg(payload)
+
+    assert peek == LubaMsgPeek(sub_msg=sub_name, leaf=leaf_name, size=len(payload))
+
+
+def test_peek_skips_envelope_fields_and_flags_bulky_frames() -> None:
+    msg = LubaMsg(
+        msgtype=MsgCmdType.NAV,
+        sender=MsgDevice.DEV_MAINCTL,
+        rcver=MsgDevice.DEV_MOBILEAPP,
+        msgattr=MsgAttr.RESP,
+        seqs=7,
+        version=1,
+        timestamp=1_700_000_000_000,
+        nav=MctlNav(
+            toapp_get_commondata_ack=NavGetCommDataAck(
+                hash=42, total_frame=1, current_frame=1, data_couple=[CommDataCouple(x=1.0, y=2.0)] * 50
+            )
+        ),
+    )
+
+    peek = peek_luba_msg(bytes(msg))
+
+    assert peek is not None
+    assert (peek.sub_msg, peek.leaf) == ("nav", "toapp_get_commondata_ack")
+    assert peek.is_bulky
+    report = peek_luba_msg(bytes(LubaMsg(sys=MctlSys(toapp_report_data=ReportInfoData(dev=RptDevStatus(battery_val=9))))))
+    assert report is not None
+    assert not report.is_bulky
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"\x12\x03abc",  # sender (field 2) as length-delimited: packed bytes, not a LubaMsg
+        b"\x5a\x05\x01",  # nav declares 5 bytes, only 1 present
+        b"\x08\xff",  # truncated varint
+        b"\x0b",  # group start wire type
+    ],
+)
+def test_peek_rejects_non_luba_payloads(payload: bytes) -> None:
+    assert peek_luba_msg(payload) is None
+
+
+def test_peek_of_empty_message() -> None:
+    assert peek_luba_msg(b"") == LubaMsgPeek(sub_msg=None, leaf=None, size=0)
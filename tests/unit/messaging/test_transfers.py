@@ -6,6 +6,8 @@ sagas stop hand-rolling them:
 * ``ack_stream``    — device streams frames, each must be acked before the next.
 * ``indexed_fetch`` — app asks for item *i*, device answers with exactly one frame.
 
+plus ``SendWindow``, which keeps several sends in flight for pipelined transfers.
+
 Everything else about a saga (branching, resume, batching) stays plain Python in
 the saga; only the mechanics live here.
 """
@@ -17,7 +19,7 @@ from typing import Any
 
 import pytest
 
-from pymammotion.messaging.transfers import ack_stream, indexed_fetch
+from pymammotion.messaging.transfers import SendWindow, ack_stream, indexed_fetch
 from pymammotion.proto import (
     LubaMsg,
     MctlNav,
@@ -272,3 +274,41 @@ async def test_indexed_fetch_works_on_the_nav_envelope_too() -> None:
         )
     ]
     assert [f.current_frame for f in got] == [1, 2]
+
+
+# ---------------------------------------------------------------------------
+# SendWindow
+# ---------------------------------------------------------------------------
+
+
+async def test_send_window_caps_sends_in_flight_and_waits_on_exit() -> None:
+    in_flight = 0
+    peak = 0
+    done: list[bytes] = []
+
+    async def _send(payload: bytes) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        done.append(payload)
+
+    async with SendWindow(_send, 3) as window:
+        for i in range(8):
+            await window.send(bytes([i]))
+
+    assert peak == 3
+    assert sorted(done) == [bytes([i]) for i in range(8)]
+
+
+async def test_send_window_surfaces_a_failed_send() -> None:
+    async def _send(payload: bytes) -> None:
+        if payload == b"bad":
+            raise RuntimeError("invoke failed")
+
+    with pytest.raises(RuntimeError, match="invoke failed"):
+        async with SendWindow(_send, 2) as window:
+            await window.send(b"bad")
+            await asyncio.sleep(0)
+            await window.send(b"next")
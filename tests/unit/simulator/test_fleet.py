@@ -0,0 +1,155 @@
+"""End-to-end tests: a real MammotionClient driving virtual mowers over the in-process broker."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from pymammotion.aliyun.exceptions import DeviceOfflineException
+from pymammotion.client import MammotionClient
+from pymammotion.data.model.rapid_state import RTKStatus
+from pymammotion.simulator import InProcessBroker, SimulatedFleet, SimulatedMap, synthetic_map
+from pymammotion.simulator.mower import HASH_LIST_FRAME_SIZE
+
+_FIXTURE = Path(__file__).parents[2] / "fixtures" / "hash_list_fixture.json"
+
+
+async def _until(predicate: Callable[[], bool], timeout: float = 5.0) -> None:
+    """Poll *predicate* until it holds; fail the test on timeout."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while not predicate():
+        if loop.time() > deadline:
+            pytest.fail("condition not met before timeout")
+        await asyncio.sleep(0.01)
+
+
+def _map_synced(client: MammotionClient, device_name: str, sim_map: SimulatedMap) -> Callable[[], bool]:
+    handle = client.mower(device_name)
+
+    def _check() -> bool:
+        raw_map = handle.snapshot.raw.map
+        fetched = set(raw_map.area) | set(raw_map.obstacle)
+        return not handle.queue.is_saga_active and fetched == set(sim_map.root_hashes)
+
+    return _check
+
+
+async def test_map_sync_fetches_every_hash_and_name() -> None:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    sim_map = synthetic_map(areas=4, obstacles=1)
+    mowers = await fleet.spawn(2, sim_map)
+    try:
+        name = mowers[0].device_name
+        await client.start_map_sync(name)
+        await _until(_map_synced(client, name, sim_map))
+
+        raw_map = client.mower(name).snapshot.raw.map
+        assert {a.hash: a.name for a in raw_map.area_name} == sim_map.names
+        assert all(sum(len(f.data_couple) for f in raw_map.area[h].data) == 120 for h in sim_map.names)
+        # Only the mower that was asked served the map.
+        assert not client.mower(mowers[1].device_name).snapshot.raw.map.area
+    finally:
+        await fleet.stop()
+        await client.stop()
+
+
+async def test_pipelined_map_sync_with_broker_latency() -> None:
+    client = MammotionClient()
+    client.map_fetch_window = 3
+    fleet = SimulatedFleet(client, InProcessBroker(latency=0.005))
+    sim_map = synthetic_map(areas=8, frames_per_area=3, obstacles=2)
+    (mower,) = await fleet.spawn(1, sim_map)
+    try:
+        await client.start_map_sync(mower.device_name)
+        await _until(_map_synced(client, mower.device_name, sim_map))
+        assert mower.stats.ignored == 0
+    finally:
+        await fleet.stop()
+        await client.stop()
+
+
+async def test_map_sync_from_capture() -> None:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    sim_map = SimulatedMap.from_capture(_FIXTURE)
+    (mower,) = await fleet.spawn(1, sim_map)
+    try:
+        await client.start_map_sync(mower.device_name)
+        await _until(_map_synced(client, mower.device_name, sim_map))
+    finally:
+        await fleet.stop()
+        await client.stop()
+
+
+async def test_mow_path_saga_fetches_multi_frame_line_list() -> None:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    # More lines than fit in one toapp_gethash_ack frame, so every frame must be acked.
+    sim_map = synthetic_map(areas=HASH_LIST_FRAME_SIZE + 5, frames_per_area=1, points_per_frame=8, obstacles=0)
+    (mower,) = await fleet.spawn(1, sim_map)
+    handle = client.mower(mower.device_name)
+    try:
+        await client.start_map_sync(mower.device_name)
+        await _until(_map_synced(client, mower.device_name, sim_map))
+
+        await client.start_mow_path_saga(mower.device_name, zone_hashs=list(sim_map.names))
+        await _until(
+            lambda: not handle.queue.is_saga_active and bool(handle.snapshot.raw.map.current_mow_path), timeout=10.0
+        )
+
+        fetched = {
+            frame.path_packets[0].path_hash
+            for frames in handle.snapshot.raw.map.current_mow_path.values()
+            for frame in frames.values()
+        }
+        assert fetched == set(sim_map.line_hashes)
+    finally:
+        await fleet.stop()
+        await client.stop()
+
+
+async def test_telemetry_reaches_every_handle() -> None:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    sim_map = synthetic_map()
+    mowers = await fleet.spawn(5, sim_map)
+    try:
+        fleet.start_telemetry(interval=0.01)
+        handles = [client.mower(m.device_name) for m in mowers]
+        await _until(
+            lambda: all(
+                h.snapshot.raw.mowing_state.rtk_status == RTKStatus.FINE
+                and h.snapshot.raw.report_data.locations
+                and h.snapshot.raw.report_data.locations[0].bol_hash == sim_map.bol_hash
+                for h in handles
+            )
+        )
+        await fleet.stop_telemetry()
+
+        assert all(m.stats.telemetry >= 2 for m in mowers)
+        stats = fleet.broker.stats()
+        assert stats.devices == 5
+        assert stats.to_app == sum(m.stats.sent for m in mowers)
+        assert stats.bytes_to_app > 0
+    finally:
+        await fleet.stop()
+        await client.stop()
+
+
+async def test_send_to_detached_mower_raises_offline() -> None:
+    client = MammotionClient()
+    fleet = SimulatedFleet(client)
+    mowers = await fleet.spawn(2)
+    try:
+        await fleet.broker.detach(mowers[0].iot_id)
+        with pytest.raises(DeviceOfflineException):
+            await fleet.transport.send(b"\x00", iot_id=mowers[0].iot_id)
+        assert fleet.broker.stats().devices == 1
+    finally:
+        await fleet.stop()
+        await client.stop()
@@ -154,3 +154,66 @@ def test_state_machine_connection_state_propagated() -> None:
     avail = DeviceAvailability(mqtt=TransportAvailability.CONNECTED)
     new_snap, _ = sm.apply(device, avail)
     assert new_snap.connection_state == DeviceConnectionState.CONNECTED
+
+
+# ---------------------------------------------------------------------------
+# DeviceStateMachine — dotted change paths
+# ---------------------------------------------------------------------------
+
+
+def _mower(battery: int = 75):
+    from pymammotion.data.model.device import MowerDevice
+
+    device = MowerDevice(name="Luba-Paths")
+    device.report_data.dev.battery_val = battery
+    return device
+
+
+def test_state_machine_reports_dotted_paths_with_ancestors() -> None:
+    import copy
+    import dataclasses
+
+    device1 = _mower()
+    sm = DeviceStateMachine("dev1", device1)
+    device2 = dataclasses.replace(device1, report_data=copy.copy(device1.report_data))
+    device2.report_data.dev = dataclasses.replace(device1.report_data.dev, battery_val=50)
+    snap, changed = sm.apply(device2, DeviceAvailability())
+    assert {"report_data", "report_data.dev", "report_data.dev.battery_val", "battery_level"} <= changed
+    assert "report_data.work" not in changed
+    assert "map" not in changed
+    assert snap.changed_fields == changed
+
+
+def test_state_machine_copied_but_equal_subtree_is_not_reported() -> None:
+    import copy
+    import dataclasses
+
+    device1 = _mower()
+    sm = DeviceStateMachine("dev1", device1)
+    device2 = dataclasses.replace(device1, mower_state=copy.deepcopy(device1.mower_state))
+    _, changed = sm.apply(device2, DeviceAvailability())
+    assert changed == frozenset()
+
+
+def test_state_machine_written_limits_diff_to_given_paths() -> None:
+    import copy
+    import dataclasses
+
+    device1 = _mower()
+    sm = DeviceStateMachine("dev1", device1)
+    device2 = dataclasses.replace(device1, location=copy.deepcopy(device1.location))
+    device2.location.work_zone = 7
+    device2.location.orientation = 90
+    _, changed = sm.apply(device2, DeviceAvailability(), written=["location.work_zone"])
+    assert changed == frozenset({"location", "location.work_zone"})
+
+
+def test_state_changed_event_touches() -> None:
+    from pymammotion.state.device_state import StateChangedEvent
+
+    sm = DeviceStateMachine("dev1", _mower())
+    old = sm.current
+    new, changed = sm.apply(_mower(battery=10), DeviceAvailability())
+    event = StateChangedEvent(device_id="dev1", old=old, new=new, changed_fields=changed)
+    assert event.touches("report_data.dev.battery_val")
+    assert not event.touches("report_data.work", "location")
@@ -238,6 +238,7 @@ def _make_device_with_rtk(lat: float = 0.5, lon: float = 0.5) -> MagicMock:
     device.location.dock.latitude = 0.01
     device.location.dock.longitude = 0.01
     device.location.dock.rotation = 0
+    device.map.async_geojson = AsyncMock()
     return device
 
 
@@ -266,7 +267,7 @@ async def _make_handle_with_transport(device_id: str, device_name: str) -> Devic
 
 
 async def test_start_map_sync_generates_geojson_on_completion() -> None:
-    """start_map_sync must call device.map.generate_geojson after the MapFetchSaga succeeds."""
+    """start_map_sync must build the map GeoJSON view off the loop after the MapFetchSaga succeeds."""
     client = MammotionClient()
     handle = await _make_handle_with_transport("dev1", "Luba-Map")
     await client._device_registry.register(handle)
@@ -285,12 +286,13 @@ async def test_start_map_sync_generates_geojson_on_completion() -> None:
         await client.start_map_sync("Luba-Map")
         await asyncio.sleep(0.15)
 
-    mock_device.map.generate_geojson.assert_called_once()
+    mock_device.map.set_geojson_origin.assert_called_once()
+    mock_device.map.async_geojson.assert_awaited_once_with("generated_geojson", client.map_executor)
     await handle.stop()
 
 
 async def test_start_mow_path_saga_generates_geojson_on_completion() -> None:
-    """start_mow_path_saga must call device.map.generate_mowing_geojson after the saga succeeds."""
+    """start_mow_path_saga must build the mow-path GeoJSON view off the loop after the saga succeeds."""
     client = MammotionClient()
     handle = await _make_handle_with_transport("dev1", "Luba-Mow")
     await client._device_registry.register(handle)
@@ -308,12 +310,39 @@ async def test_start_mow_path_saga_generates_geojson_on_completion() -> None:
         await client.start_mow_path_saga("Luba-Mow", zone_hashs=[1, 2])
         await asyncio.sleep(0.15)
 
-    mock_device.map.generate_mowing_geojson.assert_called_once()
+    mock_device.map.set_geojson_origin.assert_called_once_with(mock_device.location.RTK)
+    mock_device.map.async_geojson.assert_awaited_once_with("generated_mow_path_geojson", client.map_executor)
+    await handle.stop()
+
+
+async def test_get_dynamics_line_schedules_the_view_build() -> None:
+    """The dynamics-line view is rebuilt on the map executor, not on its next read."""
+    client = MammotionClient()
+    handle = await _make_handle_with_transport("dev1", "Luba-Dyn")
+    await client._device_registry.register(handle)
+    handle.refresh_geojson = MagicMock()  # type: ignore[method-assign]
+
+    mock_device = _make_device_with_rtk(lat=0.5, lon=0.5)
+    client.get_device_by_name = MagicMock(return_value=mock_device)  # type: ignore[method-assign]
+
+    with patch("pymammotion.client.CommonDataSaga") as MockSaga:
+        mock_saga_instance = MagicMock()
+        mock_saga_instance.name = "common_data"
+        mock_saga_instance.max_attempts = 1
+        mock_saga_instance.execute = AsyncMock()
+        mock_saga_instance.result = [MagicMock()]
+        MockSaga.return_value = mock_saga_instance
+
+        await client.get_dynamics_line("Luba-Dyn")
+        await asyncio.sleep(0.15)
+
+    mock_device.map.update_dynamics_line.assert_called_once_with(mock_saga_instance.result)
+    handle.refresh_geojson.assert_called_once_with()
     await handle.stop()
 
 
 async def test_start_map_sync_skips_geojson_when_rtk_zero() -> None:
-    """generate_geojson must not be called when RTK location is 0,0 (not yet received)."""
+    """The map GeoJSON view must not be built when RTK location is 0,0 (not yet received)."""
     client = MammotionClient()
     handle = await _make_handle_with_transport("dev1", "Luba-NoRTK")
     await client._device_registry.register(handle)
@@ -332,7 +361,7 @@ async def test_start_map_sync_skips_geojson_when_rtk_zero() -> None:
         await client.start_map_sync("Luba-NoRTK")
         await asyncio.sleep(0.15)
 
-    mock_device.map.generate_geojson.assert_not_called()
+    mock_device.map.async_geojson.assert_not_awaited()
     await handle.stop()
 
 
@@ -794,6 +823,146 @@ async def test_send_command_with_args_prefer_ble_uses_mqtt_while_ble_connect_pen
     ble.connect.assert_awaited_once()  # background warm-up attempted
 
 
+# ---------------------------------------------------------------------------
+# send_command_to_many — fleet fan-out
+# ---------------------------------------------------------------------------
+
+
+async def _fleet(client: MammotionClient, names: list[str], transport_type: TransportType) -> list[DeviceHandle]:
+    handles = []
+    for name in names:
+        handle = make_handle(name, name)
+        await handle.add_transport(_make_connected_transport(transport_type))
+        await client._device_registry.register(handle)
+        handles.append(handle)
+    return handles
+
+
+async def test_send_command_to_many_builds_payload_once_per_model() -> None:
+    client = MammotionClient()
+    handles = await _fleet(client, ["Luba-AAA", "Luba-BBB", "Yuka-CCC"], TransportType.BLE)
+    patcher = _stub_commands(handles[0], b"\x01")
+    try:
+        for handle in handles:
+            handle.queue.start()
+        results = [r async for r in client.send_command_to_many(["Luba-AAA", "Luba-BBB", "Yuka-CCC"], "get_report_cfg")]
+        commands = handles[0].commands
+    finally:
+        patcher.stop()
+
+    assert {r.device_name for r in results} == {"Luba-AAA", "Luba-BBB", "Yuka-CCC"}
+    assert all(r.ok for r in results)
+    assert commands.get_report_cfg.call_count == 2  # one Luba build shared by both Lubas, one Yuka
+    for handle in handles:
+        handle._transports[TransportType.BLE].send.assert_awaited_once_with(b"\x01", iot_id="", firmware_version=ANY)  # noqa: SLF001
+        await handle.stop()
+
+
+async def test_send_command_to_many_counts_a_copied_payload_as_sent() -> None:
+    """Delivery is matched by value, so a layer that copies the buffer still reports SENT."""
+    from pymammotion.client import FleetCommandStatus
+
+    client = MammotionClient()
+    (handle,) = await _fleet(client, ["Luba-Copy"], TransportType.BLE)
+    emit = handle._sent_bus.emit  # noqa: SLF001
+
+    async def _emit_copy(payload: bytes) -> None:
+        await emit(bytes(bytearray(payload)))
+
+    handle._sent_bus.emit = _emit_copy  # noqa: SLF001
+    handle.queue.start()
+    patcher = _stub_commands(handle, b"\x05\x06")
+    try:
+        results = [r async for r in client.send_command_to_many(["Luba-Copy"], "get_report_cfg")]
+    finally:
+        patcher.stop()
+
+    assert [r.status for r in results] == [FleetCommandStatus.SENT]
+    await handle.stop()
+
+
+async def test_send_command_to_many_bounds_concurrency() -> None:
+    client = MammotionClient()
+    names = [f"Luba-{i}" for i in range(5)]
+    handles = await _fleet(client, names, TransportType.BLE)
+    in_flight = peak = 0
+
+    async def _slow_send(*_args: object, **_kwargs: object) -> None:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+
+    for handle in handles:
+        handle._transports[TransportType.BLE].send = AsyncMock(side_effect=_slow_send)  # noqa: SLF001
+        handle.queue.start()
+    patcher = _stub_commands(handles[0], b"\x02")
+    try:
+        results = [r async for r in client.send_command_to_many(names, "get_report_cfg", concurrency=2)]
+    finally:
+        patcher.stop()
+
+    assert len(results) == 5
+    assert all(r.ok for r in results)
+    assert peak == 2
+    for handle in handles:
+        await handle.stop()
+
+
+async def test_send_command_to_many_short_circuits_rate_limited_devices() -> None:
+    from pymammotion.client import FleetCommandStatus
+
+    client = MammotionClient()
+    limited, free = await _fleet(client, ["Luba-RL", "Luba-OK"], TransportType.CLOUD_ALIYUN)
+    limited_mqtt = limited._transports[TransportType.CLOUD_ALIYUN]  # noqa: SLF001
+    limited_mqtt.is_send_blocked = MagicMock(return_value=True)
+    patcher = _stub_commands(limited, b"\x03")
+    try:
+        free.queue.start()
+        results = {r.device_name: r async for r in client.send_command_to_many(["Luba-RL", "Luba-OK"], "get_report_cfg")}
+    finally:
+        patcher.stop()
+
+    assert results["Luba-RL"].status is FleetCommandStatus.RATE_LIMITED
+    assert results["Luba-OK"].status is FleetCommandStatus.SENT
+    limited_mqtt.send.assert_not_awaited()
+    assert limited.queue._queue.empty()  # noqa: SLF001 — never enqueued
+    await limited.stop()
+    await free.stop()
+
+
+async def test_send_command_to_many_reports_timeout_and_drops_stale_send() -> None:
+    from pymammotion.client import FleetCommandStatus
+
+    client = MammotionClient()
+    (handle,) = await _fleet(client, ["Luba-Slow"], TransportType.BLE)
+    patcher = _stub_commands(handle, b"\x04")
+    try:
+        # Queue worker not started: the send sits queued past the timeout.
+        results = [r async for r in client.send_command_to_many(["Luba-Slow"], "get_report_cfg", timeout=0.01)]
+        await _drain(handle)
+    finally:
+        patcher.stop()
+
+    assert [r.status for r in results] == [FleetCommandStatus.TIMEOUT]
+    handle._transports[TransportType.BLE].send.assert_not_awaited()  # noqa: SLF001
+    await handle.stop()
+
+
+async def test_send_command_to_many_skips_unknown_devices_and_rejects_bad_keys() -> None:
+    from pymammotion.client import FleetCommandStatus
+
+    client = MammotionClient()
+    results = [r async for r in client.send_command_to_many(["Luba-Nope"], "get_report_cfg")]
+    assert [r.status for r in results] == [FleetCommandStatus.SKIPPED]
+    assert isinstance(results[0].error, KeyError)
+
+    with pytest.raises(AttributeError):
+        async for _ in client.send_command_to_many(["Luba-Nope"], "no_such_command"):
+            pass
+
+
 # ---------------------------------------------------------------------------
 # handle._poll_interval() — poll interval selection tests
 # ---------------------------------------------------------------------------
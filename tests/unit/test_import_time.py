@@ -0,0 +1,84 @@
+"""Import-time budget: ``import pymammotion`` stays cheap and the heavy stacks stay lazy."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+
+import pytest
+
+import pymammotion
+
+#: Cumulative ``-X importtime`` budget of ``import pymammotion`` (µs).  It measures
+#: ~10 ms; the budget leaves room for slow CI machines, not for an eager subpackage.
+PACKAGE_IMPORT_BUDGET_US = 250_000
+
+#: Modules a bare ``import pymammotion`` must not load.
+HEAVY_MODULES = (
+    "pymammotion.proto",
+    "pymammotion.transport.aliyun_mqtt",
+    "pymammotion.bluetooth.ble",
+    "pymammotion.homeassistant.mower_api",
+    "pymammotion.utility.map_renderer",
+    "pymammotion.http.http",
+    "google.protobuf",
+    "PIL",
+    "bleak",
+    "aiohttp",
+)
+
+#: Modules even ``import pymammotion.client`` must not load.
+CLIENT_LAZY_MODULES = (
+    "google.protobuf",
+    "PIL",
+    "pymammotion.homeassistant.mower_api",
+    "pymammotion.utility.map_renderer",
+)
+
+
+def _import_in_subprocess(module: str) -> tuple[dict[str, int], set[str]]:
+    """Import *module* in a fresh interpreter; return cumulative import times (µs) and ``sys.modules``."""
+    code = f"import sys, json; import {module}; print(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True, timeout=120
+    )
+    cumulative: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _self_us, cumulative_us, name = line.removeprefix("import time:").split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+    return cumulative, set(json.loads(result.stdout))
+
+
+def test_package_import_loads_no_heavy_modules() -> None:
+    cumulative, modules = _import_in_subprocess("pymammotion")
+    assert sorted(m for m in HEAVY_MODULES if m in modules) == []
+    assert cumulative["pymammotion"] <= PACKAGE_IMPORT_BUDGET_US
+
+
+def test_client_import_skips_second_protobuf_runtime_and_renderer() -> None:
+    _, modules = _import_in_subprocess("pymammotion.client")
+    assert sorted(m for m in CLIENT_LAZY_MODULES if m in modules) == []
+
+
+@pytest.mark.parametrize(
+    ("package", "name"),
+    [
+        ("pymammotion", "MammotionHTTP"),
+        ("pymammotion.messaging", "Priority"),
+        ("pymammotion.transport", "AliyunMQTTTransport"),
+        ("pymammotion.bluetooth", "BleMessage"),
+        ("pymammotion.homeassistant", "HomeAssistantMowerApi"),
+    ],
+)
+def test_lazy_exports_resolve_and_are_listed(package: str, name: str) -> None:
+    module = sys.modules.get(package) or __import__(package, fromlist=["_"])
+    assert getattr(module, name).__name__ == name
+    assert name in dir(module)
+    assert name in vars(module)  # cached after the first lookup
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    with pytest.raises(AttributeError, match="no attribute 'Nope'"):
+        _ = pymammotion.Nope
@@ -0,0 +1,111 @@
+"""Tests for MapExecutor and LoopLagMonitor."""
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from pymammotion.data.model.hash_list import CommDataCouple, FrameList, HashList, NavGetCommData
+from pymammotion.data.model.location import Dock, LocationPoint
+from pymammotion.utility.executor import ExecutorKind, LoopLagMonitor, MapExecutor
+
+
+def _square_map() -> HashList:
+    hash_list = HashList()
+    square = [CommDataCouple(x=x, y=y) for x, y in ((0.0, 0.0), (5.0, 0.0), (5.0, 5.0), (0.0, 5.0))]
+    frame = NavGetCommData(pver=1, action=8, type=0, hash=101, total_frame=1, current_frame=1, data_couple=square)
+    hash_list.area = {101: FrameList(total_frame=1, sub_cmd=0, data=[frame])}
+    hash_list.set_geojson_origin(LocationPoint(latitude=0.6, longitude=3.0), Dock(latitude=1.0, longitude=1.0))
+    return hash_list
+
+
+# ---------------------------------------------------------------------------
+# MapExecutor
+# ---------------------------------------------------------------------------
+
+
+async def test_thread_executor_runs_off_the_loop_and_counts_calls() -> None:
+    executor = MapExecutor()
+
+    assert await executor.run(threading.get_ident) != threading.get_ident()
+    with pytest.raises(ZeroDivisionError):
+        await executor.run(divmod, 1, 0)
+
+    stats = executor.stats()
+    assert (stats.submitted, stats.failed, stats.running) == (2, 1, 0)
+    executor.shutdown()
+
+
+async def test_async_geojson_on_a_process_pool() -> None:
+    executor = MapExecutor(ExecutorKind.PROCESS, max_workers=1)
+    hash_list = _square_map()
+    try:
+        view = await hash_list.async_geojson("generated_geojson", executor)
+    finally:
+        executor.shutdown()
+
+    assert any(f["properties"].get("hash") == 101 for f in view["features"])
+    assert hash_list.generated_geojson is view
+    assert executor.is_process
+
+
+async def test_concurrent_async_geojson_builds_use_private_feature_caches() -> None:
+    executor = MapExecutor(max_workers=2)
+    hash_list = _square_map()
+    try:
+        first = asyncio.ensure_future(hash_list.async_geojson("generated_geojson", executor))
+        await asyncio.sleep(0)  # first build is now on a worker thread with the original origin
+        cache_before = hash_list._geojson_feature_cache
+        moved_rtk, dock = LocationPoint(latitude=0.7, longitude=3.1), Dock(latitude=1.0, longitude=1.0)
+        hash_list.set_geojson_origin(moved_rtk, dock)
+        second = hash_list.async_geojson("generated_geojson", executor)
+        first_view, second_view = await asyncio.gather(first, second)
+    finally:
+        executor.shutdown()
+
+    expected_first = _square_map()
+    expected_first.generate_geojson(LocationPoint(latitude=0.6, longitude=3.0), dock)
+    expected_second = _square_map()
+    expected_second.generate_geojson(moved_rtk, dock)
+    assert first_view == expected_first.generated_geojson
+    assert second_view == expected_second.generated_geojson
+    assert hash_list.generated_geojson is second_view
+    # The live map adopted the second worker's cache, never sharing one with a running build.
+    assert hash_list._geojson_feature_cache is not cache_before
+    assert hash_list._geojson_feature_cache.origin == expected_second._geojson_feature_cache.origin
+
+
+def test_rejects_empty_pool() -> None:
+    with pytest.raises(ValueError, match="at least 1"):
+        MapExecutor(max_workers=0)
+
+
+# ---------------------------------------------------------------------------
+# LoopLagMonitor
+# ---------------------------------------------------------------------------
+
+
+async def test_monitor_sees_a_blocking_call_and_not_an_offloaded_one() -> None:
+    monitor = LoopLagMonitor(interval=0.01, stall_threshold=0.05)
+    monitor.start()
+    await asyncio.sleep(0.03)
+
+    await asyncio.to_thread(time.sleep, 0.1)
+    assert monitor.stats().stalls == 0
+
+    time.sleep(0.1)  # noqa: ASYNC251 — the stall under test
+    await asyncio.sleep(0.03)
+    await monitor.stop()
+
+    stats = monitor.stats()
+    assert stats.stalls == 1
+    assert stats.max_lag >= 0.08
+    assert stats.samples > 3
+    assert not monitor.running
+
+
+def test_monitor_rejects_non_positive_interval() -> None:
+    with pytest.raises(ValueError, match="positive"):
+        LoopLagMonitor(interval=0)